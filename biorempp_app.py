@@ -88,6 +88,7 @@ from src.presentation.pages.methods.callbacks import (
 )
 from src.presentation.pages.new_user import register_new_user_guide_callbacks
 from src.presentation.pages.uc_user_guide import register_demo_callbacks
+from src.presentation.services import build_graph_cache_store
 from src.presentation.services.results_context import context_has_results
 
 # Initialize application settings and logging
@@ -398,6 +399,7 @@ def create_app(force_initialize: bool = False) -> dash.Dash:
     logger.info("INITIALIZING SINGLETON PLOTSERVICE")
     logger.info("=" * 80)
     plot_service = get_plot_service()
+    plot_service.cache_manager.attach_shared_store(build_graph_cache_store())
     logger.info("[OK] Singleton PlotService instance created and ready")
     logger.info("  - This single instance will be shared across all 51 callbacks")
     logger.info("  - Memory optimization: 37 instances → 1 instance (97% reduction)")
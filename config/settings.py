@@ -38,6 +38,8 @@ All settings can be overridden with environment variables:
 - BIOREMPP_WORKERS: Number of Gunicorn workers (production)
 - BIOREMPP_WORKER_CLASS: Gunicorn worker class (sync/gevent)
 - BIOREMPP_TIMEOUT: Request timeout in seconds
+- BIOREMPP_PRELOAD_REFERENCE_DATA: Load reference databases in the Gunicorn
+  master before forking workers (True/False)
 - BIOREMPP_UPLOAD_MAX_SIZE_MB: Maximum upload file size in MB
 - BIOREMPP_UPLOAD_SAMPLE_LIMIT: Maximum number of samples per upload
 - BIOREMPP_UPLOAD_KO_LIMIT: Maximum number of KO entries per upload
@@ -47,10 +49,35 @@ All settings can be overridden with environment variables:
 - BIOREMPP_CACHE_DIR: Base cache directory (default: <project_root>/cache)
 - BIOREMPP_BACKGROUND_CALLBACKS_ENABLED: Enable Dash background callbacks
 - BIOREMPP_RESULTS_PAYLOAD_MODE: Results payload mode (client|server)
+- BIOREMPP_TOXCSM_SCOPE: ToxCSM graph data scope (compounds|database)
+- BIOREMPP_PROCESSING_STAGE_WORKERS: Threads for concurrent merge stages
+  (default: min(4, CPU count); 1 runs stages sequentially)
+- BIOREMPP_MERGE_CACHE_ENABLED: Reuse merge results for resubmitted datasets
+- BIOREMPP_MERGE_CACHE_BACKEND: Merge result cache backend (diskcache|redis)
+- BIOREMPP_MERGE_CACHE_TTL_SECONDS: Merge result TTL in seconds (default: 86400)
+- BIOREMPP_MERGE_CACHE_SIZE_MB: Merge result diskcache size in MB (default: 256)
+- BIOREMPP_UPLOAD_ARTIFACT_ENABLED: Keep parsed uploads server-side and pass
+  only a reference to processing
+- BIOREMPP_UPLOAD_ARTIFACT_TTL_SECONDS: Parsed upload TTL in seconds (default: 3600)
+- BIOREMPP_UPLOAD_ARTIFACT_SIZE_MB: Parsed upload diskcache size in MB (default: 256)
 - BIOREMPP_RESULTS_HYDRATION_CACHE_SIZE: In-memory hydration cache entries
 - BIOREMPP_RESULTS_HYDRATION_CACHE_TTL_SECONDS: Hydration cache TTL in seconds
 - BIOREMPP_RESULTS_HYDRATION_RETRY_ATTEMPTS: Retry attempts on resume not_found
 - BIOREMPP_RESULTS_HYDRATION_RETRY_DELAY_MS: Retry delay in milliseconds
+- BIOREMPP_RESULTS_HYDRATION_L2_ENABLED: Enable shared on-disk hydration cache
+- BIOREMPP_RESULTS_HYDRATION_L2_SIZE_MB: Shared hydration cache size in MB
+- BIOREMPP_RESULTS_HYDRATION_WAIT_SECONDS: Max wait on a concurrent hydration
+- BIOREMPP_RESULTS_FRAME_CACHE_MB: Per-worker memory budget for cached result
+  DataFrames in MB (default: 256)
+- BIOREMPP_GRAPH_CACHE_MEMORY_MB: Per-worker memory budget for cached figures
+  in MB (default: 128)
+- BIOREMPP_GRAPH_CACHE_SHARED_ENABLED: Share cached figures across workers
+- BIOREMPP_GRAPH_CACHE_SHARED_BACKEND: Shared figure cache backend
+  (diskcache|redis)
+- BIOREMPP_GRAPH_CACHE_SHARED_SIZE_MB: Shared figure diskcache size in MB
+  (default: 1024)
+- BIOREMPP_PROCESSED_DATA_CACHE_MB: Per-worker memory budget for processed
+  plot data in MB (default: 256)
 - BIOREMPP_OBSERVABILITY_ENABLED: Enable Prometheus instrumentation (True/False)
 - BIOREMPP_OBSERVABILITY_METRICS_PATH: Metrics endpoint path (default: /metrics)
 - BIOREMPP_RESUME_BACKEND: Resume backend (diskcache|redis)
@@ -58,6 +85,10 @@ All settings can be overridden with environment variables:
 - BIOREMPP_RESUME_TTL_SECONDS: Resume payload TTL in seconds (default: 14400)
 - BIOREMPP_RESUME_CACHE_SIZE_MB: Resume cache max size in MB (default: 512)
 - BIOREMPP_RESUME_MAX_PAYLOAD_MB: Max payload size per resume job in MB
+- BIOREMPP_RESUME_PERSIST_WORKERS: Concurrent resume saves per worker (default: 2)
+- BIOREMPP_RESUME_PERSIST_QUEUE_SIZE: Resume saves queued per worker (default: 8)
+- BIOREMPP_RESUME_PERSIST_DRAIN_SECONDS: Wait for queued resume saves on
+  worker shutdown (default: 20)
 - BIOREMPP_RESUME_RATE_LIMIT_ATTEMPTS: Max resume attempts per window
 - BIOREMPP_RESUME_RATE_LIMIT_WINDOW_SECONDS: Rate-limit window in seconds
 - BIOREMPP_RESUME_RATE_LIMIT_BACKOFF_BASE_SECONDS: Base backoff in seconds
@@ -75,6 +106,8 @@ All settings can be overridden with environment variables:
 - BIOREMPP_RESUME_REDIS_PASSWORD: Resume Redis password
 - BIOREMPP_RESUME_REDIS_KEY_PREFIX: Resume Redis key prefix
 - BIOREMPP_RESUME_REDIS_COMPRESSION_LEVEL: Resume Redis compression level (1-9)
+- BIOREMPP_RESUME_REDIS_CHUNK_KB: Chunk size in KB for large Redis values
+- BIOREMPP_RESUME_REDIS_COMPRESSION_THREADS: Threads compressing Redis chunks
 - BIOREMPP_RESUME_REDIS_SOCKET_TIMEOUT_SECONDS: Resume Redis socket timeout
 - BIOREMPP_TRUST_PROXY_HEADERS: Trust X-Forwarded-For only from trusted proxies
 - BIOREMPP_TRUSTED_PROXY_CIDRS: CSV of trusted reverse-proxy CIDRs
@@ -289,6 +322,8 @@ class Settings:
         Request timeout in seconds
     KEEPALIVE : int
         Keepalive timeout in seconds
+    PRELOAD_REFERENCE_DATA : bool
+        Load reference databases in the Gunicorn master before forking
     LOG_LEVEL : str
         Logging level (DEBUG/INFO/WARNING/ERROR/CRITICAL)
     LOG_FILE : Optional[str]
@@ -385,6 +420,10 @@ class Settings:
         default_factory=lambda: _get_int("BIOREMPP_KEEPALIVE", 5)
     )
 
+    PRELOAD_REFERENCE_DATA: bool = field(
+        default_factory=lambda: _get_bool("BIOREMPP_PRELOAD_REFERENCE_DATA", True)
+    )
+
     # ========================================================================
     # LOGGING
     # ========================================================================
@@ -477,6 +516,52 @@ class Settings:
         )
     )
 
+    RESULTS_HYDRATION_L2_ENABLED: bool = field(
+        default_factory=lambda: _get_bool(
+            "BIOREMPP_RESULTS_HYDRATION_L2_ENABLED", True
+        )
+    )
+
+    RESULTS_HYDRATION_L2_SIZE_MB: int = field(
+        default_factory=lambda: _get_int(
+            "BIOREMPP_RESULTS_HYDRATION_L2_SIZE_MB", 512
+        )
+    )
+
+    RESULTS_HYDRATION_WAIT_SECONDS: int = field(
+        default_factory=lambda: _get_int(
+            "BIOREMPP_RESULTS_HYDRATION_WAIT_SECONDS", 15
+        )
+    )
+
+    RESULTS_FRAME_CACHE_MB: int = field(
+        default_factory=lambda: _get_int("BIOREMPP_RESULTS_FRAME_CACHE_MB", 256)
+    )
+
+    GRAPH_CACHE_MEMORY_MB: int = field(
+        default_factory=lambda: _get_int("BIOREMPP_GRAPH_CACHE_MEMORY_MB", 128)
+    )
+
+    GRAPH_CACHE_SHARED_ENABLED: bool = field(
+        default_factory=lambda: _get_bool("BIOREMPP_GRAPH_CACHE_SHARED_ENABLED", True)
+    )
+
+    GRAPH_CACHE_SHARED_BACKEND: Literal["diskcache", "redis"] = field(
+        default_factory=lambda: os.getenv(
+            "BIOREMPP_GRAPH_CACHE_SHARED_BACKEND", "diskcache"
+        )
+        .strip()
+        .lower()
+    )
+
+    GRAPH_CACHE_SHARED_SIZE_MB: int = field(
+        default_factory=lambda: _get_int("BIOREMPP_GRAPH_CACHE_SHARED_SIZE_MB", 1024)
+    )
+
+    PROCESSED_DATA_CACHE_MB: int = field(
+        default_factory=lambda: _get_int("BIOREMPP_PROCESSED_DATA_CACHE_MB", 256)
+    )
+
     # ========================================================================
     # OBSERVABILITY
     # ========================================================================
@@ -565,6 +650,18 @@ class Settings:
         default_factory=lambda: _get_int("BIOREMPP_RESUME_MAX_PAYLOAD_MB", 64)
     )
 
+    RESUME_PERSIST_WORKERS: int = field(
+        default_factory=lambda: _get_int("BIOREMPP_RESUME_PERSIST_WORKERS", 2)
+    )
+
+    RESUME_PERSIST_QUEUE_SIZE: int = field(
+        default_factory=lambda: _get_int("BIOREMPP_RESUME_PERSIST_QUEUE_SIZE", 8)
+    )
+
+    RESUME_PERSIST_DRAIN_SECONDS: int = field(
+        default_factory=lambda: _get_int("BIOREMPP_RESUME_PERSIST_DRAIN_SECONDS", 20)
+    )
+
     RESUME_RATE_LIMIT_ATTEMPTS: int = field(
         default_factory=lambda: _get_int("BIOREMPP_RESUME_RATE_LIMIT_ATTEMPTS", 10)
     )
@@ -671,6 +768,16 @@ class Settings:
         )
     )
 
+    RESUME_REDIS_CHUNK_KB: int = field(
+        default_factory=lambda: _get_int("BIOREMPP_RESUME_REDIS_CHUNK_KB", 1024)
+    )
+
+    RESUME_REDIS_COMPRESSION_THREADS: int = field(
+        default_factory=lambda: _get_int(
+            "BIOREMPP_RESUME_REDIS_COMPRESSION_THREADS", 4
+        )
+    )
+
     RESUME_REDIS_SOCKET_TIMEOUT_SECONDS: int = field(
         default_factory=lambda: _get_int(
             "BIOREMPP_RESUME_REDIS_SOCKET_TIMEOUT_SECONDS", 3
@@ -792,6 +899,48 @@ class Settings:
         )
     )
 
+    PROCESSING_STAGE_WORKERS: int = field(
+        default_factory=lambda: _get_int(
+            "BIOREMPP_PROCESSING_STAGE_WORKERS", min(4, os.cpu_count() or 1)
+        )
+    )
+
+    TOXCSM_SCOPE: Literal["compounds", "database"] = field(
+        default_factory=lambda: os.getenv("BIOREMPP_TOXCSM_SCOPE", "compounds")
+        .strip()
+        .lower()
+    )
+
+    MERGE_CACHE_ENABLED: bool = field(
+        default_factory=lambda: _get_bool("BIOREMPP_MERGE_CACHE_ENABLED", True)
+    )
+
+    MERGE_CACHE_BACKEND: Literal["diskcache", "redis"] = field(
+        default_factory=lambda: os.getenv("BIOREMPP_MERGE_CACHE_BACKEND", "diskcache")
+        .strip()
+        .lower()
+    )
+
+    MERGE_CACHE_TTL_SECONDS: int = field(
+        default_factory=lambda: _get_int("BIOREMPP_MERGE_CACHE_TTL_SECONDS", 86400)
+    )
+
+    MERGE_CACHE_SIZE_MB: int = field(
+        default_factory=lambda: _get_int("BIOREMPP_MERGE_CACHE_SIZE_MB", 256)
+    )
+
+    UPLOAD_ARTIFACT_ENABLED: bool = field(
+        default_factory=lambda: _get_bool("BIOREMPP_UPLOAD_ARTIFACT_ENABLED", True)
+    )
+
+    UPLOAD_ARTIFACT_TTL_SECONDS: int = field(
+        default_factory=lambda: _get_int("BIOREMPP_UPLOAD_ARTIFACT_TTL_SECONDS", 3600)
+    )
+
+    UPLOAD_ARTIFACT_SIZE_MB: int = field(
+        default_factory=lambda: _get_int("BIOREMPP_UPLOAD_ARTIFACT_SIZE_MB", 256)
+    )
+
     def __post_init__(self):
         """Post-initialization validation and setup."""
         # Normalize environment
@@ -912,6 +1061,9 @@ class Settings:
         self.RESUME_TTL_SECONDS = max(self.RESUME_TTL_SECONDS, 60)
         self.RESUME_CACHE_SIZE_MB = max(self.RESUME_CACHE_SIZE_MB, 32)
         self.RESUME_MAX_PAYLOAD_MB = max(self.RESUME_MAX_PAYLOAD_MB, 8)
+        self.RESUME_PERSIST_WORKERS = max(self.RESUME_PERSIST_WORKERS, 1)
+        self.RESUME_PERSIST_QUEUE_SIZE = max(self.RESUME_PERSIST_QUEUE_SIZE, 0)
+        self.RESUME_PERSIST_DRAIN_SECONDS = max(self.RESUME_PERSIST_DRAIN_SECONDS, 0)
 
         self.RESUME_RATE_LIMIT_ATTEMPTS = max(self.RESUME_RATE_LIMIT_ATTEMPTS, 1)
         self.RESUME_RATE_LIMIT_WINDOW_SECONDS = max(
@@ -953,6 +1105,10 @@ class Settings:
         self.RESUME_REDIS_COMPRESSION_LEVEL = min(
             max(self.RESUME_REDIS_COMPRESSION_LEVEL, 1), 9
         )
+        self.RESUME_REDIS_CHUNK_KB = max(self.RESUME_REDIS_CHUNK_KB, 64)
+        self.RESUME_REDIS_COMPRESSION_THREADS = max(
+            self.RESUME_REDIS_COMPRESSION_THREADS, 1
+        )
         self.RESUME_REDIS_SOCKET_TIMEOUT_SECONDS = max(
             self.RESUME_REDIS_SOCKET_TIMEOUT_SECONDS, 1
         )
@@ -1009,6 +1165,17 @@ class Settings:
                 "[WARNING] Invalid BIOREMPP_RESULTS_PAYLOAD_MODE, using 'server'"
             )
             self.RESULTS_PAYLOAD_MODE = "server"
+        if self.TOXCSM_SCOPE not in ("compounds", "database"):
+            print("[WARNING] Invalid BIOREMPP_TOXCSM_SCOPE, using 'compounds'")
+            self.TOXCSM_SCOPE = "compounds"
+        if self.MERGE_CACHE_BACKEND not in ("diskcache", "redis"):
+            print("[WARNING] Invalid BIOREMPP_MERGE_CACHE_BACKEND, using 'diskcache'")
+            self.MERGE_CACHE_BACKEND = "diskcache"
+        self.MERGE_CACHE_TTL_SECONDS = max(self.MERGE_CACHE_TTL_SECONDS, 60)
+        self.PROCESSING_STAGE_WORKERS = max(self.PROCESSING_STAGE_WORKERS, 1)
+        self.MERGE_CACHE_SIZE_MB = max(self.MERGE_CACHE_SIZE_MB, 32)
+        self.UPLOAD_ARTIFACT_TTL_SECONDS = max(self.UPLOAD_ARTIFACT_TTL_SECONDS, 60)
+        self.UPLOAD_ARTIFACT_SIZE_MB = max(self.UPLOAD_ARTIFACT_SIZE_MB, 32)
         self.RESULTS_HYDRATION_CACHE_SIZE = max(
             self.RESULTS_HYDRATION_CACHE_SIZE, 1
         )
@@ -1021,6 +1188,22 @@ class Settings:
         self.RESULTS_HYDRATION_RETRY_DELAY_MS = max(
             self.RESULTS_HYDRATION_RETRY_DELAY_MS, 0
         )
+        self.RESULTS_HYDRATION_L2_SIZE_MB = max(
+            self.RESULTS_HYDRATION_L2_SIZE_MB, 16
+        )
+        self.RESULTS_HYDRATION_WAIT_SECONDS = max(
+            self.RESULTS_HYDRATION_WAIT_SECONDS, 1
+        )
+        self.RESULTS_FRAME_CACHE_MB = max(self.RESULTS_FRAME_CACHE_MB, 16)
+        self.GRAPH_CACHE_MEMORY_MB = max(self.GRAPH_CACHE_MEMORY_MB, 8)
+        self.PROCESSED_DATA_CACHE_MB = max(self.PROCESSED_DATA_CACHE_MB, 16)
+        if self.GRAPH_CACHE_SHARED_BACKEND not in ("diskcache", "redis"):
+            print(
+                "[WARNING] Invalid BIOREMPP_GRAPH_CACHE_SHARED_BACKEND, "
+                "using 'diskcache'"
+            )
+            self.GRAPH_CACHE_SHARED_BACKEND = "diskcache"
+        self.GRAPH_CACHE_SHARED_SIZE_MB = max(self.GRAPH_CACHE_SHARED_SIZE_MB, 32)
 
         # Auto-adjust settings based on environment
         if self.is_production:
@@ -1253,6 +1436,8 @@ class Settings:
                 "resume_backend": self.RESUME_BACKEND,
                 "resume_security_mode": self.RESUME_SECURITY_MODE,
                 "resume_ttl_seconds": self.RESUME_TTL_SECONDS,
+                "resume_persist_workers": self.RESUME_PERSIST_WORKERS,
+                "resume_persist_queue_size": self.RESUME_PERSIST_QUEUE_SIZE,
                 "resume_rate_limit_attempts": self.RESUME_RATE_LIMIT_ATTEMPTS,
                 "resume_rate_limit_window_seconds": self.RESUME_RATE_LIMIT_WINDOW_SECONDS,
                 "resume_rate_limit_backend": self.RESUME_RATE_LIMIT_BACKEND,
@@ -1270,6 +1455,15 @@ class Settings:
                 "results_hydration_cache_ttl_seconds": self.RESULTS_HYDRATION_CACHE_TTL_SECONDS,
                 "results_hydration_retry_attempts": self.RESULTS_HYDRATION_RETRY_ATTEMPTS,
                 "results_hydration_retry_delay_ms": self.RESULTS_HYDRATION_RETRY_DELAY_MS,
+                "results_hydration_l2_enabled": self.RESULTS_HYDRATION_L2_ENABLED,
+                "results_hydration_l2_size_mb": self.RESULTS_HYDRATION_L2_SIZE_MB,
+                "results_hydration_wait_seconds": self.RESULTS_HYDRATION_WAIT_SECONDS,
+                "results_frame_cache_mb": self.RESULTS_FRAME_CACHE_MB,
+                "graph_cache_memory_mb": self.GRAPH_CACHE_MEMORY_MB,
+                "graph_cache_shared_enabled": self.GRAPH_CACHE_SHARED_ENABLED,
+                "graph_cache_shared_backend": self.GRAPH_CACHE_SHARED_BACKEND,
+                "graph_cache_shared_size_mb": self.GRAPH_CACHE_SHARED_SIZE_MB,
+                "processed_data_cache_mb": self.PROCESSED_DATA_CACHE_MB,
             },
         )
 
@@ -1324,6 +1518,7 @@ class Settings:
                 f"  Worker Connections: {self.WORKER_CONNECTIONS}",
                 f"  Timeout: {self.TIMEOUT}s",
                 f"  Keepalive: {self.KEEPALIVE}s",
+                f"  Preload Reference Data: {self.PRELOAD_REFERENCE_DATA}",
             ])
 
         lines.extend([
@@ -1349,6 +1544,14 @@ class Settings:
             f"{self.PROCESSING_CIRCUIT_BREAKER_THRESHOLD}",
             f"  Circuit Breaker Timeout: "
             f"{self.PROCESSING_CIRCUIT_BREAKER_TIMEOUT}s",
+            f"  Stage Workers: {self.PROCESSING_STAGE_WORKERS}",
+            f"  ToxCSM Scope: {self.TOXCSM_SCOPE}",
+            f"  Merge Cache: {self.MERGE_CACHE_BACKEND} "
+            f"(enabled={self.MERGE_CACHE_ENABLED}, "
+            f"ttl={self.MERGE_CACHE_TTL_SECONDS}s)",
+            f"  Upload Artifacts: {self.RESUME_BACKEND} "
+            f"(enabled={self.UPLOAD_ARTIFACT_ENABLED}, "
+            f"ttl={self.UPLOAD_ARTIFACT_TTL_SECONDS}s)",
             "",
             "Observability:",
             f"  Enabled: {self.OBSERVABILITY_ENABLED}",
@@ -1366,6 +1569,9 @@ class Settings:
             f"  TTL: {self.RESUME_TTL_SECONDS}s",
             f"  Cache Size: {self.RESUME_CACHE_SIZE_MB} MB",
             f"  Max Payload: {self.RESUME_MAX_PAYLOAD_MB} MB",
+            f"  Persistence: {self.RESUME_PERSIST_WORKERS} workers, "
+            f"queue {self.RESUME_PERSIST_QUEUE_SIZE}, "
+            f"drain {self.RESUME_PERSIST_DRAIN_SECONDS}s",
             f"  Rate Limit: {self.RESUME_RATE_LIMIT_ATTEMPTS} attempts / "
             f"{self.RESUME_RATE_LIMIT_WINDOW_SECONDS}s",
             f"  Rate Limit Backend: {self.RESUME_RATE_LIMIT_BACKEND}",
@@ -1379,6 +1585,15 @@ class Settings:
             f"  Hydration Cache TTL: {self.RESULTS_HYDRATION_CACHE_TTL_SECONDS}s",
             f"  Hydration Retry Attempts: {self.RESULTS_HYDRATION_RETRY_ATTEMPTS}",
             f"  Hydration Retry Delay: {self.RESULTS_HYDRATION_RETRY_DELAY_MS}ms",
+            f"  Hydration L2 Enabled: {self.RESULTS_HYDRATION_L2_ENABLED}",
+            f"  Hydration L2 Size: {self.RESULTS_HYDRATION_L2_SIZE_MB}MB",
+            f"  Hydration Wait: {self.RESULTS_HYDRATION_WAIT_SECONDS}s",
+            f"  Frame Cache: {self.RESULTS_FRAME_CACHE_MB} MB",
+            f"  Graph Cache: {self.GRAPH_CACHE_MEMORY_MB} MB per worker, "
+            f"shared {self.GRAPH_CACHE_SHARED_BACKEND} "
+            f"(enabled={self.GRAPH_CACHE_SHARED_ENABLED}, "
+            f"{self.GRAPH_CACHE_SHARED_SIZE_MB} MB)",
+            f"  Processed Data Cache: {self.PROCESSED_DATA_CACHE_MB} MB per worker",
             f"  Gunicorn Line Limit: {self.GUNICORN_LIMIT_REQUEST_LINE}",
             f"  Gunicorn Header Size: {self.GUNICORN_LIMIT_REQUEST_FIELD_SIZE}",
             f"  Gunicorn Header Count: {self.GUNICORN_LIMIT_REQUEST_FIELDS}",
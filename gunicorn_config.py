@@ -15,9 +15,11 @@ Usage:
 """
 
 # Ensure project root is importable when Gunicorn loads this config file.
+import gc
 import os
 import shutil
 import sys
+import time
 from pathlib import Path
 
 try:  # Unix-like systems only
@@ -60,11 +62,18 @@ _prepare_prometheus_multiproc_dir()
 
 from src.shared.metrics import (
     WORKERS_ACTIVE,
+    WORKER_MEMORY_BREAKDOWN_BYTES,
     WORKER_MEMORY_BYTES,
     WORKER_REQUESTS_TOTAL,
     WORKER_RESTARTS_TOTAL,
 )
 
+from src.shared.metrics.process_memory import (
+    build_memory_report,
+    format_memory_report,
+    read_process_memory,
+)
+
 try:
     from prometheus_client import multiprocess as prom_multiprocess
 except Exception:  # pragma: no cover - defensive fallback
@@ -196,6 +205,53 @@ def _read_worker_memory_bytes() -> float | None:
         return None
 
 
+# Minimum seconds between smaps_rollup reads in the request path
+_MEMORY_BREAKDOWN_INTERVAL_SECONDS = 30.0
+_last_memory_breakdown_at = 0.0
+
+
+def _record_worker_memory_breakdown(force: bool = False) -> dict | None:
+    """Export rss/pss/shared/private bytes for the current worker."""
+    global _last_memory_breakdown_at
+    now = time.monotonic()
+    elapsed = now - _last_memory_breakdown_at
+    if not force and elapsed < _MEMORY_BREAKDOWN_INTERVAL_SECONDS:
+        return None
+    _last_memory_breakdown_at = now
+
+    memory = read_process_memory()
+    if memory is None:
+        return None
+    for kind, value in memory.items():
+        WORKER_MEMORY_BREAKDOWN_BYTES.labels(kind=kind).set(value)
+    return memory
+
+
+def _preload_reference_data() -> None:
+    """
+    Load reference databases in the master so workers inherit them.
+
+    Objects created before fork are then frozen out of the cyclic GC so
+    collections in workers do not write to (and privately copy) their pages.
+    """
+    if not (preload_app and settings.PRELOAD_REFERENCE_DATA):
+        return
+    try:
+        from src.presentation.callbacks.real_processing_callbacks import (
+            get_data_service,
+        )
+
+        get_data_service()
+    except Exception as exc:  # pragma: no cover - startup diagnostics
+        print(f"WARNING: failed to preload reference data: {exc}")
+        return
+    gc.freeze()
+    report = build_memory_report(os.getpid(), [])
+    if report["processes"]:
+        print("[OK] Reference data preloaded in master")
+        print(format_memory_report(report))
+
+
 def on_starting(server):
     """
     Called just before the master process is initialized.
@@ -245,6 +301,7 @@ def when_ready(server):
     print(f"[OK] Gunicorn server ready on {bind}")
     print(f"[OK] Process name: {proc_name}")
     print(f"[OK] Logging to: {log_dir}")
+    _preload_reference_data()
     print("=" * 80)
 
 
@@ -274,7 +331,8 @@ def pre_fork(server, worker):
 
     Pre-fork hook.
     """
-    pass
+    # Keep objects inherited from the master out of the workers' GC passes
+    gc.freeze()
 
 
 def post_fork(server, worker):
@@ -287,7 +345,30 @@ def post_fork(server, worker):
     memory_bytes = _read_worker_memory_bytes()
     if memory_bytes is not None:
         WORKER_MEMORY_BYTES.set(memory_bytes)
-    print(f"Worker spawned (pid: {worker.pid})")
+    memory = _record_worker_memory_breakdown(force=True)
+    if memory is not None:
+        print(
+            f"Worker spawned (pid: {worker.pid}, "
+            f"rss={memory['rss'] // 1024**2}MiB, "
+            f"pss={memory['pss'] // 1024**2}MiB, "
+            f"shared={memory['shared'] // 1024**2}MiB)"
+        )
+    else:
+        print(f"Worker spawned (pid: {worker.pid})")
+
+
+def worker_exit(server, worker):
+    """
+    Called just after a worker has been exited, in the worker process.
+
+    Worker exit hook.
+    """
+    try:
+        from src.presentation.services import drain_resume_persistence
+
+        drain_resume_persistence()
+    except Exception as exc:  # pragma: no cover - shutdown diagnostics
+        print(f"WARNING: failed to drain resume persistence: {exc}")
 
 
 def pre_exec(server):
@@ -311,6 +392,7 @@ def pre_request(worker, req):
     memory_bytes = _read_worker_memory_bytes()
     if memory_bytes is not None:
         WORKER_MEMORY_BYTES.set(memory_bytes)
+    _record_worker_memory_breakdown()
     try:
         content_length_raw = req.headers.get("Content-Length", "0")
         content_length = int(content_length_raw)
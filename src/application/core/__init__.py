@@ -11,6 +11,8 @@ UploadHandler
     Handles file upload validation and processing
 SampleParser
     Parses input data into domain entities
+UploadParser
+    Vectorized parser for Sample/KO upload content
 DataProcessor
     Orchestrates data processing and merge operations
 ResultExporter
@@ -26,10 +28,13 @@ from src.application.core.data_processor import DataProcessor
 from src.application.core.result_exporter import ResultExporter
 from src.application.core.sample_parser import SampleParser
 from src.application.core.upload_handler import UploadHandler
+from src.application.core.upload_parser import ParsedUpload, UploadParser
 
 __all__ = [
     "UploadHandler",
     "SampleParser",
+    "UploadParser",
+    "ParsedUpload",
     "DataProcessor",
     "ResultExporter",
 ]
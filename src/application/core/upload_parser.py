@@ -0,0 +1,410 @@
+"""
+Upload Parser - Vectorized Sample/KO parsing over raw upload bytes.
+
+Parses the ``>Sample`` / ``KXXXXX`` upload format in a single vectorized
+pass over the raw bytes: line boundaries, whitespace trimming and line
+classification are computed with NumPy, KO tokens are gathered into a
+fixed-width byte array and factorized, and (Sample, KO) pairs are
+deduplicated as integer codes. Only sample headers and the rare lines
+holding non-ASCII bytes are decoded in Python, so memory stays a small
+multiple of the input size even near the upload KO limit.
+
+Classes
+-------
+ParsedUpload
+    Deduplicated, integer-coded Sample/KO pairs
+UploadParser
+    Single-pass parser with fused upload limit checks
+
+Examples
+--------
+>>> parser = UploadParser(max_samples=100)
+>>> parsed = parser.parse(b">Sample1\\nK00001\\nK00002\\n>Sample2\\nK00001")
+>>> parsed.to_frame()["KO"].tolist()
+['K00001', 'K00002', 'K00001']
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.shared.exceptions import KOLimitExceededError, SampleLimitExceededError
+from src.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Bytes removed by ``str.strip()`` that are single bytes in UTF-8
+_ASCII_WHITESPACE = np.zeros(256, dtype=bool)
+_ASCII_WHITESPACE[[0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x1C, 0x1D, 0x1E, 0x1F, 0x20]] = True
+
+_HEADER_BYTE = ord(">")
+_KO_BYTE = ord("K")
+
+# Lines without a header / KO meaning
+_LINE_OTHER = 0
+_LINE_HEADER = 1
+_LINE_KO = 2
+
+
+@dataclass
+class ParsedUpload:
+    """
+    Deduplicated, integer-coded Sample/KO pairs.
+
+    Rows keep the order of the first occurrence of each (Sample, KO) pair
+    in the upload.
+
+    Attributes
+    ----------
+    sample_codes : np.ndarray
+        Per-row index into ``sample_names``.
+    ko_codes : np.ndarray
+        Per-row index into ``ko_ids``.
+    sample_names : List[str]
+        Sample names in first-appearance order of their rows.
+    ko_ids : List[str]
+        Distinct KO identifiers.
+    ko_lines : int
+        KO lines read before deduplication.
+    """
+
+    sample_codes: np.ndarray
+    ko_codes: np.ndarray
+    sample_names: List[str]
+    ko_ids: List[str]
+    ko_lines: int = 0
+
+    def __len__(self) -> int:
+        """Return number of deduplicated (Sample, KO) pairs."""
+        return len(self.sample_codes)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Return pairs as a DataFrame with categorical Sample and KO columns.
+
+        Returns
+        -------
+        pd.DataFrame
+            Columns ``Sample`` and ``KO``; empty (no columns) when no pair
+            was parsed, like ``pd.DataFrame([])``.
+        """
+        if not len(self):
+            return pd.DataFrame()
+        return pd.DataFrame(
+            {
+                "Sample": pd.Categorical.from_codes(
+                    self.sample_codes,
+                    categories=pd.Index(self.sample_names, dtype=object),
+                ),
+                "KO": pd.Categorical.from_codes(
+                    self.ko_codes, categories=pd.Index(self.ko_ids, dtype=object)
+                ),
+            }
+        )
+
+
+class UploadParser:
+    """
+    Single-pass vectorized parser for Sample/KO uploads.
+
+    A line is a sample header when it starts with ``>`` after trimming
+    whitespace; a KO line when it starts with ``K`` and follows a header
+    with a non-empty name. Every other line is ignored.
+
+    Methods
+    -------
+    parse(content)
+        Parse upload content into a :class:`ParsedUpload`
+    """
+
+    # KO tokens longer than this are decoded in Python instead of being
+    # gathered into the fixed-width token array
+    MAX_TOKEN_WIDTH = 32
+
+    def __init__(
+        self,
+        max_samples: Optional[int] = None,
+        max_total_kos: Optional[int] = None,
+        max_kos_per_sample: Optional[int] = None,
+    ):
+        """
+        Initialize parser.
+
+        Parameters
+        ----------
+        max_samples : Optional[int], default=None
+            Maximum distinct samples with KO data (None disables).
+        max_total_kos : Optional[int], default=None
+            Maximum KO lines before deduplication (None disables).
+        max_kos_per_sample : Optional[int], default=None
+            Maximum distinct KOs in one sample (None disables).
+        """
+        self.max_samples = max_samples
+        self.max_total_kos = max_total_kos
+        self.max_kos_per_sample = max_kos_per_sample
+
+    @staticmethod
+    def _line_bounds(buf: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (has_content, first, last) byte positions of trimmed lines."""
+        # int32 byte positions: uploads are far below 2 GiB
+        newlines = np.flatnonzero(buf == 0x0A).astype(np.int32)
+        starts = np.concatenate((np.zeros(1, np.int32), newlines + 1))
+        ends = np.concatenate((newlines, np.full(1, len(buf), np.int32)))
+        del newlines
+
+        # Runs of non-whitespace bytes never cross a newline, so a line's
+        # trimmed span runs from its first run start to its last run end
+        content = np.zeros(len(buf) + 2, dtype=np.int8)
+        content[1:-1] = ~_ASCII_WHITESPACE[buf]
+        edges = np.diff(content)
+        del content
+        run_starts = np.flatnonzero(edges == 1).astype(np.int32)
+        run_ends = (np.flatnonzero(edges == -1) - 1).astype(np.int32)
+        del edges
+
+        first_idx = np.searchsorted(run_starts, starts, side="left")
+        last_idx = np.searchsorted(run_ends, ends, side="left") - 1
+        has_content = last_idx >= first_idx
+        if not len(run_starts):
+            return has_content, starts, ends
+        first = run_starts[np.minimum(first_idx, len(run_starts) - 1)]
+        last = run_ends[np.maximum(last_idx, 0)]
+        return has_content, first, last
+
+    @staticmethod
+    def _special_lines(
+        buf: np.ndarray, first: np.ndarray, last: np.ndarray
+    ) -> np.ndarray:
+        """Return mask of lines whose content holds non-ASCII or NUL bytes."""
+        special = np.flatnonzero((buf >= 0x80) | (buf == 0x00))
+        if not len(special):
+            return np.zeros(len(first), dtype=bool)
+        return np.searchsorted(special, last, side="right") > np.searchsorted(
+            special, first, side="left"
+        )
+
+    @staticmethod
+    def _factorize(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sort-based factorization with int32 codes.
+
+        Lighter than ``np.unique(..., return_inverse=True)``: one argsort,
+        one sorted copy and a boolean group-start mask.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]
+            Codes per value, sorted distinct values and the position of the
+            first occurrence of each distinct value.
+        """
+        order = np.argsort(values)
+        ordered = values[order]
+        is_new = np.ones(len(values), dtype=bool)
+        is_new[1:] = ordered[1:] != ordered[:-1]
+        codes = np.empty(len(values), dtype=np.int32)
+        codes[order] = np.cumsum(is_new, dtype=np.int32) - 1
+        # The sort is not stable: take the smallest position of each group
+        first_positions = np.minimum.reduceat(order, np.flatnonzero(is_new))
+        return codes, ordered[is_new], first_positions
+
+    @classmethod
+    def _factorize_tokens(
+        cls,
+        buf: np.ndarray,
+        first: np.ndarray,
+        lengths: np.ndarray,
+    ) -> Tuple[np.ndarray, List[str]]:
+        """Factorize byte ranges into (codes, distinct ASCII tokens)."""
+        # Gather tokens column by column into a zero-padded fixed-width array
+        width = max(int(lengths.max()) if len(lengths) else 1, 1)
+        padded_width = 8 if width <= 8 else width
+        chars = np.zeros((len(first), padded_width), dtype=np.uint8)
+        shortest = int(lengths.min()) if len(lengths) else 0
+        for offset in range(width):
+            if offset < shortest:
+                chars[:, offset] = buf[first + offset]
+            else:
+                rows = np.flatnonzero(lengths > offset)
+                chars[rows, offset] = buf[first[rows] + offset]
+
+        if padded_width == 8:
+            # KO IDs fit in one machine word: sort integers, not strings
+            codes, uniques, _ = cls._factorize(chars.view(np.uint64).ravel())
+            tokens = uniques.view("S8").tolist()
+        else:
+            codes, uniques, _ = cls._factorize(chars.view(f"S{padded_width}").ravel())
+            tokens = uniques.tolist()
+        return codes, [token.decode("ascii") for token in tokens]
+
+    def _check_total(self, ko_lines: int) -> None:
+        if self.max_total_kos is not None and ko_lines > self.max_total_kos:
+            error_msg = (
+                f"Too many KO entries: {ko_lines:,} "
+                f"(maximum: {self.max_total_kos:,})"
+            )
+            logger.error(error_msg, extra={"max_total_kos": self.max_total_kos})
+            raise KOLimitExceededError(error_msg)
+
+    def _check_samples(self, sample_count: int) -> None:
+        if self.max_samples is not None and sample_count > self.max_samples:
+            error_msg = (
+                f"Too many samples: {sample_count} (maximum: {self.max_samples})"
+            )
+            logger.error(error_msg, extra={"max_samples": self.max_samples})
+            raise SampleLimitExceededError(error_msg)
+
+    def _check_per_sample(
+        self, sample_codes: np.ndarray, sample_names: List[str]
+    ) -> None:
+        if self.max_kos_per_sample is None or not len(sample_codes):
+            return
+        counts = np.bincount(sample_codes, minlength=len(sample_names))
+        worst = int(counts.argmax())
+        if counts[worst] > self.max_kos_per_sample:
+            error_msg = (
+                f"Sample '{sample_names[worst]}' has too many KOs: "
+                f"{int(counts[worst]):,} (maximum: {self.max_kos_per_sample:,})"
+            )
+            logger.error(
+                error_msg, extra={"max_kos_per_sample": self.max_kos_per_sample}
+            )
+            raise KOLimitExceededError(error_msg)
+
+    def parse(self, content: Union[str, bytes]) -> ParsedUpload:
+        """
+        Parse upload content.
+
+        Parameters
+        ----------
+        content : Union[str, bytes]
+            Upload text (UTF-8 when given as bytes).
+
+        Returns
+        -------
+        ParsedUpload
+            Deduplicated, integer-coded Sample/KO pairs.
+
+        Raises
+        ------
+        SampleLimitExceededError
+            If more than ``max_samples`` samples hold KO data.
+        KOLimitExceededError
+            If ``max_total_kos`` or ``max_kos_per_sample`` is exceeded.
+        """
+        data = content.encode("utf-8") if isinstance(content, str) else bytes(content)
+        buf = np.frombuffer(data, dtype=np.uint8)
+        empty = ParsedUpload(
+            sample_codes=np.empty(0, dtype=np.int32),
+            ko_codes=np.empty(0, dtype=np.int32),
+            sample_names=[],
+            ko_ids=[],
+        )
+        if not len(buf):
+            return empty
+
+        # 1. Classify trimmed lines by their first byte
+        has_content, first, last = self._line_bounds(buf)
+        kinds = np.full(len(first), _LINE_OTHER, dtype=np.int8)
+        lead = buf[np.minimum(first, len(buf) - 1)]
+        kinds[has_content & (lead == _HEADER_BYTE)] = _LINE_HEADER
+        kinds[has_content & (lead == _KO_BYTE)] = _LINE_KO
+
+        # Lines with multi-byte characters (e.g. Unicode whitespace) follow
+        # Python str.strip() semantics exactly
+        special_mask = has_content & self._special_lines(buf, first, last)
+        special = np.flatnonzero(special_mask)
+        special_text: Dict[int, str] = {}
+        for line in special.tolist():
+            text = data[first[line] : last[line] + 1].decode("utf-8").strip()
+            special_text[line] = text
+            if text.startswith(">"):
+                kinds[line] = _LINE_HEADER
+            elif text.startswith("K"):
+                kinds[line] = _LINE_KO
+            else:
+                kinds[line] = _LINE_OTHER
+
+        # 2. Sample header -> sample code (-1 for empty names)
+        header_lines = np.flatnonzero(kinds == _LINE_HEADER)
+        header_codes = np.empty(len(header_lines), dtype=np.int64)
+        code_by_name: Dict[str, int] = {}
+        for position, line in enumerate(header_lines.tolist()):
+            if line in special_text:
+                name = special_text[line][1:].strip()
+            else:
+                name = data[first[line] + 1 : last[line] + 1].decode("utf-8").strip()
+            header_codes[position] = (
+                code_by_name.setdefault(name, len(code_by_name)) if name else -1
+            )
+
+        # 3. KO lines under a named sample
+        if not len(header_lines):
+            return empty
+        ko_lines = np.flatnonzero(kinds == _LINE_KO).astype(np.int32)
+        header_position = np.searchsorted(header_lines, ko_lines, side="right") - 1
+        line_samples = np.where(
+            header_position >= 0, header_codes[np.maximum(header_position, 0)], -1
+        ).astype(np.int32)
+        del header_position
+        keep = line_samples >= 0
+        ko_lines = ko_lines[keep]
+        line_samples = line_samples[keep]
+        del keep
+        self._check_total(len(ko_lines))
+        if not len(ko_lines):
+            return empty
+
+        # 4. Factorize KO tokens
+        ko_first = first[ko_lines]
+        lengths = last[ko_lines] - ko_first + 1
+        slow = special_mask[ko_lines] | (lengths > self.MAX_TOKEN_WIDTH)
+        fast = np.flatnonzero(~slow)
+
+        line_kos = np.empty(len(ko_lines), dtype=np.int32)
+        line_kos[fast], ko_ids = self._factorize_tokens(
+            buf, ko_first[fast], lengths[fast]
+        )
+        del ko_first, lengths, fast
+
+        slow_lines = np.flatnonzero(slow)
+        if len(slow_lines):
+            code_by_ko = {ko: code for code, ko in enumerate(ko_ids)}
+            for row in slow_lines.tolist():
+                line = int(ko_lines[row])
+                token = special_text.get(line)
+                if token is None:
+                    token = data[first[line] : last[line] + 1].decode("utf-8")
+                code = code_by_ko.setdefault(token, len(code_by_ko))
+                if code == len(ko_ids):
+                    ko_ids.append(token)
+                line_kos[row] = code
+
+        # 5. Deduplicate (Sample, KO) pairs, keeping first occurrences
+        pair_keys = line_samples.astype(np.int64) * len(ko_ids) + line_kos
+        first_rows = self._factorize(pair_keys)[2]
+        del pair_keys
+        first_rows.sort()
+        pair_samples = line_samples[first_rows]
+        pair_kos = line_kos[first_rows]
+
+        # Number samples by their first row so unused headers drop out
+        used_samples, first_seen = np.unique(pair_samples, return_index=True)
+        row_order = used_samples[np.argsort(first_seen, kind="stable")]
+        remap = np.full(len(code_by_name), -1, dtype=np.int32)
+        remap[row_order] = np.arange(len(row_order))
+        names = list(code_by_name)
+        sample_names = [names[code] for code in row_order.tolist()]
+        self._check_samples(len(sample_names))
+
+        sample_codes = remap[pair_samples]
+        self._check_per_sample(sample_codes, sample_names)
+
+        return ParsedUpload(
+            sample_codes=sample_codes,
+            ko_codes=pair_kos,
+            sample_names=sample_names,
+            ko_ids=ko_ids,
+            ko_lines=len(ko_lines),
+        )
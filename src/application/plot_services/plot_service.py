@@ -15,6 +15,11 @@ Implements Facade Pattern, providing simple interface while managing:
 - Strategy creation
 - Multi-layer caching
 - Error handling
+
+Two cache layers of the YAML ``performance.cache`` section are served here:
+``graph`` holds finished figures per data and filter state, ``dataframe``
+holds the output of ``process_data`` per data and strategy configuration, so
+a filter change only re-runs filtering and figure construction.
 """
 
 import hashlib
@@ -26,11 +31,20 @@ from typing import Any, Dict, Optional, Tuple
 import pandas as pd
 import plotly.graph_objects as go
 
+from config.settings import get_settings
 from src.application.plot_services.plot_config_loader import PlotConfigLoader
 from src.application.plot_services.plot_factory import PlotFactory
-from src.infrastructure.cache import GraphCacheManager
+from src.infrastructure.cache import DataFrameCache, GraphCacheManager
+from src.shared.dataframe_fingerprint import fingerprint_dataframe
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# The byte budget bounds figure memory; the entry count is only a backstop
+GRAPH_CACHE_MAX_ENTRIES = 1000
+PROCESSED_DATA_CACHE_MAX_ENTRIES = 500
+# Processing runs before filtering, so processed frames never depend on them
+PROCESSED_FILTERS_HASH = "no_filters"
 
 
 class PlotService:
@@ -54,6 +68,8 @@ class PlotService:
         Plot factory instance.
     cache_manager : GraphCacheManager
         Cache manager instance.
+    dataframe_cache : DataFrameCache
+        Per-worker cache of processed data (``dataframe`` layer).
 
     Examples
     --------
@@ -69,7 +85,14 @@ class PlotService:
         """Initialize plot service with dependencies."""
         self.config_loader = PlotConfigLoader()
         self.factory = PlotFactory()
-        self.cache_manager = GraphCacheManager()
+        self.cache_manager = GraphCacheManager(
+            max_size=GRAPH_CACHE_MAX_ENTRIES,
+            max_bytes=settings.GRAPH_CACHE_MEMORY_MB * 1024 * 1024,
+        )
+        self.dataframe_cache = DataFrameCache(
+            max_size=PROCESSED_DATA_CACHE_MAX_ENTRIES,
+            max_bytes=settings.PROCESSED_DATA_CACHE_MB * 1024 * 1024,
+        )
         logger.info("PlotService initialized")
 
     def generate_plot(
@@ -79,7 +102,8 @@ class PlotService:
         filters: Optional[Dict[str, Any]] = None,
         customizations: Optional[Any] = None,
         force_refresh: bool = False,
-    ) -> go.Figure:
+        serialized: bool = False,
+    ) -> go.Figure | Dict[str, Any]:
         """
         Generate plot for given use case with caching.
 
@@ -87,9 +111,10 @@ class PlotService:
         1. Load configuration from YAML
         2. Generate cache keys
         3. Check graph cache
-        4. If miss: Create strategy and generate plot
-        5. Cache result
-        6. Return figure
+        4. If miss: Create strategy and process data (reusing the
+           ``dataframe`` layer when configured)
+        5. Filter processed data and build the figure
+        6. Cache result and return figure
 
         Parameters
         ----------
@@ -103,11 +128,15 @@ class PlotService:
             Additional customizations (future feature).
         force_refresh : bool, default=False
             Force cache refresh.
+        serialized : bool, default=False
+            Return graph cache hits as the cached figure JSON decoded to a
+            plain dict, skipping ``go.Figure`` reconstruction. Only for
+            callers that pass the result straight to ``dcc.Graph``.
 
         Returns
         -------
-        go.Figure
-            Generated Plotly figure.
+        go.Figure | Dict[str, Any]
+            Generated Plotly figure (a figure dict on serialized cache hits).
 
         Raises
         ------
@@ -137,11 +166,19 @@ class PlotService:
 
         # Generate cache key (needed for both checking and storing)
         graph_cache_key = self._get_cache_key(config, "graph", data_hash, filters_hash)
+        ttl = self._get_cache_ttl(cache_config, "graph")
 
         # 3. Check if caching is enabled
         if cache_config.get("enabled", True) and not force_refresh:
             # Check graph cache (fastest)
-            cached_figure = self.cache_manager.get_cached_graph(graph_cache_key)
+            if serialized:
+                cached_figure = self.cache_manager.get_serialized_graph(
+                    graph_cache_key, ttl=ttl
+                )
+            else:
+                cached_figure = self.cache_manager.get_cached_graph(
+                    graph_cache_key, ttl=ttl
+                )
             if cached_figure:
                 cache_time = time.time() - start_time
                 logger.info(
@@ -156,18 +193,28 @@ class PlotService:
 
         # 5. Generate plot (includes validation, processing, filtering)
         try:
-            figure = strategy.generate_plot(
-                data, filters=filters, customizations=customizations
-            )
+            if self._uses_processed_cache(strategy, cache_config):
+                processed_df = self._get_processed_data(
+                    use_case_id,
+                    strategy,
+                    config,
+                    data,
+                    data_hash,
+                    force_refresh=force_refresh,
+                )
+                figure = strategy.render_figure(
+                    processed_df, filters=filters, customizations=customizations
+                )
+            else:
+                figure = strategy.generate_plot(
+                    data, filters=filters, customizations=customizations
+                )
 
             # 6. Cache the figure
             if cache_config.get("enabled", True):
-                ttl = self._get_cache_ttl(cache_config, "graph")
-                # Note: ttl is not used by current GraphCacheManager
-                # (it uses global TTL), but we pass metadata
                 metadata = {"use_case_id": use_case_id, "filters": filters, "ttl": ttl}
                 self.cache_manager.cache_graph(
-                    graph_cache_key, figure, metadata=metadata
+                    graph_cache_key, figure, metadata=metadata, ttl=ttl
                 )
                 logger.debug(f"Cached graph for {use_case_id} (TTL: {ttl}s)")
 
@@ -180,9 +227,87 @@ class PlotService:
             logger.error(f"Error generating plot for {use_case_id}: {e}", exc_info=True)
             raise
 
+    def _uses_processed_cache(
+        self, strategy: Any, cache_config: Dict[str, Any]
+    ) -> bool:
+        """
+        Check whether processed data of this plot goes through the cache.
+
+        Requires caching to be enabled, a ``dataframe`` layer in the config
+        and a strategy whose processed data can be reused.
+        """
+        if not cache_config.get("enabled", True):
+            return False
+        if not getattr(strategy, "cache_processed_data", False):
+            return False
+        layers = cache_config.get("layers", [])
+        return any(layer_def.get("layer") == "dataframe" for layer_def in layers)
+
+    def _get_processed_data(
+        self,
+        use_case_id: str,
+        strategy: Any,
+        config: Dict[str, Any],
+        data: pd.DataFrame,
+        data_hash: str,
+        force_refresh: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Return processed data from the ``dataframe`` layer or process it.
+
+        The key combines the layer's ``key_template`` with a hash of the
+        strategy class and configuration, so editing a plot config or
+        swapping its strategy never serves stale processed data.
+
+        Parameters
+        ----------
+        use_case_id : str
+            Use case identifier.
+        strategy : BasePlotStrategy
+            Strategy that processes the data.
+        config : Dict[str, Any]
+            Use case configuration.
+        data : pd.DataFrame
+            Input data.
+        data_hash : str
+            Fingerprint of ``data``.
+        force_refresh : bool, default=False
+            Skip cache read if True.
+
+        Returns
+        -------
+        pd.DataFrame
+            Processed data (a private copy on cache hits).
+        """
+        try:
+            layer_key = self._get_cache_key(
+                config, "dataframe", data_hash, PROCESSED_FILTERS_HASH
+            )
+        except KeyError:
+            # Template expects tokens only known to custom callbacks
+            return strategy.prepare_data(data)
+
+        params_hash = self.generate_token_hash(
+            {"strategy": type(strategy).__name__, "config": config}
+        )
+        cache_key = f"{layer_key}_{params_hash}"
+
+        if not force_refresh:
+            processed_df = self.dataframe_cache.get_cached_dataframe(cache_key)
+            if processed_df is not None:
+                logger.info(f"Cache HIT (dataframe) for {use_case_id}")
+                return processed_df
+            logger.debug(f"Cache MISS (dataframe) for {use_case_id}")
+
+        processed_df = strategy.prepare_data(data)
+        cache_config = config.get("performance", {}).get("cache", {})
+        ttl = self._get_cache_ttl(cache_config, "dataframe")
+        self.dataframe_cache.cache_dataframe(cache_key, processed_df, ttl=ttl)
+        return processed_df
+
     def _generate_data_hash(self, df: pd.DataFrame) -> str:
         """
-        Generate hash from DataFrame content.
+        Generate hash from the full DataFrame content.
 
         Parameters
         ----------
@@ -192,34 +317,12 @@ class PlotService:
         Returns
         -------
         str
-            MD5 hash (16 characters).
+            Content fingerprint (16 characters).
         """
-        hash_df = df
-        # UpSet-like datasets are often built from Python sets; sort rows to
-        # stabilize hash generation across callback executions.
-        if {"category", "identifier"}.issubset(df.columns):
-            try:
-                hash_df = (
-                    df.sort_values(
-                        by=["category", "identifier"],
-                        kind="mergesort",
-                        na_position="last",
-                    )
-                    .reset_index(drop=True)
-                )
-            except Exception:
-                hash_df = df
-
-        # Create hash from shape + columns + sample of data
-        hash_components = [
-            str(hash_df.shape),
-            str(sorted(hash_df.columns.tolist())),
-            str(hash_df.head(5).values.tobytes()) if len(hash_df) > 0 else "",
-            str(hash_df.tail(5).values.tobytes()) if len(hash_df) > 5 else "",
-        ]
-
-        hash_string = "|".join(hash_components)
-        return hashlib.md5(hash_string.encode()).hexdigest()[:16]
+        # UpSet-like datasets are often built from Python sets; ignore row
+        # order so the hash is stable across callback executions.
+        ordered = not {"category", "identifier"}.issubset(df.columns)
+        return fingerprint_dataframe(df, ordered=ordered)
 
     def _generate_filters_hash(self, filters: Dict[str, Any]) -> str:
         """
@@ -418,7 +521,7 @@ class PlotService:
         if force_refresh:
             return None, cache_context
 
-        cached_figure = self.cache_manager.get_cached_graph(graph_cache_key)
+        cached_figure = self.cache_manager.get_cached_graph(graph_cache_key, ttl=ttl)
         if cached_figure is not None:
             logger.info(f"Cache HIT (graph) for {use_case_id}")
         else:
@@ -502,4 +605,5 @@ class PlotService:
             logger.info(f"Clearing cache for {use_case_id}")
         else:
             self.cache_manager.clear()
+            self.dataframe_cache.clear()
             logger.info("Cleared all plot caches")
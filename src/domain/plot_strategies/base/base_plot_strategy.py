@@ -43,6 +43,9 @@ class BasePlotStrategy(ABC):
         Visualization section from config
     validation_rules : Dict[str, Any]
         Validation rules from config
+    cache_processed_data : bool
+        Whether the output of `prepare_data()` may be cached and reused by
+        `render_figure()` on another instance (class attribute)
 
     Notes
     -----
@@ -50,8 +53,13 @@ class BasePlotStrategy(ABC):
     - `validate_data()` - Validate input data
     - `process_data()` - Process and transform data
     - `create_figure()` - Create Plotly figure
+
+    Strategies whose `process_data()` leaves state on the instance that
+    later steps read must set `cache_processed_data = False`.
     """
 
+    cache_processed_data = True
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize base strategy with configuration.
@@ -243,6 +251,33 @@ class BasePlotStrategy(ABC):
         go.Figure
             Complete Plotly figure.
 
+        Raises
+        ------
+        ValueError
+            If validation fails.
+        """
+        processed_df = self.prepare_data(data)
+        return self.render_figure(
+            processed_df, filters=filters, customizations=customizations
+        )
+
+    def prepare_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Validate and process input data (steps 1-2 of `generate_plot()`).
+
+        The result depends only on the input data and the configuration,
+        so it can be cached and reused across filter changes.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            Input data.
+
+        Returns
+        -------
+        pd.DataFrame
+            Processed data ready for `render_figure()`.
+
         Raises
         ------
         ValueError
@@ -252,8 +287,31 @@ class BasePlotStrategy(ABC):
         self.validate_data(data)
 
         # 2. Process
-        processed_df = self.process_data(data)
+        return self.process_data(data)
+
+    def render_figure(
+        self,
+        processed_df: pd.DataFrame,
+        filters: Optional[Dict[str, Any]] = None,
+        customizations: Optional[Any] = None,
+    ) -> go.Figure:
+        """
+        Filter processed data and build the figure (steps 3-5).
+
+        Parameters
+        ----------
+        processed_df : pd.DataFrame
+            Output of `prepare_data()`.
+        filters : Optional[Dict[str, Any]], default=None
+            Filters to apply.
+        customizations : Optional[Any], default=None
+            Customizations to apply.
 
+        Returns
+        -------
+        go.Figure
+            Complete Plotly figure.
+        """
         # 3. Filter
         filtered_df = self.apply_filters(processed_df, filters)
 
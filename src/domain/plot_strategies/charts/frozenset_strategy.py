@@ -93,6 +93,10 @@ class FrozensetStrategy(BasePlotStrategy):
     - Supports compound class filtering
     """
 
+    # process_data() keeps the grouped profiles and KO counts on the instance,
+    # so cached processed frames cannot be reused
+    cache_processed_data = False
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize strategy with configuration.
@@ -76,6 +76,10 @@ class PCAStrategy(BasePlotStrategy):
     - Visualizes PC1 vs PC2 with explained variance
     """
 
+    # process_data() keeps the explained variance on the instance,
+    # so cached processed frames cannot be reused
+    cache_processed_data = False
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize strategy with configuration.
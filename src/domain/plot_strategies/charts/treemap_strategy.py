@@ -78,6 +78,10 @@ class TreemapStrategy(BasePlotStrategy):
     - Color can be continuous or discrete
     """
 
+    # process_data() keeps the aggregated value column on the instance,
+    # so cached processed frames cannot be reused
+    cache_processed_data = False
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize strategy with configuration.
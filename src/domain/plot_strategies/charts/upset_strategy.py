@@ -78,6 +78,10 @@ class UpSetStrategy(BasePlotStrategy):
     - Maintains consistency with application's visualization framework
     """
 
+    # process_data() keeps the category sets on the instance,
+    # so cached processed frames cannot be reused
+    cache_processed_data = False
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize strategy with configuration.
@@ -11,14 +11,14 @@ DataFrameCache
 """
 
 import gzip
-import hashlib
 import pickle
 from typing import Optional
 
 import pandas as pd
 
+from src.shared.dataframe_fingerprint import fingerprint_dataframe
 from src.shared.logging import get_logger
-from src.shared.metrics import CACHE_ENTRY_SIZE_BYTES, CACHE_OPERATIONS_TOTAL
+from src.shared.metrics import CACHE_OPERATIONS_TOTAL
 
 from .memory_cache import MemoryCache
 
@@ -40,13 +40,15 @@ class DataFrameCache(MemoryCache):
         Gzip compression level (1-9)
     """
     CACHE_TYPE = "dataframe"
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
 
     def __init__(
         self,
         max_size: int = 50,
         default_ttl: int = 3600,
         compress_threshold: int = 1024 * 1024,  # 1 MB
-        compression_level: int = 6
+        compression_level: int = 6,
+        max_bytes: Optional[int] = None
     ):
         """
         Initialize DataFrame cache.
@@ -61,8 +63,12 @@ class DataFrameCache(MemoryCache):
             Size threshold (bytes) for compression.
         compression_level : int, default=6
             Gzip compression level (1-9).
+        max_bytes : Optional[int], default=None
+            Byte budget of cached frames (defaults to 256 MB).
         """
-        super().__init__(max_size=max_size, default_ttl=default_ttl)
+        super().__init__(
+            max_size=max_size, default_ttl=default_ttl, max_bytes=max_bytes
+        )
         self.compress_threshold = compress_threshold
         self.compression_level = compression_level
 
@@ -105,6 +111,7 @@ class DataFrameCache(MemoryCache):
                 extra={'size_mb': round(df_size / 1024**2, 2)}
             )
             cached_data = self._compress_dataframe(df)
+            cached_size = len(cached_data)
             is_compressed = True
             CACHE_OPERATIONS_TOTAL.labels(
                 cache_type=self._cache_type,
@@ -113,6 +120,7 @@ class DataFrameCache(MemoryCache):
             ).inc()
         else:
             cached_data = df.copy()
+            cached_size = int(df_size)
             is_compressed = False
             CACHE_OPERATIONS_TOTAL.labels(
                 cache_type=self._cache_type,
@@ -128,8 +136,7 @@ class DataFrameCache(MemoryCache):
             'shape': df.shape
         }
 
-        self.set(key, cache_entry, ttl=ttl)
-        CACHE_ENTRY_SIZE_BYTES.labels(cache_type=self._cache_type).observe(float(df_size))
+        self.set(key, cache_entry, ttl=ttl, size_bytes=cached_size)
 
         logger.info(
             f"Cached DataFrame: {key}",
@@ -193,24 +200,10 @@ class DataFrameCache(MemoryCache):
 
         Notes
         -----
-        - Key based on columns, shape, and sample data
+        - Key based on columns, dtypes and every value (see
+          ``fingerprint_dataframe``)
         """
-        # Create hash from DataFrame characteristics
-        hash_components = [
-            str(df.shape),
-            str(sorted(df.columns.tolist())),
-            str(df.dtypes.to_dict()),
-            # Sample first/last rows for content hash
-            (str(df.head(5).values.tobytes())
-             if len(df) > 0 else ''),
-            (str(df.tail(5).values.tobytes())
-             if len(df) > 5 else '')
-        ]
-
-        hash_string = '|'.join(hash_components)
-        hash_value = hashlib.md5(
-            hash_string.encode()
-        ).hexdigest()[:16]
+        hash_value = fingerprint_dataframe(df)
 
         if prefix:
             return f"{prefix}_{hash_value}"
@@ -0,0 +1,88 @@
+"""
+Frequency Sketch - approximate key popularity for cache admission.
+
+Count-min sketch with small saturating counters, as used by TinyLFU: every
+lookup increments the counters of its key, and all counters are halved
+after a sample period of lookups so the estimate follows recent popularity
+instead of all-time totals.
+
+Classes
+-------
+FrequencySketch
+    Approximate access counts of recently seen keys
+"""
+
+from typing import Hashable
+
+
+class FrequencySketch:
+    """
+    Count-min sketch of recent key access frequency.
+
+    Attributes
+    ----------
+    width : int
+        Counters per row (power of two)
+    """
+
+    DEPTH = 4
+    MAX_COUNT = 15
+    # Counters are halved after SAMPLE_FACTOR * width increments, counting
+    # those that find every counter of their key saturated
+    SAMPLE_FACTOR = 10
+    # Odd 64-bit multipliers, one per row; the index is taken from the high
+    # bits of the product so rows pick independent counters for a key
+    _SEEDS = (
+        0x9E3779B97F4A7C15,
+        0xC2B2AE3D27D4EB4F,
+        0x165667B19E3779F9,
+        0xD6E8FEB86659FD93,
+    )
+    _MASK64 = (1 << 64) - 1
+
+    def __init__(self, capacity: int):
+        """
+        Initialize frequency sketch.
+
+        Parameters
+        ----------
+        capacity : int
+            Expected number of cached entries.
+        """
+        width = 16
+        while width < capacity:
+            width <<= 1
+        self.width = width
+        self._shift = 64 - (width.bit_length() - 1)
+        self._rows = [[0] * width for _ in range(self.DEPTH)]
+        self._sample_size = self.SAMPLE_FACTOR * width
+        self._additions = 0
+
+    def _indexes(self, key: Hashable) -> list[int]:
+        item = hash(key) & self._MASK64
+        return [
+            (((item ^ (seed >> 7)) * seed) & self._MASK64) >> self._shift
+            for seed in self._SEEDS
+        ]
+
+    def increment(self, key: Hashable) -> None:
+        """Record one access to ``key``."""
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < self.MAX_COUNT:
+                row[index] += 1
+        # Hot keys keep the sample period moving, so their counts still age
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._age()
+
+    def frequency(self, key: Hashable) -> int:
+        """Return the estimated recent access count of ``key``."""
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+
+    def _age(self) -> None:
+        """Halve every counter so older accesses fade out."""
+        for row in self._rows:
+            for index, count in enumerate(row):
+                if count:
+                    row[index] = count >> 1
+        self._additions //= 2
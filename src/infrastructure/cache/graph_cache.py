@@ -4,6 +4,11 @@ Graph Cache - Plotly Figure Caching.
 Provides specialized caching for Plotly graph objects with JSON
 serialization for efficient storage.
 
+Figures are stored as the compact JSON that Dash sends to ``dcc.Graph``.
+``get_serialized_figure`` decodes it to a plain dict that callbacks can
+return as-is, skipping the ``go.Figure`` reconstruction (and Plotly's
+property validation) that ``get_cached_figure`` performs.
+
 Classes
 -------
 GraphCache
@@ -12,9 +17,10 @@ GraphCache
 
 import hashlib
 import json
-from typing import Optional
+from typing import Any, Optional
 
 import plotly.graph_objects as go
+from plotly.io.json import from_json_plotly, to_json_plotly
 
 from src.shared.logging import get_logger
 
@@ -36,13 +42,17 @@ class GraphCache(MemoryCache):
         Maximum number of graphs to cache
     default_ttl : int
         Default TTL in seconds
+    max_bytes : Optional[int]
+        Maximum size of all serialized figures in bytes
     """
     CACHE_TYPE = "graph"
+    DEFAULT_MAX_BYTES = 128 * 1024 * 1024
 
     def __init__(
         self,
         max_size: int = 100,
-        default_ttl: int = 1800  # 30 minutes
+        default_ttl: int = 1800,  # 30 minutes
+        max_bytes: Optional[int] = None
     ):
         """
         Initialize graph cache.
@@ -53,14 +63,38 @@ class GraphCache(MemoryCache):
             Maximum number of figures to cache.
         default_ttl : int, default=1800
             Default TTL in seconds (30 minutes).
+        max_bytes : Optional[int], default=None
+            Maximum size of all serialized figures in bytes (defaults to
+            128 MB).
         """
-        super().__init__(max_size=max_size, default_ttl=default_ttl)
+        super().__init__(
+            max_size=max_size, default_ttl=default_ttl, max_bytes=max_bytes
+        )
 
         logger.info(
             f"Initialized {self.__class__.__name__}",
-            extra={'max_size': max_size, 'default_ttl': default_ttl}
+            extra={
+                'max_size': max_size,
+                'default_ttl': default_ttl,
+                'max_bytes': self.max_bytes
+            }
         )
 
+    @staticmethod
+    def serialize_figure(figure: go.Figure) -> bytes:
+        """Serialize ``figure`` exactly as Dash does for a dcc.Graph."""
+        return to_json_plotly(figure).encode("utf-8")
+
+    @staticmethod
+    def deserialize_figure(fig_json: Any) -> dict[str, Any]:
+        """Decode a serialized figure into a plain figure dict."""
+        if isinstance(fig_json, dict):
+            return fig_json
+        if isinstance(fig_json, (bytearray, memoryview)):
+            # from_json_plotly only accepts str and bytes
+            fig_json = bytes(fig_json)
+        return from_json_plotly(fig_json)
+
     def cache_figure(
         self,
         key: str,
@@ -79,11 +113,7 @@ class GraphCache(MemoryCache):
         ttl : Optional[int], default=None
             TTL in seconds
         """
-        # Convert figure to JSON dict
-        fig_dict = figure.to_dict()
-
-        # Store JSON-serializable dict
-        self.set(key, fig_dict, ttl=ttl)
+        self.set(key, self.serialize_figure(figure), ttl=ttl)
 
         logger.info(f"Cached figure: {key}")
 
@@ -101,7 +131,7 @@ class GraphCache(MemoryCache):
         Optional[go.Figure]
             Cached figure or None if not found
         """
-        fig_dict = self.get(key)
+        fig_dict = self.get_serialized_figure(key)
 
         if fig_dict is None:
             return None
@@ -113,6 +143,29 @@ class GraphCache(MemoryCache):
 
         return figure
 
+    def get_serialized_figure(self, key: str) -> Optional[dict[str, Any]]:
+        """
+        Retrieve cached figure as a plain JSON dict.
+
+        Parameters
+        ----------
+        key : str
+            Cache key
+
+        Returns
+        -------
+        Optional[dict[str, Any]]
+            Figure dict ready for ``dcc.Graph(figure=...)``, or None if not
+            found. Callers that modify the figure should use
+            ``get_cached_figure`` instead.
+        """
+        fig_json = self.get(key)
+
+        if fig_json is None:
+            return None
+
+        return self.deserialize_figure(fig_json)
+
     def generate_figure_key(
         self,
         analysis_id: str,
@@ -4,18 +4,26 @@ Graph Cache Manager - Graph Caching Interface.
 Provides manager interface compatible with PlotService for graph caching
 operations.
 
+Figures are cached in two tiers: a byte-bounded ``GraphCache`` inside each
+worker process (L1) and, when a shared store is attached, a tier shared by
+every worker (L2, a diskcache directory or Redis behind the ResumeStore
+``get_bytes``/``set_bytes`` contract). Both tiers hold the serialized figure
+JSON with the TTL of the use case's ``graph`` cache layer, so a figure
+rendered by one worker is served from cache by all of them.
+
 Classes
 -------
 GraphCacheManager
     Manager wrapper for GraphCache with metadata support
 """
 
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 import plotly.graph_objects as go
 
 from src.infrastructure.cache.graph_cache import GraphCache
 from src.shared.logging import get_logger
+from src.shared.metrics import CACHE_OPERATIONS_TOTAL
 
 logger = get_logger(__name__)
 
@@ -30,24 +38,35 @@ class GraphCacheManager:
     Attributes
     ----------
     cache : GraphCache
-        Underlying cache instance
+        Underlying per-process cache instance
+    shared_store : Optional[Any]
+        Store shared by all workers (None when disabled)
 
     Methods
     -------
     cache_graph(key, figure, metadata, ttl)
         Cache a Plotly figure
-    get_cached_graph(key)
+    get_cached_graph(key, ttl)
         Retrieve cached Plotly figure
+    get_serialized_graph(key, ttl)
+        Retrieve cached figure as a plain JSON dict
+    attach_shared_store(store)
+        Enable the tier shared across workers
     clear()
         Clear all cached graphs
     get_stats()
         Get cache statistics
     """
 
+    SHARED_CACHE_TYPE = "graph_shared"
+    SHARED_KEY_PREFIX = "graph:v1:"
+
     def __init__(
         self,
         max_size: int = 100,
-        default_ttl: int = 3600
+        default_ttl: int = 3600,
+        max_bytes: Optional[int] = None,
+        shared_store: Optional[Any] = None
     ):
         """
         Initialize graph cache manager.
@@ -58,13 +77,85 @@ class GraphCacheManager:
             Maximum number of graphs to cache.
         default_ttl : int, default=3600
             Default TTL in seconds (1 hour).
+        max_bytes : Optional[int], default=None
+            Per-process byte budget for serialized figures.
+        shared_store : Optional[Any], default=None
+            ResumeStore-like backend shared by all workers.
         """
         self.cache = GraphCache(
             max_size=max_size,
-            default_ttl=default_ttl
+            default_ttl=default_ttl,
+            max_bytes=max_bytes
         )
+        self.shared_store = shared_store
         logger.info("GraphCacheManager initialized")
 
+    def attach_shared_store(self, store: Optional[Any]) -> None:
+        """
+        Attach the store shared by all workers (None disables the tier).
+
+        Parameters
+        ----------
+        store : Optional[Any]
+            Backend providing ``get_bytes(key)`` and
+            ``set_bytes(key, data, ttl_seconds)``.
+        """
+        self.shared_store = store
+        if store is not None:
+            logger.info(
+                "Shared graph cache attached",
+                extra={'backend': getattr(store, 'backend_name', None)}
+            )
+
+    def _count_shared(self, operation: str, outcome: str) -> None:
+        CACHE_OPERATIONS_TOTAL.labels(
+            cache_type=self.SHARED_CACHE_TYPE,
+            operation=operation,
+            outcome=outcome,
+        ).inc()
+
+    def _ttl(self, ttl: Optional[int]) -> int:
+        return int(ttl) if ttl is not None else self.cache.default_ttl
+
+    def _load(self, key: str, ttl: Optional[int]) -> Optional[Dict[str, Any]]:
+        """
+        Return the figure dict from L1, then from the shared tier.
+
+        Entries that cannot be decoded are deleted from both tiers and
+        reported as a miss, so the figure is rendered and cached again.
+        """
+        fig_json = self.cache.get(key)
+        from_shared = False
+        if fig_json is None:
+            if self.shared_store is None:
+                return None
+            fig_json = self.shared_store.get_bytes(self.SHARED_KEY_PREFIX + key)
+            if fig_json is None:
+                self._count_shared("get", "miss")
+                return None
+            fig_json = bytes(fig_json)
+            from_shared = True
+
+        try:
+            fig_dict = GraphCache.deserialize_figure(fig_json)
+        except (TypeError, ValueError):
+            logger.warning(
+                "Discarding unreadable cached graph",
+                extra={'from_shared': from_shared},
+            )
+            self.cache.delete(key)
+            if self.shared_store is not None:
+                self.shared_store.delete(self.SHARED_KEY_PREFIX + key)
+            if from_shared:
+                self._count_shared("get", "corrupt")
+            return None
+
+        if from_shared:
+            self._count_shared("get", "hit")
+            # Promote, so later hits in this worker skip the shared tier
+            self.cache.set(key, fig_json, ttl=self._ttl(ttl))
+        return fig_dict
+
     def cache_graph(
         self,
         key: str,
@@ -86,12 +177,23 @@ class GraphCacheManager:
         ttl : Optional[int], default=None
             TTL in seconds (if None, uses default)
         """
-        self.cache.cache_figure(key, figure, ttl=ttl)
+        fig_json = GraphCache.serialize_figure(figure)
+        self.cache.set(key, fig_json, ttl=ttl)
+
+        if self.shared_store is not None:
+            stored = self.shared_store.set_bytes(
+                self.SHARED_KEY_PREFIX + key,
+                fig_json,
+                ttl_seconds=self._ttl(ttl),
+            )
+            self._count_shared("set", "ok" if stored else "error")
 
         if metadata:
             logger.debug(f"Cached graph with metadata: {metadata}")
 
-    def get_cached_graph(self, key: str) -> Optional[go.Figure]:
+    def get_cached_graph(
+        self, key: str, ttl: Optional[int] = None
+    ) -> Optional[go.Figure]:
         """
         Retrieve cached Plotly figure.
 
@@ -99,16 +201,41 @@ class GraphCacheManager:
         ----------
         key : str
             Cache key
+        ttl : Optional[int], default=None
+            TTL for an entry promoted from the shared tier
 
         Returns
         -------
         Optional[go.Figure]
             Cached figure or None if not found
         """
-        return self.cache.get_cached_figure(key)
+        fig_dict = self._load(key, ttl)
+        if fig_dict is None:
+            return None
+        return go.Figure(fig_dict)
+
+    def get_serialized_graph(
+        self, key: str, ttl: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve cached figure without rebuilding a ``go.Figure``.
+
+        Parameters
+        ----------
+        key : str
+            Cache key
+        ttl : Optional[int], default=None
+            TTL for an entry promoted from the shared tier
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Figure dict for ``dcc.Graph`` or None if not found
+        """
+        return self._load(key, ttl)
 
     def clear(self) -> None:
-        """Clear all cached graphs."""
+        """Clear all cached graphs of this worker."""
         self.cache.clear()
         logger.info("All cached graphs cleared")
 
@@ -121,4 +248,6 @@ class GraphCacheManager:
         dict
             Statistics including size, max_size, etc.
         """
-        return self.cache.get_stats()
+        stats = self.cache.get_stats()
+        stats['shared_backend'] = getattr(self.shared_store, 'backend_name', None)
+        return stats
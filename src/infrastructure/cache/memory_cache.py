@@ -2,7 +2,17 @@
 Memory Cache - LRU Cache Implementation.
 
 Provides Least Recently Used (LRU) cache with TTL support for
-general-purpose caching.
+general-purpose caching. An optional byte budget bounds the estimated size
+of the stored values in addition to the entry count.
+
+With a byte budget the cache is size-aware (W-TinyLFU): new entries small
+enough for the admission window (``WINDOW_FRACTION`` of the budgets) are
+always stored there first. Entries leaving the window once it or the cache
+is full, and new entries too large for it, are only kept when their recent
+access frequency (TinyLFU sketch) reaches that of every least recently used
+entry they would evict. One large, rarely used value cannot flush hot ones,
+while a large value that keeps being requested is admitted once its count
+catches up. Each cache type has its own default budget (``DEFAULT_MAX_BYTES``).
 
 Classes
 -------
@@ -19,9 +29,12 @@ from src.shared.metrics import (
     CACHE_ENTRY_SIZE_BYTES,
     CACHE_HIT_RATIO,
     CACHE_OPERATIONS_TOTAL,
+    CACHE_SIZE_BYTES,
     CACHE_SIZE_ITEMS,
 )
 
+from .frequency_sketch import FrequencySketch
+
 logger = get_logger(__name__)
 
 
@@ -38,6 +51,9 @@ class MemoryCache:
         Maximum number of entries in cache
     default_ttl : int
         Default TTL in seconds (0 = no expiration)
+    max_bytes : Optional[int]
+        Maximum estimated size of all values in bytes (None = unbounded,
+        plain LRU)
     _cache : OrderedDict
         Ordered dictionary storing cached values
     _expiry : dict[str, Optional[datetime]]
@@ -61,11 +77,16 @@ class MemoryCache:
         Get cache statistics
     """
     CACHE_TYPE = "memory"
+    # Byte budget used when none is passed (None = unbounded)
+    DEFAULT_MAX_BYTES: Optional[int] = None
+    # Share of the entry and byte budgets for the admission window
+    WINDOW_FRACTION = 0.01
 
     def __init__(
         self,
         max_size: int = 1000,
-        default_ttl: int = 0
+        default_ttl: int = 0,
+        max_bytes: Optional[int] = None
     ):
         """
         Initialize memory cache.
@@ -76,11 +97,30 @@ class MemoryCache:
             Maximum number of cache entries.
         default_ttl : int, default=0
             Default TTL in seconds (0 = no expiration).
+        max_bytes : Optional[int], default=None
+            Maximum estimated size of all values in bytes (defaults to
+            ``DEFAULT_MAX_BYTES``). Enables size-aware admission; larger
+            values are not cached.
         """
         self.max_size = max_size
         self.default_ttl = default_ttl
+        self.max_bytes = (
+            max_bytes if max_bytes is not None else self.DEFAULT_MAX_BYTES
+        )
+        self._sketch = FrequencySketch(max_size)
+        # Admission window: sizes of its entries, least recently used first
+        self._window: OrderedDict = OrderedDict()
+        self._window_bytes = 0
+        if self.max_bytes is None:
+            self._window_max_size = 0
+            self._window_max_bytes = 0
+        else:
+            self._window_max_size = int(max_size * self.WINDOW_FRACTION)
+            self._window_max_bytes = int(self.max_bytes * self.WINDOW_FRACTION)
         self._cache: OrderedDict = OrderedDict()
         self._expiry: dict[str, Optional[datetime]] = {}
+        self._sizes: dict[str, int] = {}
+        self._total_bytes = 0
         self._cache_type = self.CACHE_TYPE
         self._hits = 0
         self._misses = 0
@@ -101,8 +141,9 @@ class MemoryCache:
         ).inc()
 
     def _emit_size_metric(self) -> None:
-        """Emit current cache item count gauge."""
+        """Emit current cache item count and byte occupancy gauges."""
         CACHE_SIZE_ITEMS.labels(cache_type=self._cache_type).set(len(self._cache))
+        CACHE_SIZE_BYTES.labels(cache_type=self._cache_type).set(self._total_bytes)
 
     def _emit_hit_ratio_metric(self) -> None:
         """Emit cache hit-ratio snapshot gauge."""
@@ -139,6 +180,8 @@ class MemoryCache:
         Optional[Any]
             Cached value or None if not found/expired
         """
+        self._sketch.increment(key)
+
         # Check if key exists
         if key not in self._cache:
             logger.debug(f"Cache miss: {key}")
@@ -158,6 +201,8 @@ class MemoryCache:
 
         # Move to end (LRU)
         self._cache.move_to_end(key)
+        if key in self._window:
+            self._window.move_to_end(key)
 
         logger.debug(f"Cache hit: {key}")
         self._hits += 1
@@ -169,7 +214,8 @@ class MemoryCache:
         self,
         key: str,
         value: Any,
-        ttl: Optional[int] = None
+        ttl: Optional[int] = None,
+        size_bytes: Optional[int] = None
     ) -> None:
         """
         Set value in cache.
@@ -182,14 +228,55 @@ class MemoryCache:
             Value to cache
         ttl : Optional[int], default=None
             TTL in seconds (if None, uses default_ttl)
+        size_bytes : Optional[int], default=None
+            Size of the value in bytes (estimated when None)
         """
-        # Enforce max size (evict oldest if necessary)
-        if key not in self._cache and len(self._cache) >= self.max_size:
-            self._evict_oldest()
+        if size_bytes is None:
+            size_bytes = int(self._estimate_value_size_bytes(value))
+        if self.max_bytes is not None and size_bytes > self.max_bytes:
+            logger.debug(
+                f"Cache set skipped: {key}",
+                extra={'size_bytes': size_bytes, 'max_bytes': self.max_bytes}
+            )
+            self._emit_operation_metric("set", "too_large")
+            # Never leave an older value behind for the key
+            self.delete(key)
+            return
+
+        # New entries that fit the admission window skip the filter for now
+        resident = key in self._cache
+        windowed = key in self._window or (
+            not resident
+            and self._window_max_size > 0
+            and size_bytes <= self._window_max_bytes
+        )
+
+        # Enforce max size and byte budget (evict oldest if necessary)
+        victims = [] if windowed else self._select_victims(key, size_bytes)
+        if victims and not resident and not self._admit(key, victims):
+            logger.debug(
+                f"Cache set rejected: {key}",
+                extra={'size_bytes': size_bytes, 'victims': len(victims)}
+            )
+            self._emit_operation_metric("admit", "rejected")
+            return
+        for victim in victims:
+            self.delete(victim)
+            logger.debug(f"Evicted oldest entry: {victim}")
+            self._emit_operation_metric("evict", "lru")
+
+        # Replaced values no longer count against the budget
+        self._total_bytes -= self._sizes.pop(key, 0)
 
         # Set value
         self._cache[key] = value
         self._cache.move_to_end(key)
+        self._sizes[key] = size_bytes
+        self._total_bytes += size_bytes
+        if windowed:
+            self._window_bytes += size_bytes - self._window.get(key, 0)
+            self._window[key] = size_bytes
+            self._window.move_to_end(key)
 
         # Set expiry
         ttl = ttl if ttl is not None else self.default_ttl
@@ -204,8 +291,10 @@ class MemoryCache:
         )
         self._emit_operation_metric("set", "ok")
         CACHE_ENTRY_SIZE_BYTES.labels(cache_type=self._cache_type).observe(
-            self._estimate_value_size_bytes(value)
+            size_bytes
         )
+        if windowed:
+            self._drain_window()
         self._emit_size_metric()
 
     def delete(self, key: str) -> bool:
@@ -225,6 +314,8 @@ class MemoryCache:
         if key in self._cache:
             del self._cache[key]
             del self._expiry[key]
+            self._total_bytes -= self._sizes.pop(key, 0)
+            self._window_bytes -= self._window.pop(key, 0)
             logger.debug(f"Cache delete: {key}")
             self._emit_operation_metric("delete", "ok")
             self._emit_size_metric()
@@ -236,6 +327,10 @@ class MemoryCache:
         count = len(self._cache)
         self._cache.clear()
         self._expiry.clear()
+        self._sizes.clear()
+        self._total_bytes = 0
+        self._window.clear()
+        self._window_bytes = 0
         logger.info(f"Cache cleared: {count} entries removed")
         self._emit_operation_metric("clear", "ok")
         self._emit_size_metric()
@@ -263,6 +358,11 @@ class MemoryCache:
 
         return True
 
+    @property
+    def total_bytes(self) -> int:
+        """Estimated size of all cached values in bytes."""
+        return self._total_bytes
+
     def size(self) -> int:
         """
         Get current cache size.
@@ -287,7 +387,9 @@ class MemoryCache:
             'current_size': len(self._cache),
             'max_size': self.max_size,
             'default_ttl': self.default_ttl,
-            'usage_percent': (len(self._cache) / self.max_size) * 100
+            'usage_percent': (len(self._cache) / self.max_size) * 100,
+            'current_bytes': self._total_bytes,
+            'max_bytes': self.max_bytes
         }
 
     def _is_expired(self, key: str) -> bool:
@@ -309,17 +411,88 @@ class MemoryCache:
             return False
         return datetime.now() > expiry
 
-    def _evict_oldest(self) -> None:
+    def _select_victims(self, key: str, size_bytes: int) -> list[str]:
+        """
+        Return least recently used keys to evict so ``key`` fits.
+
+        Entries in the admission window are never selected; they leave it
+        through :meth:`_drain_window`.
+
+        Parameters
+        ----------
+        key : str
+            Key being set or leaving the window (never selected).
+        size_bytes : int
+            Size of the new value.
+
+        Returns
+        -------
+        list[str]
+            Keys in eviction order (empty when the value already fits).
+        """
+        resident = key in self._cache
+        count = len(self._cache) + (0 if resident else 1)
+        total = self._total_bytes - self._sizes.get(key, 0) + size_bytes
+        victims = []
+        for cached_key in self._cache:
+            over_count = count > self.max_size
+            over_bytes = self.max_bytes is not None and total > self.max_bytes
+            if not (over_count or over_bytes):
+                break
+            if cached_key == key or cached_key in self._window:
+                continue
+            victims.append(cached_key)
+            count -= 1
+            total -= self._sizes.get(cached_key, 0)
+        return victims
+
+    def _drain_window(self) -> None:
         """
-        Evict oldest (least recently used) entry.
+        Move the oldest window entries out while the window or cache is full.
 
-        Notes
-        -----
-        This is called automatically when cache is full and a new
-        entry is being added.
+        Each entry leaving the window that needs room must pass
+        :meth:`_admit` against the entries outside the window it would
+        evict, or it is dropped.
         """
-        if self._cache:
-            oldest_key = next(iter(self._cache))
-            self.delete(oldest_key)
-            logger.debug(f"Evicted oldest entry: {oldest_key}")
-            self._emit_operation_metric("evict", "lru")
+        while self._window and (
+            len(self._window) > self._window_max_size
+            or self._window_bytes > self._window_max_bytes
+            or len(self._cache) > self.max_size
+            or self._total_bytes > self.max_bytes
+        ):
+            candidate, size_bytes = self._window.popitem(last=False)
+            self._window_bytes -= size_bytes
+            victims = self._select_victims(candidate, size_bytes)
+            if victims and not self._admit(candidate, victims):
+                logger.debug(
+                    f"Cache window entry rejected: {candidate}",
+                    extra={'size_bytes': size_bytes, 'victims': len(victims)}
+                )
+                self._emit_operation_metric("admit", "rejected")
+                self.delete(candidate)
+                continue
+            for victim in victims:
+                self.delete(victim)
+                logger.debug(f"Evicted oldest entry: {victim}")
+                self._emit_operation_metric("evict", "lru")
+
+    def _admit(self, key: str, victims: list[str]) -> bool:
+        """
+        Decide whether ``key`` may evict ``victims`` (TinyLFU).
+
+        Without a byte budget every key is admitted (plain LRU). Otherwise
+        the key's recent frequency must reach that of the most frequently
+        used unexpired victim. Counters saturate, so a key that keeps being
+        requested is eventually admitted however many victims it needs.
+        """
+        if self.max_bytes is None:
+            return True
+        victim_frequency = max(
+            (
+                self._sketch.frequency(victim)
+                for victim in victims
+                if not self._is_expired(victim)
+            ),
+            default=0,
+        )
+        return self._sketch.frequency(key) >= victim_frequency
@@ -16,12 +16,21 @@ HADEGRepository
     Repository for HADEG enzyme database
 ToxCSMRepository
     Repository for ToxCSM toxicity prediction database
+DatabaseSnapshotStore
+    Checksum-keyed columnar snapshots memory-mapped instead of CSV parsing
+KORowIndex
+    Precomputed KO row ranges for gather-based KO joins
+ReferenceVocabulary
+    Shared categorical dtypes for identifier columns across databases
 """
 
 from .biorempp_repository import BioRemPPRepository
 from .csv_database_repository import CSVDatabaseRepository
+from .database_snapshot import DatabaseSnapshotStore
 from .hadeg_repository import HADEGRepository
 from .kegg_repository import KEGGRepository
+from .ko_index import KORowIndex
+from .reference_vocabulary import ReferenceVocabulary
 from .toxcsm_repository import ToxCSMRepository
 
 __all__ = [
@@ -30,4 +39,7 @@ __all__ = [
     "KEGGRepository",
     "HADEGRepository",
     "ToxCSMRepository",
+    "DatabaseSnapshotStore",
+    "KORowIndex",
+    "ReferenceVocabulary",
 ]
@@ -15,6 +15,7 @@ from typing import Optional
 
 import pandas as pd
 
+from src.infrastructure.persistence.database_snapshot import DatabaseSnapshotStore
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -67,6 +68,7 @@ class CSVDatabaseRepository:
         encoding: str = "utf-8",
         separator: str = ";",
         required_columns: Optional[list[str]] = None,
+        use_snapshots: bool = True,
     ):
         """
         Initialize CSV database repository.
@@ -81,11 +83,15 @@ class CSVDatabaseRepository:
             CSV separator.
         required_columns : Optional[list[str]], default=None
             List of required column names for validation.
+        use_snapshots : bool, default=True
+            Memory-map the checksum-keyed columnar snapshot of the CSV when
+            one is available instead of parsing the file.
         """
         self.filepath = filepath
         self.encoding = encoding
         self.separator = separator
         self.required_columns = required_columns or []
+        self.use_snapshots = use_snapshots
         self._data: Optional[pd.DataFrame] = None
 
         logger.info(
@@ -129,8 +135,15 @@ class CSVDatabaseRepository:
             raise FileNotFoundError(error_msg)
 
         try:
-            # Load CSV
-            df = pd.read_csv(self.filepath, encoding=self.encoding, sep=self.separator)
+            # Load snapshot (falls back to CSV parsing)
+            if self.use_snapshots:
+                df = DatabaseSnapshotStore(Path(self.filepath).parent).load_or_build(
+                    self.filepath, separator=self.separator, encoding=self.encoding
+                )
+            else:
+                df = pd.read_csv(
+                    self.filepath, encoding=self.encoding, sep=self.separator
+                )
 
             # Validate schema
             if not self.validate_schema(df):
@@ -0,0 +1,501 @@
+"""
+Database Snapshot - Columnar Binary Snapshots of Reference CSV Databases.
+
+Converts each reference CSV database into a columnar, dictionary-encoded
+snapshot that worker processes memory-map at startup instead of re-parsing
+text. Snapshots are keyed to the SHA256 entries of ``checksums.sha256`` so a
+snapshot built for a different database release is never used.
+
+Snapshot layout (one file per database and checksum)::
+
+    <database_dir>/.snapshots/<stem>-<checksum[:16]>.snap
+
+    8 bytes   magic ``BRPSNAP1``
+    8 bytes   header length (little-endian uint64)
+    N bytes   JSON header: column order, dtypes, string dictionaries,
+              buffer offsets and source fingerprint
+    ...       64-byte aligned column buffers (integer codes for
+              dictionary-encoded columns, raw values for numeric columns)
+
+Classes
+-------
+DatabaseSnapshotStore
+    Build, validate and memory-map columnar database snapshots
+
+Functions
+---------
+read_checksum_manifest(database_dir)
+    Parse ``checksums.sha256`` into a filename -> digest mapping
+build_database_snapshots(database_dir)
+    Build snapshots for every CSV listed in the checksum manifest
+
+Notes
+-----
+Run the build step once per release (the production image runs it at build
+time)::
+
+    python -m src.infrastructure.persistence.database_snapshot
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_MAGIC = b"BRPSNAP1"
+SNAPSHOT_SUFFIX = ".snap"
+CHECKSUM_MANIFEST_NAME = "checksums.sha256"
+SNAPSHOT_DIR_NAME = ".snapshots"
+_BUFFER_ALIGNMENT = 64
+_PREAMBLE = struct.Struct("<8sQ")
+
+
+def compute_file_sha256(path: Path) -> str:
+    """Compute SHA256 digest of a file."""
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_checksum_manifest(database_dir: Path) -> Dict[str, str]:
+    """
+    Parse ``checksums.sha256`` (``sha256sum`` format) into a mapping.
+
+    Parameters
+    ----------
+    database_dir : Path
+        Directory containing the CSV databases and checksum manifest.
+
+    Returns
+    -------
+    Dict[str, str]
+        Mapping of CSV filename to lowercase SHA256 digest. Empty when the
+        manifest is missing or unreadable.
+    """
+    manifest_path = Path(database_dir) / CHECKSUM_MANIFEST_NAME
+    if not manifest_path.exists():
+        return {}
+
+    try:
+        lines = manifest_path.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        logger.warning(f"Unable to read checksum manifest: {manifest_path}")
+        return {}
+
+    checksums: Dict[str, str] = {}
+    for line in lines:
+        parts = line.strip().split(None, 1)
+        if len(parts) != 2:
+            continue
+        digest, filename = parts
+        filename = filename.strip().lstrip("*")
+        if len(digest) == 64 and filename:
+            checksums[Path(filename).name] = digest.lower()
+    return checksums
+
+
+def _aligned(offset: int) -> int:
+    remainder = offset % _BUFFER_ALIGNMENT
+    return offset if remainder == 0 else offset + _BUFFER_ALIGNMENT - remainder
+
+
+class DatabaseSnapshotStore:
+    """
+    Columnar snapshot store for one database directory.
+
+    String columns are dictionary-encoded (integer codes plus a string
+    dictionary) and numeric columns are stored as raw arrays. Loaded frames
+    expose string columns as ``category`` dtype whose codes, like numeric
+    columns, are read-only views over a single memory-mapped file, so pages
+    are shared between processes through the OS page cache. Dictionary
+    strings are interned, so every table and column draws from one
+    process-wide string pool; with Gunicorn ``preload_app`` that pool is
+    built once in the master and inherited by the workers.
+
+    Attributes
+    ----------
+    database_dir : Path
+        Directory containing the CSV databases and ``checksums.sha256``
+    snapshot_dir : Path
+        Root directory for snapshot files
+
+    Methods
+    -------
+    load(csv_path)
+        Memory-map a current snapshot for ``csv_path`` (None when unavailable)
+    build(csv_path, df)
+        Write a snapshot for ``csv_path`` keyed to its manifest checksum
+    load_or_build(csv_path, separator, encoding)
+        Load the snapshot, or parse the CSV and write a fresh snapshot
+    """
+
+    def __init__(self, database_dir: Path, snapshot_dir: Optional[Path] = None):
+        """
+        Initialize snapshot store.
+
+        Parameters
+        ----------
+        database_dir : Path
+            Directory containing the CSV databases.
+        snapshot_dir : Optional[Path], default=None
+            Snapshot root. Defaults to ``<database_dir>/.snapshots``.
+        """
+        self.database_dir = Path(database_dir)
+        self.snapshot_dir = (
+            Path(snapshot_dir)
+            if snapshot_dir is not None
+            else self.database_dir / SNAPSHOT_DIR_NAME
+        )
+        self._checksums = read_checksum_manifest(self.database_dir)
+
+    def expected_checksum(self, csv_path: Path) -> Optional[str]:
+        """Return the manifest checksum for ``csv_path`` (None if unlisted)."""
+        return self._checksums.get(Path(csv_path).name)
+
+    def snapshot_path(self, csv_path: Path) -> Optional[Path]:
+        """Return snapshot file for ``csv_path`` keyed to its checksum."""
+        checksum = self.expected_checksum(csv_path)
+        if checksum is None:
+            return None
+        return self.snapshot_dir / (
+            f"{Path(csv_path).stem}-{checksum[:16]}{SNAPSHOT_SUFFIX}"
+        )
+
+    @staticmethod
+    def _source_fingerprint(csv_path: Path) -> Dict[str, int]:
+        stat = Path(csv_path).stat()
+        return {"size": int(stat.st_size), "mtime_ns": int(stat.st_mtime_ns)}
+
+    def _is_current(self, header: Dict[str, Any], csv_path: Path) -> bool:
+        """Check snapshot header against the checksum entry and the CSV."""
+        if header.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            return False
+        if header.get("source_checksum") != self.expected_checksum(csv_path):
+            return False
+
+        if self._source_fingerprint(csv_path) == header.get("source_fingerprint"):
+            return True
+        # File metadata changed (fresh checkout, image copy): confirm content.
+        return compute_file_sha256(csv_path) == header.get("source_content_sha256")
+
+    @staticmethod
+    def _read_header(buffer: mmap.mmap) -> Dict[str, Any]:
+        magic, header_length = _PREAMBLE.unpack_from(buffer, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Invalid snapshot magic")
+        start = _PREAMBLE.size
+        return json.loads(buffer[start : start + header_length].decode("utf-8"))
+
+    def load(self, csv_path: Path) -> Optional[pd.DataFrame]:
+        """
+        Memory-map snapshot for ``csv_path``.
+
+        Parameters
+        ----------
+        csv_path : Path
+            Source CSV database path.
+
+        Returns
+        -------
+        Optional[pd.DataFrame]
+            Snapshot-backed DataFrame, or None when no current snapshot exists.
+        """
+        snapshot_path = self.snapshot_path(csv_path)
+        if snapshot_path is None or not snapshot_path.exists():
+            return None
+
+        try:
+            with snapshot_path.open("rb") as fh:
+                buffer = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            header = self._read_header(buffer)
+            if not self._is_current(header, csv_path):
+                logger.warning(
+                    f"Ignoring stale database snapshot for {Path(csv_path).name}"
+                )
+                buffer.close()
+                return None
+
+            rows = int(header["rows"])
+            columns: Dict[str, Any] = {}
+            for spec in header["columns"]:
+                values = np.frombuffer(
+                    buffer,
+                    dtype=np.dtype(spec["buffer_dtype"]),
+                    count=rows,
+                    offset=int(spec["offset"]),
+                )
+                if spec["kind"] == "dictionary":
+                    columns[spec["name"]] = pd.Categorical.from_codes(
+                        values,
+                        dtype=pd.CategoricalDtype(
+                            pd.Index(
+                                [sys.intern(v) for v in spec["categories"]],
+                                dtype=object,
+                            ),
+                            ordered=False,
+                        ),
+                    )
+                else:
+                    columns[spec["name"]] = values
+
+            df = pd.DataFrame(columns, copy=False)
+        except Exception as exc:
+            logger.warning(
+                f"Failed to load database snapshot for {Path(csv_path).name}: {exc}"
+            )
+            return None
+
+        logger.debug(
+            f"Loaded database snapshot: {snapshot_path.name}",
+            extra={"rows": len(df), "columns": len(df.columns)},
+        )
+        return df
+
+    @staticmethod
+    def _encode_column(series: pd.Series) -> Optional[Dict[str, Any]]:
+        """Encode one column; None when the dtype is not supported."""
+        if series.dtype == object:
+            categorical = pd.Categorical(series)
+            categories = categorical.categories.tolist()
+            if not all(isinstance(value, str) for value in categories):
+                return None
+            return {
+                "kind": "dictionary",
+                "categories": categories,
+                "buffer": np.ascontiguousarray(categorical.codes),
+            }
+        if series.dtype.kind in "biuf":
+            return {
+                "kind": "values",
+                "buffer": np.ascontiguousarray(series.to_numpy()),
+            }
+        return None
+
+    def build(self, csv_path: Path, df: pd.DataFrame) -> Optional[Path]:
+        """
+        Write snapshot for ``csv_path`` from its parsed DataFrame.
+
+        Parameters
+        ----------
+        csv_path : Path
+            Source CSV database path (must be listed in the checksum manifest).
+        df : pd.DataFrame
+            Parsed CSV content.
+
+        Returns
+        -------
+        Optional[Path]
+            Snapshot file, or None when the CSV is not listed in the checksum
+            manifest or a column cannot be encoded.
+        """
+        snapshot_path = self.snapshot_path(csv_path)
+        if snapshot_path is None:
+            return None
+
+        column_specs: List[Dict[str, Any]] = []
+        buffers: List[np.ndarray] = []
+        for name in df.columns:
+            encoded = self._encode_column(df[name])
+            if encoded is None:
+                logger.warning(
+                    f"Snapshot skipped for {Path(csv_path).name}: "
+                    f"unsupported column '{name}' ({df[name].dtype})"
+                )
+                return None
+            buffer = encoded.pop("buffer")
+            buffers.append(buffer)
+            column_specs.append(
+                {
+                    "name": str(name),
+                    "dtype": str(df[name].dtype),
+                    "buffer_dtype": buffer.dtype.str,
+                    **encoded,
+                }
+            )
+
+        header: Dict[str, Any] = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "source_file": Path(csv_path).name,
+            "source_checksum": self.expected_checksum(csv_path),
+            "source_content_sha256": compute_file_sha256(csv_path),
+            "source_fingerprint": self._source_fingerprint(csv_path),
+            "rows": int(len(df)),
+            "columns": column_specs,
+        }
+
+        # Buffer offsets depend on the header length, which depends on the
+        # offsets: reserve generous padding and settle in two passes.
+        header_bytes = b""
+        for _ in range(2):
+            offset = _aligned(_PREAMBLE.size + len(header_bytes) + 256)
+            for spec, buffer in zip(column_specs, buffers):
+                spec["offset"] = offset
+                offset = _aligned(offset + buffer.nbytes)
+            header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+        if column_specs and (
+            _PREAMBLE.size + len(header_bytes) > column_specs[0]["offset"]
+        ):
+            raise ValueError("Snapshot header exceeds reserved space")
+
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = snapshot_path.with_name(
+            f".{snapshot_path.name}.{uuid.uuid4().hex[:8]}.tmp"
+        )
+        try:
+            with tmp_path.open("wb") as fh:
+                fh.write(_PREAMBLE.pack(SNAPSHOT_MAGIC, len(header_bytes)))
+                fh.write(header_bytes)
+                for spec, buffer in zip(column_specs, buffers):
+                    fh.write(b"\0" * (spec["offset"] - fh.tell()))
+                    fh.write(buffer.tobytes())
+            os.replace(tmp_path, snapshot_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        self._remove_superseded(csv_path, keep=snapshot_path)
+        logger.info(
+            f"Built database snapshot: {snapshot_path.name}",
+            extra={"rows": len(df), "columns": len(df.columns)},
+        )
+        return snapshot_path
+
+    def _remove_superseded(self, csv_path: Path, keep: Path) -> None:
+        """Delete snapshots of the same database keyed to other checksums."""
+        pattern = f"{Path(csv_path).stem}-*{SNAPSHOT_SUFFIX}"
+        for candidate in self.snapshot_dir.glob(pattern):
+            if candidate != keep:
+                candidate.unlink(missing_ok=True)
+
+    def load_or_build(
+        self,
+        csv_path: Path,
+        separator: str = ";",
+        encoding: str = "utf-8",
+    ) -> pd.DataFrame:
+        """
+        Load current snapshot, falling back to CSV parsing.
+
+        When the CSV had to be parsed, a snapshot is written on a best-effort
+        basis so the next process start can memory-map it.
+
+        Parameters
+        ----------
+        csv_path : Path
+            Source CSV database path.
+        separator : str, default=';'
+            CSV separator.
+        encoding : str, default='utf-8'
+            File encoding.
+
+        Returns
+        -------
+        pd.DataFrame
+            Database content.
+        """
+        df = self.load(csv_path)
+        if df is not None:
+            return df
+
+        parsed = pd.read_csv(csv_path, sep=separator, encoding=encoding)
+        if self.snapshot_path(csv_path) is None:
+            return parsed
+
+        try:
+            if self.build(csv_path, parsed) is not None:
+                snapshot_df = self.load(csv_path)
+                if snapshot_df is not None:
+                    return snapshot_df
+        except OSError as exc:
+            logger.warning(
+                f"Unable to write database snapshot for {Path(csv_path).name}: "
+                f"{exc}"
+            )
+        return parsed
+
+
+def build_database_snapshots(
+    database_dir: Path,
+    snapshot_dir: Optional[Path] = None,
+    separator: str = ";",
+    encoding: str = "utf-8",
+) -> Dict[str, Optional[Path]]:
+    """
+    Build snapshots for every CSV listed in ``checksums.sha256``.
+
+    Parameters
+    ----------
+    database_dir : Path
+        Directory containing the CSV databases.
+    snapshot_dir : Optional[Path], default=None
+        Snapshot root. Defaults to ``<database_dir>/.snapshots``.
+    separator : str, default=';'
+        CSV separator.
+    encoding : str, default='utf-8'
+        File encoding.
+
+    Returns
+    -------
+    Dict[str, Optional[Path]]
+        Mapping of CSV filename to the snapshot file written (None when the
+        CSV is missing or could not be encoded).
+    """
+    store = DatabaseSnapshotStore(database_dir, snapshot_dir=snapshot_dir)
+    results: Dict[str, Optional[Path]] = {}
+    for filename in sorted(read_checksum_manifest(database_dir)):
+        csv_path = Path(database_dir) / filename
+        if not csv_path.exists():
+            logger.warning(f"Checksum entry without database file: {filename}")
+            results[filename] = None
+            continue
+        df = pd.read_csv(csv_path, sep=separator, encoding=encoding)
+        results[filename] = store.build(csv_path, df)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point for the snapshot build step."""
+    default_dir = Path(__file__).resolve().parents[2] / "data" / "databases"
+    parser = argparse.ArgumentParser(
+        description="Build columnar snapshots of the BioRemPP reference databases."
+    )
+    parser.add_argument(
+        "--database-dir",
+        type=Path,
+        default=default_dir,
+        help=f"Directory with CSV databases (default: {default_dir})",
+    )
+    parser.add_argument(
+        "--snapshot-dir",
+        type=Path,
+        default=None,
+        help="Snapshot output directory (default: <database-dir>/.snapshots)",
+    )
+    args = parser.parse_args(argv)
+
+    results = build_database_snapshots(args.database_dir, args.snapshot_dir)
+    for filename, snapshot_path in results.items():
+        status = snapshot_path.name if snapshot_path is not None else "SKIPPED"
+        print(f"{filename}: {status}")
+    return 0 if results and all(results.values()) else 1
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
@@ -0,0 +1,149 @@
+"""
+KO Index - Precomputed KO Row Ranges for Reference Databases.
+
+Builds, once per database, a stable KO sort of the reference table and the
+contiguous row range each KO occupies in it. Joining uploaded sample KOs
+against the database then becomes a vectorized gather of row offsets
+instead of a hash join over the whole table, so per-job cost scales with
+the number of uploaded KOs.
+
+Classes
+-------
+KORowIndex
+    KO -> row-range index over one reference database
+"""
+
+from __future__ import annotations
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class KORowIndex:
+    """
+    KO -> row-range index over one reference database.
+
+    The table itself is never copied: the index keeps the stable sort
+    permutation, so rows of a KO are ``order[start:end]`` in original table
+    order. Gathering rows therefore matches ``pd.merge(..., how="inner")``
+    row order (left rows in order, matching right rows in table order).
+
+    Attributes
+    ----------
+    key_column : str
+        Column holding KO identifiers in the reference table
+
+    Methods
+    -------
+    lookup(keys)
+        Return (left_positions, right_positions) row pairs for ``keys``
+    join(left_df, left_on, columns)
+        Inner-join ``left_df`` with selected reference columns
+    """
+
+    def __init__(self, table: pd.DataFrame, key_column: str = "ko"):
+        """
+        Build index over ``table``.
+
+        Parameters
+        ----------
+        table : pd.DataFrame
+            Reference database table.
+        key_column : str, default='ko'
+            Column holding KO identifiers.
+
+        Raises
+        ------
+        KeyError
+            If ``key_column`` is not present in ``table``.
+        """
+        if key_column not in table.columns:
+            raise KeyError(f"Key column '{key_column}' not found")
+
+        self.key_column = key_column
+        self._table = table
+
+        codes, uniques = pd.factorize(
+            table[key_column].to_numpy(dtype=object), sort=True
+        )
+        order = np.argsort(codes, kind="stable")
+        sorted_codes = codes[order]
+        key_codes = np.arange(len(uniques))
+
+        self._keys = pd.Index(uniques, dtype=object)
+        self._order = order
+        self._starts = np.searchsorted(sorted_codes, key_codes, side="left")
+        self._ends = np.searchsorted(sorted_codes, key_codes, side="right")
+
+    def __len__(self) -> int:
+        """Return number of distinct KOs in the index."""
+        return len(self._keys)
+
+    def lookup(self, keys: Sequence) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Resolve KOs to matching (left, right) row positions.
+
+        Parameters
+        ----------
+        keys : Sequence
+            KO identifiers (one per left row). Categorical keys are resolved
+            once per category.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Left row positions and the matching reference-table positions.
+        """
+        if isinstance(getattr(keys, "dtype", None), pd.CategoricalDtype):
+            categorical = pd.Categorical(keys)
+            category_codes = self._keys.get_indexer(
+                np.asarray(categorical.categories, dtype=object)
+            )
+            # Missing values (code -1) stay unmatched
+            key_codes = np.append(category_codes, -1)[categorical.codes]
+        else:
+            key_codes = self._keys.get_indexer(np.asarray(keys, dtype=object))
+        matched = key_codes >= 0
+        safe_codes = np.where(matched, key_codes, 0)
+
+        starts = self._starts[safe_codes]
+        counts = np.where(matched, self._ends[safe_codes] - starts, 0)
+        total = int(counts.sum())
+
+        left_positions = np.repeat(np.arange(len(key_codes)), counts)
+        group_offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        right_positions = self._order[np.repeat(starts, counts) + group_offsets]
+        return left_positions, right_positions
+
+    def join(
+        self, left_df: pd.DataFrame, left_on: str, columns: List[str]
+    ) -> pd.DataFrame:
+        """
+        Inner-join ``left_df`` with selected reference columns.
+
+        Parameters
+        ----------
+        left_df : pd.DataFrame
+            Left DataFrame (e.g. Sample-KO pairs).
+        left_on : str
+            Left column holding KO identifiers.
+        columns : List[str]
+            Reference columns to gather.
+
+        Returns
+        -------
+        pd.DataFrame
+            All ``left_df`` columns followed by ``columns``, one row per
+            matching (left row, reference row) pair.
+        """
+        left_positions, right_positions = self.lookup(left_df[left_on])
+
+        gathered = {
+            column: left_df[column].array.take(left_positions)
+            for column in left_df.columns
+        }
+        for column in columns:
+            gathered[column] = self._table[column].array.take(right_positions)
+        return pd.DataFrame(gathered, copy=False)
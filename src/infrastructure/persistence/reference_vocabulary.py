@@ -0,0 +1,170 @@
+"""
+Reference Vocabulary - Shared Dictionary Encoding for Identifier Columns.
+
+Builds one vocabulary per identifier (KO, Compound_ID, Pathway, Gene_Symbol)
+from the reference databases and exposes it as a shared ``CategoricalDtype``.
+Reference columns holding the same identifier are recoded to that dtype, so
+merged frames carry integer codes from merge to serialization and joins
+between tables compare codes instead of strings. Values are decoded to
+strings only when frames leave the process (``to_dict`` / export); frames
+rebuilt from serialized results for plotting keep plain string columns.
+
+Classes
+-------
+ReferenceVocabulary
+    Shared categorical dtypes for identifier columns
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Identifier name (as exposed in merged frames) -> (database, column) sources
+IDENTIFIER_SOURCES: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "KO": (("biorempp", "ko"), ("hadeg", "ko"), ("kegg", "ko")),
+    "Compound_ID": (("biorempp", "cpd"), ("toxcsm", "cpd")),
+    "Pathway": (("hadeg", "Pathway"), ("kegg", "pathname")),
+    "Gene_Symbol": (("biorempp", "genesymbol"), ("kegg", "genesymbol")),
+}
+
+
+class ReferenceVocabulary:
+    """
+    Shared categorical dtypes for identifier columns.
+
+    Attributes
+    ----------
+    identifiers : Tuple[str, ...]
+        Identifier names with a vocabulary
+
+    Methods
+    -------
+    from_databases(databases)
+        Build vocabulary from loaded reference databases
+    dtype(identifier)
+        Shared ``CategoricalDtype`` for an identifier
+    encode_databases(databases)
+        Recode reference identifier columns to the shared dtypes
+    encode_samples(values)
+        Per-job categorical for sample names (first-appearance order)
+    decode_frame(df)
+        Convert categorical columns back to object strings
+    """
+
+    def __init__(self, dtypes: Mapping[str, pd.CategoricalDtype]):
+        """
+        Initialize vocabulary.
+
+        Parameters
+        ----------
+        dtypes : Mapping[str, pd.CategoricalDtype]
+            Identifier name -> shared categorical dtype.
+        """
+        self._dtypes = dict(dtypes)
+
+    @classmethod
+    def from_databases(
+        cls, databases: Mapping[str, pd.DataFrame]
+    ) -> "ReferenceVocabulary":
+        """
+        Build vocabulary from loaded reference databases.
+
+        Parameters
+        ----------
+        databases : Mapping[str, pd.DataFrame]
+            Database name -> reference table.
+
+        Returns
+        -------
+        ReferenceVocabulary
+            Vocabulary with sorted categories per identifier.
+        """
+        dtypes: Dict[str, pd.CategoricalDtype] = {}
+        for identifier, sources in IDENTIFIER_SOURCES.items():
+            values = set()
+            for db_name, column in sources:
+                table = databases.get(db_name)
+                if table is None or column not in table.columns:
+                    continue
+                values.update(table[column].dropna().unique())
+            categories = pd.Index(sorted(values, key=str), dtype=object)
+            dtypes[identifier] = pd.CategoricalDtype(categories, ordered=False)
+        return cls(dtypes)
+
+    @property
+    def identifiers(self) -> Tuple[str, ...]:
+        """Return identifier names with a vocabulary."""
+        return tuple(self._dtypes)
+
+    def dtype(self, identifier: str) -> pd.CategoricalDtype:
+        """Return shared ``CategoricalDtype`` for ``identifier``."""
+        return self._dtypes[identifier]
+
+    def size(self, identifier: str) -> int:
+        """Return number of vocabulary entries for ``identifier``."""
+        return len(self._dtypes[identifier].categories)
+
+    def _recode(self, series: pd.Series, identifier: str) -> Optional[pd.Series]:
+        """Recode ``series`` to the shared dtype (None if a value is unknown)."""
+        dtype = self._dtypes.get(identifier)
+        if dtype is None:
+            return None
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            if series.dtype == dtype:
+                return series
+        elif series.dtype != object:
+            return None
+
+        encoded = series.astype(dtype)
+        if encoded.isna().sum() != series.isna().sum():
+            return None
+        return encoded
+
+    def encode_databases(
+        self, databases: Dict[str, pd.DataFrame]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Recode reference identifier columns to the shared dtypes (in place).
+
+        Parameters
+        ----------
+        databases : Dict[str, pd.DataFrame]
+            Database name -> reference table.
+
+        Returns
+        -------
+        Dict[str, pd.DataFrame]
+            Same mapping with recoded tables.
+        """
+        for identifier, sources in IDENTIFIER_SOURCES.items():
+            for db_name, column in sources:
+                table = databases.get(db_name)
+                if table is None or column not in table.columns:
+                    continue
+                series = table[column]
+                encoded = self._recode(series, identifier)
+                if encoded is not None and encoded is not series:
+                    databases[db_name] = table.assign(**{column: encoded})
+                    table = databases[db_name]
+        return databases
+
+    @staticmethod
+    def encode_samples(values: Iterable[str]) -> pd.Categorical:
+        """Encode sample names as a per-job categorical (first-appearance order)."""
+        codes, uniques = pd.factorize(np.asarray(list(values), dtype=object))
+        return pd.Categorical.from_codes(codes, categories=uniques)
+
+    @staticmethod
+    def decode_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """Return ``df`` with categorical columns converted to object strings."""
+        categorical_columns = [
+            column
+            for column in df.columns
+            if isinstance(df[column].dtype, pd.CategoricalDtype)
+        ]
+        if not categorical_columns:
+            return df
+        return df.astype({column: object for column in categorical_columns})
@@ -66,7 +66,7 @@ def register_database_download_callbacks(app):
     )
     def download_biorempp_database(csv_clicks, excel_clicks, json_clicks, merged_data):
         """Download BioRemPP merged database in selected format."""
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_results_payload(merged_data, tables=("biorempp_raw_df",))
         logger.info(
             f"[DEBUG] BioRemPP download triggered: csv={csv_clicks}, excel={excel_clicks}, json={json_clicks}"
         )
@@ -131,7 +131,7 @@ def register_database_download_callbacks(app):
     )
     def download_hadeg_database(csv_clicks, excel_clicks, json_clicks, merged_data):
         """Download HADEG merged database in selected format."""
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_results_payload(merged_data, tables=("hadeg_raw_df",))
         if not ctx.triggered or not merged_data:
             return None
 
@@ -189,7 +189,7 @@ def register_database_download_callbacks(app):
     )
     def download_kegg_database(csv_clicks, excel_clicks, json_clicks, merged_data):
         """Download KEGG merged database in selected format."""
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_results_payload(merged_data, tables=("kegg_raw_df",))
         if not ctx.triggered or not merged_data:
             return None
 
@@ -247,7 +247,7 @@ def register_database_download_callbacks(app):
     )
     def download_toxcsm_database(csv_clicks, excel_clicks, json_clicks, merged_data):
         """Download ToxCSM merged database in selected format (wide format, 66 columns)."""
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_results_payload(merged_data, tables=("toxcsm_raw_df",))
         if not ctx.triggered or not merged_data:
             return None
 
@@ -183,7 +183,9 @@ class DownloadCallbackFactory:
             *additional_states,  # DB buttons + dropdown filters
         ):
             """Download data for this use case."""
-            merged_data = resolve_results_payload(merged_data)
+            merged_data = resolve_results_payload(
+                merged_data, tables=databases or None
+            )
             from dash import callback_context
 
             # Determine which button was clicked
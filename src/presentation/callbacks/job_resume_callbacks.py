@@ -567,8 +567,12 @@ def resolve_resume_request(job_id: str, owner_token: str):
             ),
         )
 
+    # Server mode keeps only a reference client-side: /results callbacks load
+    # the tables they need, so resuming reads metadata only
     payload, status = job_resume_service.load_job_payload(
-        normalized_job_id, owner_token
+        normalized_job_id,
+        owner_token,
+        tables=() if settings.RESULTS_PAYLOAD_MODE == "server" else None,
     )
     job_ref = _job_id_ref(normalized_job_id)
 
@@ -27,7 +27,8 @@ from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
 from src.shared.logging import get_logger
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = get_logger(__name__)
 
@@ -171,9 +172,9 @@ def _extract_database_data(merged_data: list) -> tuple:
             )
 
             # Data is already serialized as list of dicts
-            biorempp_df = pd.DataFrame(biorempp_data)
-            hadeg_df = pd.DataFrame(hadeg_data)
-            kegg_df = pd.DataFrame(kegg_data)
+            biorempp_df = get_results_frame(merged_data, "biorempp_df")
+            hadeg_df = get_results_frame(merged_data, "hadeg_df")
+            kegg_df = get_results_frame(merged_data, "kegg_df")
 
         else:
             # Original list-based approach
@@ -353,7 +354,7 @@ def register_uc_1_1_callbacks(app, plot_service) -> None:
         - Extracts and normalizes KO sets from databases
         - Generates visualization using UpSetStrategy via PlotService
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-1.1")
         logger.info(
             "UC-1.1 render_uc_1_1 callback triggered",
             extra={"active_item": active_item, "has_data": bool(merged_data)},
@@ -449,7 +450,9 @@ def register_uc_1_1_callbacks(app, plot_service) -> None:
                 extra={"use_case_id": "UC-1.1"},
             )
 
-            fig = plot_service.generate_plot(use_case_id="UC-1.1", data=upset_df)
+            fig = plot_service.generate_plot(
+                use_case_id="UC-1.1", data=upset_df, serialized=True
+            )
 
             logger.info("UpSet plot generated successfully")
             logger.debug(
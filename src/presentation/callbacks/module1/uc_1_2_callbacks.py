@@ -27,7 +27,8 @@ from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
 from src.shared.logging import get_logger
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = get_logger(__name__)
 
@@ -216,7 +217,7 @@ def _extract_biorempp_data(merged_data: dict) -> Optional[pd.DataFrame]:
         return None
 
     try:
-        biorempp_df = pd.DataFrame(biorempp_list)
+        biorempp_df = get_results_frame(merged_data, "biorempp_df")
         logger.info(
             f"[UC-1.2] Extracted BioRemPP DataFrame: "
             f"{len(biorempp_df)} rows, {len(biorempp_df.columns)} columns"
@@ -389,7 +390,7 @@ def register_uc_1_2_callbacks(app, plot_service) -> None:
         - Extracts and normalizes compound sets grouped by regulatory agency
         - Generates visualization using UpSetStrategy via PlotService
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-1.2")
         logger.info(f"[UC-1.2] ========== RENDER CALLBACK TRIGGERED ==========")
         logger.info(f"[UC-1.2] active_item received: '{active_item}'")
         logger.info(
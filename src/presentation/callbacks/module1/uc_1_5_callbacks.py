@@ -22,14 +22,14 @@ import logging
 import os
 from typing import Any, Dict, Optional
 
-import pandas as pd
 from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
 logger = logging.getLogger(__name__)
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 
 def register_uc_1_5_callbacks(app, plot_service) -> None:
@@ -112,7 +112,7 @@ def register_uc_1_5_callbacks(app, plot_service) -> None:
         - Calculates compliance scores: (sample compounds / agency compounds) × 100%
         - Uses HeatmapScoredStrategy via PlotService
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-1.5")
         logger.debug(f"UC-1.5 render callback triggered. Active item: {active_item}")
 
         # Check if UC-1.5 accordion is active
@@ -138,7 +138,7 @@ def register_uc_1_5_callbacks(app, plot_service) -> None:
 
             # Extract DataFrame
             logger.debug("UC-1.5: Extracting DataFrame from merged_data")
-            df = pd.DataFrame(merged_data["biorempp_df"])
+            df = get_results_frame(merged_data, "biorempp_df")
 
             if df.empty:
                 logger.warning("UC-1.5: DataFrame is empty")
@@ -281,6 +281,7 @@ def register_uc_1_5_callbacks(app, plot_service) -> None:
                 data=df_for_plot,
                 filters={},  # No filters needed for this use case
                 force_refresh=False,
+                serialized=True,
             )
 
             logger.info("UC-1.5: Chart generation successful")
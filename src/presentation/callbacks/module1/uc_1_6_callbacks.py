@@ -22,12 +22,12 @@ import logging
 import os
 from typing import Any, Dict, Optional
 
-import pandas as pd
 from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = logging.getLogger(__name__)
 
@@ -122,7 +122,7 @@ def register_uc_1_6_callbacks(app, plot_service) -> None:
         - Calculates unique KO counts per (Agency, Sample) combination
         - Uses HeatmapStrategy via PlotService
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-1.6")
         logger.debug(f"[UC-1.6] Render callback triggered. Active item: {active_item}")
 
         # Check if UC-1.6 accordion is active
@@ -168,7 +168,7 @@ def register_uc_1_6_callbacks(app, plot_service) -> None:
                     "bi bi-inbox",
                 )
 
-            df = pd.DataFrame(biorempp_data)
+            df = get_results_frame(merged_data, "biorempp_df")
 
             if df.empty:
                 logger.warning("[UC-1.6] DataFrame is empty after conversion")
@@ -335,7 +335,11 @@ def register_uc_1_6_callbacks(app, plot_service) -> None:
             logger.debug("[UC-1.6] Calling PlotService to generate heatmap")
 
             fig = plot_service.generate_plot(
-                use_case_id="UC-1.6", data=df_for_plot, filters={}, force_refresh=False
+                use_case_id="UC-1.6",
+                data=df_for_plot,
+                filters={},
+                force_refresh=False,
+                serialized=True,
             )
 
             logger.info("[UC-1.6] Heatmap generation successful")
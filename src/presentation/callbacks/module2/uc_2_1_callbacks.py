@@ -27,7 +27,8 @@ from dash import Input, Output, State, callback_context, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = logging.getLogger(__name__)
 logger.propagate = False  # Prevent duplicate logs
@@ -181,7 +182,7 @@ def register_uc_2_1_callbacks(app, plot_service) -> None:
         - Slider/database changes trigger auto-update if chart already rendered
         - Validates Sample and KO columns before processing
         """
-        biorempp_data = resolve_results_payload(biorempp_data)
+        biorempp_data = resolve_use_case_payload(biorempp_data, "UC-2.1")
         # Check data availability
         if not biorempp_data:
             logger.warning("No data available for UC-2.1")
@@ -239,7 +240,7 @@ def register_uc_2_1_callbacks(app, plot_service) -> None:
         try:
             # Extract DataFrame from store
             if isinstance(biorempp_data, dict) and selected_db_key in biorempp_data:
-                df = pd.DataFrame(biorempp_data[selected_db_key])
+                df = get_results_frame(biorempp_data, selected_db_key)
                 logger.info(
                     f"UC-2.1: Using {selected_db_key}, "
                     f"shape: {df.shape}, columns: {df.columns.tolist()}"
@@ -268,7 +269,11 @@ def register_uc_2_1_callbacks(app, plot_service) -> None:
 
             # Generate plot via PlotService
             fig = plot_service.generate_plot(
-                use_case_id="UC-2.1", data=df, filters=filters, force_refresh=False
+                use_case_id="UC-2.1",
+                data=df,
+                filters=filters,
+                force_refresh=False,
+                serialized=True,
             )
             logger.info("UC-2.1: Figure generated successfully")
 
@@ -367,7 +372,7 @@ def register_uc_2_1_callbacks(app, plot_service) -> None:
         - Calculates maximum KO count across all samples
         - Generates slider marks at appropriate intervals
         """
-        biorempp_data = resolve_results_payload(biorempp_data)
+        biorempp_data = resolve_use_case_payload(biorempp_data, "UC-2.1")
         if not biorempp_data:
             logger.debug("[UC-2.1] No data in store, preventing update")
             raise PreventUpdate
@@ -408,7 +413,7 @@ def register_uc_2_1_callbacks(app, plot_service) -> None:
 
             # Extract DataFrame
             if isinstance(biorempp_data, dict) and selected_db_key in biorempp_data:
-                df = pd.DataFrame(biorempp_data[selected_db_key])
+                df = get_results_frame(biorempp_data, selected_db_key)
             elif isinstance(biorempp_data, list):
                 df = pd.DataFrame(biorempp_data)
             else:
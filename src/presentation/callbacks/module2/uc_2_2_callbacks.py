@@ -27,6 +27,7 @@ from dash import Input, Output, State, callback_context, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
+from src.presentation.services.results_frame_cache import get_results_frame
 from src.presentation.services.results_payload_resolver import resolve_results_payload
 
 logger = logging.getLogger(__name__)
@@ -161,7 +162,9 @@ def register_uc_2_2_callbacks(app, plot_service) -> None:
         - Slider/database changes trigger auto-update if chart already rendered
         - Processes compound counts per sample with range filtering
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_results_payload(
+            merged_data, tables=("biorempp_df", "kegg_df")
+        )
         # Check data availability
         if not merged_data:
             logger.warning("No data available for UC-2.2")
@@ -222,7 +225,7 @@ def register_uc_2_2_callbacks(app, plot_service) -> None:
         try:
             # Extract DataFrame from store
             if isinstance(merged_data, dict) and selected_db_key in merged_data:
-                df = pd.DataFrame(merged_data[selected_db_key])
+                df = get_results_frame(merged_data, selected_db_key)
                 logger.info(
                     f"UC-2.2: Using {selected_db_key}, "
                     f"shape: {df.shape}, columns: {df.columns.tolist()}"
@@ -313,6 +316,7 @@ def register_uc_2_2_callbacks(app, plot_service) -> None:
                 data=filtered,
                 filters=filters,
                 force_refresh=False,  # Temporarily True to clear cache
+                serialized=True,
             )
 
             logger.info("UC-2.2: Chart generated successfully")
@@ -396,7 +400,9 @@ def register_uc_2_2_callbacks(app, plot_service) -> None:
         - Calculates maximum compound count across all samples
         - Generates slider marks at appropriate intervals
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_results_payload(
+            merged_data, tables=("biorempp_df", "kegg_df")
+        )
         if not merged_data:
             logger.debug("[UC-2.2] No data in store, preventing update")
             raise PreventUpdate
@@ -431,7 +437,7 @@ def register_uc_2_2_callbacks(app, plot_service) -> None:
 
             # Extract DataFrame
             if isinstance(merged_data, dict) and selected_db_key in merged_data:
-                df = pd.DataFrame(merged_data[selected_db_key])
+                df = get_results_frame(merged_data, selected_db_key)
             elif isinstance(merged_data, list):
                 df = pd.DataFrame(merged_data)
             else:
@@ -27,7 +27,8 @@ from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = logging.getLogger(__name__)
 logger.propagate = False  # Prevent duplicate logs
@@ -121,7 +122,7 @@ def register_uc_2_4_callbacks(app, plot_service) -> None:
         - Extracts unique compound classes from BioRemPP DataFrame
         - Returns sorted list of options with no initial selection
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-2.4")
         logger.info(
             f"[UC-2.4] 🔄 Dropdown init triggered, data type: {type(merged_data)}"
         )
@@ -137,7 +138,7 @@ def register_uc_2_4_callbacks(app, plot_service) -> None:
         try:
             # Extract DataFrame from store
             if isinstance(merged_data, dict) and "biorempp_df" in merged_data:
-                df = pd.DataFrame(merged_data["biorempp_df"])
+                df = get_results_frame(merged_data, "biorempp_df")
             elif isinstance(merged_data, list):
                 df = pd.DataFrame(merged_data)
             else:
@@ -211,7 +212,7 @@ def register_uc_2_4_callbacks(app, plot_service) -> None:
         - Limits to top 50 compounds by gene diversity
         - Generates ranking chart via PlotService
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-2.4")
         # Check dropdown selection
         if not selected_class:
             logger.debug("UC-2.4: No compound class selected")
@@ -227,7 +228,7 @@ def register_uc_2_4_callbacks(app, plot_service) -> None:
             logger.debug(f"UC-2.4: Received data type: {type(merged_data)}")
 
             if isinstance(merged_data, dict) and "biorempp_df" in merged_data:
-                df = pd.DataFrame(merged_data["biorempp_df"])
+                df = get_results_frame(merged_data, "biorempp_df")
                 logger.info(
                     f"UC-2.4: Using biorempp_df from store, " f"shape: {df.shape}"
                 )
@@ -345,6 +346,7 @@ def register_uc_2_4_callbacks(app, plot_service) -> None:
                 data=compound_ranking,
                 filters=filters,
                 force_refresh=False,  # Temporarily True to clear cache
+                serialized=True,
             )
 
             logger.info(
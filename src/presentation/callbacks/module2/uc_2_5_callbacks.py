@@ -28,6 +28,7 @@ from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
 from src.shared.logging import get_logger
+from src.presentation.services.results_frame_cache import get_results_frame
 from src.presentation.services.results_payload_resolver import resolve_results_payload
 
 logger = get_logger(__name__)
@@ -293,7 +294,9 @@ def register_uc_2_5_callbacks(app, plot_service) -> None:
         - Calculates ranks within database
         - Generates box-scatter plot via BoxScatterStrategy
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_results_payload(
+            merged_data, tables=("biorempp_df", "hadeg_df", "kegg_df")
+        )
         from dash import ctx
 
         # Determine which component triggered the callback
@@ -360,7 +363,7 @@ def register_uc_2_5_callbacks(app, plot_service) -> None:
                     icon="fas fa-database",
                 )
 
-            df = pd.DataFrame(merged_data[db_key])
+            df = get_results_frame(merged_data, db_key)
 
             logger.info(
                 f"UC-2.5: Loaded {db_key} - "
@@ -440,6 +443,7 @@ def register_uc_2_5_callbacks(app, plot_service) -> None:
                 data=ko_counts,
                 filters={"database": selected_database},
                 force_refresh=False,
+                serialized=True,
             )
 
             logger.info(f"UC-2.5: Plot generated successfully for {selected_database}")
@@ -22,12 +22,12 @@ import logging
 import os
 from typing import Any, Dict, Optional
 
-import pandas as pd
 from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = logging.getLogger(__name__)
 
@@ -124,7 +124,7 @@ def register_uc_3_2_callbacks(app, plot_service) -> None:
         - Passes prepared data to PCAStrategy via PlotService
         - Generates scatter plot with PC1/PC2 components
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-3.2")
         logger.debug(f"[UC-3.2] Render callback triggered. Active item: {active_item}")
 
         # Check if UC-3.2 accordion is active
@@ -170,7 +170,7 @@ def register_uc_3_2_callbacks(app, plot_service) -> None:
                     "bi bi-inbox",
                 )
 
-            df = pd.DataFrame(biorempp_data)
+            df = get_results_frame(merged_data, "biorempp_df")
 
             if df.empty:
                 logger.warning("[UC-3.2] DataFrame is empty after conversion")
@@ -325,7 +325,11 @@ def register_uc_3_2_callbacks(app, plot_service) -> None:
             logger.debug("[UC-3.2] Calling PlotService to generate PCA plot")
 
             fig = plot_service.generate_plot(
-                use_case_id="UC-3.2", data=df_for_plot, filters={}, force_refresh=False
+                use_case_id="UC-3.2",
+                data=df_for_plot,
+                filters={},
+                force_refresh=False,
+                serialized=True,
             )
 
             logger.info("[UC-3.2] PCA scatter plot generation successful")
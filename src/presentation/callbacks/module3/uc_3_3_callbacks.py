@@ -27,6 +27,7 @@ from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
+from src.presentation.services.results_frame_cache import get_results_frame
 from src.presentation.services.results_payload_resolver import resolve_results_payload
 
 logger = logging.getLogger(__name__)
@@ -104,7 +105,7 @@ def register_uc_3_3_callbacks(app, plot_service) -> None:
         - Creates binary matrix using pd.crosstab
         - Passes data and parameters to PlotService
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_results_payload(merged_data, tables=("biorempp_df",))
         logger.debug(f"UC-3.3 callback triggered: metric={metric}, method={method}")
 
         # Check data availability
@@ -140,7 +141,7 @@ def register_uc_3_3_callbacks(app, plot_service) -> None:
                 raise ValueError(error_msg)
 
             logger.debug("UC-3.3: Converting to DataFrame")
-            df = pd.DataFrame(merged_data["biorempp_df"])
+            df = get_results_frame(merged_data, "biorempp_df")
             logger.info(
                 f"UC-3.3: biorempp_df loaded - "
                 f"shape: {df.shape}, columns: {df.columns.tolist()}"
@@ -194,6 +195,7 @@ def register_uc_3_3_callbacks(app, plot_service) -> None:
                 data=binary_matrix,
                 filters=filters,
                 force_refresh=False,
+                serialized=True,
             )
             logger.info("UC-3.3: Figure generated successfully")
 
@@ -23,12 +23,12 @@ import logging
 import os
 from typing import Any, Optional
 
-import pandas as pd
 from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = logging.getLogger(__name__)
 logger.propagate = False  # Prevent duplicate logs
@@ -128,7 +128,7 @@ def register_uc_4_10_callbacks(app, plot_service) -> None:
         PreventUpdate
             If accordion not opened or no data available.
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-4.10")
         # Check if accordion is opened
         if not active_item or active_item != "uc-4-10-accordion":
             logger.debug("[UC-4.10] Accordion not opened")
@@ -153,7 +153,7 @@ def register_uc_4_10_callbacks(app, plot_service) -> None:
                     "Please ensure BioRemPP data is loaded."
                 )
 
-            df = pd.DataFrame(merged_data["biorempp_df"])
+            df = get_results_frame(merged_data, "biorempp_df")
 
             # Validate required columns (with variant checking)
             required_cols = {
@@ -218,7 +218,9 @@ def register_uc_4_10_callbacks(app, plot_service) -> None:
                 f"with {len(df)} rows"
             )
 
-            fig = plot_service.generate_plot(use_case_id=use_case_id, data=df)
+            fig = plot_service.generate_plot(
+                use_case_id=use_case_id, data=df, serialized=True
+            )
 
             logger.info(f"[UC-4.10] [OK] Plot generated successfully")
 
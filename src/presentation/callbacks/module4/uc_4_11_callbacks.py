@@ -24,12 +24,12 @@ import logging
 import os
 from typing import Any, Optional
 
-import pandas as pd
 from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = logging.getLogger(__name__)
 logger.propagate = False  # Prevent duplicate logs
@@ -218,7 +218,7 @@ def register_uc_4_11_callbacks(app, plot_service) -> None:
         >>> # active_item = None
         >>> # → PreventUpdate (no re-render)
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-4.11")
         # Determine trigger
         from dash import callback_context
 
@@ -286,7 +286,7 @@ def register_uc_4_11_callbacks(app, plot_service) -> None:
                     f"Please ensure data is loaded."
                 )
 
-            df = pd.DataFrame(merged_data[selected_db])
+            df = get_results_frame(merged_data, selected_db)
             logger.info(f"[UC-4.11] Loaded {db_name} data: {df.shape}")
 
             # Define required columns based on database
@@ -382,7 +382,9 @@ def register_uc_4_11_callbacks(app, plot_service) -> None:
                 f"with {len(aggregated)} hierarchical nodes from {db_name}"
             )
 
-            fig = plot_service.generate_plot(use_case_id=use_case_id, data=aggregated)
+            fig = plot_service.generate_plot(
+                use_case_id=use_case_id, data=aggregated, serialized=True
+            )
 
             logger.info(f"[UC-4.11] [OK] Sunburst plot generated successfully")
 
@@ -23,12 +23,12 @@ import logging
 import os
 from typing import Any, Optional, Tuple
 
-import pandas as pd
 from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = logging.getLogger(__name__)
 logger.propagate = False  # Prevent duplicate logs
@@ -134,7 +134,7 @@ def register_uc_4_12_callbacks(app, plot_service) -> None:
         PreventUpdate
             If no data available or required column not found.
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-4.12")
         logger.info(
             f"[UC-4.12] 🔄 Dropdown init triggered, " f"data type: {type(merged_data)}"
         )
@@ -157,7 +157,7 @@ def register_uc_4_12_callbacks(app, plot_service) -> None:
                 )
                 raise PreventUpdate
 
-            df = pd.DataFrame(merged_data["hadeg_df"])
+            df = get_results_frame(merged_data, "hadeg_df")
 
             # Validate 'Sample' column exists
             sample_col_variants = ["Sample", "sample", "sample_id", "Sample_ID"]
@@ -242,7 +242,7 @@ def register_uc_4_12_callbacks(app, plot_service) -> None:
         PreventUpdate
             If no sample selected or no data available.
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-4.12")
         if not selected_sample:
             logger.debug("[UC-4.12] No sample selected, preventing update")
             raise PreventUpdate
@@ -264,7 +264,7 @@ def register_uc_4_12_callbacks(app, plot_service) -> None:
                     "Please ensure HADEG data is loaded."
                 )
 
-            df = pd.DataFrame(merged_data["hadeg_df"])
+            df = get_results_frame(merged_data, "hadeg_df")
 
             # Validate required columns with variants
             required_cols_variants = {
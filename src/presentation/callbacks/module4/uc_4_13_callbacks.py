@@ -48,12 +48,12 @@ import logging
 import os
 from typing import Any, Optional, Tuple
 
-import pandas as pd
 from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = logging.getLogger(__name__)
 logger.propagate = False  # Prevent duplicate logs
@@ -158,7 +158,7 @@ def register_uc_4_13_callbacks(app, plot_service) -> None:
         PreventUpdate
             If no data available or required column not found.
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-4.13")
         logger.info(
             f"[UC-4.13] 🔄 Dropdown init triggered, data type: {type(merged_data)}"
         )
@@ -181,7 +181,7 @@ def register_uc_4_13_callbacks(app, plot_service) -> None:
                 )
                 raise PreventUpdate
 
-            df = pd.DataFrame(merged_data["hadeg_df"])
+            df = get_results_frame(merged_data, "hadeg_df")
 
             # Validate 'Compound' column exists (compound pathway in HADEG)
             compound_pathway_col_variants = [
@@ -279,7 +279,7 @@ def register_uc_4_13_callbacks(app, plot_service) -> None:
         PreventUpdate
             If no compound pathway selected or no data available.
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-4.13")
         if not selected_compound_pathway:
             logger.debug("[UC-4.13] No compound pathway selected, preventing update")
             raise PreventUpdate
@@ -301,7 +301,7 @@ def register_uc_4_13_callbacks(app, plot_service) -> None:
                     "Please ensure HADEG data is loaded."
                 )
 
-            df = pd.DataFrame(merged_data["hadeg_df"])
+            df = get_results_frame(merged_data, "hadeg_df")
 
             # Validate required columns with variants
             required_cols_variants = {
@@ -22,12 +22,12 @@ import logging
 import os
 from typing import Any, Optional, Tuple
 
-import pandas as pd
 from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = logging.getLogger(__name__)
 logger.propagate = False  # Prevent duplicate logs
@@ -133,7 +133,7 @@ def register_uc_4_1_callbacks(app, plot_service) -> None:
         PreventUpdate
             If no data available or 'Sample' column not found.
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-4.1")
         logger.info(
             f"[UC-4.1] 🔄 Dropdown init triggered, data type: {type(merged_data)}"
         )
@@ -156,7 +156,7 @@ def register_uc_4_1_callbacks(app, plot_service) -> None:
                 )
                 raise PreventUpdate
 
-            df = pd.DataFrame(merged_data["kegg_df"])
+            df = get_results_frame(merged_data, "kegg_df")
 
             # Validate 'Sample' column exists
             sample_col = None
@@ -219,7 +219,7 @@ def register_uc_4_1_callbacks(app, plot_service) -> None:
         PreventUpdate
             If no sample selected or no data available.
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-4.1")
         # Check dropdown selection
         if not selected_sample:
             logger.debug("[UC-4.1] No sample selected")
@@ -243,7 +243,7 @@ def register_uc_4_1_callbacks(app, plot_service) -> None:
                     "Please ensure KEGG data is loaded."
                 )
 
-            df = pd.DataFrame(merged_data["kegg_df"])
+            df = get_results_frame(merged_data, "kegg_df")
 
             # Validate required columns
             required_cols = {
@@ -298,7 +298,9 @@ def register_uc_4_1_callbacks(app, plot_service) -> None:
                 f"with {len(sample_data)} rows"
             )
 
-            fig = plot_service.generate_plot(use_case_id=use_case_id, data=sample_data)
+            fig = plot_service.generate_plot(
+                use_case_id=use_case_id, data=sample_data, serialized=True
+            )
 
             logger.info(f"[UC-4.1] [OK] Plot generated successfully")
 
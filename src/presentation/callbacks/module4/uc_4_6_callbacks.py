@@ -22,12 +22,12 @@ import logging
 import os
 from typing import Any, Optional, Tuple
 
-import pandas as pd
 from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = logging.getLogger(__name__)
 logger.propagate = False  # Prevent duplicate logs
@@ -133,7 +133,7 @@ def register_uc_4_6_callbacks(app, plot_service) -> None:
         PreventUpdate
             If no data available or 'Compound_Class' column not found.
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-4.6")
         logger.info(
             f"[UC-4.6] 🔄 Dropdown init triggered, data type: {type(merged_data)}"
         )
@@ -156,7 +156,7 @@ def register_uc_4_6_callbacks(app, plot_service) -> None:
                 )
                 raise PreventUpdate
 
-            df = pd.DataFrame(merged_data["biorempp_df"])
+            df = get_results_frame(merged_data, "biorempp_df")
 
             # Validate 'Compound_Class' column exists
             compound_class_col = None
@@ -239,7 +239,7 @@ def register_uc_4_6_callbacks(app, plot_service) -> None:
         PreventUpdate
             If no compound class selected or no data available.
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-4.6")
         # Check dropdown selection
         if not selected_compound_class:
             logger.debug("[UC-4.6] No compound class selected")
@@ -263,7 +263,7 @@ def register_uc_4_6_callbacks(app, plot_service) -> None:
                     "Please ensure BioRemPP data is loaded."
                 )
 
-            df = pd.DataFrame(merged_data["biorempp_df"])
+            df = get_results_frame(merged_data, "biorempp_df")
 
             # Validate required columns
             required_cols = {
@@ -349,7 +349,9 @@ def register_uc_4_6_callbacks(app, plot_service) -> None:
             )
 
             fig = plot_service.generate_plot(
-                use_case_id=use_case_id, data=compound_class_data
+                use_case_id=use_case_id,
+                data=compound_class_data,
+                serialized=True,
             )
 
             logger.info(f"[UC-4.6] [OK] Plot generated successfully")
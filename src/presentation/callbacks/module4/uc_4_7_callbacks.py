@@ -28,7 +28,8 @@ from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = logging.getLogger(__name__)
 logger.propagate = False  # Prevent duplicate logs
@@ -163,7 +164,7 @@ def register_uc_4_7_callbacks(app, plot_service) -> None:
         active_item: Optional[str],
     ) -> Tuple[list, list]:
         """Initialize dropdowns with full stable catalogs from BioRemPP data."""
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-4.7")
         logger.info(
             "[UC-4.7] Dropdowns init triggered, data type: %s, active_item=%s",
             type(merged_data),
@@ -186,7 +187,7 @@ def register_uc_4_7_callbacks(app, plot_service) -> None:
                 )
                 raise PreventUpdate
 
-            df = pd.DataFrame(merged_data["biorempp_df"])
+            df = get_results_frame(merged_data, "biorempp_df")
 
             required_cols = {
                 "compoundname": [
@@ -258,7 +259,7 @@ def register_uc_4_7_callbacks(app, plot_service) -> None:
         merged_data: Optional[dict],
     ) -> Any:
         """Render UC-4.7 scatter plot with multiselect-aware conditional filtering."""
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-4.7")
         selected_compounds = _normalize_selection(selected_compound)
         selected_genes = _normalize_selection(selected_gene)
 
@@ -288,7 +289,7 @@ def register_uc_4_7_callbacks(app, plot_service) -> None:
                     "Please ensure BioRemPP data is loaded."
                 )
 
-            df = pd.DataFrame(merged_data["biorempp_df"])
+            df = get_results_frame(merged_data, "biorempp_df")
 
             required_cols = {
                 "sample": ["sample", "Sample", "sample_id"],
@@ -28,7 +28,8 @@ from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = logging.getLogger(__name__)
 logger.propagate = False  # Prevent duplicate logs
@@ -149,7 +150,7 @@ def register_uc_4_8_callbacks(app, plot_service) -> None:
         active_item: Optional[str],
     ) -> Tuple[list, list]:
         """Initialize dropdowns with full stable catalogs from BioRemPP data."""
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-4.8")
         logger.info(
             "[UC-4.8] Dropdowns init triggered, data type: %s, active_item=%s",
             type(merged_data),
@@ -172,7 +173,7 @@ def register_uc_4_8_callbacks(app, plot_service) -> None:
                 )
                 raise PreventUpdate
 
-            df = pd.DataFrame(merged_data["biorempp_df"])
+            df = get_results_frame(merged_data, "biorempp_df")
 
             required_cols = {
                 "sample": ["sample", "Sample", "sample_id"],
@@ -237,7 +238,7 @@ def register_uc_4_8_callbacks(app, plot_service) -> None:
         merged_data: Optional[dict],
     ) -> Any:
         """Render UC-4.8 scatter plot with multiselect-aware conditional filtering."""
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-4.8")
         selected_samples = _normalize_selection(selected_sample)
         selected_genes = _normalize_selection(selected_gene)
 
@@ -265,7 +266,7 @@ def register_uc_4_8_callbacks(app, plot_service) -> None:
                     "Please ensure BioRemPP data is loaded."
                 )
 
-            df = pd.DataFrame(merged_data["biorempp_df"])
+            df = get_results_frame(merged_data, "biorempp_df")
 
             required_cols = {
                 "sample": ["sample", "Sample", "sample_id"],
@@ -23,12 +23,12 @@ import logging
 import os
 from typing import Any, Dict, List, Optional, Tuple
 
-import pandas as pd
 from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = logging.getLogger(__name__)
 
@@ -105,7 +105,7 @@ def register_uc_5_3_callbacks(app, plot_service) -> None:
         - Filters out placeholder values (#N/D, #N/A, etc.)
         - Returns sorted list of agency options for dropdown
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-5.3")
         logger.info(f"[UC-5.3] Dropdown init triggered, " f"active_item: {active_item}")
 
         if not merged_data:
@@ -125,7 +125,7 @@ def register_uc_5_3_callbacks(app, plot_service) -> None:
 
             # Convert list of dicts to DataFrame
             if isinstance(biorempp_data, list):
-                df = pd.DataFrame(biorempp_data)
+                df = get_results_frame(merged_data, "biorempp_df")
                 logger.info(
                     f"[UC-5.3] BioRemPP DataFrame: {df.shape}, "
                     f"Columns: {df.columns.tolist()}"
@@ -215,7 +215,7 @@ def register_uc_5_3_callbacks(app, plot_service) -> None:
         - Passes filtered data to ChordStrategy via PlotService
         - Generates agency-specific chord diagram
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-5.3")
         logger.info(f"[UC-5.3] Render triggered, agency: {selected_agency}")
 
         # Check if agency is selected
@@ -272,7 +272,7 @@ def register_uc_5_3_callbacks(app, plot_service) -> None:
                     "bi bi-inbox",
                 )
 
-            df = pd.DataFrame(biorempp_data)
+            df = get_results_frame(merged_data, "biorempp_df")
 
             if df.empty:
                 logger.warning("[UC-5.3] DataFrame is empty after conversion")
@@ -400,6 +400,7 @@ def register_uc_5_3_callbacks(app, plot_service) -> None:
                 data=df_filtered,
                 filters={"agency": selected_agency},
                 force_refresh=False,
+                serialized=True,
             )
 
             logger.info("[UC-5.3] Chord diagram generation successful")
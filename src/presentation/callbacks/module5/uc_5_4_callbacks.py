@@ -22,12 +22,12 @@ import logging
 import os
 from typing import Any, Dict, Optional
 
-import pandas as pd
 from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = logging.getLogger(__name__)
 
@@ -104,7 +104,7 @@ def register_uc_5_4_callbacks(app, plot_service) -> None:
         - Passes prepared data to NetworkStrategy via PlotService
         - Generates bipartite gene-compound network diagram
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-5.4")
         logger.info(f"[UC-5.4] Render triggered, active_item: {active_item}")
 
         # Check if accordion is active
@@ -151,7 +151,7 @@ def register_uc_5_4_callbacks(app, plot_service) -> None:
                     "bi bi-inbox",
                 )
 
-            df = pd.DataFrame(biorempp_data)
+            df = get_results_frame(merged_data, "biorempp_df")
 
             if df.empty:
                 logger.warning("[UC-5.4] DataFrame is empty after conversion")
@@ -284,6 +284,7 @@ def register_uc_5_4_callbacks(app, plot_service) -> None:
                 data=df_for_plot,
                 filters=None,
                 force_refresh=False,
+                serialized=True,
             )
 
             logger.info("[UC-5.4] Network diagram generation successful")
@@ -22,12 +22,12 @@ import logging
 import os
 from typing import Any, Dict, Optional
 
-import pandas as pd
 from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = logging.getLogger(__name__)
 
@@ -104,7 +104,7 @@ def register_uc_5_5_callbacks(app, plot_service) -> None:
         - Computes gene-gene similarity based on shared compounds
         - Generates similarity network diagram
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-5.5")
         logger.info(f"[UC-5.5] Render triggered, active_item: {active_item}")
 
         # Check if accordion is active
@@ -151,7 +151,7 @@ def register_uc_5_5_callbacks(app, plot_service) -> None:
                     "bi bi-inbox",
                 )
 
-            df = pd.DataFrame(biorempp_data)
+            df = get_results_frame(merged_data, "biorempp_df")
 
             if df.empty:
                 logger.warning("[UC-5.5] DataFrame is empty after conversion")
@@ -279,6 +279,7 @@ def register_uc_5_5_callbacks(app, plot_service) -> None:
                 data=df_for_plot,
                 filters=None,
                 force_refresh=False,
+                serialized=True,
             )
 
             logger.info("[UC-5.5] Similarity network generation successful")
@@ -27,7 +27,8 @@ from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = logging.getLogger(__name__)
 
@@ -121,7 +122,7 @@ def register_uc_7_1_callbacks(app, plot_service) -> None:
         - Generates 5-facet heatmap (Nuclear Response, Stress Response, etc.)
         - Cell colors represent toxicity scores (0-1, Reds colorscale)
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-7.1")
         logger.debug(f"[UC-7.1] Render callback triggered. Active item: {active_item}")
 
         # Check if UC-7.1 accordion is active
@@ -167,7 +168,7 @@ def register_uc_7_1_callbacks(app, plot_service) -> None:
                     "bi bi-inbox",
                 )
 
-            df = pd.DataFrame(toxcsm_data)
+            df = get_results_frame(merged_data, "toxcsm_df")
 
             if df.empty:
                 logger.warning("[UC-7.1] DataFrame is empty after conversion")
@@ -254,7 +255,11 @@ def register_uc_7_1_callbacks(app, plot_service) -> None:
             logger.debug("[UC-7.1] Calling PlotService to generate faceted heatmap")
 
             fig = plot_service.generate_plot(
-                use_case_id="UC-7.1", data=df_clean, filters={}, force_refresh=False
+                use_case_id="UC-7.1",
+                data=df_clean,
+                filters={},
+                force_refresh=False,
+                serialized=True,
             )
 
             logger.info("[UC-7.1] Faceted heatmap generation successful")
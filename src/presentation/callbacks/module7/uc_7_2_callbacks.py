@@ -29,7 +29,8 @@ from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = logging.getLogger(__name__)
 
@@ -105,7 +106,7 @@ def register_uc_7_2_callbacks(app, plot_service) -> None:
         - Passes intersection data to ChordStrategy via PlotService
         - Generates chord diagram showing overlap magnitudes
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-7.2")
         logger.info(f"[UC-7.2] Render triggered, threshold: {selected_threshold}")
 
         # Check if threshold is selected
@@ -172,8 +173,8 @@ def register_uc_7_2_callbacks(app, plot_service) -> None:
                     "bi bi-inbox",
                 )
 
-            df_biorempp = pd.DataFrame(biorempp_data)
-            df_toxcsm = pd.DataFrame(toxcsm_data)
+            df_biorempp = get_results_frame(merged_data, "biorempp_df")
+            df_toxcsm = get_results_frame(merged_data, "toxcsm_df")
 
             logger.info(
                 f"[UC-7.2] BioRemPP: {len(df_biorempp)} rows, "
@@ -369,6 +370,7 @@ def register_uc_7_2_callbacks(app, plot_service) -> None:
                 data=df_links,
                 filters={"threshold": selected_threshold},
                 force_refresh=False,
+                serialized=True,
             )
 
             logger.info("[UC-7.2] Chord diagram generation successful")
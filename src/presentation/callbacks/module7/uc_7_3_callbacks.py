@@ -28,7 +28,8 @@ from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = logging.getLogger(__name__)
 logger.propagate = False
@@ -104,7 +105,7 @@ def register_uc_7_3_callbacks(app, plot_service) -> None:
         - Extracts unique 'super_category' values from ToxCSM dataset
         - Returns empty list if ToxCSM data unavailable
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-7.3")
         logger.info(f"[UC-7.3] 🔄 Dropdown init triggered")
 
         if not merged_data:
@@ -121,7 +122,7 @@ def register_uc_7_3_callbacks(app, plot_service) -> None:
             return [], None
 
         try:
-            df_tox = pd.DataFrame(toxcsm_data)
+            df_tox = get_results_frame(merged_data, "toxcsm_df")
 
             # Validate super_category column
             cat_col = "super_category"
@@ -178,7 +179,7 @@ def register_uc_7_3_callbacks(app, plot_service) -> None:
         - Passes prepared data to HeatmapStrategy via PlotService
         - Generates heatmap showing genetic toolkit diversity
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-7.3")
         logger.debug(
             f"[UC-7.3] Render callback triggered. Category: {selected_category}"
         )
@@ -209,8 +210,8 @@ def register_uc_7_3_callbacks(app, plot_service) -> None:
                     "fas fa-database",
                 )
 
-            df_tox = pd.DataFrame(toxcsm_data)
-            df_bio = pd.DataFrame(biorempp_data)
+            df_tox = get_results_frame(merged_data, "toxcsm_df")
+            df_bio = get_results_frame(merged_data, "biorempp_df")
 
             # 1. Filter ToxCSM for selected category
             if "super_category" not in df_tox.columns:
@@ -314,6 +315,7 @@ def register_uc_7_3_callbacks(app, plot_service) -> None:
                 data=df_response,
                 filters={"category": selected_category},
                 force_refresh=False,
+                serialized=True,
             )
 
             # Prepare safe basename for selected category (replace spaces)
@@ -24,13 +24,13 @@ import os
 from typing import Any, Optional, Tuple
 
 import numpy as np
-import pandas as pd
 import plotly.graph_objects as go
 from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = logging.getLogger(__name__)
 logger.propagate = False
@@ -103,7 +103,7 @@ def register_uc_7_4_callbacks(app, plot_service) -> None:
         - ToxCSM data is in long format with super_category column
         - Returns empty list if ToxCSM data unavailable
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-7.4")
         logger.info(
             f"[UC-7.4] 🔄 Dropdown init triggered, " f"data type: {type(merged_data)}"
         )
@@ -122,7 +122,7 @@ def register_uc_7_4_callbacks(app, plot_service) -> None:
 
                 # Convert list of dicts to DataFrame
                 if isinstance(toxcsm_data, list):
-                    df_long = pd.DataFrame(toxcsm_data)
+                    df_long = get_results_frame(merged_data, "toxcsm_df")
                     logger.info(
                         f"[UC-7.4] 📊 ToxCSM DataFrame: {df_long.shape}, "
                         f"Columns: {df_long.columns.tolist()}"
@@ -195,7 +195,7 @@ def register_uc_7_4_callbacks(app, plot_service) -> None:
         - Adds threshold lines (0.3 safety, 0.5 moderate, 0.7 high risk)
         - Sorts endpoints by median toxicity score (descending)
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-7.4")
         logger.info(f"[UC-7.4] 📊 Render triggered, category: {selected_category}")
 
         if not selected_category:
@@ -215,7 +215,7 @@ def register_uc_7_4_callbacks(app, plot_service) -> None:
 
             # Convert to DataFrame (data is already in long format)
             if isinstance(toxcsm_data, list):
-                df_long = pd.DataFrame(toxcsm_data)
+                df_long = get_results_frame(merged_data, "toxcsm_df")
                 logger.info(
                     f"[UC-7.4] 📊 Data loaded: {df_long.shape}, "
                     f"Columns: {df_long.columns.tolist()}"
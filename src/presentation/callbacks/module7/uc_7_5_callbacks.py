@@ -23,12 +23,12 @@ import logging
 import os
 from typing import Any, Optional, Tuple
 
-import pandas as pd
 from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = logging.getLogger(__name__)
 logger.propagate = False  # Prevent duplicate logs
@@ -124,7 +124,7 @@ def register_uc_7_5_callbacks(app, plot_service) -> None:
         - ToxCSM data includes: compoundname, endpoint, toxicity_score, super_category
         - Returns empty list if data unavailable
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-7.5")
         logger.info(f"[UC-7.5] 🔄 Dropdown init triggered")
         logger.debug(f"[UC-7.5] merged_data type: {type(merged_data)}")
         logger.debug(f"[UC-7.5] active_item: {active_item}")
@@ -171,7 +171,7 @@ def register_uc_7_5_callbacks(app, plot_service) -> None:
                 raise PreventUpdate
 
             # Convert to DataFrame
-            df = pd.DataFrame(toxcsm_data)
+            df = get_results_frame(merged_data, "toxcsm_df")
             logger.info(f"[UC-7.5] [OK] DataFrame created: shape={df.shape}")
             logger.debug(f"[UC-7.5] Available columns: {df.columns.tolist()}")
 
@@ -253,7 +253,7 @@ def register_uc_7_5_callbacks(app, plot_service) -> None:
         - Passes filtered data to DensityPlotStrategy via PlotService
         - Generates overlaid KDE curves for toxicity score distributions
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-7.5")
         logger.info(f"[UC-7.5] 📊 Render triggered for: {selected_category}")
 
         # Check dropdown selection
@@ -280,7 +280,7 @@ def register_uc_7_5_callbacks(app, plot_service) -> None:
                 )
 
             # Convert to DataFrame (data already processed!)
-            df = pd.DataFrame(merged_data["toxcsm_df"])
+            df = get_results_frame(merged_data, "toxcsm_df")
             logger.info(f"[UC-7.5] [OK] DataFrame loaded: shape={df.shape}")
             logger.debug(f"[UC-7.5] Available columns: {df.columns.tolist()}")
 
@@ -29,7 +29,8 @@ from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = logging.getLogger(__name__)
 
@@ -103,7 +104,7 @@ def register_uc_7_7_callbacks(app, plot_service) -> None:
         - Counts ALL interactions per sample-category-compound (NOT unique)
         - Generates treemap with 4-level hierarchy: Root > Sample > Category > Compound
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-7.7")
         logger.debug(f"[UC-7.7] Render callback triggered. Active item: {active_item}")
 
         # Check if UC-7.7 accordion is active
@@ -164,8 +165,8 @@ def register_uc_7_7_callbacks(app, plot_service) -> None:
                 logger.warning("[UC-7.7] toxcsm_df is empty")
                 return _create_error_message("ToxCSM dataset is empty.", "bi bi-inbox")
 
-            df_biorempp = pd.DataFrame(biorempp_data)
-            df_toxcsm = pd.DataFrame(toxcsm_data)
+            df_biorempp = get_results_frame(merged_data, "biorempp_df")
+            df_toxcsm = get_results_frame(merged_data, "toxcsm_df")
 
             logger.info(
                 f"[UC-7.7] BioRemPP: {len(df_biorempp)} rows, "
@@ -29,7 +29,8 @@ from dash import Input, Output, State, dcc, html
 from plotly.subplots import make_subplots
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 logger = logging.getLogger(__name__)
 
@@ -103,7 +104,7 @@ def register_uc_8_1_callbacks(app, plot_service) -> None:
         - Extracts unique compound classes from BioRemPP data
         - Returns empty list if accordion not active or data unavailable
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-8.1")
         logger.info(
             f"[UC-8.1] [CALLBACK 2] Dropdown init triggered, "
             f"active_item: {active_item}"
@@ -124,7 +125,7 @@ def register_uc_8_1_callbacks(app, plot_service) -> None:
             return []
 
         try:
-            df = pd.DataFrame(merged_data["biorempp_df"])
+            df = get_results_frame(merged_data, "biorempp_df")
             logger.debug(
                 f"[UC-8.1] [CALLBACK 2] DataFrame created: "
                 f"{len(df)} rows, columns: {df.columns.tolist()}"
@@ -198,7 +199,7 @@ def register_uc_8_1_callbacks(app, plot_service) -> None:
         - Calculates unique KO counts per compound for color scaling
         - Generates faceted scatter with one subplot per minimized group
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-8.1")
         logger.info(f"[UC-8.1] [CALLBACK 3] ========== RENDER TRIGGERED ==========")
         logger.info(f"[UC-8.1] [CALLBACK 3] selected_class: '{selected_class}'")
         logger.debug(f"[UC-8.1] [CALLBACK 3] merged_data type: {type(merged_data)}")
@@ -251,7 +252,7 @@ def register_uc_8_1_callbacks(app, plot_service) -> None:
                     "bi bi-inbox",
                 )
 
-            df = pd.DataFrame(biorempp_data)
+            df = get_results_frame(merged_data, "biorempp_df")
 
             if df.empty:
                 logger.warning("[UC-8.1] DataFrame is empty after conversion")
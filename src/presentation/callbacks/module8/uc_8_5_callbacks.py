@@ -21,7 +21,6 @@ Version: 1.0.0
 import logging
 from typing import Any, Dict, Optional
 
-import pandas as pd
 from dash import Input, Output, State, dcc, html
 from dash.exceptions import PreventUpdate
 
@@ -29,7 +28,8 @@ logger = logging.getLogger(__name__)
 import os
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 
 def register_uc_8_5_callbacks(app, plot_service) -> None:
@@ -117,7 +117,7 @@ def register_uc_8_5_callbacks(app, plot_service) -> None:
         - Uses color-only display (text_auto: false) for pattern recognition
         - Hover tooltips show exact percentages
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-8.5")
         logger.debug(f"UC-8.5 render callback triggered. Active item: {active_item}")
 
         # Check if UC-8.5 accordion is active
@@ -143,7 +143,7 @@ def register_uc_8_5_callbacks(app, plot_service) -> None:
 
             # Extract DataFrame
             logger.debug("UC-8.5: Extracting DataFrame from merged_data")
-            df = pd.DataFrame(merged_data["kegg_df"])
+            df = get_results_frame(merged_data, "kegg_df")
 
             if df.empty:
                 logger.warning("UC-8.5: DataFrame is empty")
@@ -255,6 +255,7 @@ def register_uc_8_5_callbacks(app, plot_service) -> None:
                 use_case_id="UC-8.5",
                 filters={},
                 customizations={},
+                serialized=True,
             )
 
             logger.info("UC-8.5: Heatmap generated successfully (color-only mode)")
@@ -30,6 +30,7 @@ logger = get_logger(__name__)
 import os
 
 from src.presentation.components.download_component import sanitize_filename
+from src.presentation.services.results_frame_cache import get_results_frame
 from src.presentation.services.results_payload_resolver import resolve_results_payload
 
 # =============================================================================
@@ -83,7 +84,7 @@ def _extract_kegg_data(merged_data: dict) -> Optional[pd.DataFrame]:
         return None
 
     # Convert from list of dicts to DataFrame
-    kegg_df = pd.DataFrame(kegg_data)
+    kegg_df = get_results_frame(merged_data, "kegg_df")
 
     logger.info(
         f"[UC-8.6] Extracted KEGG DataFrame: {len(kegg_df)} rows, "
@@ -144,7 +145,7 @@ def _extract_hadeg_data(merged_data: dict) -> Optional[pd.DataFrame]:
         return None
 
     # Convert from list of dicts to DataFrame
-    hadeg_df = pd.DataFrame(hadeg_data)
+    hadeg_df = get_results_frame(merged_data, "hadeg_df")
 
     logger.info(
         f"[UC-8.6] Extracted HADEG DataFrame: {len(hadeg_df)} rows, "
@@ -522,7 +523,9 @@ def register_uc_8_6_callbacks(app, plot_service):
         - HADEG: 58 pathways for degradation analysis (default)
         - KEGG: 19 pathways for general metabolism
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_results_payload(
+            merged_data, tables=("hadeg_df", "kegg_df")
+        )
         from dash import callback_context
 
         logger.info("[UC-8.6] populate_pathway_dropdown callback triggered")
@@ -666,7 +669,9 @@ def register_uc_8_6_callbacks(app, plot_service):
         - No KOs for pathway → Warning message
         - Plot generation error → Error message with details
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_results_payload(
+            merged_data, tables=("hadeg_df", "kegg_df")
+        )
         logger.info("[UC-8.6] render_uc_8_6 callback triggered")
         logger.debug(f"[UC-8.6] Selected pathway: '{selected_pathway}'")
 
@@ -760,7 +765,9 @@ def register_uc_8_6_callbacks(app, plot_service):
             # Instantiate PlotService
 
             # Generate plot
-            fig = plot_service.generate_plot(data=upset_df, use_case_id="UC-8.6")
+            fig = plot_service.generate_plot(
+                data=upset_df, use_case_id="UC-8.6", serialized=True
+            )
 
             logger.info("[UC-8.6] Plot generated successfully")
 
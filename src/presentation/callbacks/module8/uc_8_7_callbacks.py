@@ -30,7 +30,8 @@ logger = get_logger(__name__)
 import os
 
 from src.presentation.components.download_component import sanitize_filename
-from src.presentation.services.results_payload_resolver import resolve_results_payload
+from src.presentation.services.results_frame_cache import get_results_frame
+from src.presentation.services.results_payload_resolver import resolve_use_case_payload
 
 # =============================================================================
 # Helper Functions
@@ -82,7 +83,7 @@ def _extract_biorempp_data(merged_data: dict) -> Optional[pd.DataFrame]:
         return None
 
     # Convert from list of dicts to DataFrame
-    biorempp_df = pd.DataFrame(biorempp_data)
+    biorempp_df = get_results_frame(merged_data, "biorempp_df")
 
     logger.info(
         f"[UC-8.7] Extracted BioRemPP DataFrame: {len(biorempp_df)} rows, "
@@ -257,7 +258,7 @@ def register_uc_8_7_callbacks(app, plot_service):
         Triggered when accordion is opened.
         Extracts unique sample identifiers from BioRemPP database.
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-8.7")
         logger.info("[UC-8.7] populate_sample_dropdown callback triggered")
         logger.debug(f"[UC-8.7] active_item: {active_item}")
 
@@ -335,7 +336,7 @@ def register_uc_8_7_callbacks(app, plot_service):
 
         Based on CLI reference: docs/CLI_UC/8.7/plot.py
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_use_case_payload(merged_data, "UC-8.7")
         logger.info("[UC-8.7] render_uc_8_7 callback triggered")
         logger.debug(f"[UC-8.7] Selected samples: {selected_samples}")
 
@@ -437,7 +438,9 @@ def register_uc_8_7_callbacks(app, plot_service):
             # Generate plot using PlotService
             logger.info("[UC-8.7] Calling PlotService to generate UpSet plot...")
 
-            fig = plot_service.generate_plot(data=upset_df, use_case_id="UC-8.7")
+            fig = plot_service.generate_plot(
+                data=upset_df, use_case_id="UC-8.7", serialized=True
+            )
 
             if fig is None:
                 logger.error("[UC-8.7] PlotService returned None")
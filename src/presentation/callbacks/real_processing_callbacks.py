@@ -13,11 +13,11 @@ import os
 import time
 import json
 import logging
+from concurrent.futures import wait as future_wait
 from dataclasses import dataclass
 import dash_bootstrap_components as dbc
 from dash import Input, Output, State, html, no_update
 from dash.exceptions import PreventUpdate
-from threading import Thread
 from uuid import uuid4
 
 from config.settings import get_settings
@@ -28,7 +28,15 @@ from src.presentation.components.composite.processing_feedback import (
     create_validation_summary,
 )
 from src.presentation.routing import app_path
-from src.presentation.services import DataProcessingService, job_resume_service
+from src.presentation.services import (
+    DataProcessingService,
+    build_merge_result_cache,
+    build_upload_parser,
+    job_resume_service,
+    resume_persist_executor,
+    upload_artifact_store,
+)
+from src.presentation.services.resume_block_store import EncodedPayload
 from src.presentation.services.results_payload_resolver import (
     build_results_payload_ref,
     prime_results_payload_cache,
@@ -75,11 +83,50 @@ def get_data_service():
     """Get or create data processing service instance."""
     global _data_service
     if _data_service is None:
-        _data_service = DataProcessingService()
+        _data_service = DataProcessingService(
+            toxcsm_scope=settings.TOXCSM_SCOPE,
+            result_cache=build_merge_result_cache(),
+            stage_workers=settings.PROCESSING_STAGE_WORKERS,
+            upload_parser=build_upload_parser(),
+        )
         logger.info("DataProcessingService initialized")
     return _data_service
 
 
+def _process_file_data(
+    service: DataProcessingService, file_data: dict, job_id: str
+) -> dict:
+    """
+    Process an upload store entry into serialized results.
+
+    Entries saved in the upload artifact store carry only ``artifact_ref``;
+    their parsed dataset is loaded instead of re-parsing the file. Entries
+    with inline ``content`` (artifact store disabled) are parsed here.
+    """
+    artifact_ref = file_data.get("artifact_ref")
+    if artifact_ref:
+        parsed = (
+            upload_artifact_store.load(artifact_ref)
+            if upload_artifact_store is not None
+            else None
+        )
+        if parsed is not None:
+            return service.process_parsed_records(
+                parsed, filename=file_data["filename"], job_id=job_id
+            )
+        if not file_data.get("content"):
+            raise ValidationError(
+                "Uploaded dataset is no longer available on the server. "
+                "Please upload the file again."
+            )
+
+    return service.process_upload_records(
+        content=file_data["content"],
+        filename=file_data["filename"],
+        job_id=job_id,
+    )
+
+
 @dataclass(frozen=True)
 class ResumePersistOutcome:
     """Structured result for non-blocking resume persistence."""
@@ -95,7 +142,7 @@ class ResumePersistOutcome:
 
 def _persist_resume_payload_with_timeout(
     job_id: str,
-    payload: dict,
+    payload: dict | EncodedPayload,
     owner_token: str,
     ttl_seconds: int,
     timeout_seconds: float = _RESUME_SAVE_TIMEOUT_SECONDS,
@@ -103,6 +150,10 @@ def _persist_resume_payload_with_timeout(
     """
     Persist resume payload with bounded wait time.
 
+    The save runs on the worker's bounded persistence executor. Waiting for
+    a free slot counts against ``timeout_seconds``; a save that cannot be
+    queued in time is reported as ``queue_full``.
+
     Returns
     -------
     ResumePersistOutcome
@@ -146,15 +197,32 @@ def _persist_resume_payload_with_timeout(
         except Exception as exc:  # pragma: no cover - defensive fallback
             outcome["error"] = exc
 
-    worker = Thread(
-        target=_worker,
-        name="resume-persistence",
-        daemon=True,
-    )
-    worker.start()
-    worker.join(timeout_seconds)
+    future = resume_persist_executor.submit(_worker, timeout_seconds)
+    if future is None:
+        RESUME_PERSIST_DURATION_SECONDS.labels(outcome="queue_full").observe(
+            max(time.perf_counter() - persist_started, 0.0)
+        )
+        RESUME_PERSIST_STAGE_TOTAL.labels(stage="queue_full").inc()
+        logger.warning(
+            "Resume payload persistence rejected: persistence queue full",
+            extra={
+                "job_ref": _job_ref(job_id),
+                "timeout_seconds": timeout_seconds,
+                "queue_depth": resume_persist_executor.queue_depth,
+                "in_flight": resume_persist_executor.in_flight,
+            },
+        )
+        return ResumePersistOutcome(
+            saved_effective=False,
+            stage="queue_full",
+            timed_out=True,
+            store_set_confirmed=False,
+            store_set_saved=False,
+        )
+    remaining_seconds = timeout_seconds - (time.perf_counter() - persist_started)
+    future_wait([future], timeout=max(remaining_seconds, 0.0))
 
-    if worker.is_alive():
+    if not future.done():
         RESUME_PERSIST_DURATION_SECONDS.labels(outcome="timed_out").observe(
             max(time.perf_counter() - persist_started, 0.0)
         )
@@ -448,74 +516,21 @@ def register_real_processing_callbacks(app):
                     extra={"job_ref": _job_ref(job_id)},
                 )
 
-            # Process data (all merges happen here)
-            result = service.process_upload(
-                content=file_data["content"],
-                filename=file_data["filename"],
-                job_id=job_id,
-            )
+            # Process data (all merges happen here). Resubmitted datasets are
+            # served as already-serialized records from the merge result cache.
+            serialized_result = _process_file_data(service, file_data, job_id)
 
             logger.info(
                 "Processing completed successfully",
                 extra={
-                    "metadata": result.get("metadata", {}),
-                    "biorempp_rows": result["biorempp_df"].shape[0],
-                    "kegg_rows": result["kegg_df"].shape[0],
-                    "hadeg_rows": result["hadeg_df"].shape[0],
-                    "toxcsm_rows": result["toxcsm_df"].shape[0],
-                },
-            )
-
-            # Log DataFrame structures for debugging
-            logger.debug(
-                "DataFrame structures",
-                extra={
-                    "biorempp": {
-                        "shape": result["biorempp_df"].shape,
-                        "columns": result["biorempp_df"].columns.tolist(),
-                    },
-                    "hadeg": {
-                        "shape": result["hadeg_df"].shape,
-                        "columns": result["hadeg_df"].columns.tolist(),
-                    },
-                    "toxcsm": {
-                        "shape": result["toxcsm_df"].shape,
-                        "columns": result["toxcsm_df"].columns.tolist(),
-                    },
-                    "kegg": {
-                        "shape": result["kegg_df"].shape,
-                        "columns": result["kegg_df"].columns.tolist(),
-                    },
+                    "metadata": serialized_result.get("metadata", {}),
+                    "biorempp_rows": len(serialized_result["biorempp_df"]),
+                    "kegg_rows": len(serialized_result["kegg_df"]),
+                    "hadeg_rows": len(serialized_result["hadeg_df"]),
+                    "toxcsm_rows": len(serialized_result["toxcsm_df"]),
                 },
             )
 
-            # Debug logging for ToxCSM fields before serialization
-            logger.info(f"[DEBUG] ToxCSM fields before serialization:")
-            logger.info(f"  - toxcsm_raw_df in result: {'toxcsm_raw_df' in result}")
-            if "toxcsm_raw_df" in result:
-                toxcsm_raw = result["toxcsm_raw_df"]
-                logger.info(f"  - toxcsm_raw_df type: {type(toxcsm_raw)}")
-                logger.info(
-                    f"  - toxcsm_raw_df shape: {toxcsm_raw.shape if hasattr(toxcsm_raw, 'shape') else 'N/A'}"
-                )
-
-            # Convert DataFrames to dict for JSON serialization
-            serialized_result = {
-                "biorempp_df": result["biorempp_df"].to_dict("records"),
-                "biorempp_raw_df": result["biorempp_raw_df"].to_dict("records"),
-                "hadeg_df": result["hadeg_df"].to_dict("records"),
-                "hadeg_raw_df": result["hadeg_raw_df"].to_dict("records"),
-                "toxcsm_df": result["toxcsm_df"].to_dict(
-                    "records"
-                ),  # Processed (5 cols for graphs)
-                "toxcsm_raw_df": result["toxcsm_raw_df"].to_dict(
-                    "records"
-                ),  # Merged (66 cols for table & download)
-                "kegg_df": result["kegg_df"].to_dict("records"),
-                "kegg_raw_df": result["kegg_raw_df"].to_dict("records"),
-                "metadata": result["metadata"],
-            }
-
             logger.info(f"[DEBUG] After serialization:")
             logger.info(
                 f"  - toxcsm_raw_df records: {len(serialized_result.get('toxcsm_raw_df', []))}"
@@ -523,19 +538,19 @@ def register_real_processing_callbacks(app):
 
             logger.info("DataFrames serialized successfully")
 
-            # Persist serialized payload for resume-by-job-id flow (non-blocking)
-            metadata = result["metadata"]
+            # Persist serialized payload for resume-by-job-id flow (non-blocking).
+            # Encoded once: the same bytes give the payload size and are stored.
+            metadata = serialized_result["metadata"]
             persisted_job_id = metadata.get("job_id", job_id)
+            encoded_payload = job_resume_service.encode_job_payload(serialized_result)
+            payload_size_bytes = encoded_payload.size_bytes
             resume_persist_outcome = _persist_resume_payload_with_timeout(
                 job_id=persisted_job_id,
-                payload=serialized_result,
+                payload=encoded_payload,
                 owner_token=effective_owner_token,
                 ttl_seconds=job_resume_service.get_resume_ttl_seconds(),
             )
             resume_saved = resume_persist_outcome.saved_effective
-            payload_size_bytes = job_resume_service.estimate_payload_size_bytes(
-                serialized_result
-            )
 
             logger.info(
                 "Resume payload persistence result",
@@ -7,6 +7,7 @@ Callbacks for handling file uploads and validation.
 
 import base64
 from pathlib import Path
+from typing import Optional
 
 from dash import Input, Output, State, callback, no_update
 from dash.exceptions import PreventUpdate
@@ -18,6 +19,9 @@ from src.presentation.components.composite.upload_feedback import (
     create_error_alert,
     create_file_info_card,
 )
+from src.application.core.upload_parser import ParsedUpload
+from src.presentation.services import build_upload_parser, upload_artifact_store
+from src.shared.exceptions import SampleLimitExceededError, ValidationError
 from src.shared.logging import get_logger
 from src.shared.metrics import (
     UPLOAD_OPERATIONS_TOTAL,
@@ -31,6 +35,8 @@ settings = get_settings()
 # Configure logging
 logger = get_logger(__name__)
 
+_upload_parser = build_upload_parser()
+
 
 def _record_upload_metrics(
     source: str,
@@ -43,6 +49,32 @@ def _record_upload_metrics(
         UPLOAD_SIZE_BYTES.labels(source=source, status=status).observe(float(size_bytes))
 
 
+def _store_upload_artifact(file_content: str, parsed: ParsedUpload) -> Optional[str]:
+    """
+    Save parsed upload content in the upload artifact store.
+
+    Returns
+    -------
+    Optional[str]
+        Artifact reference, or None when the content must travel inline
+        (store disabled or unavailable).
+    """
+    if upload_artifact_store is None:
+        return None
+    try:
+        return upload_artifact_store.save(file_content, parsed)
+    except Exception:
+        logger.exception("Upload artifact save failed; keeping content inline")
+        return None
+
+
+def _with_upload_content(file_data: dict, file_content: str, artifact_ref) -> dict:
+    """Attach the artifact reference, or the content when there is none."""
+    if artifact_ref:
+        return {"artifact_ref": artifact_ref, **file_data}
+    return {"content": file_content, **file_data}
+
+
 def register_real_upload_callbacks(app):
     """
     Register real upload callbacks.
@@ -205,21 +237,12 @@ def register_real_upload_callbacks(app):
                 )
 
             # ============================================================
-            # STEP 6: Count Samples and KOs for Limit Validation
+            # STEP 6: Parse Once, Enforcing Sample and KO Limits
             # ============================================================
-            lines = file_content.strip().split("\n")
-            sample_count = sum(1 for line in lines if line.startswith(">"))
-            ko_count = sum(1 for line in lines if line.strip().startswith("K"))
-
-            # ============================================================
-            # STEP 7: Validate Sample Count Limit
-            # ============================================================
-            is_valid, error_msg = ValidationService.validate_sample_count(
-                sample_count=sample_count, max_samples=settings.UPLOAD_SAMPLE_LIMIT
-            )
-
-            if not is_valid:
-                logger.warning(f"Sample count limit exceeded: {error_msg}")
+            try:
+                parsed = _upload_parser.parse(file_content)
+            except SampleLimitExceededError as e:
+                logger.warning(f"Sample count limit exceeded: {e}")
                 _record_upload_metrics(
                     "upload",
                     "sample_limit_exceeded",
@@ -228,7 +251,7 @@ def register_real_upload_callbacks(app):
                 return (
                     create_error_alert(
                         "Sample Limit Exceeded",
-                        error_msg,
+                        str(e),
                         suggestions=[
                             f"Reduce to {settings.UPLOAD_SAMPLE_LIMIT} samples or fewer",
                             "Split dataset into multiple files",
@@ -238,16 +261,8 @@ def register_real_upload_callbacks(app):
                     no_update,
                     None,  # Clear file info display on error
                 )
-
-            # ============================================================
-            # STEP 8: Validate KO Count Limit
-            # ============================================================
-            is_valid, error_msg = ValidationService.validate_ko_count(
-                ko_count=ko_count, max_kos=settings.UPLOAD_KO_LIMIT
-            )
-
-            if not is_valid:
-                logger.warning(f"KO count limit exceeded: {error_msg}")
+            except ValidationError as e:
+                logger.warning(f"KO count limit exceeded: {e}")
                 _record_upload_metrics(
                     "upload",
                     "ko_limit_exceeded",
@@ -256,10 +271,11 @@ def register_real_upload_callbacks(app):
                 return (
                     create_error_alert(
                         "KO Entry Limit Exceeded",
-                        error_msg,
+                        str(e),
                         suggestions=[
                             f"Reduce to {settings.UPLOAD_KO_LIMIT:,} KO entries or fewer",
-                            "Remove duplicate KO entries",
+                            f"Keep each sample under "
+                            f"{settings.PARSING_MAX_KOS_PER_SAMPLE:,} distinct KOs",
                             "Split into multiple files",
                         ],
                     ),
@@ -267,11 +283,15 @@ def register_real_upload_callbacks(app):
                     None,  # Clear file info display on error
                 )
 
+            # Samples holding KO data, and KO lines before deduplication
+            sample_count = len(parsed.sample_names)
+            ko_count = parsed.ko_lines
+
             # ============================================================
-            # STEP 9: Sanitize Sample Names
+            # STEP 7: Sanitize Sample Names
             # ============================================================
             warnings = []
-            for idx, line in enumerate(lines, 1):
+            for idx, line in enumerate(file_content.strip().split("\n"), 1):
                 if line.startswith(">"):
                     sample_name = line[1:].strip()
                     is_valid, sanitized, error = (
@@ -306,16 +326,24 @@ def register_real_upload_callbacks(app):
                         )
 
             # ============================================================
-            # STEP 10: All Validations Passed - Store Data
+            # STEP 8: Store Parsed Upload Server-Side
             # ============================================================
-            file_data = {
-                "content": file_content,
-                "filename": safe_filename,
-                "original_filename": filename,
-                "sample_count": sample_count,
-                "ko_count": ko_count,
-                "file_size_bytes": len(decoded),
-            }
+            artifact_ref = _store_upload_artifact(file_content, parsed)
+
+            # ============================================================
+            # STEP 9: All Validations Passed - Store Data
+            # ============================================================
+            file_data = _with_upload_content(
+                {
+                    "filename": safe_filename,
+                    "original_filename": filename,
+                    "sample_count": sample_count,
+                    "ko_count": ko_count,
+                    "file_size_bytes": len(decoded),
+                },
+                file_content,
+                artifact_ref,
+            )
 
             logger.info(
                 f"File upload successful: {safe_filename}",
@@ -330,7 +358,7 @@ def register_real_upload_callbacks(app):
             _record_upload_metrics("upload", "success", size_bytes=len(decoded))
 
             # ============================================================
-            # STEP 11: Create File Info Display (includes success state)
+            # STEP 10: Create File Info Display (includes success state)
             # ============================================================
             file_info = create_file_info_card(
                 filename=safe_filename,
@@ -449,22 +477,25 @@ def register_real_upload_callbacks(app):
                 )
 
             # ============================================================
-            # STEP 3: Count Samples and KOs
+            # STEP 3: Parse Once and Count Samples and KOs
             # ============================================================
-            lines = file_content.strip().split("\n")
-            sample_count = sum(1 for line in lines if line.startswith(">"))
-            ko_count = sum(1 for line in lines if line.strip().startswith("K"))
+            parsed = _upload_parser.parse(file_content)
+            sample_count = len(parsed.sample_names)
+            ko_count = parsed.ko_lines
 
             # ============================================================
             # STEP 4: Create Data Object
             # ============================================================
-            example_data = {
-                "content": file_content,
-                "filename": "exemple_dataset.txt",
-                "sample_count": sample_count,
-                "ko_count": ko_count,
-                "file_size_bytes": len(file_content.encode("utf-8")),
-            }
+            example_data = _with_upload_content(
+                {
+                    "filename": "exemple_dataset.txt",
+                    "sample_count": sample_count,
+                    "ko_count": ko_count,
+                    "file_size_bytes": len(file_content.encode("utf-8")),
+                },
+                file_content,
+                _store_upload_artifact(file_content, parsed),
+            )
 
             logger.info(
                 "Example dataset loaded successfully",
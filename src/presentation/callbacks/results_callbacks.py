@@ -52,7 +52,7 @@ def register_results_callbacks(app):
     )
     def render_biorempp_table(active_item, merged_data):
         """Render BioRemPP table when accordion opens."""
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_results_payload(merged_data, tables=("biorempp_df",))
         if not active_item or not merged_data:
             raise PreventUpdate
 
@@ -73,7 +73,7 @@ def register_results_callbacks(app):
     )
     def render_hadeg_table(active_item, merged_data):
         """Render HADEG table when accordion opens."""
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_results_payload(merged_data, tables=("hadeg_df",))
         if not active_item or not merged_data:
             raise PreventUpdate
 
@@ -98,7 +98,7 @@ def register_results_callbacks(app):
         Uses toxcsm_raw_df to display merged data (user's compounds + ToxCSM data + Sample column).
         This shows only the compounds that matched the user's input, in wide format (66 columns).
         """
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_results_payload(merged_data, tables=("toxcsm_raw_df",))
         if not active_item or not merged_data:
             raise PreventUpdate
 
@@ -134,7 +134,7 @@ def register_results_callbacks(app):
     )
     def render_kegg_table(active_item, merged_data):
         """Render KEGG table when accordion opens."""
-        merged_data = resolve_results_payload(merged_data)
+        merged_data = resolve_results_payload(merged_data, tables=("kegg_df",))
         if not active_item or not merged_data:
             raise PreventUpdate
 
@@ -6,10 +6,15 @@ Service layer for presentation logic.
 """
 
 from config.settings import get_settings
+from src.application.core.upload_parser import UploadParser
 from .data_processing_service import DataProcessingService
 from .job_resume_service import JobResumeService
+from .merge_result_cache import MergeResultCache
+from .resume_block_store import ResumeBlockStore
+from .resume_persist_executor import ResumePersistExecutor
 from .resume_store_diskcache import DiskcacheResumeStore
 from .resume_store_redis import RedisResumeStore
+from .upload_artifact_store import UploadArtifactStore
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -20,25 +25,29 @@ def _build_diskcache_store() -> DiskcacheResumeStore:
     return DiskcacheResumeStore(
         cache_dir=settings.CACHE_DIR / "job_resume",
         cache_size_mb=settings.RESUME_CACHE_SIZE_MB,
+        ttl_only_prefixes=ResumeBlockStore.KEY_PREFIXES,
     )
 
 
-def _build_redis_store() -> RedisResumeStore:
+def _build_redis_store(key_prefix: str) -> RedisResumeStore:
+    """Build a store on the resume Redis server under ``key_prefix``."""
     return RedisResumeStore(
         host=settings.RESUME_REDIS_HOST,
         port=settings.RESUME_REDIS_PORT,
         db=settings.RESUME_REDIS_DB,
         password=settings.RESUME_REDIS_PASSWORD or None,
-        key_prefix=settings.RESUME_REDIS_KEY_PREFIX,
+        key_prefix=key_prefix,
         socket_timeout_seconds=float(settings.RESUME_REDIS_SOCKET_TIMEOUT_SECONDS),
         compression_level=settings.RESUME_REDIS_COMPRESSION_LEVEL,
+        chunk_size_kb=settings.RESUME_REDIS_CHUNK_KB,
+        compression_threads=settings.RESUME_REDIS_COMPRESSION_THREADS,
     )
 
 
 def _build_resume_store():
     backend = settings.RESUME_BACKEND
     if backend == "redis":
-        store = _build_redis_store()
+        store = _build_redis_store(settings.RESUME_REDIS_KEY_PREFIX)
         logger.info("Resume backend selected", extra={"backend": "redis"})
         return store
     if backend != "diskcache":
@@ -51,6 +60,80 @@ def _build_resume_store():
     return store
 
 
+def build_merge_result_cache():
+    """Build the merge result cache configured in settings (None if disabled)."""
+    if not settings.MERGE_CACHE_ENABLED:
+        return None
+    try:
+        if settings.MERGE_CACHE_BACKEND == "redis":
+            store = _build_redis_store("biorempp:cache:")
+        else:
+            store = DiskcacheResumeStore(
+                cache_dir=settings.CACHE_DIR / "merge_results",
+                cache_size_mb=settings.MERGE_CACHE_SIZE_MB,
+            )
+    except Exception:
+        logger.exception(
+            "Merge result cache unavailable; processing without it",
+            extra={"backend": settings.MERGE_CACHE_BACKEND},
+        )
+        return None
+    logger.info(
+        "Merge result cache backend selected",
+        extra={"backend": store.backend_name},
+    )
+    return MergeResultCache(store, ttl_seconds=settings.MERGE_CACHE_TTL_SECONDS)
+
+
+def build_graph_cache_store():
+    """Build the figure store shared by all workers (None if disabled)."""
+    if not settings.GRAPH_CACHE_SHARED_ENABLED:
+        return None
+    try:
+        if settings.GRAPH_CACHE_SHARED_BACKEND == "redis":
+            return _build_redis_store("biorempp:cache:")
+        return DiskcacheResumeStore(
+            cache_dir=settings.CACHE_DIR / "graph_cache",
+            cache_size_mb=settings.GRAPH_CACHE_SHARED_SIZE_MB,
+        )
+    except Exception:
+        logger.exception(
+            "Shared graph cache unavailable; figures are cached per worker",
+            extra={"backend": settings.GRAPH_CACHE_SHARED_BACKEND},
+        )
+        return None
+
+
+def build_upload_parser() -> UploadParser:
+    """Build the upload parser with the configured upload limits."""
+    return UploadParser(
+        max_samples=settings.UPLOAD_SAMPLE_LIMIT,
+        max_total_kos=settings.UPLOAD_KO_LIMIT,
+        max_kos_per_sample=settings.PARSING_MAX_KOS_PER_SAMPLE,
+    )
+
+
+def build_upload_artifact_store():
+    """Build the upload artifact store on the resume backend (None if disabled)."""
+    if not settings.UPLOAD_ARTIFACT_ENABLED:
+        return None
+    try:
+        if settings.RESUME_BACKEND == "redis":
+            store = _build_redis_store("biorempp:upload:")
+        else:
+            store = DiskcacheResumeStore(
+                cache_dir=settings.CACHE_DIR / "upload_artifacts",
+                cache_size_mb=settings.UPLOAD_ARTIFACT_SIZE_MB,
+            )
+    except Exception:
+        logger.exception(
+            "Upload artifact store unavailable; uploads keep their content",
+            extra={"backend": settings.RESUME_BACKEND},
+        )
+        return None
+    return UploadArtifactStore(store, ttl_seconds=settings.UPLOAD_ARTIFACT_TTL_SECONDS)
+
+
 job_resume_service = JobResumeService(
     store=_build_resume_store(),
     ttl_seconds=settings.RESUME_TTL_SECONDS,
@@ -61,11 +144,32 @@ job_resume_service = JobResumeService(
     alert_token_mismatch_threshold=settings.RESUME_ALERT_TOKEN_MISMATCH_THRESHOLD,
     alert_save_failed_threshold=settings.RESUME_ALERT_SAVE_FAILED_THRESHOLD,
 )
+upload_artifact_store = build_upload_artifact_store()
+resume_persist_executor = ResumePersistExecutor(
+    max_workers=settings.RESUME_PERSIST_WORKERS,
+    max_queue=settings.RESUME_PERSIST_QUEUE_SIZE,
+)
+
+
+def drain_resume_persistence() -> bool:
+    """Wait for pending resume saves of this worker (called on shutdown)."""
+    return resume_persist_executor.drain(settings.RESUME_PERSIST_DRAIN_SECONDS)
+
 
 __all__ = [
     "DataProcessingService",
     "JobResumeService",
+    "MergeResultCache",
+    "ResumePersistExecutor",
     "DiskcacheResumeStore",
     "RedisResumeStore",
+    "UploadArtifactStore",
+    "build_graph_cache_store",
+    "build_merge_result_cache",
+    "build_upload_artifact_store",
+    "build_upload_parser",
+    "drain_resume_persistence",
     "job_resume_service",
+    "resume_persist_executor",
+    "upload_artifact_store",
 ]
@@ -5,6 +5,7 @@ BioRemPP Web - Data Processing Service
 Service for processing uploaded files and merging with databases.
 """
 
+import hashlib
 import logging
 import time
 from datetime import datetime
@@ -14,6 +15,17 @@ from uuid import uuid4
 
 import pandas as pd
 
+from src.application.core.upload_parser import ParsedUpload, UploadParser
+from src.infrastructure.persistence.database_snapshot import (
+    DatabaseSnapshotStore,
+    compute_file_sha256,
+)
+from src.infrastructure.persistence.ko_index import KORowIndex
+from src.infrastructure.persistence.reference_vocabulary import ReferenceVocabulary
+
+from .merge_result_cache import MergeResultCache
+from .stage_scheduler import Stage, StageScheduler
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,7 +40,17 @@ class DataProcessingService:
     - Metadata generation
     """
 
-    def __init__(self, database_path: Optional[Path] = None):
+    TOXCSM_SCOPES = ("compounds", "database")
+
+    def __init__(
+        self,
+        database_path: Optional[Path] = None,
+        use_snapshots: bool = True,
+        toxcsm_scope: str = "compounds",
+        result_cache: Optional[MergeResultCache] = None,
+        stage_workers: int = 4,
+        upload_parser: Optional[UploadParser] = None,
+    ):
         """
         Initialize data processing service.
 
@@ -36,7 +58,29 @@ class DataProcessingService:
         ----------
         database_path : Optional[Path]
             Path to databases directory. If None, uses default location.
+        use_snapshots : bool, default=True
+            Memory-map checksum-keyed columnar snapshots of the databases
+            instead of parsing the CSV files (falls back to CSV parsing when
+            no valid snapshot can be used).
+        toxcsm_scope : str, default='compounds'
+            Default scope of ``merge_with_toxcsm``: ``'compounds'`` keeps
+            only compounds matched in the BioRemPP results, ``'database'``
+            returns every ToxCSM compound.
+        result_cache : Optional[MergeResultCache], default=None
+            Content-addressed cache used by ``process_upload_records``. When
+            set, re-submitted datasets are served without running the merges.
+        stage_workers : int, default=4
+            Threads used to run independent merge stages concurrently
+            (``1`` runs them sequentially in the calling thread).
+        upload_parser : Optional[UploadParser], default=None
+            Parser for upload content. Defaults to a parser without upload
+            limits.
         """
+        if toxcsm_scope not in self.TOXCSM_SCOPES:
+            raise ValueError(
+                f"Invalid toxcsm_scope '{toxcsm_scope}'. "
+                f"Expected one of {self.TOXCSM_SCOPES}"
+            )
         if database_path is None:
             # Default to data/databases relative to biorempp_web root
             current_dir = Path(__file__).parent  # services/
@@ -44,7 +88,16 @@ class DataProcessingService:
             database_path = biorempp_web_root / "data" / "databases"
 
         self.database_path = Path(database_path)
+        self.use_snapshots = use_snapshots
+        self.toxcsm_scope = toxcsm_scope
+        self.result_cache = result_cache
+        self._stage_scheduler = StageScheduler(max_workers=stage_workers)
+        self._upload_parser = upload_parser or UploadParser()
+        self._reference_version = ""
         self._databases: Dict[str, pd.DataFrame] = {}
+        self._ko_indexes: Dict[str, KORowIndex] = {}
+        self._vocabulary = ReferenceVocabulary({})
+        self._toxcsm_long: pd.DataFrame = pd.DataFrame()
         self._database_overview_global_stats: Dict[str, Dict[str, int]] = {}
         self._load_databases()
         self._database_overview_global_stats = (
@@ -60,15 +113,75 @@ class DataProcessingService:
             "kegg": "kegg_degradation_db.csv",
         }
 
+        snapshot_store = (
+            DatabaseSnapshotStore(self.database_path) if self.use_snapshots else None
+        )
+
+        reference_digest = hashlib.sha256(
+            f"toxcsm_scope={self.toxcsm_scope}\n".encode("utf-8")
+        )
         for db_name, filename in db_files.items():
             db_path = self.database_path / filename
             if db_path.exists():
-                # All databases use semicolon separator
-                self._databases[db_name] = pd.read_csv(
-                    db_path, sep=";", encoding="utf-8"
+                reference_digest.update(
+                    f"{filename}={compute_file_sha256(db_path)}\n".encode("utf-8")
                 )
+                # All databases use semicolon separator
+                if snapshot_store is not None:
+                    self._databases[db_name] = snapshot_store.load_or_build(
+                        db_path, separator=";", encoding="utf-8"
+                    )
+                else:
+                    self._databases[db_name] = pd.read_csv(
+                        db_path, sep=";", encoding="utf-8"
+                    )
             else:
                 raise FileNotFoundError(f"Database not found: {db_path}")
+        self._reference_version = reference_digest.hexdigest()
+
+        # Shared identifier vocabulary: KO/Compound_ID/Pathway/Gene_Symbol
+        # columns carry the same integer codes in every database
+        self._vocabulary = ReferenceVocabulary.from_databases(self._databases)
+        self._vocabulary.encode_databases(self._databases)
+
+        # KO-keyed databases: precompute KO row ranges once per database
+        for db_name in ("biorempp", "hadeg", "kegg"):
+            self._ko_indexes[db_name] = KORowIndex(self._databases[db_name], "ko")
+
+        # ToxCSM long format does not depend on user input: build it once
+        self._toxcsm_long = self._build_toxcsm_long_format()
+        self._toxcsm_long_all = (
+            self._dedupe_rows(self._toxcsm_long.drop(columns="cpd"))
+            if not self._toxcsm_long.empty
+            else self._toxcsm_long
+        )
+
+    @property
+    def vocabulary(self) -> ReferenceVocabulary:
+        """Shared identifier vocabulary built from the reference databases."""
+        return self._vocabulary
+
+    @property
+    def reference_version(self) -> str:
+        """SHA256 of the loaded database contents and merge options."""
+        return self._reference_version
+
+    def _join_on_ko(
+        self, db_name: str, sample_df: pd.DataFrame, columns: List[str]
+    ) -> pd.DataFrame:
+        """
+        Inner-join Sample-KO rows with database columns via the KO index.
+
+        The output ``KO`` column is gathered from the database ``ko`` column,
+        so it carries vocabulary codes instead of the uploaded strings.
+        """
+        index = self._ko_indexes.get(db_name)
+        if index is None:
+            index = KORowIndex(self._databases[db_name], "ko")
+            self._ko_indexes[db_name] = index
+        joined = index.join(sample_df, left_on="KO", columns=["ko"] + columns)
+        joined["KO"] = joined.pop("ko")
+        return joined
 
     @staticmethod
     def _dedupe_rows(
@@ -394,31 +507,17 @@ class DataProcessingService:
         -------
         pd.DataFrame
             DataFrame with columns: Sample, KO
-        """
-        lines = content.strip().split("\n")
-
-        data = []
-        current_sample = None
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            if line.startswith(">"):
-                # Sample name line
-                current_sample = line[1:].strip()
-            elif current_sample:
-                # KO line
-                ko = line.strip()
-                if ko.startswith("K"):  # Validate KO format
-                    data.append({"Sample": current_sample, "KO": ko})
 
-        parsed_df = pd.DataFrame(data)
-        if parsed_df.empty:
-            return parsed_df
-        # Prevent artificial row multiplication from repeated KO lines in same sample.
-        return self._dedupe_rows(parsed_df, subset=["Sample", "KO"])
+        Raises
+        ------
+        SampleLimitExceededError
+            If the configured sample limit is exceeded.
+        KOLimitExceededError
+            If the configured total or per-sample KO limit is exceeded.
+        """
+        # Single vectorized pass: pairs come out deduplicated, with Sample
+        # and KO as per-job categoricals (first-appearance sample order)
+        return self._upload_parser.parse(content).to_frame()
 
     def merge_with_biorempp(self, sample_df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -434,24 +533,19 @@ class DataProcessingService:
         pd.DataFrame
             Merged results with BioRemPP annotations
         """
-        biorempp_db = self._databases["biorempp"]
-
-        # Merge on KO
-        merged = sample_df.merge(biorempp_db, left_on="KO", right_on="ko", how="inner")
-
-        # Select and rename columns for output
-        result = merged[
+        # Gather matching rows on KO and rename columns for output
+        result = self._join_on_ko(
+            "biorempp",
+            sample_df[["Sample", "KO"]],
             [
-                "Sample",
-                "KO",
                 "cpd",
                 "compoundname",
                 "genesymbol",
                 "referenceAG",
                 "compoundclass",
                 "enzyme_activity",
-            ]
-        ].copy()
+            ],
+        )
 
         result.columns = [
             "Sample",
@@ -480,38 +574,28 @@ class DataProcessingService:
         pd.DataFrame
             Merged results with HADEG pathways
         """
-        hadeg_db = self._databases["hadeg"]
-
-        # Merge on KO
-        merged = sample_df.merge(hadeg_db, left_on="KO", right_on="ko", how="inner")
-
-        # Select and rename columns
-        result = merged[["Sample", "KO", "Gene", "Pathway", "compound_pathway"]].copy()
+        # Gather matching rows on KO and rename columns
+        result = self._join_on_ko(
+            "hadeg", sample_df[["Sample", "KO"]], ["Gene", "Pathway", "compound_pathway"]
+        )
 
         result.columns = ["Sample", "KO", "Gene", "Pathway", "Compound"]
 
         return self._dedupe_rows(result)
 
-    def merge_with_toxcsm(self, biorempp_df: pd.DataFrame) -> pd.DataFrame:
+    def _build_toxcsm_long_format(self) -> pd.DataFrame:
         """
-        Process ToxCSM database to long format with all value_ columns.
+        Build ToxCSM long-format table from the wide database.
 
-        Transforms wide ToxCSM data into long format containing:
-        - compoundname: Compound identifier
-        - endpoint: Toxicity endpoint name (without 'value_' prefix)
-        - toxicity_score: Numeric toxicity score (0-1)
-        - super_category: Mapped category (Nuclear Response, Genomic, etc.)
-        - prefix: Original endpoint prefix (NR, SR, Gen, Env, Org)
-
-        Parameters
-        ----------
-        biorempp_df : pd.DataFrame
-            BioRemPP merged results (not used, kept for compatibility)
+        Endpoint name, prefix and super-category depend only on the
+        ``value_`` column, so they are resolved once per column and stored
+        as categoricals together with ``compoundname``.
 
         Returns
         -------
         pd.DataFrame
-            Long-format toxicity data with all endpoints
+            Columns: cpd, compoundname, endpoint, toxicity_score, prefix,
+            super_category (empty if the database has no value_ columns)
         """
         toxcsm_db = self._databases["toxcsm"]
 
@@ -524,21 +608,25 @@ class DataProcessingService:
             "Org": "Organic",
         }
 
-        # Identify value_ columns
+        # Identify value_ columns with a mapped super-category
         value_columns = [col for col in toxcsm_db.columns if col.startswith("value_")]
 
         if not value_columns:
             logger.warning("[ToxCSM] No value_ columns found in database")
             return pd.DataFrame()
 
-        # Select compoundname + value_ columns and remove duplicates
-        required_cols = ["compoundname"] + value_columns
-        df_tox = self._dedupe_rows(toxcsm_db[required_cols])
+        prefixes = {col: self._extract_toxcsm_prefix(col) for col in value_columns}
+        mapped_columns = [
+            col for col in value_columns if prefixes[col] in category_mapping
+        ]
+
+        # Select compound keys + value_ columns and remove duplicates
+        df_tox = self._dedupe_rows(toxcsm_db[["cpd", "compoundname"] + value_columns])
 
-        # Convert to long format (wide → long)
+        # Convert to long format (wide → long) for mapped endpoints only
         df_long = df_tox.melt(
-            id_vars=["compoundname"],
-            value_vars=value_columns,
+            id_vars=["cpd", "compoundname"],
+            value_vars=mapped_columns,
             var_name="endpoint",
             value_name="toxicity_score",
         )
@@ -549,26 +637,73 @@ class DataProcessingService:
         )
         df_long = df_long.dropna(subset=["toxicity_score"])
 
-        # Extract prefix from endpoint (e.g., 'value_NR_AR' → 'NR')
-        df_long["prefix"] = df_long["endpoint"].map(self._extract_toxcsm_prefix)
-
-        # Map prefix to super-category
-        df_long["super_category"] = df_long["prefix"].map(category_mapping)
-
-        # Remove rows without mapped category
-        df_long = df_long.dropna(subset=["super_category"])
-
-        # Clean endpoint name (remove 'value_' prefix)
-        df_long["endpoint"] = df_long.apply(
-            lambda row: self._normalize_toxcsm_endpoint(
-                str(row["endpoint"]), row["prefix"]
-            ),
-            axis=1,
+        # Resolve per-column attributes and store them as categoricals
+        column_prefix = pd.Series(prefixes).loc[mapped_columns]
+        column_endpoint = pd.Series(
+            {
+                col: self._normalize_toxcsm_endpoint(col, prefixes[col])
+                for col in mapped_columns
+            }
+        )
+        endpoint = df_long["endpoint"]
+        df_long = df_long.assign(
+            cpd=df_long["cpd"].astype("category"),
+            compoundname=df_long["compoundname"].astype("category"),
+            endpoint=endpoint.map(column_endpoint).astype("category"),
+            prefix=endpoint.map(column_prefix).astype("category"),
+            super_category=endpoint.map(column_prefix)
+            .map(category_mapping)
+            .astype("category"),
         )
 
         # Keep unique compounds
         return self._dedupe_rows(df_long)
 
+    def merge_with_toxcsm(
+        self, biorempp_df: pd.DataFrame, scope: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Return ToxCSM data in long format with all value_ columns.
+
+        The long-format table is precomputed at database load and contains:
+        - compoundname: Compound identifier
+        - endpoint: Toxicity endpoint name (without 'value_' prefix)
+        - toxicity_score: Numeric toxicity score (0-1)
+        - super_category: Mapped category (Nuclear Response, Genomic, etc.)
+        - prefix: Original endpoint prefix (NR, SR, Gen, Env, Org)
+
+        Parameters
+        ----------
+        biorempp_df : pd.DataFrame
+            BioRemPP merged results. In ``'compounds'`` scope, rows are kept
+            only for ToxCSM compounds whose ``cpd`` appears in its
+            ``Compound_ID`` column (same key as the wide-format table).
+        scope : Optional[str], default=None
+            ``'compounds'`` or ``'database'``. Defaults to the service's
+            ``toxcsm_scope``.
+
+        Returns
+        -------
+        pd.DataFrame
+            Long-format toxicity data with all endpoints
+        """
+        scope = scope or self.toxcsm_scope
+        if scope not in self.TOXCSM_SCOPES:
+            raise ValueError(
+                f"Invalid ToxCSM scope '{scope}'. Expected one of {self.TOXCSM_SCOPES}"
+            )
+
+        if scope == "database" or self._toxcsm_long.empty:
+            return self._toxcsm_long_all.copy()
+
+        if biorempp_df.empty or "Compound_ID" not in biorempp_df.columns:
+            return self._toxcsm_long_all.iloc[0:0].copy()
+
+        # Semi-join on the compounds actually matched in the user's results
+        matched = self._toxcsm_long["cpd"].isin(biorempp_df["Compound_ID"].unique())
+        scoped = self._toxcsm_long.loc[matched].drop(columns="cpd")
+        return self._dedupe_rows(scoped).reset_index(drop=True)
+
     def merge_with_kegg(self, sample_df: pd.DataFrame) -> pd.DataFrame:
         """
         Merge sample data with KEGG pathways database.
@@ -584,13 +719,10 @@ class DataProcessingService:
             Merged results with KEGG pathway annotations
             Columns: Sample, KO, Pathway, Gene_Symbol
         """
-        kegg_db = self._databases["kegg"]
-
-        # Merge on KO
-        merged = sample_df.merge(kegg_db, left_on="KO", right_on="ko", how="inner")
-
-        # Select and rename columns for TABLE display
-        result = merged[["Sample", "KO", "pathname", "genesymbol"]].copy()
+        # Gather matching rows on KO and rename columns for TABLE display
+        result = self._join_on_ko(
+            "kegg", sample_df[["Sample", "KO"]], ["pathname", "genesymbol"]
+        )
 
         result.columns = ["Sample", "KO", "Pathway", "Gene_Symbol"]
 
@@ -682,34 +814,160 @@ class DataProcessingService:
             job_id = self.generate_job_id()
 
         # 1. Parse uploaded file
-        sample_df = self.parse_upload_content(content, filename)
+        sample_df = self._parse_required_samples(content, filename)
+
+        return self._process_samples(sample_df, filename, job_id, start_time)
+
+    def process_upload_records(
+        self, content: str, filename: str, job_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Process uploaded file and return the JSON-ready result.
+
+        Same output as ``serialize_result(process_upload(...))``. With a
+        ``result_cache`` configured, a Sample/KO set already processed
+        against the same databases is served from the cache and only the
+        job-specific metadata is regenerated.
 
+        Parameters
+        ----------
+        content : str
+            File content
+        filename : str
+            Original filename
+        job_id : Optional[str]
+            Optional job identifier. If None, generated automatically.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Result tables as lists of records plus ``metadata``.
+        """
+        start_time = time.time()
+        if not job_id:
+            job_id = self.generate_job_id()
+
+        sample_df = self._parse_required_samples(content, filename)
+        return self._process_sample_records(sample_df, filename, job_id, start_time)
+
+    def process_parsed_records(
+        self, parsed: ParsedUpload, filename: str, job_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Process an already parsed upload and return the JSON-ready result.
+
+        Same output as ``process_upload_records`` for the content ``parsed``
+        was produced from, without parsing the file again.
+
+        Parameters
+        ----------
+        parsed : ParsedUpload
+            Parsed Sample/KO pairs (e.g. loaded from the upload artifact
+            store).
+        filename : str
+            Original filename
+        job_id : Optional[str]
+            Optional job identifier. If None, generated automatically.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Result tables as lists of records plus ``metadata``.
+        """
+        start_time = time.time()
+        if not job_id:
+            job_id = self.generate_job_id()
+
+        sample_df = self._require_samples(parsed.to_frame())
+        return self._process_sample_records(sample_df, filename, job_id, start_time)
+
+    def _process_sample_records(
+        self,
+        sample_df: pd.DataFrame,
+        filename: str,
+        job_id: str,
+        start_time: float,
+    ) -> Dict[str, Any]:
+        """Serialize processed samples, going through the result cache."""
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = self.result_cache.build_key(sample_df, self.reference_version)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                cached["metadata"] = {
+                    "job_id": job_id,
+                    "filename": filename,
+                    **cached["metadata"],
+                    "processing_time": round(time.time() - start_time, 2),
+                    "timestamp": datetime.now().isoformat(),
+                }
+                return cached
+
+        serialized = self.serialize_result(
+            self._process_samples(sample_df, filename, job_id, start_time)
+        )
+        if cache_key is not None:
+            self.result_cache.set(cache_key, serialized)
+        return serialized
+
+    @staticmethod
+    def serialize_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert ``process_upload`` DataFrames to lists of records."""
+        serialized = {
+            key: result[key].to_dict("records") for key in MergeResultCache.TABLE_KEYS
+        }
+        serialized["metadata"] = result["metadata"]
+        return serialized
+
+    def _parse_required_samples(self, content: str, filename: str) -> pd.DataFrame:
+        """Parse upload content, rejecting files without Sample/KO pairs."""
+        return self._require_samples(self.parse_upload_content(content, filename))
+
+    @staticmethod
+    def _require_samples(sample_df: pd.DataFrame) -> pd.DataFrame:
+        """Reject parsed uploads without Sample/KO pairs."""
         if sample_df.empty:
             raise ValueError(
                 "No valid data found in uploaded file. "
                 "Check format: >Sample_Name followed by KO IDs"
             )
+        return sample_df
 
-        # 2. Merge with each database
-        # BioRemPP: Merged data with samples
-        biorempp_df = self.merge_with_biorempp(sample_df)
-        biorempp_raw_df = biorempp_df.copy()  # For download (has Sample column)
+    def _process_samples(
+        self,
+        sample_df: pd.DataFrame,
+        filename: str,
+        job_id: str,
+        start_time: float,
+    ) -> Dict[str, Any]:
+        """Run database merges and metadata generation for parsed samples."""
+        # 2. Merge with each database. HADEG and KEGG depend only on the
+        # samples and both ToxCSM outputs only on the BioRemPP merge, so the
+        # scheduler overlaps them.
+        stage_run = self._stage_scheduler.run(
+            [
+                # BioRemPP: Merged data with samples
+                Stage("biorempp", lambda: self.merge_with_biorempp(sample_df)),
+                # HADEG: Merged data with samples
+                Stage("hadeg", lambda: self.merge_with_hadeg(sample_df)),
+                # KEGG: Merged data with samples
+                Stage("kegg", lambda: self.merge_with_kegg(sample_df)),
+                # ToxCSM: Long format (5 columns) for graphs
+                Stage("toxcsm", self.merge_with_toxcsm, ("biorempp",)),
+                # ToxCSM: Wide format (66 columns) for download
+                Stage("toxcsm_wide", self._get_toxcsm_wide_format, ("biorempp",)),
+            ]
+        )
+        stage_results = stage_run.results
 
-        # HADEG: Merged data with samples
-        hadeg_df = self.merge_with_hadeg(sample_df)
+        biorempp_df = stage_results["biorempp"]
+        biorempp_raw_df = biorempp_df.copy()  # For download (has Sample column)
+        hadeg_df = stage_results["hadeg"]
         hadeg_raw_df = hadeg_df.copy()  # For download (has Sample column)
-
-        # KEGG: Merged data with samples
-        kegg_df = self.merge_with_kegg(sample_df)
+        kegg_df = stage_results["kegg"]
         kegg_raw_df = kegg_df.copy()  # For download (has Sample column)
-
-        # ToxCSM: Long format for graphs, wide format for download
-        toxcsm_df = self.merge_with_toxcsm(
-            biorempp_df
-        )  # Long format (5 columns) for graphs
-        toxcsm_raw_df = self._get_toxcsm_wide_format(
-            biorempp_df
-        )  # Wide format (66 columns) for download
+        toxcsm_df = stage_results["toxcsm"]
+        toxcsm_raw_df = stage_results["toxcsm_wide"]
 
         # 3. Generate metadata
         processing_time = time.time() - start_time
@@ -741,6 +999,11 @@ class DataProcessingService:
             "timestamp": datetime.now().isoformat(),
             "database_overview": database_overview,
             "database_aggregate_overview": database_aggregate_overview,
+            "stage_timings_ms": {
+                name: round(elapsed_ms, 2)
+                for name, elapsed_ms in stage_run.stage_ms.items()
+            },
+            "critical_path_ms": round(stage_run.critical_path_ms, 2),
         }
 
         # Debug logging for ToxCSM data
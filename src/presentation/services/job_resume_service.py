@@ -2,10 +2,14 @@
 Job Resume Service - orchestration layer for resumable processed results.
 
 The service validates job metadata and delegates persistence to a ResumeStore
-backend (diskcache or redis).
+backend (diskcache or redis). Payloads are saved column-oriented (see
+``resume_payload_codec``) as a manifest whose tables live in shared,
+content-addressed blocks (see ``resume_block_store``); v1 record payloads and
+v2 inline columnar payloads remain readable. Payloads are serialized once
+(see ``encode_job_payload``); that encoding drives the size limit, the size
+metric and storage.
 """
 
-import json
 import os
 import re
 import time
@@ -13,8 +17,10 @@ from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
 from threading import Lock
-from typing import Callable, Optional
+from typing import Callable, Iterable, Optional, Union
 
+from .resume_block_store import EncodedPayload, ResumeBlockStore
+from .resume_payload_codec import decode_payload, encode_payload
 from .resume_store import ResumeStore
 from .resume_store_diskcache import DiskcacheResumeStore
 from src.shared.logging import build_log_ref, get_logger
@@ -40,8 +46,10 @@ class JobResumeService:
     DEFAULT_ALERT_NOT_FOUND_THRESHOLD = 30
     DEFAULT_ALERT_TOKEN_MISMATCH_THRESHOLD = 10
     DEFAULT_ALERT_SAVE_FAILED_THRESHOLD = 5
-    CURRENT_PAYLOAD_VERSION = 1
-    SUPPORTED_PAYLOAD_VERSIONS = {1}
+    # v1: tables as record lists; v2: column-oriented tables;
+    # v3: column-oriented tables stored as shared blocks
+    CURRENT_PAYLOAD_VERSION = 3
+    SUPPORTED_PAYLOAD_VERSIONS = {1, 2, 3}
     PAYLOAD_SCHEMA_PREFIX = "resume-payload-v"
     JOB_ID_PATTERN = re.compile(r"^BRP-\d{8}-\d{6}-[A-F0-9]{6}$")
 
@@ -173,9 +181,12 @@ class JobResumeService:
             else DiskcacheResumeStore(
                 cache_dir=self._cache_dir,
                 cache_size_mb=self._cache_size_mb,
+                ttl_only_prefixes=ResumeBlockStore.KEY_PREFIXES,
             )
         )
 
+        self._blocks = ResumeBlockStore(self._store)
+
         # Exposed for tests using diskcache adapter internals.
         self._cache = getattr(self._store, "_cache", None)
 
@@ -221,10 +232,16 @@ class JobResumeService:
         """Return configured max payload size per job (MB)."""
         return self._max_payload_mb
 
-    @classmethod
-    def estimate_payload_size_bytes(cls, payload: dict) -> int:
-        """Estimate serialized payload size in bytes."""
-        return cls._estimate_payload_size(payload)
+    @staticmethod
+    def encode_job_payload(payload: dict) -> EncodedPayload:
+        """
+        Serialize a payload for :meth:`save_job_payload`.
+
+        The result's ``size_bytes`` is the stored size of the payload, so
+        callers that need the size pass the encoded payload on to the save
+        instead of serializing twice.
+        """
+        return ResumeBlockStore.split_tables(encode_payload(payload, binary=True))
 
     @classmethod
     def validate_job_id(cls, job_id: str) -> bool:
@@ -357,18 +374,10 @@ class JobResumeService:
                 backend=self._store.backend_name
             ).observe(float(payload_size_bytes))
 
-    @staticmethod
-    def _estimate_payload_size(payload: dict) -> int:
-        """Estimate payload size in bytes for logging."""
-        try:
-            return len(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
-        except Exception:
-            return len(str(payload).encode("utf-8", errors="ignore"))
-
     def save_job_payload(
         self,
         job_id: str,
-        payload: dict,
+        payload: Union[dict, EncodedPayload],
         owner_token: str,
         ttl_seconds: Optional[int] = None,
         on_store_set_complete: Optional[Callable[[bool, float], None]] = None,
@@ -380,8 +389,9 @@ class JobResumeService:
         ----------
         job_id : str
             Processing job identifier.
-        payload : dict
-            Serialized `merged-result-store` payload.
+        payload : Union[dict, EncodedPayload]
+            Serialized `merged-result-store` payload, or its
+            :meth:`encode_job_payload` output.
         owner_token : str
             Browser ownership token for same-browser enforcement.
         ttl_seconds : Optional[int]
@@ -424,7 +434,7 @@ class JobResumeService:
             metrics_emit_ms = (time.perf_counter() - metrics_started) * 1000
             _emit_timing_log(self.STATUS_SAVE_FAILED)
             return False
-        if not isinstance(payload, dict):
+        if not isinstance(payload, (dict, EncodedPayload)):
             logger.warning(
                 "Refusing to save resume payload: payload must be dict",
                 extra={"job_ref": masked_job_id},
@@ -459,7 +469,14 @@ class JobResumeService:
             except (TypeError, ValueError):
                 ttl = self._ttl_seconds
 
-        payload_size_bytes = self.estimate_payload_size_bytes(payload)
+        encoded = (
+            payload
+            if isinstance(payload, EncodedPayload)
+            else self.encode_job_payload(payload)
+        )
+        manifest_payload = encoded.manifest
+        blocks = encoded.blocks
+        payload_size_bytes = encoded.size_bytes
         if payload_size_bytes > self._max_payload_bytes:
             self._record_security_event("save_failed")
             logger.warning(
@@ -503,12 +520,29 @@ class JobResumeService:
             "payload_schema": self._expected_payload_schema(
                 self.CURRENT_PAYLOAD_VERSION
             ),
-            "merged_result_payload": payload,
+            "merged_result_payload": manifest_payload,
         }
 
         serialize_check_ms = (time.perf_counter() - operation_started) * 1000
         start_time = time.perf_counter()
-        saved = self._store.set(cache_key, cache_value, ttl)
+        # Blocks of an entry being replaced are released once the new
+        # manifest is stored
+        previous_entry = self._store.get(cache_key)
+        previous_blocks = (
+            self._blocks.referenced_blocks(
+                previous_entry.get("merged_result_payload")
+            )
+            if isinstance(previous_entry, dict)
+            else []
+        )
+        block_stats = self._blocks.acquire(blocks, ttl)
+        saved = block_stats is not None and self._store.set(
+            cache_key, cache_value, ttl
+        )
+        if saved:
+            self._blocks.release(previous_blocks)
+        elif block_stats is not None:
+            self._blocks.release(blocks)
         store_set_ms = (time.perf_counter() - start_time) * 1000
         if on_store_set_complete is not None:
             try:
@@ -528,6 +562,8 @@ class JobResumeService:
                     "backend": self._store.backend_name,
                     "ttl_seconds": ttl,
                     "payload_size_bytes": payload_size_bytes,
+                    "blocks_written": block_stats["written"],
+                    "blocks_shared": block_stats["shared"],
                     "save_ms": round(store_set_ms, 2),
                 },
             )
@@ -564,10 +600,22 @@ class JobResumeService:
         self,
         job_id: str,
         owner_token: str,
+        tables: Optional[Iterable[str]] = None,
     ) -> tuple[Optional[dict], str]:
         """
         Load serialized payload by `job_id`.
 
+        Parameters
+        ----------
+        job_id : str
+            Processing job identifier.
+        owner_token : str
+            Browser ownership token.
+        tables : Optional[Iterable[str]]
+            Result tables to load (e.g. ``("biorempp_df",)``). Only their
+            blocks are read and decoded; metadata is always included. Record
+            payloads (v1) are returned in full. None loads every table.
+
         Returns
         -------
         tuple[Optional[dict], str]
@@ -652,7 +700,25 @@ class JobResumeService:
             )
             return None, self.STATUS_INCOMPATIBLE_VERSION
 
-        payload = cached.get("merged_result_payload")
+        if tables is not None:
+            tables = tuple(tables)
+        stored_payload = cached.get("merged_result_payload")
+        payload_size_bytes: Optional[int] = None
+        if isinstance(stored_payload, dict) and payload_version >= 3:
+            resolved = self._blocks.resolve(stored_payload, tables)
+            stored_payload, payload_size_bytes = (
+                resolved if resolved is not None else (None, None)
+            )
+        payload = stored_payload
+        if isinstance(stored_payload, dict) and payload_version >= 2:
+            try:
+                payload = decode_payload(stored_payload, tables=tables)
+            except ValueError:
+                logger.warning(
+                    "Discarding unreadable resume payload",
+                    extra={"job_ref": masked_job_id},
+                )
+                payload = None
         if not isinstance(payload, dict):
             self._record_security_event(self.STATUS_NOT_FOUND)
             self._emit_load_metrics(
@@ -667,14 +733,16 @@ class JobResumeService:
             extra={
                 "job_ref": masked_job_id,
                 "backend": self._store.backend_name,
-                "payload_size_bytes": self.estimate_payload_size_bytes(payload),
+                "payload_version": payload_version,
+                "tables": list(tables) if tables is not None else "all",
+                "payload_size_bytes": payload_size_bytes,
                 "load_ms": round(elapsed_ms, 2),
             },
         )
         self._emit_load_metrics(
             self.STATUS_OK,
             time.perf_counter() - operation_started,
-            payload_size_bytes=self.estimate_payload_size_bytes(payload),
+            payload_size_bytes=payload_size_bytes,
         )
 
         return payload, self.STATUS_OK
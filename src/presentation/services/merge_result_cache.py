@@ -0,0 +1,159 @@
+"""
+Merge Result Cache - content-addressed cache for processed uploads.
+
+Serialized merge results (table records plus dataset metadata) are stored
+in a ResumeStore backend (diskcache or redis) under a canonical hash of the
+parsed Sample/KO set, so resubmitting the same dataset from any worker skips
+every database merge and the DataFrame serialization. Keys embed the
+reference database version, so updated databases never serve stale merges.
+"""
+
+import hashlib
+import time
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from src.shared.logging import build_log_ref, get_logger
+from src.shared.metrics import CACHE_OPERATIONS_TOTAL
+
+from .resume_store import ResumeStore
+
+logger = get_logger(__name__)
+
+
+class MergeResultCache:
+    """Store and load merged result tables keyed by dataset content."""
+
+    CACHE_TYPE = "merge_result"
+    CACHE_KEY_PREFIX = "merge:v2:"
+    DEFAULT_TTL_SECONDS = 86400  # 24 hours
+    TABLE_KEYS = (
+        "biorempp_df",
+        "biorempp_raw_df",
+        "hadeg_df",
+        "hadeg_raw_df",
+        "toxcsm_df",
+        "toxcsm_raw_df",
+        "kegg_df",
+        "kegg_raw_df",
+    )
+    # Metadata fields that describe the job rather than the dataset
+    JOB_METADATA_KEYS = (
+        "job_id",
+        "filename",
+        "processing_time",
+        "timestamp",
+        "stage_timings_ms",
+        "critical_path_ms",
+    )
+
+    def __init__(
+        self, store: ResumeStore, ttl_seconds: int = DEFAULT_TTL_SECONDS
+    ) -> None:
+        self._store = store
+        self._ttl_seconds = max(int(ttl_seconds), 60)
+
+    @property
+    def backend_name(self) -> str:
+        return self._store.backend_name
+
+    @staticmethod
+    def fingerprint(sample_df: pd.DataFrame) -> str:
+        """
+        Return canonical SHA256 of a parsed Sample/KO table.
+
+        The hash covers the set of distinct (Sample, KO) pairs, so sample
+        order, KO order and repeated lines do not change it. Pairs are
+        hashed column-wise and the sorted row hashes are digested, so no
+        Python tuple is built per line.
+        """
+        pairs = pd.DataFrame(
+            {
+                "Sample": sample_df["Sample"].astype(str),
+                "KO": sample_df["KO"].astype(str),
+            }
+        ).drop_duplicates()
+        row_hashes = pd.util.hash_pandas_object(pairs, index=False).to_numpy()
+        row_hashes.sort()
+        return hashlib.sha256(row_hashes.tobytes()).hexdigest()
+
+    def build_key(self, sample_df: pd.DataFrame, reference_version: str) -> str:
+        """Return cache key for ``sample_df`` under ``reference_version``."""
+        return (
+            f"{self.CACHE_KEY_PREFIX}{reference_version[:16]}:"
+            f"{self.fingerprint(sample_df)}"
+        )
+
+    def _count(self, operation: str, outcome: str) -> None:
+        CACHE_OPERATIONS_TOTAL.labels(
+            cache_type=self.CACHE_TYPE,
+            operation=operation,
+            outcome=outcome,
+        ).inc()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a cached serialized result.
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Result tables as records plus dataset-level ``metadata``, or None
+            on a miss or an unreadable entry.
+        """
+        started_at = time.perf_counter()
+        payload = self._store.get(key)
+        if payload is None:
+            self._count("get", "miss")
+            return None
+
+        if not isinstance(payload.get("metadata"), dict) or not all(
+            isinstance(payload.get(table_key), list) for table_key in self.TABLE_KEYS
+        ):
+            logger.warning(
+                "Discarding unreadable merge result cache entry",
+                extra={"cache_ref": build_log_ref(key, namespace="cache")},
+            )
+            self._count("get", "invalid")
+            return None
+
+        self._count("get", "hit")
+        logger.info(
+            "Merge result cache hit",
+            extra={
+                "cache_ref": build_log_ref(key, namespace="cache"),
+                "backend": self.backend_name,
+                "load_ms": round((time.perf_counter() - started_at) * 1000, 2),
+            },
+        )
+        return payload
+
+    def set(self, key: str, result: Dict[str, Any]) -> bool:
+        """
+        Store a serialized result without its job-specific metadata.
+
+        Parameters
+        ----------
+        key : str
+            Key from :meth:`build_key`.
+        result : Dict[str, Any]
+            ``TABLE_KEYS`` record lists plus a ``metadata`` dict.
+        """
+        try:
+            payload = {table_key: result[table_key] for table_key in self.TABLE_KEYS}
+            payload["metadata"] = {
+                field: value
+                for field, value in result["metadata"].items()
+                if field not in self.JOB_METADATA_KEYS
+            }
+        except (KeyError, AttributeError):
+            self._count("set", "invalid")
+            return False
+
+        saved = self._store.set(key, payload, ttl_seconds=self._ttl_seconds)
+        self._count("set", "stored" if saved else "failed")
+        return saved
+
+    def close(self) -> None:
+        self._store.close()
@@ -0,0 +1,175 @@
+"""
+Results frame cache for `/results` use-case callbacks.
+
+Use-case callbacks read result tables as record lists and each built its own
+DataFrame on every render and filter change. This module builds the
+DataFrame once per (job, table) and shares it inside the worker process,
+evicting least recently used frames beyond a memory budget.
+
+Entries are bound to the record list they were built from: a callback only
+receives a cached frame when it holds that same list (as returned by the
+hydration cache), so changed or foreign payloads never hit a stale frame.
+
+Cached frames are made read-only when they are built: callbacks get shallow
+copies sharing those arrays, so an in-place cell write raises instead of
+changing the table for every later render in the worker. Writes into
+existing cells raise ``ValueError``: ``.loc[mask, col] = v``, ``.iat``, and
+``inplace=True`` methods such as ``fillna`` or ``replace``. Callbacks derive
+new frames instead (``df.fillna(...)``, ``df.assign(...)``, or
+``df[col] = ...`` which replaces the whole column).
+
+The full-content fingerprint of each frame is computed once when it is
+built and remembered for every copy handed out, so plot cache keys of an
+unchanged table cost nothing on later renders.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import pandas as pd
+
+from config.settings import get_settings
+from src.shared.dataframe_fingerprint import (
+    fingerprint_dataframe,
+    freeze_dataframe,
+    remember_fingerprint,
+)
+from src.shared.logging import get_logger
+from src.shared.metrics import CACHE_OPERATIONS_TOTAL
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Object columns are sized from a sample of their values
+_SIZE_SAMPLE_ROWS = 1000
+
+
+def _estimate_frame_bytes(frame: pd.DataFrame) -> int:
+    """Estimate DataFrame memory without a full deep scan of object columns."""
+    total = int(frame.memory_usage(index=True, deep=False).sum())
+    row_count = len(frame)
+    if not row_count:
+        return total
+    step = max(row_count // _SIZE_SAMPLE_ROWS, 1)
+    for column in frame.columns[frame.dtypes == object]:
+        sample = frame[column].iloc[::step]
+        mean_size = sum(map(sys.getsizeof, sample)) / len(sample)
+        total += int(mean_size * row_count)
+    return total
+
+
+class ResultsFrameCache:
+    """Byte-bounded LRU cache of DataFrames built from result records."""
+
+    CACHE_TYPE = "results_frame"
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max(int(max_bytes), 1)
+        self._entries: OrderedDict[
+            tuple[str | None, str], tuple[list, pd.DataFrame, int, str]
+        ] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def _count(self, operation: str, outcome: str) -> None:
+        CACHE_OPERATIONS_TOTAL.labels(
+            cache_type=self.CACHE_TYPE,
+            operation=operation,
+            outcome=outcome,
+        ).inc()
+
+    def _pop(self, key: tuple[str | None, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry[2]
+
+    @staticmethod
+    def _hand_out(frame: pd.DataFrame, fingerprint: str) -> pd.DataFrame:
+        shared = frame.copy(deep=False)
+        remember_fingerprint(shared, fingerprint)
+        return shared
+
+    def get(self, payload: Any, table: str) -> pd.DataFrame:
+        """
+        Return the DataFrame of ``table`` in a resolved results payload.
+
+        Parameters
+        ----------
+        payload : Any
+            Payload from ``resolve_results_payload``.
+        table : str
+            Table key (e.g. ``"biorempp_df"``).
+
+        Returns
+        -------
+        pd.DataFrame
+            Shallow copy of the cached, read-only frame: adding, dropping or
+            replacing columns does not affect other callbacks, and in-place
+            cell writes raise ``ValueError`` (use ``.copy()`` first). Empty
+            when the table is missing.
+        """
+        records = payload.get(table) if isinstance(payload, dict) else None
+        if not isinstance(records, list):
+            return pd.DataFrame(records)
+
+        metadata = payload.get("metadata")
+        job_id = metadata.get("job_id") if isinstance(metadata, dict) else None
+        key = (job_id if isinstance(job_id, str) else None, table)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is records:
+                self._entries.move_to_end(key)
+                frame, fingerprint = entry[1], entry[3]
+            else:
+                frame = None
+        if frame is not None:
+            self._count("get", "hit")
+            return self._hand_out(frame, fingerprint)
+
+        self._count("get", "miss")
+        frame = pd.DataFrame(records)
+        size_bytes = _estimate_frame_bytes(frame)
+        if size_bytes > self._max_bytes or not freeze_dataframe(frame):
+            # Not shared, so the caller may modify it
+            return frame
+        fingerprint = fingerprint_dataframe(frame)
+
+        with self._lock:
+            self._pop(key)
+            # The entry keeps ``records`` alive, so the identity check above
+            # cannot match a different list reusing the same id
+            self._entries[key] = (records, frame, size_bytes, fingerprint)
+            self._total_bytes += size_bytes
+            while self._total_bytes > self._max_bytes:
+                evicted_key = next(iter(self._entries))
+                self._pop(evicted_key)
+                self._count("evict", "size")
+        return self._hand_out(frame, fingerprint)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+
+_frame_cache = ResultsFrameCache(
+    max_bytes=settings.RESULTS_FRAME_CACHE_MB * 1024 * 1024,
+)
+
+
+def get_results_frame(payload: Any, table: str) -> pd.DataFrame:
+    """
+    Return a shared DataFrame for ``table`` of a resolved results payload.
+
+    See :meth:`ResultsFrameCache.get`.
+    """
+    return _frame_cache.get(payload, table)
@@ -0,0 +1,143 @@
+"""
+Local-disk L2 tier for hydrated `/results` payloads.
+
+Each Gunicorn worker keeps hydrated payloads in its own in-memory cache (L1).
+Consecutive callbacks of one job often land on different workers, so this
+tier keeps hydrated tables in a diskcache directory shared by every worker
+on the host. Tables are stored as packed columnar tables (see
+``resume_payload_codec.pack_table``), one file per table; a hit maps the
+file read-only and decodes the columns in place, which avoids the resume
+backend round trip, its retries and decompression.
+
+Entries are keyed by the resolver's (job_id, owner_token) digest, so a
+payload is only served to the browser that owns it.
+"""
+
+from __future__ import annotations
+
+import mmap
+from pathlib import Path
+from typing import Any
+
+import diskcache
+
+from src.shared.logging import get_logger
+
+from .resume_payload_codec import decode_table, encode_table, pack_table, unpack_table
+
+logger = get_logger(__name__)
+
+
+class HydrationDiskCache:
+    """Shared on-disk cache of hydrated payload tables."""
+
+    # Tables above this size are stored as files and read through mmap
+    MIN_FILE_SIZE = 32 * 1024
+
+    def __init__(self, directory: Path, size_limit_mb: int, ttl_seconds: int) -> None:
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._ttl_seconds = max(int(ttl_seconds), 1)
+        self._cache = diskcache.Cache(
+            str(self._directory),
+            size_limit=max(int(size_limit_mb), 16) * 1024 * 1024,
+            disk_min_file_size=self.MIN_FILE_SIZE,
+        )
+
+    @staticmethod
+    def _index_key(key: str) -> str:
+        return f"{key}:index"
+
+    @staticmethod
+    def _table_key(key: str, table: str) -> str:
+        return f"{key}:table:{table}"
+
+    def _read_table(self, key: str, table: str) -> list | None:
+        value = self._cache.get(self._table_key(key, table), default=None, read=True)
+        if value is None:
+            return None
+        if not isinstance(value, bytes):
+            with value:
+                value = mmap.mmap(value.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return decode_table(unpack_table(value))
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Discarding unreadable hydration cache table")
+            self._cache.delete(self._table_key(key, table))
+            return None
+
+    def get(self, key: str, tables: frozenset[str] | None) -> dict[str, Any] | None:
+        """
+        Return the payload holding ``tables`` (every table when None).
+
+        Returns None unless all requested tables are stored.
+        """
+        try:
+            index = self._cache.get(self._index_key(key), default=None)
+            if not isinstance(index, dict):
+                return None
+            stored = set(index.get("tables", ()))
+            if tables is None:
+                if not index.get("complete"):
+                    return None
+                wanted = stored
+            elif tables <= stored:
+                wanted = tables
+            else:
+                return None
+
+            payload = dict(index.get("fields", {}))
+            for table in wanted:
+                records = self._read_table(key, table)
+                if records is None:
+                    return None
+                payload[table] = records
+            return payload
+        except Exception:
+            logger.warning("Hydration disk cache read failed", exc_info=True)
+            return None
+
+    def set(
+        self, key: str, payload: dict[str, Any], tables: frozenset[str] | None
+    ) -> None:
+        """
+        Store the loaded ``tables`` of ``payload`` (every table when None).
+
+        Tables that cannot be encoded column-wise are not stored.
+        """
+        try:
+            fields = {}
+            stored = []
+            for name, value in payload.items():
+                if not isinstance(value, list):
+                    fields[name] = value
+                    continue
+                if tables is not None and name not in tables:
+                    continue
+                table = encode_table(value, binary=True)
+                if table is None:
+                    continue
+                self._cache.set(
+                    self._table_key(key, name),
+                    pack_table(table),
+                    expire=self._ttl_seconds,
+                )
+                stored.append(name)
+
+            with self._cache.transact():
+                index = self._cache.get(self._index_key(key), default=None)
+                if not isinstance(index, dict):
+                    index = {"tables": [], "complete": False}
+                index["fields"] = fields
+                index["tables"] = sorted(set(index["tables"]) | set(stored))
+                index["complete"] = bool(index["complete"]) or (
+                    tables is None
+                    and len(stored)
+                    == sum(isinstance(value, list) for value in payload.values())
+                )
+                self._cache.set(self._index_key(key), index, expire=self._ttl_seconds)
+        except Exception:
+            logger.warning("Hydration disk cache write failed", exc_info=True)
+
+    def close(self) -> None:
+        self._cache.close()
@@ -6,7 +6,14 @@ This module supports two payload transport modes:
 - server mode: only a lightweight payload reference is stored client-side
 
 In server mode, callbacks resolve the reference back to the full payload
-through `job_resume_service`, using `job_id` + `owner_token`.
+through `job_resume_service`, using `job_id` + `owner_token`. Callbacks that
+pass the tables they read (or their use case, whose tables are declared in
+`download_config.yaml`) only load and deserialize those tables.
+
+Hydrated payloads are cached per worker (L1) and, when enabled, in a local
+disk tier shared by all workers on the host (L2) before falling back to the
+resume backend. Concurrent misses for the same job within a worker share
+one load.
 """
 
 from __future__ import annotations
@@ -15,11 +22,23 @@ import hashlib
 import threading
 import time
 from collections import OrderedDict
-from typing import Any
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable
+
+import yaml
 
 from config.settings import get_settings
 from src.presentation.services import job_resume_service
+from src.presentation.services.results_hydration_disk_cache import (
+    HydrationDiskCache,
+)
 from src.shared.logging import build_log_ref, get_logger
+from src.shared.metrics import (
+    CACHE_HIT_RATIO,
+    CACHE_OPERATIONS_TOTAL,
+    RESULTS_HYDRATION_COALESCED_TOTAL,
+)
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -32,15 +51,29 @@ _FULL_PAYLOAD_KEYS = (
     "toxcsm_df",
     "kegg_df",
 )
+_DOWNLOAD_CONFIG_PATH = (
+    Path(__file__).resolve().parents[2]
+    / "infrastructure"
+    / "config"
+    / "download_config.yaml"
+)
 
 
 class _HydrationCache:
-    """Small in-memory cache for hydrated payloads inside one worker process."""
+    """
+    Small in-memory cache for hydrated payloads inside one worker process.
+
+    Entries may be partial: each records which tables were requested
+    (None meaning the full payload), so later callbacks only load the tables
+    still missing.
+    """
 
     def __init__(self, max_entries: int, ttl_seconds: int) -> None:
         self._max_entries = max(int(max_entries), 1)
         self._ttl_seconds = max(int(ttl_seconds), 1)
-        self._store: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._store: OrderedDict[
+            str, tuple[float, dict[str, Any], frozenset[str] | None]
+        ] = OrderedDict()
         self._lock = threading.Lock()
 
     def _now(self) -> float:
@@ -48,33 +81,120 @@ class _HydrationCache:
 
     def _prune_expired(self, now: float) -> None:
         expired_keys = [
-            key for key, (expires_at, _) in self._store.items() if expires_at <= now
+            key for key, (expires_at, _, _) in self._store.items() if expires_at <= now
         ]
         for key in expired_keys:
             self._store.pop(key, None)
 
-    def get(self, key: str) -> dict[str, Any] | None:
+    def get(
+        self, key: str
+    ) -> tuple[dict[str, Any], frozenset[str] | None] | None:
+        """Return ``(payload, requested tables or None if full)``."""
         with self._lock:
             now = self._now()
             self._prune_expired(now)
             value = self._store.get(key)
             if value is None:
                 return None
-            expires_at, payload = value
+            expires_at, payload, tables = value
             if expires_at <= now:
                 self._store.pop(key, None)
                 return None
             self._store.move_to_end(key)
-            return payload
+            return payload, tables
+
+    def set(
+        self,
+        key: str,
+        payload: dict[str, Any],
+        tables: frozenset[str] | None = None,
+    ) -> None:
+        with self._lock:
+            now = self._now()
+            self._prune_expired(now)
+            self._store[key] = (now + self._ttl_seconds, payload, tables)
+            self._store.move_to_end(key)
+            while len(self._store) > self._max_entries:
+                self._store.popitem(last=False)
 
-    def set(self, key: str, payload: dict[str, Any]) -> None:
+    def merge(
+        self,
+        key: str,
+        payload: dict[str, Any],
+        tables: frozenset[str] | None,
+    ) -> dict[str, Any]:
+        """
+        Add loaded tables to the entry of ``key`` and return its payload.
+
+        Tables stored by concurrent loads of other tables are kept.
+        """
         with self._lock:
             now = self._now()
             self._prune_expired(now)
-            self._store[key] = (now + self._ttl_seconds, payload)
+            current = self._store.get(key)
+            if current is not None and tables is not None:
+                _, current_payload, current_tables = current
+                # Copy on merge: payloads handed to earlier callbacks stay as-is
+                payload = {**current_payload, **payload}
+                tables = None if current_tables is None else tables | current_tables
+            self._store[key] = (now + self._ttl_seconds, payload, tables)
             self._store.move_to_end(key)
             while len(self._store) > self._max_entries:
                 self._store.popitem(last=False)
+            return payload
+
+
+def _covers(loaded: frozenset[str] | None, requested: frozenset[str] | None) -> bool:
+    """Return whether tables ``loaded`` (None = all) include ``requested``."""
+    return loaded is None or (requested is not None and requested <= loaded)
+
+
+class _HydrationFlights:
+    """
+    Per-key single flight for hydration loads inside one worker process.
+
+    Each load registers the tables it fetches. A caller whose tables are
+    covered by a running load waits for it and then reads the hydration
+    cache; other callers of the same key load their own tables concurrently.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[
+            str, list[tuple[frozenset[str] | None, threading.Event]]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def claim(
+        self, key: str, tables: frozenset[str] | None = None
+    ) -> tuple[threading.Event, bool]:
+        """
+        Return ``(event, leader)``.
+
+        Leaders load ``tables`` and pass the event to :meth:`release`;
+        other callers wait on the event of a load covering their tables.
+        """
+        with self._lock:
+            flights = self._flights.setdefault(key, [])
+            for loading, event in flights:
+                if _covers(loading, tables):
+                    return event, False
+            event = threading.Event()
+            flights.append((tables, event))
+            return event, True
+
+    def release(self, key: str, event: threading.Event) -> None:
+        """End a leader's load and wake its waiters."""
+        with self._lock:
+            flights = [
+                (loading, waited)
+                for loading, waited in self._flights.get(key, ())
+                if waited is not event
+            ]
+            if flights:
+                self._flights[key] = flights
+            else:
+                self._flights.pop(key, None)
+        event.set()
 
 
 _hydration_cache = _HydrationCache(
@@ -83,6 +203,52 @@ _hydration_cache = _HydrationCache(
 )
 
 
+def _build_disk_cache() -> HydrationDiskCache | None:
+    if not settings.RESULTS_HYDRATION_L2_ENABLED:
+        return None
+    try:
+        return HydrationDiskCache(
+            directory=settings.CACHE_DIR / "results_hydration",
+            size_limit_mb=settings.RESULTS_HYDRATION_L2_SIZE_MB,
+            ttl_seconds=settings.RESULTS_HYDRATION_CACHE_TTL_SECONDS,
+        )
+    except Exception:
+        logger.exception("Results hydration disk cache unavailable; using L1 only")
+        return None
+
+
+_hydration_disk_cache = _build_disk_cache()
+_hydration_flights = _HydrationFlights()
+_tier_counts: dict[str, list[int]] = {"l1": [0, 0], "l2": [0, 0]}
+_tier_counts_lock = threading.Lock()
+
+
+def _observe_coalesced(outcome: str) -> None:
+    """Count a hydration that waited on a concurrent load of the same job."""
+    try:
+        RESULTS_HYDRATION_COALESCED_TOTAL.labels(outcome=outcome).inc()
+    except Exception:
+        return
+
+
+def _observe_tier(tier: str, hit: bool) -> None:
+    """Count a lookup on a hydration cache tier and refresh its hit ratio."""
+    cache_type = f"results_hydration_{tier}"
+    with _tier_counts_lock:
+        counts = _tier_counts[tier]
+        counts[0 if hit else 1] += 1
+        ratio = counts[0] / (counts[0] + counts[1])
+    try:
+        CACHE_OPERATIONS_TOTAL.labels(
+            cache_type=cache_type,
+            operation="get",
+            outcome="hit" if hit else "miss",
+        ).inc()
+        CACHE_HIT_RATIO.labels(cache_type=cache_type).set(ratio)
+    except Exception:
+        return
+
+
 def _build_cache_key(job_id: str, owner_token: str) -> str:
     digest = hashlib.sha256(f"{job_id}|{owner_token}".encode("utf-8")).hexdigest()
     return digest
@@ -102,6 +268,14 @@ def _hydration_retry_attempts() -> int:
         return 1
 
 
+def _hydration_wait_seconds() -> float:
+    raw_value = getattr(settings, "RESULTS_HYDRATION_WAIT_SECONDS", 15)
+    try:
+        return float(max(int(raw_value), 1))
+    except (TypeError, ValueError):
+        return 15.0
+
+
 def _hydration_retry_delay_seconds() -> float:
     raw_value = getattr(settings, "RESULTS_HYDRATION_RETRY_DELAY_MS", 0)
     try:
@@ -128,9 +302,37 @@ def _extract_payload_ref_identity(payload_ref: dict[str, Any]) -> tuple[str, str
     return job_id.strip().upper(), owner_token.strip()
 
 
+@lru_cache(maxsize=1)
+def _load_use_case_tables() -> dict[str, tuple[str, ...]]:
+    try:
+        with open(_DOWNLOAD_CONFIG_PATH, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+    except (OSError, yaml.YAMLError):
+        logger.warning(
+            "Download config unavailable; use cases hydrate full payloads",
+            exc_info=True,
+        )
+        return {}
+    return {
+        str(use_case_id): tuple(uc_config.get("databases") or ())
+        for use_case_id, uc_config in config.items()
+        if isinstance(uc_config, dict)
+    }
+
+
+def use_case_tables(use_case_id: str) -> tuple[str, ...] | None:
+    """
+    Return result tables declared for a use case in `download_config.yaml`.
+
+    Returns None when the use case declares no tables.
+    """
+    return _load_use_case_tables().get(use_case_id) or None
+
+
 def _load_payload_with_retry(
     job_id: str,
     owner_token: str,
+    tables: tuple[str, ...] | None = None,
 ) -> tuple[dict[str, Any] | None, str | None, int]:
     max_attempts = _hydration_retry_attempts()
     delay_seconds = _hydration_retry_delay_seconds()
@@ -140,7 +342,9 @@ def _load_payload_with_retry(
     last_status: str | None = None
     for attempt in range(1, max_attempts + 1):
         attempts = attempt
-        payload, status = job_resume_service.load_job_payload(job_id, owner_token)
+        payload, status = job_resume_service.load_job_payload(
+            job_id, owner_token, tables=tables
+        )
         last_status = status
         if status == job_resume_service.STATUS_OK and isinstance(payload, dict):
             return payload, status, attempts
@@ -154,6 +358,64 @@ def _load_payload_with_retry(
     return None, last_status, attempts
 
 
+def _lookup_hydration_cache(
+    cache_key: str, requested: frozenset[str] | None
+) -> tuple[dict[str, Any] | None, dict[str, Any], frozenset[str] | None]:
+    """Return ``(payload if it covers requested, cached payload, cached tables)``."""
+    cached = _hydration_cache.get(cache_key)
+    if cached is None:
+        return None, {}, frozenset()
+    cached_payload, cached_tables = cached
+    if _covers(cached_tables, requested):
+        return cached_payload, cached_payload, cached_tables
+    return None, cached_payload, cached_tables
+
+
+def _hydrate_payload(
+    cache_key: str,
+    job_id: str,
+    owner_token: str,
+    requested: frozenset[str] | None,
+    cached_payload: dict[str, Any],
+    cached_tables: frozenset[str] | None,
+) -> dict[str, Any]:
+    """Load tables missing from the hydration cache from L2 or the backend."""
+    missing_set = None if requested is None else requested - cached_tables
+    if _hydration_disk_cache is not None:
+        shared = _hydration_disk_cache.get(cache_key, missing_set)
+        _observe_tier("l2", hit=shared is not None)
+        if shared is not None:
+            if missing_set is not None:
+                shared = {**cached_payload, **shared}
+                requested = requested | cached_tables
+            return _hydration_cache.merge(cache_key, shared, requested)
+
+    missing = None if missing_set is None else tuple(sorted(missing_set))
+    payload, status, attempts = _load_payload_with_retry(
+        job_id,
+        owner_token,
+        tables=missing,
+    )
+    if isinstance(payload, dict):
+        if _hydration_disk_cache is not None:
+            _hydration_disk_cache.set(cache_key, payload, missing_set)
+        if missing is not None:
+            # Copy on merge: payloads handed to earlier callbacks stay as-is
+            payload = {**cached_payload, **payload}
+            requested = requested | cached_tables
+        return _hydration_cache.merge(cache_key, payload, requested)
+
+    logger.warning(
+        "Failed to hydrate results payload from resume backend",
+        extra={
+            "job_ref": build_log_ref(job_id, namespace="job"),
+            "status": status,
+            "attempts": attempts,
+        },
+    )
+    return {}
+
+
 def prime_results_payload_cache(payload: Any, owner_token: str) -> bool:
     """
     Prime hydration cache with a just-produced full payload.
@@ -213,13 +475,24 @@ def build_results_payload_ref(payload: dict[str, Any], owner_token: str) -> dict
     }
 
 
-def resolve_results_payload(store_data: Any) -> dict[str, Any]:
+def resolve_results_payload(
+    store_data: Any, tables: Iterable[str] | None = None
+) -> dict[str, Any]:
     """
-    Resolve full merged payload from store data.
+    Resolve merged payload from store data.
 
     Accepted shapes:
     - full payload dict (legacy/client mode)
     - reference payload dict (server mode)
+
+    Parameters
+    ----------
+    store_data : Any
+        `merged-result-store` data.
+    tables : Iterable[str] | None
+        Result tables the caller reads. In server mode only these are loaded
+        and deserialized (the payload may hold more when already cached);
+        metadata is always included. None resolves the full payload.
     """
     if _is_full_payload(store_data):
         return store_data
@@ -236,25 +509,43 @@ def resolve_results_payload(store_data: Any) -> dict[str, Any]:
         return {}
     normalized_job_id, normalized_owner_token = identity
 
+    requested = None if tables is None else frozenset(tables)
     cache_key = _build_cache_key(normalized_job_id, normalized_owner_token)
-    cached_payload = _hydration_cache.get(cache_key)
-    if isinstance(cached_payload, dict):
-        return cached_payload
+    hit, cached_payload, cached_tables = _lookup_hydration_cache(cache_key, requested)
+    if hit is not None:
+        _observe_tier("l1", hit=True)
+        return hit
+    _observe_tier("l1", hit=False)
+
+    in_flight, leader = _hydration_flights.claim(cache_key, requested)
+    if not leader:
+        # Another callback is loading these tables: wait for it, then reuse
+        # its result, falling back to an own load if it failed or timed out
+        in_flight.wait(_hydration_wait_seconds())
+        hit, cached_payload, cached_tables = _lookup_hydration_cache(
+            cache_key, requested
+        )
+        _observe_coalesced("saved" if hit is not None else "fallback")
+        if hit is not None:
+            return hit
+    try:
+        return _hydrate_payload(
+            cache_key,
+            normalized_job_id,
+            normalized_owner_token,
+            requested,
+            cached_payload,
+            cached_tables,
+        )
+    finally:
+        if leader:
+            _hydration_flights.release(cache_key, in_flight)
 
-    payload, status, attempts = _load_payload_with_retry(
-        normalized_job_id,
-        normalized_owner_token,
-    )
-    if isinstance(payload, dict):
-        _hydration_cache.set(cache_key, payload)
-        return payload
 
-    logger.warning(
-        "Failed to hydrate results payload from resume backend",
-        extra={
-            "job_ref": build_log_ref(normalized_job_id, namespace="job"),
-            "status": status,
-            "attempts": attempts,
-        },
-    )
-    return {}
+def resolve_use_case_payload(store_data: Any, use_case_id: str) -> dict[str, Any]:
+    """
+    Resolve the tables a use case reads, as declared in `download_config.yaml`.
+
+    Use cases without declared tables resolve the full payload.
+    """
+    return resolve_results_payload(store_data, tables=use_case_tables(use_case_id))
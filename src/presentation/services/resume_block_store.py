@@ -0,0 +1,236 @@
+"""
+Resume Block Store - content-addressed table blocks for resume payloads.
+
+Job entries keep only a manifest: each columnar table is replaced by a
+reference to a block keyed by the SHA256 of its packed bytes (see
+``resume_payload_codec.pack_table``). Identical
+tables - the raw/display pairs of one job, or the same table across jobs -
+are written once. Every block carries a reference count of the manifests
+pointing at it, and its TTL is extended to cover the longest-lived one, so
+blocks are deleted when their last manifest is replaced and expire with the
+last manifest otherwise.
+
+Each table is serialized exactly once: the bytes that are hashed are the
+bytes that are stored, and their length is the size used for limits and
+metrics. Blocks are loaded through the store's ``get_buffer``, so blocks
+kept in files are memory-mapped and their columns read in place.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.shared.logging import build_log_ref, get_logger
+from src.shared.metrics import CACHE_OPERATIONS_TOTAL
+
+from .resume_payload_codec import is_packed_table, pack_table, unpack_table
+from .resume_store import ResumeStore
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class EncodedPayload:
+    """Resume payload serialized for storage."""
+
+    manifest: Dict[str, Any]
+    blocks: Dict[str, bytes]
+    size_bytes: int
+
+
+class ResumeBlockStore:
+    """Store columnar payload tables as shared, reference-counted blocks."""
+
+    CACHE_TYPE = "resume_block"
+    BLOCK_KEY_PREFIX = "resume:v1:block:"
+    REFS_KEY_PREFIX = "resume:v1:refs:"
+    REF_FIELD = "block"
+    # Stored once and then only touched: kept out of recency-based eviction
+    KEY_PREFIXES = (BLOCK_KEY_PREFIX, REFS_KEY_PREFIX)
+
+    def __init__(self, store: ResumeStore) -> None:
+        self._store = store
+
+    def _count(self, operation: str, outcome: str, amount: int = 1) -> None:
+        if amount:
+            CACHE_OPERATIONS_TOTAL.labels(
+                cache_type=self.CACHE_TYPE,
+                operation=operation,
+                outcome=outcome,
+            ).inc(amount)
+
+    @staticmethod
+    def _canonical_json(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, sort_keys=True)
+
+    @classmethod
+    def split_tables(cls, stored_payload: Dict[str, Any]) -> EncodedPayload:
+        """
+        Serialize columnar tables into blocks and replace them by references.
+
+        Parameters
+        ----------
+        stored_payload : Dict[str, Any]
+            Output of ``encode_payload(payload, binary=True)``.
+
+        Returns
+        -------
+        EncodedPayload
+            Manifest payload, serialized distinct blocks by digest, and the
+            serialized size of the full payload in bytes.
+        """
+        blocks: Dict[str, bytes] = {}
+        table_refs: Dict[str, Dict[str, Any]] = {}
+        size_bytes = 0
+        for name, table in stored_payload["tables"].items():
+            encoded = pack_table(table)
+            digest = hashlib.sha256(encoded).hexdigest()
+            if digest not in blocks:
+                blocks[digest] = encoded
+            table_refs[name] = {cls.REF_FIELD: digest, "bytes": len(encoded)}
+            size_bytes += len(encoded)
+
+        manifest = dict(stored_payload, tables=table_refs)
+        size_bytes += len(cls._canonical_json(manifest).encode("utf-8"))
+        return EncodedPayload(manifest=manifest, blocks=blocks, size_bytes=size_bytes)
+
+    @classmethod
+    def referenced_blocks(cls, stored_payload: Any) -> List[str]:
+        """Return distinct block digests referenced by a manifest payload."""
+        if not isinstance(stored_payload, dict):
+            return []
+        tables = stored_payload.get("tables")
+        if not isinstance(tables, dict):
+            return []
+        digests = []
+        for table in tables.values():
+            digest = table.get(cls.REF_FIELD) if isinstance(table, dict) else None
+            if isinstance(digest, str) and digest not in digests:
+                digests.append(digest)
+        return digests
+
+    def _block_key(self, digest: str) -> str:
+        return f"{self.BLOCK_KEY_PREFIX}{digest}"
+
+    def _refs_key(self, digest: str) -> str:
+        return f"{self.REFS_KEY_PREFIX}{digest}"
+
+    def acquire(
+        self, blocks: Dict[str, bytes], ttl_seconds: int
+    ) -> Optional[Dict[str, int]]:
+        """
+        Take one reference on each block, writing blocks not yet stored.
+
+        Returns
+        -------
+        Optional[Dict[str, int]]
+            ``written`` and ``shared`` block counts, or None when a block
+            could not be stored (references taken so far are released).
+        """
+        acquired: List[str] = []
+        written = 0
+        for digest, data in blocks.items():
+            # Count first: release only deletes blocks whose count is zero,
+            # so a block touch finds stays stored, and one deleted before our
+            # increment is missing here and rewritten below
+            if self._store.incr(self._refs_key(digest), 1, ttl_seconds) is None:
+                self._count("set", "failed")
+                self.release(acquired)
+                return None
+            acquired.append(digest)
+            block_key = self._block_key(digest)
+            if self._store.touch(block_key, ttl_seconds):
+                continue
+            if not self._store.set_bytes(block_key, data, ttl_seconds):
+                self._count("set", "failed")
+                self.release(acquired)
+                return None
+            written += 1
+
+        shared = len(blocks) - written
+        self._count("set", "stored", written)
+        self._count("set", "shared", shared)
+        return {"written": written, "shared": shared}
+
+    def release(self, digests: Iterable[str]) -> None:
+        """Drop one reference per block, deleting blocks no longer used."""
+        for digest in digests:
+            refs_key = self._refs_key(digest)
+            remaining = self._store.incr(refs_key, -1, 1)
+            if remaining is None or remaining > 0:
+                continue
+            # Re-checks the count atomically: an acquire may have run since
+            if self._store.delete_unreferenced(refs_key, self._block_key(digest)):
+                self._count("delete", "released")
+
+    def _load_block(self, digest: str) -> Tuple[Optional[Dict[str, Any]], int]:
+        """Return a block's table and stored size, (None, 0) when missing."""
+        block_key = self._block_key(digest)
+        data = self._store.get_buffer(block_key)
+        if data is not None:
+            try:
+                if is_packed_table(data):
+                    table = unpack_table(data)
+                else:
+                    # Blocks written as JSON before tables were packed
+                    table = json.loads(bytes(data))
+            except ValueError:
+                table = None
+            return (table, len(data)) if isinstance(table, dict) else (None, 0)
+        # Blocks written before block bytes were stored as-is
+        table = self._store.get(block_key)
+        return table, 0
+
+    def resolve(
+        self, manifest: Dict[str, Any], tables: Optional[Iterable[str]] = None
+    ) -> Optional[Tuple[Dict[str, Any], int]]:
+        """
+        Replace block references in a manifest payload by their tables.
+
+        Parameters
+        ----------
+        manifest : Dict[str, Any]
+            Manifest payload from :meth:`split_tables`.
+        tables : Optional[Iterable[str]]
+            Tables to load; references to other tables are left unresolved.
+            None loads every table.
+
+        Returns
+        -------
+        Optional[Tuple[Dict[str, Any], int]]
+            Payload accepted by ``decode_payload`` and the stored size of the
+            blocks read, or None when a referenced block is missing.
+        """
+        if not isinstance(manifest.get("tables"), dict):
+            return manifest, 0
+
+        wanted = None if tables is None else set(tables)
+        loaded: Dict[str, Dict[str, Any]] = {}
+        resolved: Dict[str, Any] = {}
+        size_bytes = 0
+        for name, table in manifest["tables"].items():
+            digest = table.get(self.REF_FIELD) if isinstance(table, dict) else None
+            if not isinstance(digest, str) or (
+                wanted is not None and name not in wanted
+            ):
+                # Table not requested, or inline (written before block storage)
+                resolved[name] = table
+                continue
+            if digest not in loaded:
+                block, block_bytes = self._load_block(digest)
+                if block is None:
+                    self._count("get", "miss")
+                    logger.warning(
+                        "Resume payload block missing",
+                        extra={
+                            "block_ref": build_log_ref(digest, namespace="block"),
+                            "backend": self._store.backend_name,
+                        },
+                    )
+                    return None
+                self._count("get", "hit")
+                loaded[digest] = block
+                size_bytes += block_bytes or int(table.get("bytes", 0) or 0)
+            resolved[name] = loaded[digest]
+        return dict(manifest, tables=resolved), size_bytes
@@ -0,0 +1,310 @@
+"""
+Resume Payload Codec - column-oriented encoding of result tables.
+
+Result tables travel through the app as ``to_dict("records")`` lists, which
+repeat every column name in every row. Resume payload v2 stores each table
+column by column instead: string columns as a value dictionary plus int32
+codes, numeric and boolean columns as typed little-endian arrays. Binary
+arrays are base64 encoded so the payload stays JSON-safe for the Redis
+backend and compact for the pickling diskcache backend.
+
+Tables can also be packed into one binary buffer: a small JSON index
+followed by the raw, 8-byte aligned column arrays. Unpacking only parses the
+index; arrays are read in place, so a packed table in a memory-mapped file
+is decoded without copying its buffers first.
+
+Functions
+---------
+encode_payload(payload)
+    Encode record-list tables of a payload column-wise
+decode_payload(encoded)
+    Rebuild the original payload from :func:`encode_payload` output
+pack_table(table) / unpack_table(buffer)
+    Convert a binary columnar table to and from its packed form
+"""
+
+import base64
+import json
+import struct
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+PAYLOAD_FORMAT = "columnar-v1"
+PACKED_TABLE_MAGIC = b"BRPCOL1\n"
+_PACKED_LENGTH = struct.Struct("<Q")
+_PACKED_ALIGNMENT = 8
+# Column fields holding arrays (base64 strings, arrays or buffers)
+_ARRAY_FIELDS = ("codes", "data")
+
+# Column kinds -> little-endian array dtype
+_ARRAY_DTYPES = {
+    "float64": "<f8",
+    "int64": "<i8",
+    "bool": "|u1",
+}
+
+
+def _b64(array: np.ndarray) -> str:
+    return base64.b64encode(array.tobytes()).decode("ascii")
+
+
+def _column_array(column: Dict[str, Any], field: str, dtype: str) -> np.ndarray:
+    blob = column[field]
+    if isinstance(blob, str):
+        return np.frombuffer(base64.b64decode(blob), dtype=dtype)
+    return np.frombuffer(blob, dtype=dtype)
+
+
+def _encode_column(values: Sequence[Any]) -> Dict[str, Any]:
+    """Encode one column with raw arrays, falling back to the plain value list."""
+    value_types = set(map(type, values))
+
+    if value_types <= {str, type(None)}:
+        codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+        return {
+            "kind": "dict",
+            "values": uniques.tolist(),
+            "codes": codes.astype("<i4"),
+        }
+    if value_types == {float}:
+        return {"kind": "float64", "data": np.asarray(values, dtype="<f8")}
+    if value_types == {int}:
+        try:
+            data = np.asarray(values, dtype="<i8")
+        except OverflowError:
+            return {"kind": "values", "values": list(values)}
+        return {"kind": "int64", "data": data}
+    if value_types == {bool}:
+        return {"kind": "bool", "data": np.asarray(values, dtype="|u1")}
+    return {"kind": "values", "values": list(values)}
+
+
+def _decode_column(column: Dict[str, Any]) -> List[Any]:
+    kind = column["kind"]
+    if kind == "dict":
+        codes = _column_array(column, "codes", "<i4")
+        # Code -1 (missing) selects the trailing None
+        lookup = np.array(list(column["values"]) + [None], dtype=object)
+        return lookup[codes].tolist()
+    if kind in _ARRAY_DTYPES:
+        data = _column_array(column, "data", _ARRAY_DTYPES[kind])
+        if kind == "bool":
+            data = data.astype(bool)
+        return data.tolist()
+    if kind == "values":
+        return list(column["values"])
+    raise ValueError(f"Unknown column kind '{kind}'")
+
+
+def encode_table(
+    records: List[Dict[str, Any]], binary: bool = False
+) -> Optional[Dict[str, Any]]:
+    """
+    Encode a list of records column-wise.
+
+    Parameters
+    ----------
+    records : List[Dict[str, Any]]
+        Rows sharing the same keys (``DataFrame.to_dict("records")``).
+    binary : bool
+        Keep column arrays as numpy arrays (for :func:`pack_table`) instead
+        of base64 strings.
+
+    Returns
+    -------
+    Optional[Dict[str, Any]]
+        Columnar table, or None when rows do not share one set of keys.
+    """
+    if not records:
+        return {"format": PAYLOAD_FORMAT, "rows": 0, "columns": []}
+    if not isinstance(records[0], dict) or not records[0]:
+        return None
+    names = list(records[0])
+
+    # Every row must hold exactly the first row's keys: same size, and the
+    # getter raises on a missing key or a non-dict row
+    try:
+        if set(map(len, records)) != {len(names)}:
+            return None
+        rows = list(map(itemgetter(*names), records))
+    except (KeyError, TypeError):
+        return None
+    column_values = list(zip(*rows)) if len(names) > 1 else [tuple(rows)]
+
+    columns = []
+    for name, values in zip(names, column_values):
+        column = _encode_column(values)
+        column["name"] = name
+        if not binary:
+            for field in _ARRAY_FIELDS:
+                if field in column:
+                    column[field] = _b64(column[field])
+        columns.append(column)
+    return {"format": PAYLOAD_FORMAT, "rows": len(records), "columns": columns}
+
+
+def decode_table(table: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Rebuild records from :func:`encode_table` output."""
+    if table.get("format") != PAYLOAD_FORMAT:
+        raise ValueError(f"Unsupported table format '{table.get('format')}'")
+    columns = table["columns"]
+    if not columns:
+        return [{} for _ in range(int(table["rows"]))]
+
+    names = [column["name"] for column in columns]
+    values = [_decode_column(column) for column in columns]
+    if any(len(column_values) != table["rows"] for column_values in values):
+        raise ValueError("Column lengths do not match row count")
+    return [dict(zip(names, row)) for row in zip(*values)]
+
+
+def encode_payload(payload: Dict[str, Any], binary: bool = False) -> Dict[str, Any]:
+    """
+    Encode record-list tables of a payload column-wise.
+
+    Parameters
+    ----------
+    payload : Dict[str, Any]
+        Serialized merged-result payload (tables as record lists plus
+        metadata).
+    binary : bool
+        Keep column arrays as numpy arrays, see :func:`encode_table`.
+
+    Returns
+    -------
+    Dict[str, Any]
+        ``tables`` (columnar tables), ``fields`` (every other entry, kept
+        as-is) and ``order`` (original key order).
+    """
+    tables: Dict[str, Any] = {}
+    fields: Dict[str, Any] = {}
+    for key, value in payload.items():
+        table = encode_table(value, binary=binary) if isinstance(value, list) else None
+        if table is None:
+            fields[key] = value
+        else:
+            tables[key] = table
+    return {"tables": tables, "fields": fields, "order": list(payload)}
+
+
+def _aligned(size: int) -> int:
+    return -(-size // _PACKED_ALIGNMENT) * _PACKED_ALIGNMENT
+
+
+def pack_table(table: Dict[str, Any]) -> bytes:
+    """
+    Pack a table from ``encode_table(records, binary=True)`` into bytes.
+
+    The layout is the magic marker, the index length, the JSON index (the
+    table without its arrays, which are replaced by ``[offset, length]``)
+    and then the arrays, each starting on an 8-byte boundary. Packing is
+    deterministic, so equal tables pack to equal bytes.
+    """
+    index_columns = []
+    buffers: List[bytes] = []
+    offset = 0
+    for column in table["columns"]:
+        entry = dict(column)
+        for field in _ARRAY_FIELDS:
+            if field not in column:
+                continue
+            data = np.ascontiguousarray(column[field]).tobytes()
+            padding = _aligned(len(data)) - len(data)
+            entry[field] = [offset, len(data)]
+            buffers.extend((data, b"\0" * padding))
+            offset += len(data) + padding
+        index_columns.append(entry)
+
+    index = json.dumps(
+        dict(table, columns=index_columns),
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    head = len(PACKED_TABLE_MAGIC) + _PACKED_LENGTH.size + len(index)
+    return b"".join(
+        [
+            PACKED_TABLE_MAGIC,
+            _PACKED_LENGTH.pack(len(index)),
+            index,
+            b"\0" * (_aligned(head) - head),
+            *buffers,
+        ]
+    )
+
+
+def is_packed_table(buffer: Any) -> bool:
+    """Return whether ``buffer`` starts with a packed table marker."""
+    return bytes(memoryview(buffer)[: len(PACKED_TABLE_MAGIC)]) == PACKED_TABLE_MAGIC
+
+
+def unpack_table(buffer: Any) -> Dict[str, Any]:
+    """
+    Read the index of a packed table.
+
+    Array fields of the returned table are views into ``buffer`` (bytes or
+    a memory map), read only when :func:`decode_table` touches them.
+
+    Raises
+    ------
+    ValueError
+        If the buffer is not a well-formed packed table.
+    """
+    view = memoryview(buffer)
+    if not is_packed_table(view):
+        raise ValueError("Not a packed columnar table")
+    start = len(PACKED_TABLE_MAGIC) + _PACKED_LENGTH.size
+    try:
+        (index_length,) = _PACKED_LENGTH.unpack_from(view, len(PACKED_TABLE_MAGIC))
+        table = json.loads(bytes(view[start : start + index_length]))
+        data_start = _aligned(start + index_length)
+        for column in table["columns"]:
+            for field in _ARRAY_FIELDS:
+                if field in column:
+                    offset, length = column[field]
+                    if data_start + offset + length > len(view):
+                        raise ValueError("Packed table is truncated")
+                    column[field] = view[
+                        data_start + offset : data_start + offset + length
+                    ]
+    except (struct.error, KeyError, TypeError) as e:
+        raise ValueError(f"Malformed packed table: {e}") from e
+    return table
+
+
+def decode_payload(
+    encoded: Dict[str, Any], tables: Optional[Iterable[str]] = None
+) -> Dict[str, Any]:
+    """
+    Rebuild the original payload from :func:`encode_payload` output.
+
+    Parameters
+    ----------
+    encoded : Dict[str, Any]
+        Output of :func:`encode_payload`.
+    tables : Optional[Iterable[str]]
+        Tables to decode. Other tables are left out of the result; every
+        non-table field is always kept. None decodes all tables.
+
+    Raises
+    ------
+    ValueError
+        If the encoded payload is malformed.
+    """
+    wanted = None if tables is None else set(tables)
+    try:
+        encoded_tables = encoded["tables"]
+        fields = encoded["fields"]
+        order = encoded["order"]
+        decoded = {}
+        for key in order:
+            if key not in encoded_tables:
+                decoded[key] = fields[key]
+            elif wanted is None or key in wanted:
+                decoded[key] = decode_table(encoded_tables[key])
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Malformed columnar payload: {e}") from e
+    return decoded
@@ -0,0 +1,126 @@
+"""
+Resume Persist Executor - bounded write-behind pool for resume saves.
+
+Processing callbacks hand resume saves to this executor and only wait a
+bounded time for confirmation. Each worker process runs at most
+``max_workers`` saves at once and queues at most ``max_queue`` more; when
+both are taken, ``submit`` blocks the caller until a slot frees up or its
+timeout expires (backpressure) instead of starting another writer.
+``drain`` waits for accepted saves on worker shutdown.
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+from src.shared.logging import get_logger
+from src.shared.metrics import RESUME_PERSIST_IN_FLIGHT, RESUME_PERSIST_QUEUE_DEPTH
+
+logger = get_logger(__name__)
+
+
+class ResumePersistExecutor:
+    """Bounded thread pool for resume persistence inside one worker."""
+
+    THREAD_NAME_PREFIX = "resume-persistence"
+
+    def __init__(self, max_workers: int, max_queue: int) -> None:
+        self._max_workers = max(int(max_workers), 1)
+        self._max_queue = max(int(max_queue), 0)
+        self._slots = threading.BoundedSemaphore(self._max_workers + self._max_queue)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._in_flight = 0
+        self._closed = False
+        # Threads start on first submit, so forked workers do not inherit them
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queued
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix=self.THREAD_NAME_PREFIX,
+                )
+            return self._pool
+
+    def _update_counts(self, queued: int = 0, in_flight: int = 0) -> None:
+        with self._lock:
+            self._queued += queued
+            self._in_flight += in_flight
+            RESUME_PERSIST_QUEUE_DEPTH.set(self._queued)
+            RESUME_PERSIST_IN_FLIGHT.set(self._in_flight)
+
+    def submit(
+        self, fn: Callable[[], None], timeout_seconds: float
+    ) -> Optional[Future]:
+        """
+        Schedule ``fn``, waiting up to ``timeout_seconds`` for a free slot.
+
+        Returns
+        -------
+        Optional[Future]
+            Future of the scheduled call, or None when no slot freed up in
+            time or the executor is draining.
+        """
+        if self._closed:
+            return None
+        if not self._slots.acquire(timeout=max(float(timeout_seconds), 0.0)):
+            return None
+
+        def _run() -> None:
+            self._update_counts(queued=-1, in_flight=1)
+            try:
+                fn()
+            finally:
+                self._update_counts(in_flight=-1)
+                self._slots.release()
+
+        self._update_counts(queued=1)
+        try:
+            return self._get_pool().submit(_run)
+        except RuntimeError:
+            # Pool shut down between the closed check and submit
+            self._update_counts(queued=-1)
+            self._slots.release()
+            return None
+
+    def drain(self, timeout_seconds: float) -> bool:
+        """
+        Stop accepting saves and wait for accepted ones to finish.
+
+        Returns
+        -------
+        bool
+            True when every accepted save completed within the timeout.
+        """
+        self._closed = True
+        deadline = time.monotonic() + max(float(timeout_seconds), 0.0)
+        drained = True
+        while self._queued or self._in_flight:
+            if time.monotonic() >= deadline:
+                logger.warning(
+                    "Resume persistence drain timed out; queued saves dropped",
+                    extra={
+                        "queue_depth": self._queued,
+                        "in_flight": self._in_flight,
+                        "timeout_seconds": timeout_seconds,
+                    },
+                )
+                drained = False
+                break
+            time.sleep(0.05)
+        with self._lock:
+            pool = self._pool
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return drained
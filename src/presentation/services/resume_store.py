@@ -3,7 +3,7 @@ Resume store contract for job resume persistence backends.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Optional
 
 
 class ResumeStore(ABC):
@@ -22,6 +22,72 @@ class ResumeStore(ABC):
     def get(self, key: str) -> Optional[dict]:
         """Load value by key. Returns None when missing or invalid."""
 
+    def set_bytes(self, key: str, data: bytes, ttl_seconds: int) -> bool:
+        """
+        Persist an already-serialized value with TTL. Returns True on success.
+
+        Backends that only hold dicts keep the bytes in a wrapper value.
+        """
+        return self.set(key, {"bytes": data}, ttl_seconds)
+
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        """Load a value stored with :meth:`set_bytes`. None when missing."""
+        value = self.get(key)
+        data = value.get("bytes") if isinstance(value, dict) else None
+        return data if isinstance(data, bytes) else None
+
+    def get_buffer(self, key: str) -> Optional[Any]:
+        """
+        Load a value stored with :meth:`set_bytes` as a bytes-like buffer.
+
+        Unlike :meth:`get_bytes`, the result may be a ``bytearray`` or a
+        memory map (backends that assemble or map values avoid a copy);
+        callers must not modify it. None when missing.
+        """
+        return self.get_bytes(key)
+
+    def touch(self, key: str, ttl_seconds: int) -> bool:
+        """
+        Extend the TTL of an existing key to at least ``ttl_seconds``.
+
+        Returns False when the key is missing. Backends without TTL
+        introspection rewrite the value with the new TTL.
+        """
+        value = self.get(key)
+        return value is not None and self.set(key, value, ttl_seconds)
+
+    def incr(self, key: str, delta: int, ttl_seconds: int) -> Optional[int]:
+        """
+        Add ``delta`` to the counter at ``key`` and return the new value.
+
+        The counter TTL is extended to at least ``ttl_seconds``. Returns None
+        when the backend could not update the counter.
+        """
+        current = self.get(key) or {}
+        count = int(current.get("count", 0)) + int(delta)
+        if not self.set(key, {"count": count}, ttl_seconds):
+            return None
+        return count
+
+    def delete(self, key: str) -> bool:
+        """Remove key. Backends without deletion let the TTL reclaim it."""
+        return False
+
+    def delete_unreferenced(self, counter_key: str, key: str) -> bool:
+        """
+        Delete ``key`` and ``counter_key`` if the counter is zero or missing.
+
+        Backends make the check and the deletion atomic with respect to
+        :meth:`incr`, so a reference taken concurrently keeps the value.
+        Returns True when the keys were deleted.
+        """
+        current = self.get(counter_key) or {}
+        if int(current.get("count", 0)) > 0:
+            return False
+        self.delete(key)
+        self.delete(counter_key)
+        return True
+
     @abstractmethod
     def close(self) -> None:
         """Release backend resources."""
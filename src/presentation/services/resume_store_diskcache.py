@@ -1,9 +1,20 @@
 """
 Diskcache adapter for resume payload persistence.
+
+Byte values above diskcache's file threshold are kept in their own files
+and can be read through a read-only memory map (:meth:`get_buffer`).
+
+The main cache culls least-recently-stored entries when it is full. Keys
+under ``ttl_only_prefixes`` (shared, reference-counted blocks and their
+counts, which are stored once and then only touched) live in a second cache
+that never culls: its entries leave by TTL or deletion, and writes that
+would exceed its size limit are refused instead.
 """
 
+import mmap
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Optional
 
 import diskcache
 
@@ -16,22 +27,53 @@ logger = get_logger(__name__)
 class DiskcacheResumeStore(ResumeStore):
     """Diskcache implementation of ResumeStore."""
 
-    def __init__(self, cache_dir: Path, cache_size_mb: int) -> None:
+    TTL_ONLY_DIRNAME = "ttl_only"
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        cache_size_mb: int,
+        ttl_only_prefixes: Iterable[str] = (),
+    ) -> None:
         self._cache_dir = Path(cache_dir)
         self._cache_dir.mkdir(parents=True, exist_ok=True)
-        self._cache = diskcache.Cache(
-            str(self._cache_dir),
-            size_limit=max(int(cache_size_mb), 32) * 1024 * 1024,
+        size_limit = max(int(cache_size_mb), 32) * 1024 * 1024
+        self._cache = diskcache.Cache(str(self._cache_dir), size_limit=size_limit)
+        self._ttl_only_prefixes = tuple(ttl_only_prefixes)
+        self._ttl_only_cache = (
+            diskcache.Cache(
+                str(self._cache_dir / self.TTL_ONLY_DIRNAME),
+                size_limit=size_limit,
+                eviction_policy="none",
+            )
+            if self._ttl_only_prefixes
+            else None
         )
 
     @property
     def backend_name(self) -> str:
         return "diskcache"
 
+    def _cache_for(self, key: str) -> diskcache.Cache:
+        if self._ttl_only_cache is not None and key.startswith(
+            self._ttl_only_prefixes
+        ):
+            return self._ttl_only_cache
+        return self._cache
+
+    def _has_room(self, cache: diskcache.Cache, size: int) -> bool:
+        """Size guard for the cache that never culls."""
+        if cache is not self._ttl_only_cache:
+            return True
+        if cache.volume() + size <= cache.size_limit:
+            return True
+        cache.expire()
+        return cache.volume() + size <= cache.size_limit
+
     def set(self, key: str, value: dict, ttl_seconds: int) -> bool:
         cache_ref = build_log_ref(key, namespace="cache")
         try:
-            self._cache.set(key, value, expire=max(int(ttl_seconds), 1))
+            self._cache_for(key).set(key, value, expire=max(int(ttl_seconds), 1))
             return True
         except Exception:
             logger.exception(
@@ -43,7 +85,7 @@ class DiskcacheResumeStore(ResumeStore):
     def get(self, key: str) -> Optional[dict]:
         cache_ref = build_log_ref(key, namespace="cache")
         try:
-            value = self._cache.get(key, default=None)
+            value = self._cache_for(key).get(key, default=None)
         except Exception:
             logger.exception(
                 "Diskcache resume get failed",
@@ -52,5 +94,124 @@ class DiskcacheResumeStore(ResumeStore):
             return None
         return value if isinstance(value, dict) else None
 
+    def set_bytes(self, key: str, data: bytes, ttl_seconds: int) -> bool:
+        # Bytes are stored as-is (no pickling)
+        cache_ref = build_log_ref(key, namespace="cache")
+        try:
+            cache = self._cache_for(key)
+            if not self._has_room(cache, len(data)):
+                logger.warning(
+                    "Diskcache resume store full; value not stored",
+                    extra={"cache_ref": cache_ref, "size_bytes": len(data)},
+                )
+                return False
+            cache.set(key, bytes(data), expire=max(int(ttl_seconds), 1))
+            return True
+        except Exception:
+            logger.exception(
+                "Diskcache resume set failed",
+                extra={"cache_ref": cache_ref},
+            )
+            return False
+
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        cache_ref = build_log_ref(key, namespace="cache")
+        try:
+            value = self._cache_for(key).get(key, default=None)
+        except Exception:
+            logger.exception(
+                "Diskcache resume get failed",
+                extra={"cache_ref": cache_ref},
+            )
+            return None
+        return value if isinstance(value, bytes) else None
+
+    def get_buffer(self, key: str) -> Optional[Any]:
+        cache_ref = build_log_ref(key, namespace="cache")
+        try:
+            value = self._cache_for(key).get(key, default=None, read=True)
+            if value is None or isinstance(value, bytes):
+                return value
+            if not hasattr(value, "fileno"):
+                return None
+            # The map stays valid after the file is closed, or evicted
+            with value:
+                return mmap.mmap(value.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            logger.exception(
+                "Diskcache resume get failed",
+                extra={"cache_ref": cache_ref},
+            )
+            return None
+
+    def touch(self, key: str, ttl_seconds: int) -> bool:
+        cache_ref = build_log_ref(key, namespace="cache")
+        ttl = max(int(ttl_seconds), 1)
+        cache = self._cache_for(key)
+        try:
+            with cache.transact():
+                value, expire_time = cache.get(key, default=None, expire_time=True)
+                if value is None:
+                    return False
+                if expire_time is not None and expire_time < time.time() + ttl:
+                    cache.touch(key, expire=ttl)
+            return True
+        except Exception:
+            logger.exception(
+                "Diskcache resume touch failed",
+                extra={"cache_ref": cache_ref},
+            )
+            return False
+
+    def incr(self, key: str, delta: int, ttl_seconds: int) -> Optional[int]:
+        cache_ref = build_log_ref(key, namespace="cache")
+        ttl = max(int(ttl_seconds), 1)
+        cache = self._cache_for(key)
+        try:
+            with cache.transact():
+                count, expire_time = cache.get(key, default=0, expire_time=True)
+                count = int(count) + int(delta)
+                if expire_time is not None:
+                    ttl = max(ttl, int(expire_time - time.time()) + 1)
+                cache.set(key, count, expire=ttl)
+            return count
+        except Exception:
+            logger.exception(
+                "Diskcache resume incr failed",
+                extra={"cache_ref": cache_ref},
+            )
+            return None
+
+    def delete(self, key: str) -> bool:
+        cache_ref = build_log_ref(key, namespace="cache")
+        try:
+            return bool(self._cache_for(key).delete(key))
+        except Exception:
+            logger.exception(
+                "Diskcache resume delete failed",
+                extra={"cache_ref": cache_ref},
+            )
+            return False
+
+    def delete_unreferenced(self, counter_key: str, key: str) -> bool:
+        cache_ref = build_log_ref(key, namespace="cache")
+        try:
+            # Same transaction lock as incr, so no reference is taken in between
+            counter_cache = self._cache_for(counter_key)
+            with counter_cache.transact():
+                if int(counter_cache.get(counter_key, default=0)) > 0:
+                    return False
+                self._cache_for(key).delete(key)
+                counter_cache.delete(counter_key)
+            return True
+        except Exception:
+            logger.exception(
+                "Diskcache resume delete failed",
+                extra={"cache_ref": cache_ref},
+            )
+            return False
+
     def close(self) -> None:
         self._cache.close()
+        if self._ttl_only_cache is not None:
+            self._ttl_only_cache.close()
@@ -1,12 +1,20 @@
 """
 Redis adapter for resume payload persistence.
+
+Values above ``chunk_size_kb`` are split into chunks that are compressed in
+parallel and written in pipelined batches to a per-write hash, then published
+by a small manifest stored under the value key. Reads fetch and decompress
+chunks a batch at a time into one preallocated buffer.
 """
 
 import json
 import os
 import re
+import threading
+import uuid
 import zlib
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, Optional
 
 from .resume_store import ResumeStore
 from src.shared.logging import build_log_ref, get_logger
@@ -27,6 +35,19 @@ class RedisResumeStore(ResumeStore):
     DEFAULT_KEY_PREFIX = "biorempp:resume:"
     KEY_SAFE_PATTERN = re.compile(r"^[A-Za-z0-9:_-]{1,128}$")
     PREFIX_SAFE_PATTERN = re.compile(r"^[A-Za-z0-9:_-]{1,64}:$")
+    # Manifest values start with this marker; zlib streams never do (0x78)
+    CHUNK_MANIFEST_MAGIC = b"BRPCHUNK1:"
+    CHUNK_MANIFEST_READ_BYTES = 512
+    # Chunks outlive their manifest so readers never see a dangling manifest
+    CHUNK_TTL_GRACE_SECONDS = 60
+    # KEYS[1] counter, KEYS[2] value; runs atomically on the server
+    DELETE_UNREFERENCED_SCRIPT = """
+if tonumber(redis.call('GET', KEYS[1]) or '0') > 0 then
+    return 0
+end
+redis.call('DEL', KEYS[1], KEYS[2])
+return 1
+"""
 
     def __init__(
         self,
@@ -37,6 +58,8 @@ class RedisResumeStore(ResumeStore):
         key_prefix: str = DEFAULT_KEY_PREFIX,
         socket_timeout_seconds: float = 3.0,
         compression_level: int = 6,
+        chunk_size_kb: int = 1024,
+        compression_threads: int = 4,
         client: Optional[Any] = None,
     ) -> None:
         if client is None:
@@ -63,6 +86,11 @@ class RedisResumeStore(ResumeStore):
             raise ValueError("Invalid redis resume key prefix")
         self._key_prefix = normalized_prefix
         self._compression_level = min(max(int(compression_level), 1), 9)
+        self._chunk_bytes = max(int(chunk_size_kb), 1) * 1024
+        self._compression_threads = max(int(compression_threads), 1)
+        self._pool_lock = threading.Lock()
+        # Threads start on first chunked value, so forked workers do not inherit them
+        self._pool: Optional[ThreadPoolExecutor] = None
 
     @property
     def backend_name(self) -> str:
@@ -120,6 +148,16 @@ class RedisResumeStore(ResumeStore):
             6,
             minimum=1,
         )
+        chunk_size_kb = cls._read_env_int(
+            "BIOREMPP_RESUME_REDIS_CHUNK_KB",
+            1024,
+            minimum=64,
+        )
+        compression_threads = cls._read_env_int(
+            "BIOREMPP_RESUME_REDIS_COMPRESSION_THREADS",
+            4,
+            minimum=1,
+        )
         return cls(
             host=host,
             port=port,
@@ -128,6 +166,8 @@ class RedisResumeStore(ResumeStore):
             key_prefix=key_prefix,
             socket_timeout_seconds=socket_timeout_seconds,
             compression_level=min(compression_level, 9),
+            chunk_size_kb=chunk_size_kb,
+            compression_threads=compression_threads,
         )
 
     def ping(self) -> bool:
@@ -145,36 +185,159 @@ class RedisResumeStore(ResumeStore):
         return f"{self._key_prefix}{normalized_key}"
 
     def _serialize(self, value: dict) -> bytes:
-        payload_bytes = json.dumps(
+        return json.dumps(
             value,
             ensure_ascii=False,
             separators=(",", ":"),
         ).encode("utf-8")
-        return zlib.compress(payload_bytes, self._compression_level)
 
     @staticmethod
-    def _deserialize(blob: Any) -> Optional[dict]:
+    def _decompress(blob: Any) -> Optional[bytes]:
         if blob is None:
             return None
         try:
-            raw = bytes(blob)
-            decompressed = zlib.decompress(raw).decode("utf-8")
-            payload = json.loads(decompressed)
+            return zlib.decompress(bytes(blob))
+        except Exception:
+            return None
+
+    @staticmethod
+    def _deserialize(raw: Optional[bytes]) -> Optional[dict]:
+        if raw is None:
+            return None
+        try:
+            payload = json.loads(raw)
         except Exception:
             return None
         return payload if isinstance(payload, dict) else None
 
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._compression_threads,
+                    thread_name_prefix="resume-redis-zlib",
+                )
+            return self._pool
+
+    def _compress(self, data: Any) -> bytes:
+        return zlib.compress(data, self._compression_level)
+
+    def _write(self, full_key: str, data: bytes, ttl_seconds: int) -> bool:
+        ttl = max(int(ttl_seconds), 1)
+        if len(data) <= self._chunk_bytes:
+            return bool(
+                self._client.set(name=full_key, value=self._compress(data), ex=ttl)
+            )
+
+        # Chunks go to a hash unique to this write; the manifest is written
+        # last, so readers see either the previous value or the complete new one
+        chunks_key = f"{full_key}:chunks:{uuid.uuid4().hex[:16]}"
+        chunk_ttl = ttl + self.CHUNK_TTL_GRACE_SECONDS
+        view = memoryview(data)
+        offsets = range(0, len(data), self._chunk_bytes)
+        pool = self._get_pool()
+        for batch_start in range(0, len(offsets), self._compression_threads):
+            batch = offsets[batch_start : batch_start + self._compression_threads]
+            compressed = pool.map(
+                self._compress,
+                (view[offset : offset + self._chunk_bytes] for offset in batch),
+            )
+            pipe = self._client.pipeline(transaction=False)
+            pipe.hset(
+                chunks_key,
+                mapping={
+                    str(batch_start + index): blob
+                    for index, blob in enumerate(compressed)
+                },
+            )
+            pipe.expire(chunks_key, chunk_ttl)
+            pipe.execute()
+
+        manifest = json.dumps(
+            {"key": chunks_key, "count": len(offsets), "size": len(data)},
+            separators=(",", ":"),
+        ).encode("utf-8")
+        previous = self._read_manifest(full_key)
+        saved = bool(
+            self._client.set(
+                name=full_key, value=self.CHUNK_MANIFEST_MAGIC + manifest, ex=ttl
+            )
+        )
+        if saved and previous is not None:
+            # Readers holding the previous manifest may still be fetching it
+            self._client.expire(previous["key"], self.CHUNK_TTL_GRACE_SECONDS)
+        return saved
+
+    def _parse_manifest(self, raw: Any) -> Optional[dict]:
+        if raw is None:
+            return None
+        raw = bytes(raw)
+        if not raw.startswith(self.CHUNK_MANIFEST_MAGIC):
+            return None
+        try:
+            manifest = json.loads(raw[len(self.CHUNK_MANIFEST_MAGIC) :])
+        except ValueError:
+            return None
+        return manifest if isinstance(manifest, dict) else None
+
+    def _read_manifest(self, full_key: str) -> Optional[dict]:
+        # Reads only the head of the value, so plain blobs are not transferred
+        return self._parse_manifest(
+            self._client.getrange(full_key, 0, self.CHUNK_MANIFEST_READ_BYTES - 1)
+        )
+
+    def _iter_chunks(self, manifest: dict) -> Iterator[bytes]:
+        """Fetch and decompress the chunks of a manifest, one batch at a time."""
+        pool = self._get_pool()
+        count = int(manifest["count"])
+        for batch_start in range(0, count, self._compression_threads):
+            fields = [
+                str(index)
+                for index in range(
+                    batch_start, min(batch_start + self._compression_threads, count)
+                )
+            ]
+            blobs = self._client.hmget(manifest["key"], fields)
+            if any(blob is None for blob in blobs):
+                raise KeyError("missing resume chunk")
+            yield from pool.map(zlib.decompress, blobs)
+
+    def _read(self, full_key: str) -> Optional[Any]:
+        """Return the stored bytes; chunked values come back as a bytearray."""
+        raw_value = self._client.get(full_key)
+        manifest = self._parse_manifest(raw_value)
+        if manifest is None:
+            return self._decompress(raw_value)
+        try:
+            size = int(manifest["size"])
+            buffer = bytearray(size)
+            position = 0
+            for chunk in self._iter_chunks(manifest):
+                buffer[position : position + len(chunk)] = chunk
+                position += len(chunk)
+        except Exception:
+            return None
+        # bytearray is returned as-is; copying it would double peak memory
+        return buffer if position == size else None
+
     def set(self, key: str, value: dict, ttl_seconds: int) -> bool:
         cache_ref = build_log_ref(key, namespace="cache")
         full_key = self._full_key(key)
         try:
-            compressed_payload = self._serialize(value)
-            result = self._client.set(
-                name=full_key,
-                value=compressed_payload,
-                ex=max(int(ttl_seconds), 1),
+            return self._write(full_key, self._serialize(value), ttl_seconds)
+        except Exception:
+            logger.exception(
+                "Redis resume set failed",
+                extra={"cache_ref": cache_ref},
             )
-            return bool(result)
+            return False
+
+    def set_bytes(self, key: str, data: bytes, ttl_seconds: int) -> bool:
+        # Already-serialized values are only compressed, not re-encoded
+        cache_ref = build_log_ref(key, namespace="cache")
+        full_key = self._full_key(key)
+        try:
+            return self._write(full_key, bytes(data), ttl_seconds)
         except Exception:
             logger.exception(
                 "Redis resume set failed",
@@ -182,20 +345,123 @@ class RedisResumeStore(ResumeStore):
             )
             return False
 
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        data = self.get_buffer(key)
+        # No copy for plain values; chunked values are assembled in a bytearray
+        return data if data is None or isinstance(data, bytes) else bytes(data)
+
+    def get_buffer(self, key: str) -> Optional[Any]:
+        cache_ref = build_log_ref(key, namespace="cache")
+        full_key = self._full_key(key)
+        try:
+            return self._read(full_key)
+        except Exception:
+            logger.exception(
+                "Redis resume get failed",
+                extra={"cache_ref": cache_ref},
+            )
+            return None
+
     def get(self, key: str) -> Optional[dict]:
         cache_ref = build_log_ref(key, namespace="cache")
         full_key = self._full_key(key)
         try:
-            raw_value = self._client.get(full_key)
+            raw = self._read(full_key)
         except Exception:
             logger.exception(
                 "Redis resume get failed",
                 extra={"cache_ref": cache_ref},
             )
             return None
-        return self._deserialize(raw_value)
+        return self._deserialize(raw)
+
+    def _extend_ttl(self, full_key: str, ttl_seconds: int) -> None:
+        remaining = self._client.ttl(full_key)
+        if remaining is not None and -1 <= int(remaining) < ttl_seconds:
+            self._client.expire(full_key, ttl_seconds)
+
+    def touch(self, key: str, ttl_seconds: int) -> bool:
+        cache_ref = build_log_ref(key, namespace="cache")
+        full_key = self._full_key(key)
+        try:
+            remaining = self._client.ttl(full_key)
+            if remaining is None or int(remaining) == -2:
+                return False
+            ttl = max(int(ttl_seconds), 1)
+            if int(remaining) < ttl:
+                self._client.expire(full_key, ttl)
+                manifest = self._read_manifest(full_key)
+                if manifest is not None:
+                    self._client.expire(
+                        manifest["key"], ttl + self.CHUNK_TTL_GRACE_SECONDS
+                    )
+            return True
+        except Exception:
+            logger.exception(
+                "Redis resume touch failed",
+                extra={"cache_ref": cache_ref},
+            )
+            return False
+
+    def incr(self, key: str, delta: int, ttl_seconds: int) -> Optional[int]:
+        cache_ref = build_log_ref(key, namespace="cache")
+        full_key = self._full_key(key)
+        try:
+            count = int(self._client.incrby(full_key, int(delta)))
+            self._extend_ttl(full_key, max(int(ttl_seconds), 1))
+            return count
+        except Exception:
+            logger.exception(
+                "Redis resume incr failed",
+                extra={"cache_ref": cache_ref},
+            )
+            return None
+
+    def delete(self, key: str) -> bool:
+        cache_ref = build_log_ref(key, namespace="cache")
+        full_key = self._full_key(key)
+        try:
+            manifest = self._read_manifest(full_key)
+            if manifest is not None:
+                self._client.delete(manifest["key"])
+            return bool(self._client.delete(full_key))
+        except Exception:
+            logger.exception(
+                "Redis resume delete failed",
+                extra={"cache_ref": cache_ref},
+            )
+            return False
+
+    def delete_unreferenced(self, counter_key: str, key: str) -> bool:
+        cache_ref = build_log_ref(key, namespace="cache")
+        full_key = self._full_key(key)
+        try:
+            # A value rewritten after the delete gets a new chunk hash, so the
+            # manifest read here can only name chunks of the deleted value
+            manifest = self._read_manifest(full_key)
+            deleted = bool(
+                self._client.eval(
+                    self.DELETE_UNREFERENCED_SCRIPT,
+                    2,
+                    self._full_key(counter_key),
+                    full_key,
+                )
+            )
+            if deleted and manifest is not None:
+                self._client.expire(manifest["key"], self.CHUNK_TTL_GRACE_SECONDS)
+            return deleted
+        except Exception:
+            logger.exception(
+                "Redis resume delete failed",
+                extra={"cache_ref": cache_ref},
+            )
+            return False
 
     def close(self) -> None:
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
         close_fn = getattr(self._client, "close", None)
         if callable(close_fn):
             close_fn()
@@ -0,0 +1,163 @@
+"""
+Upload Artifact Store - server-side parsed uploads keyed by content hash.
+
+The upload callback parses a validated file once and saves the integer-coded
+Sample/KO pairs in a ResumeStore backend (diskcache or redis). Browser stores
+then carry only the returned reference, and the processing callback loads the
+parsed dataset instead of receiving and re-parsing the file content.
+"""
+
+import base64
+import hashlib
+import re
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from src.application.core.upload_parser import ParsedUpload
+from src.shared.logging import build_log_ref, get_logger
+from src.shared.metrics import CACHE_OPERATIONS_TOTAL
+
+from .resume_store import ResumeStore
+
+logger = get_logger(__name__)
+
+
+class UploadArtifactStore:
+    """Save and load parsed uploads by content reference."""
+
+    CACHE_TYPE = "upload_artifact"
+    KEY_PREFIX = "upload:v1:"
+    DEFAULT_TTL_SECONDS = 3600  # 1 hour
+    _REF_PATTERN = re.compile(r"^upload:v1:[0-9a-f]{64}$")
+
+    def __init__(
+        self, store: ResumeStore, ttl_seconds: int = DEFAULT_TTL_SECONDS
+    ) -> None:
+        self._store = store
+        self._ttl_seconds = max(int(ttl_seconds), 60)
+
+    @property
+    def backend_name(self) -> str:
+        return self._store.backend_name
+
+    @classmethod
+    def build_ref(cls, content: str) -> str:
+        """Return artifact reference for upload ``content``."""
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return f"{cls.KEY_PREFIX}{digest}"
+
+    @classmethod
+    def is_valid_ref(cls, ref: Any) -> bool:
+        """Return True if ``ref`` has the shape of an artifact reference."""
+        return isinstance(ref, str) and bool(cls._REF_PATTERN.match(ref))
+
+    @staticmethod
+    def _encode_codes(codes: np.ndarray) -> str:
+        return base64.b64encode(codes.astype("<i4").tobytes()).decode("ascii")
+
+    @staticmethod
+    def _decode_codes(blob: str) -> np.ndarray:
+        return np.frombuffer(base64.b64decode(blob), dtype="<i4").astype(np.int32)
+
+    def _count(self, operation: str, outcome: str) -> None:
+        CACHE_OPERATIONS_TOTAL.labels(
+            cache_type=self.CACHE_TYPE,
+            operation=operation,
+            outcome=outcome,
+        ).inc()
+
+    def save(self, content: str, parsed: ParsedUpload) -> Optional[str]:
+        """
+        Save a parsed upload.
+
+        Parameters
+        ----------
+        content : str
+            Validated upload content (only its hash is kept).
+        parsed : ParsedUpload
+            Parsed Sample/KO pairs of ``content``.
+
+        Returns
+        -------
+        Optional[str]
+            Artifact reference, or None when the backend rejected the write.
+        """
+        ref = self.build_ref(content)
+        # JSON-safe payload: codes as base64 int32 buffers
+        payload: Dict[str, Any] = {
+            "sample_names": list(parsed.sample_names),
+            "ko_ids": list(parsed.ko_ids),
+            "sample_codes": self._encode_codes(parsed.sample_codes),
+            "ko_codes": self._encode_codes(parsed.ko_codes),
+            "ko_lines": int(parsed.ko_lines),
+        }
+        saved = self._store.set(ref, payload, ttl_seconds=self._ttl_seconds)
+        self._count("set", "stored" if saved else "failed")
+        if not saved:
+            logger.warning(
+                "Upload artifact could not be stored",
+                extra={
+                    "artifact_ref": build_log_ref(ref, namespace="upload"),
+                    "backend": self.backend_name,
+                },
+            )
+            return None
+        return ref
+
+    def load(self, ref: str) -> Optional[ParsedUpload]:
+        """
+        Load a parsed upload.
+
+        Parameters
+        ----------
+        ref : str
+            Reference returned by :meth:`save`.
+
+        Returns
+        -------
+        Optional[ParsedUpload]
+            Parsed upload, or None when the reference is malformed, expired
+            or unreadable.
+        """
+        if not self.is_valid_ref(ref):
+            self._count("get", "invalid")
+            return None
+
+        payload = self._store.get(ref)
+        if payload is None:
+            self._count("get", "miss")
+            return None
+
+        try:
+            parsed = ParsedUpload(
+                sample_codes=self._decode_codes(payload["sample_codes"]),
+                ko_codes=self._decode_codes(payload["ko_codes"]),
+                sample_names=[str(name) for name in payload["sample_names"]],
+                ko_ids=[str(ko) for ko in payload["ko_ids"]],
+                ko_lines=int(payload.get("ko_lines", 0)),
+            )
+            if len(parsed.sample_codes) != len(parsed.ko_codes):
+                raise ValueError("Code arrays differ in length")
+            if len(parsed) and (
+                parsed.sample_codes.max() >= len(parsed.sample_names)
+                or parsed.ko_codes.max() >= len(parsed.ko_ids)
+                or min(parsed.sample_codes.min(), parsed.ko_codes.min()) < 0
+            ):
+                raise ValueError("Codes out of range")
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(
+                "Discarding unreadable upload artifact",
+                extra={
+                    "artifact_ref": build_log_ref(ref, namespace="upload"),
+                    "error": str(e),
+                },
+            )
+            self._count("get", "invalid")
+            return None
+
+        self._count("get", "hit")
+        return parsed
+
+    def close(self) -> None:
+        self._store.close()
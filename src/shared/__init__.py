@@ -7,6 +7,7 @@ Shared module containing utilities, exceptions, and configurations.
 from src.shared.logger_utils import get_log_file, get_logger, set_debug_mode
 
 __all__ = [
+    "dataframe_fingerprint",
     "exceptions",
     "logging",
     "metrics",
@@ -0,0 +1,179 @@
+"""
+DataFrame Fingerprint - full-content hashes for cache keys.
+
+Hashes every value of a DataFrame column by column with pandas' vectorized
+``hash_pandas_object``, so two frames share a fingerprint only when their
+column names, dtypes and values match. Hashing a 200k-row table takes a few
+tens of milliseconds and needs no sorting or string conversion.
+
+Fingerprints of hydrated result tables are computed once and remembered for
+the frame object they were computed on (see ``remember_fingerprint``); they
+are reused while the frame keeps the same blocks, index and columns, and
+recomputed otherwise. Only frames whose arrays were made read-only with
+``freeze_dataframe`` are remembered, so their cells cannot change either.
+
+Freezing and the reuse guard read pandas' block manager (``df._mgr``, as
+laid out in pandas 2.x). When it is missing or shaped differently, frames
+are not frozen and fingerprints are recomputed on every call.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import weakref
+
+import numpy as np
+import pandas as pd
+
+# id(frame) -> (weakref to frame, (blocks, index, columns), fingerprint).
+# DataFrames are unhashable, so entries are keyed by id and dropped by the
+# weakref callback when the frame is collected.
+_remembered: dict[int, tuple[weakref.ref, tuple, str]] = {}
+# Reentrant: a frame collected while the lock is held runs its callback here
+_remembered_lock = threading.RLock()
+
+
+def _manager_blocks(df: pd.DataFrame) -> tuple | None:
+    """Blocks of the pandas 2.x block manager of ``df``, None if unavailable."""
+    blocks = getattr(getattr(df, "_mgr", None), "blocks", None)
+    return blocks if isinstance(blocks, tuple) else None
+
+
+def _frame_guard(df: pd.DataFrame) -> tuple | None:
+    """Objects that pandas replaces whenever columns or axes of ``df`` change."""
+    blocks = _manager_blocks(df)
+    if blocks is None:
+        return None
+    return (blocks, df.index, df.columns)
+
+
+def _block_arrays(df: pd.DataFrame) -> list:
+    """NumPy arrays backing the blocks of ``df`` (None for other arrays)."""
+    blocks = _manager_blocks(df)
+    if blocks is None:
+        return [None]
+    arrays = []
+    for block in blocks:
+        values = block.values
+        # Datetime and timedelta blocks wrap their ndarray
+        values = getattr(values, "_ndarray", values)
+        arrays.append(values if isinstance(values, np.ndarray) else None)
+    return arrays
+
+
+def freeze_dataframe(df: pd.DataFrame) -> bool:
+    """
+    Make the arrays backing ``df`` read-only, in place.
+
+    In-place cell writes (``.loc``, ``.iloc``, ``.at``, ``inplace=True``) on
+    ``df`` or its shallow copies then raise ``ValueError``; adding, dropping
+    or replacing whole columns still works.
+
+    Returns
+    -------
+    bool
+        False, leaving ``df`` unchanged, when a block is not NumPy-backed
+        or the block manager is unavailable.
+    """
+    arrays = _block_arrays(df)
+    if any(values is None for values in arrays):
+        return False
+    for values in arrays:
+        values.flags.writeable = False
+    return True
+
+
+def _is_frozen(df: pd.DataFrame) -> bool:
+    return all(
+        values is not None and not values.flags.writeable
+        for values in _block_arrays(df)
+    )
+
+
+def _hash_values(values: pd.Series | pd.DataFrame) -> np.ndarray:
+    """uint64 hash per row, falling back to strings for unhashable objects."""
+    try:
+        return pd.util.hash_pandas_object(values, index=False).to_numpy()
+    except TypeError:
+        # Lists, dicts and sets in object columns
+        return pd.util.hash_pandas_object(values.astype(str), index=False).to_numpy()
+
+
+def fingerprint_dataframe(df: pd.DataFrame, ordered: bool = True) -> str:
+    """
+    Return a 16-character fingerprint of the full content of ``df``.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Frame to fingerprint. The index is not part of the fingerprint.
+    ordered : bool, default=True
+        When False, the fingerprint does not depend on row order (rows built
+        from Python sets hash the same across callback executions).
+
+    Returns
+    -------
+    str
+        Hex digest; column order, names, dtypes and values are significant.
+    """
+    if ordered:
+        remembered = _lookup(df)
+        if remembered is not None:
+            return remembered
+
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(repr((df.shape, ordered)).encode())
+    for name, dtype in df.dtypes.items():
+        digest.update(repr((name, str(dtype))).encode())
+
+    if not len(df):
+        return digest.hexdigest()
+    if ordered:
+        for position in range(df.shape[1]):
+            digest.update(_hash_values(df.iloc[:, position]).tobytes())
+    else:
+        digest.update(np.sort(_hash_values(df)).tobytes())
+    return digest.hexdigest()
+
+
+def remember_fingerprint(df: pd.DataFrame, fingerprint: str) -> None:
+    """
+    Attach a known ordered ``fingerprint`` to the frame object ``df``.
+
+    The fingerprint is dropped once columns or axes of ``df`` are replaced.
+    Frames with writable arrays are not registered, since in-place writes
+    would go unnoticed (see ``freeze_dataframe``).
+    """
+    if not _is_frozen(df):
+        return
+    frame_id = id(df)
+
+    def _forget(ref: weakref.ref) -> None:
+        with _remembered_lock:
+            entry = _remembered.get(frame_id)
+            if entry is not None and entry[0] is ref:
+                del _remembered[frame_id]
+
+    with _remembered_lock:
+        _remembered[frame_id] = (
+            weakref.ref(df, _forget),
+            _frame_guard(df),
+            fingerprint,
+        )
+
+
+def _lookup(df: pd.DataFrame) -> str | None:
+    with _remembered_lock:
+        entry = _remembered.get(id(df))
+    if entry is None:
+        return None
+    ref, guard, fingerprint = entry
+    if ref() is not df:
+        return None
+    current = _frame_guard(df)
+    if current is not None and all(
+        stored is now for stored, now in zip(guard, current)
+    ):
+        return fingerprint
+    return None
@@ -0,0 +1,148 @@
+"""
+Per-process memory breakdown for Gunicorn workers.
+
+Resident set size alone counts pages shared with the master (preloaded
+reference databases, memory-mapped snapshots) once per worker. The
+proportional set size (PSS) splits every shared page between the processes
+mapping it, so the PSS total across master and workers is the real host
+footprint. Figures are read from ``/proc/<pid>/smaps_rollup`` (Linux).
+
+Usage::
+
+    python -m src.shared.metrics.process_memory --master-pid <gunicorn pid>
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+_PROC_ROOT = Path("/proc")
+_SMAPS_FIELDS = {
+    "Rss": "rss",
+    "Pss": "pss",
+    "Shared_Clean": "shared_clean",
+    "Shared_Dirty": "shared_dirty",
+    "Private_Clean": "private_clean",
+    "Private_Dirty": "private_dirty",
+}
+
+
+def _parse_smaps_rollup(text: str) -> Dict[str, int]:
+    """Parse ``smaps_rollup`` content into byte counts."""
+    values: Dict[str, int] = {}
+    for line in text.splitlines():
+        name, _, rest = line.partition(":")
+        key = _SMAPS_FIELDS.get(name.strip())
+        if key is None:
+            continue
+        parts = rest.split()
+        if parts and parts[0].isdigit():
+            values[key] = int(parts[0]) * 1024
+    return values
+
+
+def read_process_memory(pid: Optional[int] = None) -> Optional[Dict[str, int]]:
+    """
+    Read memory breakdown (bytes) for ``pid`` (default: current process).
+
+    Returns ``rss``, ``pss``, ``shared`` and ``private`` keys, or None when
+    ``/proc/<pid>/smaps_rollup`` is unavailable.
+    """
+    target = _PROC_ROOT / str(pid if pid is not None else os.getpid())
+    try:
+        values = _parse_smaps_rollup((target / "smaps_rollup").read_text())
+    except (OSError, ValueError):
+        return None
+    if "rss" not in values:
+        return None
+
+    return {
+        "rss": values["rss"],
+        "pss": values.get("pss", values["rss"]),
+        "shared": values.get("shared_clean", 0) + values.get("shared_dirty", 0),
+        "private": values.get("private_clean", 0) + values.get("private_dirty", 0),
+    }
+
+
+def find_child_pids(parent_pid: int) -> List[int]:
+    """Return direct child pids of ``parent_pid`` (Linux ``/proc``)."""
+    children: List[int] = []
+    for task_dir in (_PROC_ROOT / str(parent_pid) / "task").glob("*"):
+        try:
+            raw = (task_dir / "children").read_text().split()
+        except OSError:
+            continue
+        children.extend(int(pid) for pid in raw if pid.isdigit())
+    return sorted(set(children))
+
+
+def build_memory_report(
+    master_pid: Optional[int], worker_pids: Iterable[int]
+) -> Dict[str, Any]:
+    """
+    Build host memory report for a master process and its workers.
+
+    ``total_pss`` is the host footprint of the process group, while
+    ``total_rss`` counts every shared page once per process; the difference
+    is memory that preloading and memory-mapping saved.
+    """
+    processes: List[Dict[str, Any]] = []
+    roles = [("master", master_pid)] if master_pid is not None else []
+    roles.extend(("worker", pid) for pid in worker_pids)
+
+    for role, pid in roles:
+        memory = read_process_memory(pid)
+        if memory is not None:
+            processes.append({"role": role, "pid": pid, **memory})
+
+    total_rss = sum(p["rss"] for p in processes)
+    total_pss = sum(p["pss"] for p in processes)
+    return {
+        "processes": processes,
+        "total_rss": total_rss,
+        "total_pss": total_pss,
+        "shared_savings": max(total_rss - total_pss, 0),
+    }
+
+
+def format_memory_report(report: Dict[str, Any]) -> str:
+    """Render memory report as a fixed-width text table (MiB)."""
+    mib = 1024.0 * 1024.0
+    lines = [
+        f"{'role':<8}{'pid':>8}{'rss':>10}{'pss':>10}{'shared':>10}{'private':>10}"
+    ]
+    for proc in report["processes"]:
+        lines.append(
+            f"{proc['role']:<8}{proc['pid']:>8}"
+            f"{proc['rss'] / mib:>10.1f}{proc['pss'] / mib:>10.1f}"
+            f"{proc['shared'] / mib:>10.1f}{proc['private'] / mib:>10.1f}"
+        )
+    lines.append(
+        f"total rss={report['total_rss'] / mib:.1f} MiB "
+        f"pss={report['total_pss'] / mib:.1f} MiB "
+        f"shared_savings={report['shared_savings'] / mib:.1f} MiB"
+    )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Print memory report for a Gunicorn master and its workers."""
+    parser = argparse.ArgumentParser(
+        description="Per-worker RSS/PSS report for a Gunicorn process group."
+    )
+    parser.add_argument("--master-pid", type=int, required=True)
+    args = parser.parse_args(argv)
+
+    report = build_memory_report(args.master_pid, find_child_pids(args.master_pid))
+    if not report["processes"]:
+        print(f"No /proc memory data for pid {args.master_pid}")
+        return 1
+    print(format_memory_report(report))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
@@ -215,6 +215,13 @@ CACHE_SIZE_ITEMS = _metric(
     ["cache_type"],
 )
 
+CACHE_SIZE_BYTES = _metric(
+    Gauge,
+    "biorempp_cache_size_bytes",
+    "Current estimated size of cached values in bytes",
+    ["cache_type"],
+)
+
 CACHE_HIT_RATIO = _metric(
     Gauge,
     "biorempp_cache_hit_ratio",
@@ -361,6 +368,27 @@ RESUME_PERSIST_STAGE_TOTAL = _metric(
     ["stage"],
 )
 
+RESUME_PERSIST_QUEUE_DEPTH = _metric(
+    Gauge,
+    "biorempp_resume_persist_queue_depth",
+    "Resume saves waiting for a persistence worker",
+    multiprocess_mode="livesum",
+)
+
+RESUME_PERSIST_IN_FLIGHT = _metric(
+    Gauge,
+    "biorempp_resume_persist_in_flight",
+    "Resume saves currently being written",
+    multiprocess_mode="livesum",
+)
+
+RESULTS_HYDRATION_COALESCED_TOTAL = _metric(
+    Counter,
+    "biorempp_results_hydration_coalesced_total",
+    "Results payload hydrations that waited on a concurrent load of the same job",
+    ["outcome"],
+)
+
 RESULTS_TRANSITION_SAMPLES_TOTAL = _metric(
     Counter,
     "biorempp_results_transition_samples_total",
@@ -429,6 +457,14 @@ WORKER_MEMORY_BYTES = _metric(
     multiprocess_mode="liveall",
 )
 
+WORKER_MEMORY_BREAKDOWN_BYTES = _metric(
+    Gauge,
+    "biorempp_worker_memory_breakdown_bytes",
+    "Live worker memory split into rss, pss, shared and private bytes",
+    ["kind"],
+    multiprocess_mode="liveall",
+)
+
 WORKER_RESTARTS_TOTAL = _metric(
     Counter,
     "biorempp_worker_restarts_total",
@@ -450,6 +486,7 @@ __all__ = [
     "DASH_CALLBACK_RESPONSE_SIZE_BYTES",
     "CACHE_OPERATIONS_TOTAL",
     "CACHE_SIZE_ITEMS",
+    "CACHE_SIZE_BYTES",
     "CACHE_HIT_RATIO",
     "CACHE_ENTRY_SIZE_BYTES",
     "RESUME_LOAD_ATTEMPTS_TOTAL",
@@ -465,6 +502,9 @@ __all__ = [
     "PROCESSING_DURATION_SECONDS",
     "RESUME_PERSIST_DURATION_SECONDS",
     "RESUME_PERSIST_STAGE_TOTAL",
+    "RESUME_PERSIST_QUEUE_DEPTH",
+    "RESUME_PERSIST_IN_FLIGHT",
+    "RESULTS_HYDRATION_COALESCED_TOTAL",
     "RESULTS_TRANSITION_SAMPLES_TOTAL",
     "RESULTS_TRANSITION_CLICK_TO_REQUEST_SECONDS",
     "RESULTS_TRANSITION_REQUEST_TO_PAINT_SECONDS",
@@ -474,5 +514,6 @@ __all__ = [
     "WORKERS_ACTIVE",
     "WORKER_REQUESTS_TOTAL",
     "WORKER_MEMORY_BYTES",
+    "WORKER_MEMORY_BREAKDOWN_BYTES",
     "WORKER_RESTARTS_TOTAL",
 ]
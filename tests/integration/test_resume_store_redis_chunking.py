@@ -0,0 +1,111 @@
+"""Integration measurements for chunked Redis resume writes and reads."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+import tracemalloc
+from uuid import uuid4
+
+import pytest
+
+from src.presentation.services.resume_store_redis import RedisResumeStore
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - optional dependency in local env
+    redis = None
+
+
+pytestmark = [pytest.mark.integration, pytest.mark.slow]
+
+_SAVE_ROUNDS = 10
+
+
+def _build_redis_client():
+    if redis is None:
+        pytest.skip("redis package not available")
+
+    client = redis.Redis(
+        host=os.getenv("BIOREMPP_RESUME_REDIS_HOST", "127.0.0.1"),
+        port=int(os.getenv("BIOREMPP_RESUME_REDIS_PORT", "6379")),
+        db=int(os.getenv("BIOREMPP_RESUME_REDIS_DB", "0")),
+        password=os.getenv("BIOREMPP_RESUME_REDIS_PASSWORD", "") or None,
+        decode_responses=False,
+        socket_timeout=30.0,
+        socket_connect_timeout=2.0,
+    )
+    try:
+        client.ping()
+    except Exception as exc:  # pragma: no cover - runtime environment dependent
+        pytest.skip(f"Redis is not reachable for integration test: {exc}")
+    return client
+
+
+def _build_payload_bytes(min_bytes: int) -> bytes:
+    """Columnar-like JSON table of roughly ``min_bytes`` bytes."""
+    rows = min_bytes // 30 + 1
+    table = {
+        "Sample": [f"Sample_{i % 97}" for i in range(rows)],
+        "KO": [f"K{i % 25000:05d}" for i in range(rows)],
+        "Compound": [f"C{(i * 7919) % 100000:06d}" for i in range(rows)],
+    }
+    return json.dumps(table, separators=(",", ":")).encode("utf-8")
+
+
+def _traced_peak(fn):
+    """Return ``fn()`` and the memory it allocated above the baseline."""
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    return result, peak - baseline
+
+
+def _measure(store: RedisResumeStore, key: str, data: bytes) -> dict:
+    latencies = []
+    save_peak = 0
+    tracemalloc.start()
+    for _ in range(_SAVE_ROUNDS):
+        started = time.perf_counter()
+        saved, peak = _traced_peak(lambda: store.set_bytes(key, data, ttl_seconds=120))
+        latencies.append(time.perf_counter() - started)
+        save_peak = max(save_peak, peak)
+        assert saved
+    loaded, load_peak = _traced_peak(lambda: store.get_bytes(key))
+    tracemalloc.stop()
+
+    assert loaded == data
+    latencies.sort()
+    return {
+        "p99_save_seconds": latencies[
+            min(len(latencies) - 1, int(len(latencies) * 0.99))
+        ],
+        "save_peak_mb": save_peak / (1024 * 1024),
+        "load_peak_mb": load_peak / (1024 * 1024),
+    }
+
+
+def test_chunked_writes_bound_memory_for_large_payloads():
+    """Compare a single-blob SET with chunked pipelined writes for 50+ MB."""
+    client = _build_redis_client()
+    prefix = f"biorempp:resume:chunkbench:{uuid4().hex[:10]}:"
+    data = _build_payload_bytes(55 * 1024 * 1024)
+    single = RedisResumeStore(
+        client=client, key_prefix=prefix, chunk_size_kb=len(data) // 1024 + 1
+    )
+    chunked = RedisResumeStore(client=client, key_prefix=prefix, chunk_size_kb=1024)
+
+    try:
+        single_stats = _measure(single, "resume:v1:block:single", data)
+        chunked_stats = _measure(chunked, "resume:v1:block:chunked", data)
+        print(f"\nsingle blob: {single_stats}\nchunked:     {chunked_stats}")
+
+        assert chunked_stats["save_peak_mb"] <= single_stats["save_peak_mb"]
+        assert chunked_stats["load_peak_mb"] <= single_stats["load_peak_mb"]
+    finally:
+        for key in client.scan_iter(match=f"{prefix}*", count=200):
+            client.delete(key)
+        single.close()
+        chunked.close()
@@ -0,0 +1,111 @@
+"""
+Unit tests for UploadParser.
+
+Test Coverage:
+- Line classification and whitespace trimming
+- Deduplication and first-appearance ordering
+- Unicode and long-token fallbacks
+- Fused upload limit checks
+"""
+
+import numpy as np
+import pytest
+
+from src.application.core.upload_parser import ParsedUpload, UploadParser
+from src.shared.exceptions import KOLimitExceededError, SampleLimitExceededError
+
+
+def _pairs(parsed: ParsedUpload):
+    frame = parsed.to_frame()
+    if frame.empty:
+        return []
+    return list(zip(frame["Sample"].astype(object), frame["KO"].astype(object)))
+
+
+class TestUploadParserParse:
+    """Test the parse() method."""
+
+    def test_parse_multiple_samples(self):
+        """Test pairs are emitted in upload order with integer codes."""
+        parsed = UploadParser().parse(">S1\nK00001\nK00002\n>S2\nK00001\n")
+
+        assert _pairs(parsed) == [("S1", "K00001"), ("S1", "K00002"), ("S2", "K00001")]
+        assert parsed.sample_names == ["S1", "S2"]
+        assert parsed.sample_codes.dtype == np.int32
+        assert parsed.ko_codes.dtype == np.int32
+        assert parsed.ko_lines == 3
+
+    def test_parse_accepts_bytes(self):
+        """Test bytes and str content parse identically."""
+        content = ">S1\r\nK00001\r\n  K00002  \r\n"
+
+        assert _pairs(UploadParser().parse(content.encode("utf-8"))) == _pairs(
+            UploadParser().parse(content)
+        )
+
+    def test_parse_trims_whitespace_and_ignores_other_lines(self):
+        """Test non-KO lines, blank lines and orphan KOs are ignored."""
+        content = "K00009\n\n  > S1 \n\tK00001\r\nk00002\nX\n   \n>\nK00003\n"
+
+        assert _pairs(UploadParser().parse(content)) == [("S1", "K00001")]
+
+    def test_parse_deduplicates_pairs_keeping_first_occurrence(self):
+        """Test repeated pairs, also across repeated headers, are dropped."""
+        content = ">A\n>B\nK00001\n>A\nK00002\nK00001\n>B\nK00001\nK00002\n"
+
+        parsed = UploadParser().parse(content)
+
+        assert _pairs(parsed) == [
+            ("B", "K00001"),
+            ("A", "K00002"),
+            ("A", "K00001"),
+            ("B", "K00002"),
+        ]
+        # Samples are numbered by their first row, not their first header
+        assert parsed.sample_names == ["B", "A"]
+
+    def test_parse_handles_unicode_whitespace_and_long_tokens(self):
+        """Test lines routed to the Python fallback follow str.strip()."""
+        long_ko = "K" + "1" * 40
+        content = f"> S1 \n K00001 \nK00001\n{long_ko}\n>Sé\nK00002\n"
+
+        assert _pairs(UploadParser().parse(content)) == [
+            ("S1", "K00001"),
+            ("S1", long_ko),
+            ("Sé", "K00002"),
+        ]
+
+    def test_parse_empty_content_returns_empty_frame(self):
+        """Test content without pairs yields an empty DataFrame."""
+        parsed = UploadParser().parse(">S1\n\n>S2\n")
+
+        assert len(parsed) == 0
+        assert parsed.to_frame().empty
+        assert UploadParser().parse("").to_frame().empty
+
+
+class TestUploadParserLimits:
+    """Test limit checks fused into parsing."""
+
+    def test_total_ko_limit(self):
+        """Test KO lines are counted before deduplication."""
+        parser = UploadParser(max_total_kos=2)
+
+        with pytest.raises(KOLimitExceededError, match="Too many KO entries"):
+            parser.parse(">S1\nK00001\nK00001\nK00001\n")
+
+    def test_sample_limit_counts_samples_with_kos(self):
+        """Test only samples holding KO data count toward the limit."""
+        parser = UploadParser(max_samples=1)
+
+        assert len(parser.parse(">S1\n>S2\nK00001\n")) == 1
+        with pytest.raises(SampleLimitExceededError, match="Too many samples"):
+            parser.parse(">S1\nK00001\n>S2\nK00001\n")
+
+    def test_per_sample_limit_counts_distinct_kos(self):
+        """Test the per-sample limit applies to deduplicated KOs."""
+        parser = UploadParser(max_kos_per_sample=2)
+
+        assert len(parser.parse(">S1\nK00001\nK00002\nK00001\n")) == 2
+        with pytest.raises(KOLimitExceededError, match="Sample 'S1'"):
+            parser.parse(">S1\nK00001\nK00002\nK00003\n")
@@ -8,6 +8,7 @@ Test Categories:
 - Initialization: Test service initialization
 - Plot Generation: Test complete plot generation pipeline
 - Caching: Test cache hit/miss scenarios
+- Processed Data Cache: Test reuse of processed data across filters
 - Data Hashing: Test data and filter hash generation
 - Cache Key Generation: Test cache key templates
 - TTL Configuration: Test TTL retrieval from config
@@ -127,6 +128,29 @@ class TestDataHashing:
         # is sensitive to column order
         assert hash1 != hash2
 
+    def test_generate_data_hash_covers_middle_rows(self, plot_service):
+        """Test that rows between head and tail are part of the hash."""
+        df1 = pd.DataFrame({'A': range(20)})
+        df2 = df1.copy()
+        df2.loc[10, 'A'] = -1
+
+        assert (
+            plot_service._generate_data_hash(df1)
+            != plot_service._generate_data_hash(df2)
+        )
+
+    def test_generate_data_hash_ignores_upset_row_order(self, plot_service):
+        """Test that UpSet-like frames hash the same in any row order."""
+        df = pd.DataFrame({
+            'category': ['a', 'b', 'a'],
+            'identifier': ['K1', 'K2', 'K3'],
+        })
+
+        assert (
+            plot_service._generate_data_hash(df)
+            == plot_service._generate_data_hash(df.iloc[::-1])
+        )
+
 
 # ============================================================================
 # FILTER HASHING TESTS
@@ -549,6 +573,27 @@ class TestCachingBehavior:
         # Factory should NOT be called on cache hit
         plot_service.factory.create_strategy.assert_not_called()
 
+    def test_serialized_cache_hit_skips_figure_reconstruction(
+        self, plot_service, sample_plot_dataframe
+    ):
+        """Test that serialized hits return the cached figure dict."""
+        plot_service.config_loader = Mock()
+        plot_service.factory = Mock()
+        plot_service.cache_manager = Mock()
+        plot_service.config_loader.load_config.return_value = {
+            'performance': {'cache': {'enabled': True}}
+        }
+        cached_dict = {'data': [{'type': 'bar', 'y': [1, 2]}], 'layout': {}}
+        plot_service.cache_manager.get_serialized_graph.return_value = cached_dict
+
+        result = plot_service.generate_plot(
+            'UC-2.1', sample_plot_dataframe, serialized=True
+        )
+
+        assert result is cached_dict
+        plot_service.cache_manager.get_cached_graph.assert_not_called()
+        plot_service.factory.create_strategy.assert_not_called()
+
     def test_cache_miss_generates_and_caches(
         self, plot_service, sample_plot_dataframe
     ):
@@ -732,6 +777,125 @@ class TestCachingBehavior:
         assert kwargs['metadata']['source'] == 'unit_test'
 
 
+# ============================================================================
+# PROCESSED DATA CACHE TESTS
+# ============================================================================
+
+def _config_with_dataframe_layer(**visualization):
+    return {
+        'metadata': {'use_case_id': 'UC-2.1'},
+        'visualization': {'strategy': 'BarChartStrategy', **visualization},
+        'performance': {
+            'cache': {
+                'enabled': True,
+                'layers': [
+                    {
+                        'layer': 'dataframe',
+                        'key_template': 'uc_2_1_df_{data_hash}',
+                        'ttl': 7200
+                    },
+                    {
+                        'layer': 'graph',
+                        'key_template': 'uc_2_1_graph_{data_hash}_{filters_hash}',
+                        'ttl': 3600
+                    }
+                ]
+            }
+        }
+    }
+
+
+class TestProcessedDataCache:
+    """Test reuse of processed data through the dataframe layer."""
+
+    @pytest.fixture
+    def service(self, plot_service):
+        plot_service.config_loader = Mock()
+        plot_service.factory = Mock()
+        plot_service.cache_manager = Mock()
+        plot_service.cache_manager.get_cached_graph.return_value = None
+        plot_service.config_loader.load_config.return_value = (
+            _config_with_dataframe_layer()
+        )
+        return plot_service
+
+    @staticmethod
+    def _strategy(cacheable=True):
+        strategy = Mock()
+        strategy.cache_processed_data = cacheable
+        strategy.prepare_data.return_value = pd.DataFrame({'ko_count': [5, 20]})
+        strategy.render_figure.return_value = go.Figure()
+        strategy.generate_plot.return_value = go.Figure()
+        return strategy
+
+    def test_filter_change_reuses_processed_data(
+        self, service, sample_plot_dataframe
+    ):
+        """Test that only filtering and rendering run on a filter change."""
+        strategy = self._strategy()
+        service.factory.create_strategy.return_value = strategy
+
+        service.generate_plot(
+            'UC-2.1', sample_plot_dataframe, filters={'slider': [0, 10]}
+        )
+        service.generate_plot(
+            'UC-2.1', sample_plot_dataframe, filters={'slider': [10, 50]}
+        )
+
+        strategy.prepare_data.assert_called_once()
+        strategy.generate_plot.assert_not_called()
+        assert strategy.render_figure.call_count == 2
+        rendered_df = strategy.render_figure.call_args[0][0]
+        pd.testing.assert_frame_equal(
+            rendered_df, pd.DataFrame({'ko_count': [5, 20]})
+        )
+        assert strategy.render_figure.call_args[1]['filters'] == {
+            'slider': [10, 50]
+        }
+
+    def test_config_change_invalidates_processed_data(
+        self, service, sample_plot_dataframe
+    ):
+        """Test that processing parameters are part of the cache key."""
+        strategy = self._strategy()
+        service.factory.create_strategy.return_value = strategy
+
+        service.generate_plot('UC-2.1', sample_plot_dataframe)
+        service.config_loader.load_config.return_value = (
+            _config_with_dataframe_layer(plotly={'orientation': 'h'})
+        )
+        service.generate_plot('UC-2.1', sample_plot_dataframe)
+
+        assert strategy.prepare_data.call_count == 2
+
+    def test_stateful_strategy_bypasses_processed_cache(
+        self, service, sample_plot_dataframe
+    ):
+        """Test that strategies opting out run the full pipeline."""
+        strategy = self._strategy(cacheable=False)
+        service.factory.create_strategy.return_value = strategy
+
+        service.generate_plot('UC-2.1', sample_plot_dataframe)
+
+        strategy.generate_plot.assert_called_once()
+        strategy.prepare_data.assert_not_called()
+        assert service.dataframe_cache.size() == 0
+
+    def test_force_refresh_reprocesses_data(
+        self, service, sample_plot_dataframe
+    ):
+        """Test that force_refresh skips the processed data cache read."""
+        strategy = self._strategy()
+        service.factory.create_strategy.return_value = strategy
+
+        service.generate_plot('UC-2.1', sample_plot_dataframe)
+        service.generate_plot(
+            'UC-2.1', sample_plot_dataframe, force_refresh=True
+        )
+
+        assert strategy.prepare_data.call_count == 2
+
+
 # ============================================================================
 # ERROR HANDLING TESTS
 # ============================================================================
@@ -807,10 +971,12 @@ class TestCacheClearing:
     def test_clear_cache_all(self, plot_service):
         """Test clearing all cache."""
         plot_service.cache_manager = Mock()
+        plot_service.dataframe_cache = Mock()
 
         plot_service.clear_cache()
 
         plot_service.cache_manager.clear.assert_called_once()
+        plot_service.dataframe_cache.clear.assert_called_once()
 
     def test_clear_cache_specific_use_case(self, plot_service):
         """Test clearing cache for specific use case."""
@@ -8,7 +8,8 @@ Template Method pattern.
 Test Categories:
 - Initialization: Test strategy setup with config
 - Abstract Methods: Test that abstract methods must be implemented
-- Template Method: Test generate_plot() orchestration
+- Template Method: Test generate_plot() orchestration and its
+  prepare_data()/render_figure() steps
 - Filter Application: Test apply_filters() logic
 - Customization Hook: Test apply_customizations()
 - Edge Cases: Test boundary conditions
@@ -310,6 +311,21 @@ class TestGeneratePlotTemplateMethod:
 
         assert isinstance(result, go.Figure)
 
+    def test_render_figure_reuses_prepared_data(self):
+        """Test prepared data can be rendered with several filter states."""
+        strategy = ConcreteStrategy({})
+        strategy.process_data = Mock(side_effect=lambda df: df.assign(Processed=True))
+        strategy.apply_filters = Mock(side_effect=lambda df, f: df)
+
+        processed_df = strategy.prepare_data(pd.DataFrame({'KO': ['K00001']}))
+        strategy.render_figure(processed_df, filters={'a': [0, 1]})
+        strategy.render_figure(processed_df, filters={'a': [1, 2]})
+
+        strategy.process_data.assert_called_once()
+        assert strategy.apply_filters.call_count == 2
+        assert strategy.apply_filters.call_args[0][0] is processed_df
+        assert BasePlotStrategy.cache_processed_data is True
+
 
 # ============================================================================
 # FILTER APPLICATION TESTS
@@ -16,6 +16,7 @@ Test Coverage:
 - Compression flag behavior
 - Multiple DataFrames caching
 - DataFrame copy isolation
+- Byte accounting of stored frames
 """
 
 import pytest
@@ -177,3 +178,17 @@ class TestDataFrameCache:
         retrieved2 = cache.get_cached_dataframe('test_df')
         
         assert retrieved2.loc[0, 'A'] != 999
+
+    def test_byte_accounting_uses_stored_size(
+        self, small_dataframe, large_dataframe
+    ):
+        """Test that frames count with their stored (compressed) size."""
+        cache = DataFrameCache(compress_threshold=1024 * 1024)
+
+        cache.cache_dataframe('small', small_dataframe)
+        small_bytes = cache.total_bytes
+        cache.cache_dataframe('large', large_dataframe)
+
+        assert small_bytes == small_dataframe.memory_usage(deep=True).sum()
+        assert cache.total_bytes - small_bytes == len(cache.get('large')['data'])
+        assert cache.max_bytes == DataFrameCache.DEFAULT_MAX_BYTES
@@ -0,0 +1,45 @@
+"""Unit tests for the TinyLFU frequency sketch."""
+
+from src.infrastructure.cache.frequency_sketch import FrequencySketch
+
+
+class TestFrequencySketch:
+    """Test suite for FrequencySketch."""
+
+    def test_counts_accesses_per_key(self):
+        """Test that frequencies follow the number of increments."""
+        sketch = FrequencySketch(capacity=100)
+        for _ in range(3):
+            sketch.increment("hot")
+        sketch.increment("cold")
+
+        assert sketch.frequency("hot") == 3
+        assert sketch.frequency("cold") == 1
+        assert sketch.frequency("unseen") == 0
+
+    def test_counters_saturate(self):
+        """Test that counters stop at MAX_COUNT."""
+        sketch = FrequencySketch(capacity=100)
+        for _ in range(40):
+            sketch.increment("key")
+
+        assert sketch.frequency("key") == FrequencySketch.MAX_COUNT
+
+    def test_counters_age_after_sample_period(self):
+        """Test that all counters are halved after the sample period."""
+        sketch = FrequencySketch(capacity=16)
+        for _ in range(8):
+            sketch.increment("old")
+        for index in range(sketch.SAMPLE_FACTOR * sketch.width):
+            sketch.increment(f"key{index}")
+
+        # Collisions may raise the count, but never above a halved maximum
+        assert sketch.frequency("old") <= FrequencySketch.MAX_COUNT // 2
+
+    def test_saturated_increments_count_toward_aging(self):
+        """Test that lookups of saturated keys still advance the sample period."""
+        sketch = FrequencySketch(capacity=16)
+        for _ in range(sketch.SAMPLE_FACTOR * sketch.width):
+            sketch.increment("hot")
+
+        assert sketch.frequency("hot") == FrequencySketch.MAX_COUNT // 2
@@ -13,11 +13,16 @@ Test Coverage:
 - Key consistency for same/different filters
 - Multiple figures caching
 - Figure data preservation
+- Serialized figure retrieval
 - Config-based key generation
 """
 
+import json
+from unittest.mock import Mock
+
 import plotly.graph_objects as go
 import pytest
+from plotly.io.json import to_json_plotly
 
 from src.infrastructure.cache.graph_cache import GraphCache
 
@@ -58,6 +63,20 @@ class TestGraphCache:
         assert isinstance(retrieved, go.Figure)
         assert retrieved.layout.title.text == 'Test Chart'
 
+    def test_get_serialized_figure(self, sample_figure, monkeypatch):
+        """Test serialized retrieval returns the JSON Dash would send."""
+        cache = GraphCache()
+        cache.cache_figure('test_fig', sample_figure)
+        monkeypatch.setattr(
+            go, 'Figure', Mock(side_effect=AssertionError('rebuilt figure'))
+        )
+
+        retrieved = cache.get_serialized_figure('test_fig')
+
+        assert isinstance(retrieved, dict)
+        assert retrieved == json.loads(to_json_plotly(sample_figure))
+        assert cache.get_serialized_figure('nonexistent') is None
+
     def test_get_nonexistent_figure(self):
         """Test getting non-existent figure returns None."""
         cache = GraphCache()
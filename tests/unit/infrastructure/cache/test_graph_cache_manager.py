@@ -0,0 +1,110 @@
+"""
+Unit tests for GraphCacheManager.
+
+Test Coverage:
+- Figures cached by one worker are served by another through the shared tier
+- Shared hits are promoted into the per-worker cache with the layer TTL
+- Missing shared entries are misses
+- Chunked Redis entries (read back as bytearray) decode and promote as bytes
+- Unreadable entries are misses and are deleted from both tiers
+"""
+
+import plotly.graph_objects as go
+
+from src.infrastructure.cache.graph_cache_manager import GraphCacheManager
+from src.presentation.services.resume_store_redis import RedisResumeStore
+from tests.unit.presentation.services.test_job_resume_redis import (
+    _FakeRedisBackend,
+    _FakeRedisClient,
+)
+
+
+class _SharedStore:
+    """In-memory stand-in for a ResumeStore shared by all workers."""
+
+    backend_name = "memory"
+
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+
+    def set_bytes(self, key, data, ttl_seconds):
+        self.values[key] = bytes(data)
+        self.ttls[key] = ttl_seconds
+        return True
+
+    def get_bytes(self, key):
+        return self.values.get(key)
+
+    def delete(self, key):
+        self.values.pop(key, None)
+        self.ttls.pop(key, None)
+        return True
+
+
+class TestGraphCacheManager:
+    """Test suite for the two-tier graph cache."""
+
+    def test_shared_tier_serves_other_workers(self):
+        """Test that a figure rendered once is a hit in every worker."""
+        store = _SharedStore()
+        worker_1 = GraphCacheManager(shared_store=store)
+        worker_2 = GraphCacheManager(shared_store=store)
+        figure = go.Figure(data=go.Bar(x=["A", "B"], y=[1, 2]))
+
+        worker_1.cache_graph("uc_2_1_fig_abc", figure, ttl=600)
+        served = worker_2.get_serialized_graph("uc_2_1_fig_abc", ttl=600)
+
+        assert served["data"][0]["y"] == [1, 2]
+        assert store.ttls == {"graph:v1:uc_2_1_fig_abc": 600}
+        assert worker_2.cache.exists("uc_2_1_fig_abc") is True
+        assert worker_2.cache._expiry["uc_2_1_fig_abc"] is not None
+        assert isinstance(worker_2.get_cached_graph("uc_2_1_fig_abc"), go.Figure)
+
+    def test_missing_everywhere_is_a_miss(self):
+        """Test that keys absent from both tiers return None."""
+        manager = GraphCacheManager(shared_store=_SharedStore())
+
+        assert manager.get_cached_graph("missing") is None
+        assert manager.get_serialized_graph("missing") is None
+
+    def test_without_shared_store_caches_per_worker(self):
+        """Test that the manager works with the per-worker tier only."""
+        manager = GraphCacheManager(max_bytes=1024 * 1024)
+        manager.cache_graph("key", go.Figure())
+
+        assert manager.get_serialized_graph("key") is not None
+        assert manager.get_stats()["shared_backend"] is None
+
+    def test_chunked_redis_entries_are_served_as_bytes(self):
+        """Test that figures spread over Redis chunks decode in other workers."""
+        backend = _FakeRedisBackend()
+        worker_1 = GraphCacheManager(
+            shared_store=RedisResumeStore(
+                client=_FakeRedisClient(backend), chunk_size_kb=1
+            )
+        )
+        worker_2 = GraphCacheManager(
+            shared_store=RedisResumeStore(
+                client=_FakeRedisClient(backend), chunk_size_kb=1
+            )
+        )
+        values = list(range(2000))
+        figure = go.Figure(data=go.Scatter(x=values, y=values))
+
+        worker_1.cache_graph("uc_3_1_fig_big", figure, ttl=600)
+        served = worker_2.get_serialized_graph("uc_3_1_fig_big", ttl=600)
+
+        assert list(served["data"][0]["y"]) == values
+        assert type(worker_2.cache.get("uc_3_1_fig_big")) is bytes
+        assert isinstance(worker_2.get_cached_graph("uc_3_1_fig_big"), go.Figure)
+
+    def test_unreadable_shared_entry_is_a_miss_and_deleted(self):
+        """Test that corrupt shared bytes are dropped instead of raising."""
+        store = _SharedStore()
+        store.set_bytes("graph:v1:broken", b'{"data": [', ttl_seconds=600)
+        manager = GraphCacheManager(shared_store=store)
+
+        assert manager.get_cached_graph("broken") is None
+        assert "graph:v1:broken" not in store.values
+        assert manager.cache.exists("broken") is False
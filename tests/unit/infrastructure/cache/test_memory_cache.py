@@ -19,6 +19,9 @@ Test Coverage:
 - Different data types storage
 - Key override behavior
 - TTL=0 (no expiration) behavior
+- Byte budget eviction and oversized values
+- Frequency-aware admission under a byte budget
+- Admission window for new entries
 """
 
 import pytest
@@ -214,3 +217,96 @@ class TestMemoryCache:
         
         # Should never expire
         assert cache.exists('key1') is True
+
+    def test_byte_budget_evicts_least_recently_used(self):
+        """Test that entries are evicted to stay within max_bytes."""
+        cache = MemoryCache(max_bytes=100)
+
+        cache.set('a', b'x' * 40)
+        cache.set('b', b'x' * 40)
+        cache.get('a')
+        cache.set('c', b'x' * 40)
+
+        assert cache.exists('a') is True
+        assert cache.exists('b') is False
+        assert cache.exists('c') is True
+        assert cache.total_bytes == 80
+
+    def test_byte_budget_skips_oversized_values(self):
+        """Test that values above max_bytes are not cached."""
+        cache = MemoryCache(max_bytes=100)
+        cache.set('small', b'x' * 10)
+        cache.set('big', b'x' * 10)
+
+        cache.set('big', b'x' * 101)
+
+        assert cache.exists('small') is True
+        assert cache.exists('big') is False
+        assert cache.get_stats()['current_bytes'] == 10
+
+    def test_admission_protects_hot_entries_from_large_cold_value(self):
+        """Test that a rarely used large value cannot flush hot entries."""
+        cache = MemoryCache(max_bytes=100)
+        for index in range(5):
+            cache.set(f'hot{index}', b'x' * 20)
+            for _ in range(3):
+                cache.get(f'hot{index}')
+
+        cache.get('big')
+        cache.set('big', b'x' * 90)
+
+        assert cache.exists('big') is False
+        assert cache.size() == 5
+
+    def test_admission_accepts_value_once_it_is_popular(self):
+        """Test that a frequently requested value displaces cold entries."""
+        cache = MemoryCache(max_bytes=100)
+        cache.set('cold1', b'x' * 40)
+        cache.set('cold2', b'x' * 40)
+        cache.get('cold1')
+
+        for _ in range(2):
+            cache.get('new')
+        cache.set('new', b'x' * 70)
+
+        assert cache.exists('new') is True
+        assert cache.exists('cold1') is False
+        assert cache.exists('cold2') is False
+        assert cache.total_bytes == 70
+
+    def test_admission_accepts_large_value_that_keeps_being_requested(self):
+        """Test that a large value evicting several hot entries gets in."""
+        cache = MemoryCache(max_bytes=100)
+        for index in range(5):
+            cache.set(f'hot{index}', b'x' * 20)
+            for _ in range(20):
+                cache.get(f'hot{index}')
+
+        for _ in range(20):
+            if cache.get('big') is None:
+                cache.set('big', b'x' * 60)
+
+        assert cache.exists('big') is True
+        assert cache.total_bytes <= 100
+
+    def test_admission_window_gives_new_entries_a_grace_period(self):
+        """Test that small new entries compete only when leaving the window."""
+        cache = MemoryCache(max_size=200, max_bytes=10_000)
+        for index in range(10):
+            cache.set(f'hot{index}', b'x' * 990)
+            for _ in range(3):
+                cache.get(f'hot{index}')
+
+        cache.set('new1', b'x' * 50)
+        cache.set('new2', b'x' * 50)
+        assert cache.exists('new1') is True
+        assert cache.exists('new2') is True
+
+        # The window holds two entries: the oldest now competes and loses
+        cache.set('new3', b'x' * 50)
+
+        assert cache.exists('new1') is False
+        assert cache.exists('new2') is True
+        assert cache.exists('new3') is True
+        assert all(cache.exists(f'hot{index}') for index in range(10))
+        assert cache.total_bytes <= 10_000
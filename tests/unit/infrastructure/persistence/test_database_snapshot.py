@@ -0,0 +1,145 @@
+"""
+Unit tests for columnar database snapshots.
+
+Tests snapshot round-trips, checksum keying, stale-snapshot detection and
+the CSV fallback used by repositories and the data processing service.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.infrastructure.persistence.csv_database_repository import CSVDatabaseRepository
+from src.infrastructure.persistence.database_snapshot import (
+    DatabaseSnapshotStore,
+    build_database_snapshots,
+    read_checksum_manifest,
+)
+
+
+def _write_manifest(database_dir: Path, *filenames: str) -> None:
+    lines = []
+    for filename in filenames:
+        digest = hashlib.sha256((database_dir / filename).read_bytes()).hexdigest()
+        lines.append(f"{digest} *{filename}")
+    (database_dir / "checksums.sha256").write_text("\n".join(lines) + "\n")
+
+
+@pytest.fixture
+def database_dir(tmp_path):
+    """Create a database directory with one checksummed CSV."""
+    df = pd.DataFrame(
+        {
+            "ko": ["K00001", "K00002", "K00001", "K00003"],
+            "compoundname": ["benzene", "toluene", "phenol", "benzene"],
+            "score": [0.5, 1.25, np.nan, 3.0],
+            "count": [1, 2, 3, 4],
+        }
+    )
+    df.to_csv(tmp_path / "sample_db.csv", sep=";", index=False)
+    _write_manifest(tmp_path, "sample_db.csv")
+    return tmp_path
+
+
+class TestDatabaseSnapshotStore:
+    """Test suite for DatabaseSnapshotStore."""
+
+    def test_read_checksum_manifest(self, database_dir):
+        """Test manifest parsing strips the binary-mode marker."""
+        checksums = read_checksum_manifest(database_dir)
+
+        assert list(checksums) == ["sample_db.csv"]
+        assert len(checksums["sample_db.csv"]) == 64
+
+    def test_round_trip_matches_csv(self, database_dir):
+        """Test snapshot content equals parsed CSV content."""
+        csv_path = database_dir / "sample_db.csv"
+        store = DatabaseSnapshotStore(database_dir)
+        expected = pd.read_csv(csv_path, sep=";")
+
+        snapshot_path = store.build(csv_path, expected)
+        loaded = store.load(csv_path)
+
+        assert snapshot_path is not None
+        assert snapshot_path.exists()
+        assert loaded is not None
+        assert isinstance(loaded["ko"].dtype, pd.CategoricalDtype)
+        pd.testing.assert_frame_equal(loaded.astype(object), expected.astype(object))
+
+    def test_load_or_build_creates_snapshot(self, database_dir):
+        """Test first load parses CSV and writes a reusable snapshot."""
+        csv_path = database_dir / "sample_db.csv"
+        store = DatabaseSnapshotStore(database_dir)
+
+        df = store.load_or_build(csv_path)
+
+        assert store.snapshot_path(csv_path).exists()
+        assert df["ko"].tolist() == ["K00001", "K00002", "K00001", "K00003"]
+
+    def test_changed_csv_invalidates_snapshot(self, database_dir):
+        """Test snapshot is ignored once the CSV content changes."""
+        csv_path = database_dir / "sample_db.csv"
+        store = DatabaseSnapshotStore(database_dir)
+        store.load_or_build(csv_path)
+
+        pd.DataFrame({"ko": ["K09999"], "compoundname": ["x"]}).to_csv(
+            csv_path, sep=";", index=False
+        )
+        os.utime(csv_path, ns=(0, 0))
+
+        assert store.load(csv_path) is None
+        assert store.load_or_build(csv_path)["ko"].tolist() == ["K09999"]
+
+    def test_new_manifest_checksum_rekeys_snapshot(self, database_dir):
+        """Test snapshots keyed to a previous checksum are superseded."""
+        csv_path = database_dir / "sample_db.csv"
+        DatabaseSnapshotStore(database_dir).load_or_build(csv_path)
+
+        pd.DataFrame({"ko": ["K09999"], "compoundname": ["x"]}).to_csv(
+            csv_path, sep=";", index=False
+        )
+        _write_manifest(database_dir, "sample_db.csv")
+        store = DatabaseSnapshotStore(database_dir)
+        df = store.load_or_build(csv_path)
+
+        snapshots = list(store.snapshot_dir.glob("sample_db-*.snap"))
+        assert snapshots == [store.snapshot_path(csv_path)]
+        assert df["ko"].tolist() == ["K09999"]
+
+    def test_unlisted_csv_falls_back_to_parsing(self, database_dir):
+        """Test CSVs without a manifest entry are parsed and not snapshotted."""
+        csv_path = database_dir / "other_db.csv"
+        pd.DataFrame({"ko": ["K00001"]}).to_csv(csv_path, sep=";", index=False)
+        store = DatabaseSnapshotStore(database_dir)
+
+        df = store.load_or_build(csv_path)
+
+        assert store.snapshot_path(csv_path) is None
+        assert df["ko"].tolist() == ["K00001"]
+        assert not store.snapshot_dir.exists()
+
+    def test_build_database_snapshots(self, database_dir):
+        """Test build step covers every manifest entry."""
+        results = build_database_snapshots(database_dir)
+
+        assert set(results) == {"sample_db.csv"}
+        assert results["sample_db.csv"].exists()
+
+    def test_repository_loads_from_snapshot(self, database_dir):
+        """Test repository returns the same content through the snapshot."""
+        csv_path = database_dir / "sample_db.csv"
+        repository = CSVDatabaseRepository(csv_path, required_columns=["ko"])
+
+        df = repository.load_data()
+
+        assert DatabaseSnapshotStore(database_dir).snapshot_path(csv_path).exists()
+        assert df["compoundname"].astype(object).tolist() == [
+            "benzene",
+            "toluene",
+            "phenol",
+            "benzene",
+        ]
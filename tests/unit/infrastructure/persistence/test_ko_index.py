@@ -0,0 +1,99 @@
+"""
+Unit tests for KORowIndex.
+
+Tests that gather-based KO joins reproduce ``pd.merge`` inner-join output.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.infrastructure.persistence.ko_index import KORowIndex
+
+
+@pytest.fixture
+def reference_table():
+    """Create reference table with repeated, unsorted KOs."""
+    return pd.DataFrame(
+        {
+            "ko": ["K00003", "K00001", "K00002", "K00001", "K00003", "K00001"],
+            "gene": ["g3a", "g1a", "g2a", "g1b", "g3b", "g1c"],
+            "pathway": ["p3", "p1", "p2", "p1", "p3", "p1"],
+        }
+    )
+
+
+@pytest.fixture
+def sample_df():
+    """Create Sample-KO input including an unmatched KO."""
+    return pd.DataFrame(
+        {
+            "Sample": ["S1", "S1", "S2", "S2", "S3"],
+            "KO": ["K00001", "K09999", "K00003", "K00001", "K00002"],
+        }
+    )
+
+
+class TestKORowIndex:
+    """Test suite for KORowIndex."""
+
+    def test_len_counts_distinct_kos(self, reference_table):
+        """Test index holds one range per distinct KO."""
+        assert len(KORowIndex(reference_table)) == 3
+
+    def test_missing_key_column_raises(self, reference_table):
+        """Test KeyError when key column is absent."""
+        with pytest.raises(KeyError):
+            KORowIndex(reference_table, key_column="KO")
+
+    def test_join_matches_merge(self, reference_table, sample_df):
+        """Test join reproduces inner merge rows, order and dtypes."""
+        index = KORowIndex(reference_table)
+
+        joined = index.join(sample_df, left_on="KO", columns=["gene", "pathway"])
+        expected = sample_df.merge(
+            reference_table, left_on="KO", right_on="ko", how="inner"
+        )[["Sample", "KO", "gene", "pathway"]]
+
+        pd.testing.assert_frame_equal(joined, expected)
+
+    def test_join_with_categorical_table(self, reference_table, sample_df):
+        """Test snapshot-style categorical columns keep their dtype."""
+        table = reference_table.astype("category")
+        index = KORowIndex(table)
+
+        joined = index.join(sample_df, left_on="KO", columns=["gene"])
+
+        assert isinstance(joined["gene"].dtype, pd.CategoricalDtype)
+        assert joined["gene"].astype(object).tolist() == [
+            "g1a",
+            "g1b",
+            "g1c",
+            "g3a",
+            "g3b",
+            "g1a",
+            "g1b",
+            "g1c",
+            "g2a",
+        ]
+
+    def test_join_without_matches_returns_empty(self, reference_table):
+        """Test unmatched KOs produce an empty frame with all columns."""
+        index = KORowIndex(reference_table)
+        left = pd.DataFrame({"Sample": ["S1"], "KO": ["K09999"]})
+
+        joined = index.join(left, left_on="KO", columns=["gene"])
+
+        assert joined.empty
+        assert list(joined.columns) == ["Sample", "KO", "gene"]
+
+    def test_lookup_with_categorical_keys_matches_object_keys(self, reference_table):
+        """Test categorical keys (incl. unknown and missing) resolve per category."""
+        index = KORowIndex(reference_table)
+        keys = ["K00003", "K09999", None, "K00001", "K00003"]
+
+        expected = index.lookup(pd.Series(keys, dtype=object))
+        actual = index.lookup(pd.Series(keys, dtype="category"))
+
+        np.testing.assert_array_equal(actual[0], expected[0])
+        np.testing.assert_array_equal(actual[1], expected[1])
@@ -0,0 +1,85 @@
+"""
+Unit tests for the shared reference vocabulary.
+
+Tests vocabulary construction from reference tables, dtype sharing across
+databases, frame decoding and per-job sample encoding.
+"""
+
+import pandas as pd
+import pytest
+
+from src.infrastructure.persistence.reference_vocabulary import ReferenceVocabulary
+
+
+@pytest.fixture
+def databases():
+    """Create minimal reference tables sharing identifiers."""
+    return {
+        "biorempp": pd.DataFrame(
+            {
+                "ko": ["K00002", "K00001", "K00002"],
+                "cpd": ["C2", "C1", "C3"],
+                "genesymbol": ["geneB", "geneA", "geneB"],
+            }
+        ),
+        "hadeg": pd.DataFrame({"ko": ["K00003"], "Pathway": ["Alkanes"]}),
+        "kegg": pd.DataFrame(
+            {
+                "ko": ["K00001"],
+                "pathname": ["Benzoate"],
+                "genesymbol": ["geneC"],
+            }
+        ),
+        "toxcsm": pd.DataFrame({"cpd": ["C1", "C9"], "value_NR_AR": [0.1, 0.2]}),
+    }
+
+
+class TestReferenceVocabulary:
+    """Test suite for ReferenceVocabulary."""
+
+    def test_from_databases_collects_sorted_identifiers(self, databases):
+        """Test categories are the sorted union over every source column."""
+        vocabulary = ReferenceVocabulary.from_databases(databases)
+
+        assert vocabulary.dtype("KO").categories.tolist() == [
+            "K00001",
+            "K00002",
+            "K00003",
+        ]
+        assert vocabulary.dtype("Compound_ID").categories.tolist() == [
+            "C1",
+            "C2",
+            "C3",
+            "C9",
+        ]
+        assert vocabulary.size("Pathway") == 2
+        assert vocabulary.size("Gene_Symbol") == 3
+
+    def test_encode_databases_shares_dtype_across_tables(self, databases):
+        """Test every source column is recoded to the same dtype."""
+        vocabulary = ReferenceVocabulary.from_databases(databases)
+        vocabulary.encode_databases(databases)
+
+        ko_dtype = vocabulary.dtype("KO")
+        for db_name in ["biorempp", "hadeg", "kegg"]:
+            assert databases[db_name]["ko"].dtype == ko_dtype
+        assert databases["toxcsm"]["cpd"].dtype == vocabulary.dtype("Compound_ID")
+        assert databases["toxcsm"]["value_NR_AR"].dtype == float
+        assert databases["biorempp"]["ko"].tolist() == ["K00002", "K00001", "K00002"]
+
+    def test_encode_samples_keeps_first_appearance_order(self):
+        """Test sample categories follow upload order, not sort order."""
+        samples = ReferenceVocabulary.encode_samples(["S2", "S1", "S2"])
+
+        assert samples.categories.tolist() == ["S2", "S1"]
+        assert samples.tolist() == ["S2", "S1", "S2"]
+
+    def test_decode_frame_restores_object_columns(self, databases):
+        """Test decoding round-trips encoded identifier columns."""
+        vocabulary = ReferenceVocabulary.from_databases(databases)
+        df = pd.DataFrame({"KO": ["K00002", "K00001"], "score": [1, 2]})
+
+        encoded = df.astype({"KO": vocabulary.dtype("KO")})
+        decoded = ReferenceVocabulary.decode_frame(encoded)
+
+        pd.testing.assert_frame_equal(decoded, df)
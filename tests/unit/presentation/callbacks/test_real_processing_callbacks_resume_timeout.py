@@ -163,3 +163,38 @@ def test_persist_resume_payload_logs_redacted_job_ref_on_error(monkeypatch):
     assert extra.get("job_ref", "").startswith("job_")
     assert "job_id" not in extra
     assert job_id not in str(extra)
+
+
+class _RejectingExecutor:
+    queue_depth = 8
+    in_flight = 2
+
+    @staticmethod
+    def submit(fn, timeout_seconds):
+        return None
+
+
+def test_persist_resume_payload_reports_queue_full(monkeypatch):
+    """A save that finds the persistence queue full is not started."""
+    monkeypatch.setattr(
+        real_processing_callbacks,
+        "job_resume_service",
+        _FastResumeService(),
+    )
+    monkeypatch.setattr(
+        real_processing_callbacks,
+        "resume_persist_executor",
+        _RejectingExecutor(),
+    )
+
+    outcome = real_processing_callbacks._persist_resume_payload_with_timeout(
+        job_id="BRP-20260225-123460-ABCDEF",
+        payload={"metadata": {}},
+        owner_token="token-e",
+        ttl_seconds=60,
+        timeout_seconds=0.1,
+    )
+
+    assert outcome.saved_effective is False
+    assert outcome.stage == "queue_full"
+    assert outcome.store_set_confirmed is False
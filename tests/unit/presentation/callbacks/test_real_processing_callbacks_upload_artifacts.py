@@ -0,0 +1,69 @@
+"""Unit tests for upload artifact resolution in processing callbacks."""
+
+import pytest
+
+from src.application.core.upload_parser import UploadParser
+from src.presentation.callbacks import real_processing_callbacks
+from src.shared.exceptions import ValidationError
+
+
+class _FakeService:
+    def __init__(self) -> None:
+        self.calls: list = []
+
+    def process_parsed_records(self, parsed, filename, job_id):
+        self.calls.append(("parsed", len(parsed), filename, job_id))
+        return {"metadata": {"job_id": job_id}}
+
+    def process_upload_records(self, content, filename, job_id):
+        self.calls.append(("content", content, filename, job_id))
+        return {"metadata": {"job_id": job_id}}
+
+
+class _FakeArtifactStore:
+    def __init__(self, artifacts: dict) -> None:
+        self.artifacts = artifacts
+
+    def load(self, ref):
+        return self.artifacts.get(ref)
+
+
+def test_artifact_ref_skips_content_parsing(monkeypatch):
+    """A stored artifact is processed without the file content."""
+    parsed = UploadParser().parse(">S1\nK00001\nK00002\n")
+    monkeypatch.setattr(
+        real_processing_callbacks,
+        "upload_artifact_store",
+        _FakeArtifactStore({"upload:v1:abc": parsed}),
+    )
+    service = _FakeService()
+
+    real_processing_callbacks._process_file_data(
+        service, {"artifact_ref": "upload:v1:abc", "filename": "a.txt"}, "J1"
+    )
+
+    assert service.calls == [("parsed", 2, "a.txt", "J1")]
+
+
+def test_inline_content_is_parsed_when_no_artifact(monkeypatch):
+    """Entries without an artifact keep the content-based path."""
+    monkeypatch.setattr(real_processing_callbacks, "upload_artifact_store", None)
+    service = _FakeService()
+
+    real_processing_callbacks._process_file_data(
+        service, {"content": ">S1\nK00001\n", "filename": "a.txt"}, "J1"
+    )
+
+    assert service.calls == [("content", ">S1\nK00001\n", "a.txt", "J1")]
+
+
+def test_expired_artifact_without_content_asks_for_reupload(monkeypatch):
+    """A missing artifact surfaces as a validation error."""
+    monkeypatch.setattr(
+        real_processing_callbacks, "upload_artifact_store", _FakeArtifactStore({})
+    )
+
+    with pytest.raises(ValidationError, match="upload the file again"):
+        real_processing_callbacks._process_file_data(
+            _FakeService(), {"artifact_ref": "upload:v1:abc", "filename": "a"}, "J1"
+        )
@@ -1,11 +1,16 @@
 """Unit tests for dynamic database overview metadata generation."""
 
 import re
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
 
+from src.application.core.upload_parser import UploadParser
 from src.presentation.services.data_processing_service import DataProcessingService
+from src.presentation.services.merge_result_cache import MergeResultCache
+from src.presentation.services.resume_store_diskcache import DiskcacheResumeStore
+from src.shared.exceptions import KOLimitExceededError
 
 
 @pytest.fixture
@@ -447,3 +452,173 @@ def test_legacy_toxcsm_column_names_are_normalized_and_mapped(
     assert toxcsm_stats["toxicity_categories"]["global_value"] == 5
     assert toxcsm_stats["toxicity_endpoints"]["input_value"] == 5
     assert toxcsm_stats["toxicity_categories"]["input_value"] == 5
+
+
+def test_toxcsm_long_format_is_precomputed_at_load(mock_database_dir):
+    """ToxCSM long table is built once as categoricals; calls return copies."""
+    service = DataProcessingService(database_path=mock_database_dir)
+
+    first = service.merge_with_toxcsm(pd.DataFrame(), scope="database")
+    first.loc[0, "toxicity_score"] = 99.0
+    second = service.merge_with_toxcsm(pd.DataFrame(), scope="database")
+
+    assert len(second) == 20
+    assert second["toxicity_score"].max() == 0.5
+    for column in ["compoundname", "endpoint", "prefix", "super_category"]:
+        assert isinstance(second[column].dtype, pd.CategoricalDtype)
+    assert sorted(second["endpoint"].unique().tolist()) == [
+        "Env_Avian",
+        "Gen_AMES_Mutagenesis",
+        "NR_AR",
+        "Org_Eye_Irritation",
+        "SR_ARE",
+    ]
+
+
+def test_toxcsm_long_format_is_scoped_to_matched_compounds(mock_database_dir):
+    """Default scope keeps only ToxCSM compounds matched via Compound_ID."""
+    service = DataProcessingService(database_path=mock_database_dir)
+    content = ">SampleA\nK00002\n"
+
+    result = service.process_upload(content=content, filename="input.txt")
+    database_scope = service.merge_with_toxcsm(
+        result["biorempp_df"], scope="database"
+    )
+
+    assert result["toxcsm_df"]["compoundname"].unique().tolist() == ["Compound C"]
+    assert len(result["toxcsm_df"]) == 5
+    assert list(result["toxcsm_df"].columns) == list(database_scope.columns)
+    assert set(database_scope["compoundname"]) == {
+        "Compound A",
+        "Compound B",
+        "Compound C",
+        "Compound X",
+    }
+
+
+def test_toxcsm_scope_rejects_unknown_values(mock_database_dir):
+    """Unknown scopes raise instead of silently returning all compounds."""
+    with pytest.raises(ValueError):
+        DataProcessingService(database_path=mock_database_dir, toxcsm_scope="all")
+
+    service = DataProcessingService(database_path=mock_database_dir)
+    with pytest.raises(ValueError):
+        service.merge_with_toxcsm(pd.DataFrame(), scope="all")
+
+
+def test_merged_identifier_columns_share_reference_vocabulary(mock_database_dir):
+    """KO/Compound_ID columns carry the shared vocabulary dtype after merges."""
+    service = DataProcessingService(database_path=mock_database_dir)
+    content = ">SampleA\nK00001\n>SampleB\nK00002\n"
+
+    result = service.process_upload(content=content, filename="input.txt")
+    ko_dtype = service.vocabulary.dtype("KO")
+
+    for key in ["biorempp_df", "hadeg_df", "kegg_df"]:
+        assert result[key]["KO"].dtype == ko_dtype
+    assert result["biorempp_df"]["Compound_ID"].dtype == service.vocabulary.dtype(
+        "Compound_ID"
+    )
+    assert result["biorempp_df"]["Sample"].cat.categories.tolist() == [
+        "SampleA",
+        "SampleB",
+    ]
+    records = result["biorempp_df"].to_dict("records")
+    assert all(isinstance(record["KO"], str) for record in records)
+
+
+def test_process_upload_records_reuses_cached_merge_results(
+    mock_database_dir, tmp_path
+):
+    """Resubmitted datasets are served from the merge result cache."""
+    cache = MergeResultCache(
+        DiskcacheResumeStore(tmp_path / "merge_cache", cache_size_mb=32)
+    )
+    service = DataProcessingService(
+        database_path=mock_database_dir, result_cache=cache
+    )
+
+    first = service.process_upload_records(
+        content=">SampleA\nK00001\n>SampleB\nK00002\n", filename="a.txt"
+    )
+    other_worker = DataProcessingService(
+        database_path=mock_database_dir, result_cache=cache
+    )
+    with patch.object(
+        other_worker, "merge_with_biorempp", side_effect=AssertionError("merged")
+    ):
+        second = other_worker.process_upload_records(
+            content=">SampleB\nK00002\n>SampleA\nK00001\nK00001\n",
+            filename="b.txt",
+        )
+
+    assert second["metadata"]["filename"] == "b.txt"
+    assert second["metadata"]["job_id"] != first["metadata"]["job_id"]
+    assert (
+        second["metadata"]["database_overview"]
+        == first["metadata"]["database_overview"]
+    )
+    uncached = DataProcessingService.serialize_result(
+        service.process_upload(
+            content=">SampleA\nK00001\n>SampleB\nK00002\n", filename="a.txt"
+        )
+    )
+    for key in MergeResultCache.TABLE_KEYS:
+        assert first[key] == uncached[key]
+        assert second[key] == uncached[key]
+
+
+def test_process_upload_reports_stage_timings(mock_database_dir):
+    """Metadata carries per-stage wall time and the critical path."""
+    service = DataProcessingService(database_path=mock_database_dir, stage_workers=4)
+
+    result = service.process_upload(
+        content=">SampleA\nK00001\n>SampleB\nK00002\n", filename="input.txt"
+    )
+    timings = result["metadata"]["stage_timings_ms"]
+
+    assert set(timings) == {"biorempp", "hadeg", "kegg", "toxcsm", "toxcsm_wide"}
+    assert result["metadata"]["critical_path_ms"] >= timings["biorempp"]
+    assert len(result["toxcsm_raw_df"]) > 0
+
+
+def test_parse_upload_content_encodes_sample_and_ko_columns(mock_database_dir):
+    """Parsed Sample and KO columns are per-job categoricals."""
+    service = DataProcessingService(database_path=mock_database_dir)
+
+    parsed = service.parse_upload_content(
+        content=">SampleB\nK00002\n>SampleA\nK00001\n", filename="input.txt"
+    )
+
+    assert isinstance(parsed["Sample"].dtype, pd.CategoricalDtype)
+    assert isinstance(parsed["KO"].dtype, pd.CategoricalDtype)
+    assert list(parsed["Sample"].cat.categories) == ["SampleB", "SampleA"]
+    assert parsed["KO"].astype(str).tolist() == ["K00002", "K00001"]
+
+
+def test_parse_upload_content_enforces_configured_limits(mock_database_dir):
+    """Upload limits configured on the parser are enforced while parsing."""
+    service = DataProcessingService(
+        database_path=mock_database_dir,
+        upload_parser=UploadParser(max_kos_per_sample=1),
+    )
+
+    with pytest.raises(KOLimitExceededError):
+        service.parse_upload_content(
+            content=">SampleA\nK00001\nK00002\n", filename="input.txt"
+        )
+
+
+def test_process_parsed_records_matches_process_upload_records(mock_database_dir):
+    """Processing a stored parse gives the same records as parsing content."""
+    service = DataProcessingService(database_path=mock_database_dir)
+    content = ">SampleA\nK00001\nK00002\n>SampleB\nK00002\n"
+
+    from_content = service.process_upload_records(content, "input.txt", job_id="J1")
+    from_parsed = service.process_parsed_records(
+        UploadParser().parse(content), "input.txt", job_id="J1"
+    )
+
+    for key in MergeResultCache.TABLE_KEYS:
+        assert from_parsed[key] == from_content[key]
+    assert from_parsed["metadata"]["sample_count"] == 2
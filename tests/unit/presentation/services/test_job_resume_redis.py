@@ -8,6 +8,7 @@ from typing import Optional
 import pytest
 
 from src.presentation.services.job_resume_service import JobResumeService
+from src.presentation.services.resume_block_store import ResumeBlockStore
 from src.presentation.services.resume_store_redis import RedisResumeStore
 
 
@@ -35,6 +36,56 @@ class _FakeRedisBackend:
                 return None
             return value
 
+    def ttl(self, key: str) -> int:
+        if self.get(key) is None:
+            return -2
+        with self._lock:
+            expire_at = self._data[key][1]
+        return -1 if expire_at is None else int(expire_at - time.time())
+
+    def expire(self, key: str, seconds: int) -> bool:
+        with self._lock:
+            if key not in self._data:
+                return False
+            self._data[key] = (self._data[key][0], time.time() + max(int(seconds), 1))
+        return True
+
+    def incrby(self, key: str, amount: int) -> int:
+        raw = self.get(key)
+        with self._lock:
+            expire_at = self._data[key][1] if raw is not None else None
+            count = int(raw or 0) + int(amount)
+            self._data[key] = (str(count).encode("ascii"), expire_at)
+        return count
+
+    def delete(self, key: str) -> int:
+        with self._lock:
+            return 1 if self._data.pop(key, None) is not None else 0
+
+    def delete_unreferenced(self, counter_key: str, key: str) -> int:
+        """Atomic check-and-delete, as RedisResumeStore's Lua script does."""
+        with self._lock:
+            raw = self._data.get(counter_key)
+            if raw is not None and int(raw[0]) > 0:
+                return 0
+            self._data.pop(counter_key, None)
+            self._data.pop(key, None)
+        return 1
+
+    def hset(self, key: str, mapping: dict) -> int:
+        with self._lock:
+            fields, expire_at = self._data.get(key, ({}, None))
+            self._data[key] = ({**fields, **mapping}, expire_at)
+        return len(mapping)
+
+    def hmget(self, key: str, fields: list[str]) -> list[Optional[bytes]]:
+        values = self.get(key) or {}
+        return [values.get(field) for field in fields]
+
+    def keys(self) -> list[str]:
+        with self._lock:
+            return list(self._data)
+
     def raw_value(self, key: str) -> Optional[bytes]:
         with self._lock:
             raw = self._data.get(key)
@@ -53,6 +104,35 @@ class _FakeRedisClient:
     def get(self, name: str) -> Optional[bytes]:
         return self._backend.get(name)
 
+    def ttl(self, name: str) -> int:
+        return self._backend.ttl(name)
+
+    def expire(self, name: str, time: int) -> bool:
+        return self._backend.expire(name, time)
+
+    def incrby(self, name: str, amount: int = 1) -> int:
+        return self._backend.incrby(name, amount)
+
+    def delete(self, *names: str) -> int:
+        return sum(self._backend.delete(name) for name in names)
+
+    def getrange(self, name: str, start: int, end: int) -> bytes:
+        value = self._backend.get(name)
+        return b"" if value is None else value[start : end + 1]
+
+    def hset(self, name: str, mapping: dict) -> int:
+        return self._backend.hset(name, mapping)
+
+    def hmget(self, name: str, keys: list[str]) -> list[Optional[bytes]]:
+        return self._backend.hmget(name, keys)
+
+    def eval(self, script: str, numkeys: int, *keys: str) -> int:
+        assert script == RedisResumeStore.DELETE_UNREFERENCED_SCRIPT
+        return self._backend.delete_unreferenced(*keys[:numkeys])
+
+    def pipeline(self, transaction: bool = True) -> "_FakePipeline":
+        return _FakePipeline(self)
+
     @staticmethod
     def ping() -> bool:
         return True
@@ -62,6 +142,27 @@ class _FakeRedisClient:
         return None
 
 
+class _FakePipeline:
+    """Queues client calls and runs them on execute, like a Redis pipeline."""
+
+    def __init__(self, client: _FakeRedisClient) -> None:
+        self._client = client
+        self._calls: list = []
+
+    def __getattr__(self, name: str):
+        method = getattr(self._client, name)
+
+        def _queue(*args, **kwargs):
+            self._calls.append((method, args, kwargs))
+            return self
+
+        return _queue
+
+    def execute(self) -> list:
+        calls, self._calls = self._calls, []
+        return [method(*args, **kwargs) for method, args, kwargs in calls]
+
+
 class _FailingRedisClient:
     """Redis client stub that raises on read/write to test redacted logging."""
 
@@ -120,6 +221,64 @@ def test_redis_resume_persists_across_service_instances():
     consumer_service.close()
 
 
+def test_redis_resume_shares_table_blocks_across_jobs():
+    """Identical tables of different jobs are stored as one Redis block."""
+    backend = _FakeRedisBackend()
+    service = _build_service(backend, key_prefix="test:resume:")
+    rows = [{"Sample": "S1", "KO": "K00001"}]
+
+    for job_id in ("BRP-20260225-140004-ABC205", "BRP-20260225-140005-ABC206"):
+        payload = {
+            "metadata": {"job_id": job_id},
+            "biorempp_df": rows,
+            "biorempp_raw_df": rows,
+        }
+        assert service.save_job_payload(job_id, payload, "owner", ttl_seconds=30)
+
+    block_keys = [key for key in backend.keys() if ":block:" in key]
+    refs_keys = [key for key in backend.keys() if ":refs:" in key]
+    loaded_payload, status = service.load_job_payload(
+        "BRP-20260225-140005-ABC206", "owner"
+    )
+
+    assert len(block_keys) == 1
+    assert backend.get(refs_keys[0]) == b"2"
+    assert backend.ttl(block_keys[0]) > 0
+    assert status == service.STATUS_OK
+    assert loaded_payload["biorempp_raw_df"] == rows
+
+    service.close()
+
+
+def test_redis_release_keeps_block_acquired_concurrently():
+    """An acquire between release's decrement and delete keeps the block."""
+    backend = _FakeRedisBackend()
+    store = RedisResumeStore(client=_FakeRedisClient(backend), key_prefix="test:")
+    blocks = ResumeBlockStore(store)
+    digest = "ab" * 32
+    block_key = f"{ResumeBlockStore.BLOCK_KEY_PREFIX}{digest}"
+    assert blocks.acquire({digest: b"block"}, 30) == {"written": 1, "shared": 0}
+
+    release_incr = store.incr
+
+    def incr_then_acquire(key, delta, ttl_seconds):
+        count = release_incr(key, delta, ttl_seconds)
+        # Another worker saves a manifest sharing the block right here
+        store.incr = release_incr
+        assert blocks.acquire({digest: b"block"}, 30) == {"written": 0, "shared": 1}
+        return count
+
+    store.incr = incr_then_acquire
+    blocks.release([digest])
+
+    assert store.get_bytes(block_key) == b"block"
+    assert store.incr(f"{ResumeBlockStore.REFS_KEY_PREFIX}{digest}", 0, 30) == 1
+
+    blocks.release([digest])
+    assert store.get_bytes(block_key) is None
+    assert blocks.acquire({digest: b"block"}, 30) == {"written": 1, "shared": 0}
+
+
 def test_redis_resume_ttl_expiration_is_enforced():
     """Redis adapter must respect key TTL expiration."""
     backend = _FakeRedisBackend()
@@ -168,6 +327,85 @@ def test_redis_store_uses_prefix_and_compact_compressed_serialization():
     store.close()
 
 
+def test_redis_store_chunks_large_values_behind_a_manifest():
+    """Values above the chunk size are split into a hash and read back whole."""
+    backend = _FakeRedisBackend()
+    store = RedisResumeStore(
+        client=_FakeRedisClient(backend),
+        key_prefix="biorempp:resume:test:",
+        chunk_size_kb=1,
+        compression_threads=2,
+    )
+    logical_key = "resume:v1:block:abc123"
+    full_key = f"biorempp:resume:test:{logical_key}"
+    data = "".join(f"K{i:05d}," for i in range(1500)).encode("utf-8")
+
+    assert store.set_bytes(logical_key, data, ttl_seconds=30)
+    chunk_keys = [key for key in backend.keys() if ":chunks:" in key]
+
+    assert backend.raw_value(full_key).startswith(store.CHUNK_MANIFEST_MAGIC)
+    assert len(chunk_keys) == 1
+    assert len(backend.raw_value(chunk_keys[0])) == 11
+    assert backend.ttl(chunk_keys[0]) > backend.ttl(full_key)
+    assert store.get_bytes(logical_key) == data
+    assert type(store.get_bytes(logical_key)) is bytes
+    assert store.get_buffer(logical_key) == data
+
+    assert store.touch(logical_key, ttl_seconds=600)
+    assert backend.ttl(chunk_keys[0]) > 600
+
+    assert store.delete(logical_key)
+    assert backend.keys() == []
+
+    store.close()
+
+
+def test_redis_store_keeps_replaced_chunks_for_in_flight_readers():
+    """A reader holding the old manifest can finish after an overwrite."""
+    backend = _FakeRedisBackend()
+    store = RedisResumeStore(
+        client=_FakeRedisClient(backend),
+        key_prefix="biorempp:resume:test:",
+        chunk_size_kb=1,
+    )
+    logical_key = "resume:v1:block:def456"
+    full_key = f"biorempp:resume:test:{logical_key}"
+    old_data = b"a" * 5000
+    new_data = b"b" * 5000
+
+    assert store.set_bytes(logical_key, old_data, ttl_seconds=600)
+    old_manifest = store._read_manifest(full_key)
+    assert store.set_bytes(logical_key, new_data, ttl_seconds=600)
+
+    assert b"".join(store._iter_chunks(old_manifest)) == old_data
+    assert backend.ttl(old_manifest["key"]) <= store.CHUNK_TTL_GRACE_SECONDS
+    assert store.get_bytes(logical_key) == new_data
+
+    store.close()
+
+
+def test_redis_store_treats_incomplete_chunks_as_missing():
+    """A manifest whose chunks expired reads as a missing value."""
+    backend = _FakeRedisBackend()
+    store = RedisResumeStore(
+        client=_FakeRedisClient(backend),
+        key_prefix="biorempp:resume:test:",
+        chunk_size_kb=1,
+    )
+    logical_key = "resume:v1:job:BRP-20260225-140006-ABC207"
+    value = {"payload": [f"K{i:05d}" for i in range(1000)]}
+
+    assert store.set(logical_key, value, ttl_seconds=30)
+    assert store.get(logical_key) == value
+    for key in backend.keys():
+        if ":chunks:" in key:
+            backend.delete(key)
+
+    assert store.get(logical_key) is None
+
+    store.close()
+
+
 def test_redis_store_rejects_invalid_key_prefix():
     """Redis adapter should reject unsafe key prefixes."""
     backend = _FakeRedisBackend()
@@ -1,16 +1,26 @@
 """Unit tests for resume payload persistence by `job_id`."""
 
+import importlib
+import mmap
 import time
 
 import pytest
 
 from src.presentation.services.job_resume_service import JobResumeService
+from src.presentation.services.resume_block_store import ResumeBlockStore
+from src.presentation.services.resume_payload_codec import encode_payload
+from src.presentation.services.resume_store_diskcache import DiskcacheResumeStore
 from src.shared.metrics import (
     RESUME_LOAD_ATTEMPTS_TOTAL,
     RESUME_OPERATION_DURATION_SECONDS,
     RESUME_SAVE_TOTAL,
 )
 
+# The services package exports a service instance under the module's name
+job_resume_module = importlib.import_module(
+    "src.presentation.services.job_resume_service"
+)
+
 
 def _counter_value(counter, **labels) -> float:
     """Read Prometheus counter value for labels."""
@@ -384,3 +394,330 @@ def test_resume_service_logs_redacted_job_ref_only(tmp_path, caplog):
         assert all(job_id not in str(rec.__dict__) for rec in relevant_records)
     finally:
         service.close()
+
+
+def test_save_stores_block_manifest_and_round_trips_tables(resume_service):
+    """New entries use payload v3 and load back as record lists."""
+    job_id = "BRP-20260225-120010-ABC140"
+    owner_token = "owner-columnar"
+    payload = {
+        "metadata": {"job_id": job_id, "sample_count": 2},
+        "biorempp_df": [
+            {"Sample": "S1", "KO": "K00001", "Score": 0.5},
+            {"Sample": "S2", "KO": "K00001", "Score": None},
+        ],
+    }
+
+    assert resume_service.save_job_payload(job_id, payload, owner_token) is True
+
+    cached = resume_service._cache.get(resume_service._build_cache_key(job_id))
+    assert cached["payload_version"] == 3
+    assert cached["payload_schema"] == "resume-payload-v3"
+    assert "block" in cached["merged_result_payload"]["tables"]["biorempp_df"]
+
+    loaded_payload, status = resume_service.load_job_payload(job_id, owner_token)
+
+    assert status == resume_service.STATUS_OK
+    assert loaded_payload == payload
+
+
+def test_load_reads_legacy_v1_record_payload(resume_service):
+    """Payload v1 entries (tables as record lists) remain readable."""
+    job_id = "BRP-20260225-120011-ABC141"
+    owner_token = "owner-legacy"
+    payload = {
+        "metadata": {"job_id": job_id},
+        "biorempp_df": [{"Sample": "S1", "KO": "K00001"}],
+    }
+
+    resume_service._cache.set(
+        resume_service._build_cache_key(job_id),
+        {
+            "job_id": job_id,
+            "owner_token": owner_token,
+            "created_at": "2026-02-25T12:00:11+00:00",
+            "payload_version": 1,
+            "payload_schema": "resume-payload-v1",
+            "merged_result_payload": payload,
+        },
+        expire=30,
+    )
+
+    loaded_payload, status = resume_service.load_job_payload(job_id, owner_token)
+
+    assert status == resume_service.STATUS_OK
+    assert loaded_payload == payload
+
+
+def test_load_returns_not_found_for_malformed_columnar_payload(resume_service):
+    """Unreadable v2 payloads are discarded instead of raising."""
+    job_id = "BRP-20260225-120012-ABC142"
+    owner_token = "owner-malformed"
+
+    resume_service._cache.set(
+        resume_service._build_cache_key(job_id),
+        {
+            "job_id": job_id,
+            "owner_token": owner_token,
+            "created_at": "2026-02-25T12:00:12+00:00",
+            "payload_version": 2,
+            "payload_schema": "resume-payload-v2",
+            "merged_result_payload": {"tables": {}, "order": ["metadata"]},
+        },
+        expire=30,
+    )
+
+    loaded_payload, status = resume_service.load_job_payload(job_id, owner_token)
+
+    assert loaded_payload is None
+    assert status == resume_service.STATUS_NOT_FOUND
+
+
+def test_load_reads_inline_columnar_v2_payload(resume_service):
+    """Payload v2 entries (inline columnar tables) remain readable."""
+    job_id = "BRP-20260225-120013-ABC143"
+    owner_token = "owner-inline"
+    payload = {
+        "metadata": {"job_id": job_id},
+        "biorempp_df": [{"Sample": "S1", "KO": "K00001"}],
+    }
+
+    resume_service._cache.set(
+        resume_service._build_cache_key(job_id),
+        {
+            "job_id": job_id,
+            "owner_token": owner_token,
+            "created_at": "2026-02-25T12:00:13+00:00",
+            "payload_version": 2,
+            "payload_schema": "resume-payload-v2",
+            "merged_result_payload": encode_payload(payload),
+        },
+        expire=30,
+    )
+
+    loaded_payload, status = resume_service.load_job_payload(job_id, owner_token)
+
+    assert status == resume_service.STATUS_OK
+    assert loaded_payload == payload
+
+
+def _block_cache(service):
+    # Blocks and reference counts live in the store's TTL-only cache
+    return service._store._ttl_only_cache
+
+
+def _block_keys(service):
+    return [
+        key
+        for key in _block_cache(service).iterkeys()
+        if key.startswith(ResumeBlockStore.BLOCK_KEY_PREFIX)
+    ]
+
+
+def _table_payload(job_id, rows):
+    return {
+        "metadata": {"job_id": job_id},
+        "biorempp_df": rows,
+        "biorempp_raw_df": list(rows),
+        "hadeg_df": [{"Sample": "S1", "Gene": "g1"}],
+    }
+
+
+def test_identical_tables_are_stored_once_within_and_across_jobs(resume_service):
+    """Raw/display pairs and tables shared by jobs occupy one block."""
+    rows = [{"Sample": "S1", "KO": "K00001"}, {"Sample": "S2", "KO": "K00002"}]
+    first_job = "BRP-20260225-120014-ABC144"
+    second_job = "BRP-20260225-120015-ABC145"
+
+    assert resume_service.save_job_payload(
+        first_job, _table_payload(first_job, rows), "owner-a"
+    )
+    assert len(_block_keys(resume_service)) == 2
+
+    assert resume_service.save_job_payload(
+        second_job, _table_payload(second_job, rows), "owner-b"
+    )
+    assert len(_block_keys(resume_service)) == 2
+
+    loaded_payload, status = resume_service.load_job_payload(second_job, "owner-b")
+    assert status == resume_service.STATUS_OK
+    assert loaded_payload == _table_payload(second_job, rows)
+
+
+def test_replacing_entry_releases_unreferenced_blocks(resume_service):
+    """Blocks only referenced by a replaced manifest are deleted."""
+    job_id = "BRP-20260225-120016-ABC146"
+    first_rows = [{"Sample": "S1", "KO": "K00001"}]
+    second_rows = [{"Sample": "S1", "KO": "K00009"}]
+
+    resume_service.save_job_payload(job_id, _table_payload(job_id, first_rows), "o")
+    resume_service.save_job_payload(job_id, _table_payload(job_id, second_rows), "o")
+
+    assert len(_block_keys(resume_service)) == 2
+    loaded_payload, status = resume_service.load_job_payload(job_id, "o")
+    assert status == resume_service.STATUS_OK
+    assert loaded_payload["biorempp_df"] == second_rows
+
+
+def test_release_keeps_block_acquired_concurrently(tmp_path):
+    """An acquire between release's decrement and delete keeps the block."""
+    store = DiskcacheResumeStore(tmp_path / "blocks", cache_size_mb=32)
+    blocks = ResumeBlockStore(store)
+    digest = "cd" * 32
+    block_key = f"{ResumeBlockStore.BLOCK_KEY_PREFIX}{digest}"
+    assert blocks.acquire({digest: b"block"}, 30) == {"written": 1, "shared": 0}
+
+    release_incr = store.incr
+
+    def incr_then_acquire(key, delta, ttl_seconds):
+        count = release_incr(key, delta, ttl_seconds)
+        # Another worker saves a manifest sharing the block right here
+        store.incr = release_incr
+        assert blocks.acquire({digest: b"block"}, 30) == {"written": 0, "shared": 1}
+        return count
+
+    store.incr = incr_then_acquire
+    blocks.release([digest])
+
+    assert store.get_bytes(block_key) == b"block"
+
+    blocks.release([digest])
+    assert store.get_bytes(block_key) is None
+    assert blocks.acquire({digest: b"block"}, 30) == {"written": 1, "shared": 0}
+    store.close()
+
+
+def test_load_returns_not_found_when_block_is_missing(resume_service):
+    """A manifest whose block was evicted is reported as not_found."""
+    job_id = "BRP-20260225-120017-ABC147"
+    rows = [{"Sample": "S1", "KO": "K00001"}]
+    resume_service.save_job_payload(job_id, _table_payload(job_id, rows), "o")
+
+    for block_key in _block_keys(resume_service):
+        _block_cache(resume_service).delete(block_key)
+
+    loaded_payload, status = resume_service.load_job_payload(job_id, "o")
+
+    assert loaded_payload is None
+    assert status == resume_service.STATUS_NOT_FOUND
+
+
+def test_load_selected_tables_reads_only_their_blocks(resume_service, monkeypatch):
+    """Loading a table subset fetches only the blocks of those tables."""
+    job_id = "BRP-20260225-120018-ABC148"
+    rows = [{"Sample": "S1", "KO": "K00001"}]
+    resume_service.save_job_payload(job_id, _table_payload(job_id, rows), "o")
+
+    fetched_keys = []
+    original_get = resume_service._store.get
+    original_get_buffer = resume_service._store.get_buffer
+
+    def _tracking_get(key):
+        fetched_keys.append(key)
+        return original_get(key)
+
+    def _tracking_get_buffer(key):
+        fetched_keys.append(key)
+        return original_get_buffer(key)
+
+    monkeypatch.setattr(resume_service._store, "get", _tracking_get)
+    monkeypatch.setattr(resume_service._store, "get_buffer", _tracking_get_buffer)
+
+    loaded_payload, status = resume_service.load_job_payload(
+        job_id, "o", tables=("hadeg_df",)
+    )
+
+    assert status == resume_service.STATUS_OK
+    assert loaded_payload == {
+        "metadata": {"job_id": job_id},
+        "hadeg_df": [{"Sample": "S1", "Gene": "g1"}],
+    }
+    block_reads = [
+        key for key in fetched_keys if key.startswith(ResumeBlockStore.BLOCK_KEY_PREFIX)
+    ]
+    assert len(block_reads) == 1
+
+    metadata_only, status = resume_service.load_job_payload(job_id, "o", tables=())
+    assert status == resume_service.STATUS_OK
+    assert metadata_only == {"metadata": {"job_id": job_id}}
+
+
+def test_encoded_payload_is_saved_without_reencoding(resume_service, monkeypatch):
+    """A payload encoded up front is stored as-is with its encoded size."""
+    job_id = "BRP-20260225-120019-ABC149"
+    rows = [{"Sample": "S1", "KO": "K00001"}]
+    payload = _table_payload(job_id, rows)
+    encoded = resume_service.encode_job_payload(payload)
+
+    def _fail(_payload):
+        raise AssertionError("payload encoded twice")
+
+    monkeypatch.setattr(job_resume_module, "encode_payload", _fail)
+    assert resume_service.save_job_payload(job_id, encoded, "o")
+
+    stored_blocks = [
+        _block_cache(resume_service).get(key) for key in _block_keys(resume_service)
+    ]
+    assert all(isinstance(block, bytes) for block in stored_blocks)
+    assert sorted(stored_blocks) == sorted(encoded.blocks.values())
+    assert encoded.size_bytes > sum(map(len, stored_blocks))
+
+    loaded_payload, status = resume_service.load_job_payload(job_id, "o")
+    assert status == resume_service.STATUS_OK
+    assert loaded_payload == payload
+
+
+def test_large_blocks_are_memory_mapped(resume_service):
+    """Blocks stored as diskcache files are read through a memory map."""
+    job_id = "BRP-20260225-120020-ABC150"
+    rows = [{"Sample": f"S{i % 7}", "KO": f"K{i:05d}", "Score": i / 3} for i in range(5000)]
+    payload = _table_payload(job_id, rows)
+    assert resume_service.save_job_payload(job_id, payload, "o")
+
+    buffers = [
+        resume_service._store.get_buffer(key) for key in _block_keys(resume_service)
+    ]
+    loaded_payload, status = resume_service.load_job_payload(job_id, "o")
+
+    assert sum(isinstance(buffer, mmap.mmap) for buffer in buffers) == 1
+    assert status == resume_service.STATUS_OK
+    assert loaded_payload == payload
+
+
+def test_shared_blocks_survive_culling_of_the_main_cache(tmp_path):
+    """Culling old manifests never evicts blocks or their reference counts."""
+    store = DiskcacheResumeStore(
+        tmp_path / "culled",
+        cache_size_mb=32,
+        ttl_only_prefixes=ResumeBlockStore.KEY_PREFIXES,
+    )
+    blocks = ResumeBlockStore(store)
+    digest = "ef" * 32
+    assert blocks.acquire({digest: b"block"}, 300) == {"written": 1, "shared": 0}
+    store.set("resume:v1:job:first", {"tables": {}}, 300)
+
+    # A full main cache culls its least recently stored entries on each set
+    store._cache.reset("size_limit", 0)
+    for index in range(50):
+        store.set(f"resume:v1:job:{index}", {"tables": {}}, 300)
+    assert store.get("resume:v1:job:first") is None
+    assert blocks.acquire({digest: b"block"}, 300) == {"written": 0, "shared": 1}
+
+    assert store.get_bytes(f"{ResumeBlockStore.BLOCK_KEY_PREFIX}{digest}") == b"block"
+    assert store.incr(f"{ResumeBlockStore.REFS_KEY_PREFIX}{digest}", 0, 300) == 2
+    store.close()
+
+
+def test_ttl_only_cache_refuses_writes_beyond_its_size_limit(tmp_path):
+    """The cache that never culls rejects blocks once it is full."""
+    store = DiskcacheResumeStore(
+        tmp_path / "full",
+        cache_size_mb=32,
+        ttl_only_prefixes=ResumeBlockStore.KEY_PREFIXES,
+    )
+    blocks = ResumeBlockStore(store)
+    store._ttl_only_cache.reset("size_limit", 0)
+
+    assert blocks.acquire({"ab" * 32: b"block"}, 300) is None
+    assert store.set_bytes("resume:v1:job:any", b"value", 300) is True
+    store.close()
@@ -0,0 +1,101 @@
+"""Unit tests for the content-addressed merge result cache."""
+
+from typing import Optional
+
+import pandas as pd
+
+from src.presentation.services.merge_result_cache import MergeResultCache
+from src.presentation.services.resume_store import ResumeStore
+
+
+class _DictResumeStore(ResumeStore):
+    """In-memory ResumeStore used to observe cache payloads."""
+
+    def __init__(self) -> None:
+        self.data: dict = {}
+
+    @property
+    def backend_name(self) -> str:
+        return "memory"
+
+    def set(self, key: str, value: dict, ttl_seconds: int) -> bool:
+        self.data[key] = value
+        return True
+
+    def get(self, key: str) -> Optional[dict]:
+        return self.data.get(key)
+
+    def close(self) -> None:
+        self.data.clear()
+
+
+def _sample_df(pairs):
+    return pd.DataFrame(pairs, columns=["Sample", "KO"])
+
+
+def _result():
+    records = [
+        {"Sample": "S1", "KO": "K00001", "score": 0.5},
+        {"Sample": "S2", "KO": "K00002", "score": None},
+    ]
+    return {
+        **{key: list(records) for key in MergeResultCache.TABLE_KEYS},
+        "metadata": {"job_id": "BRP-1", "filename": "a.txt", "sample_count": 2},
+    }
+
+
+def test_fingerprint_ignores_order_and_duplicates():
+    """Sample order, KO order and repeated lines map to the same hash."""
+    first = _sample_df([("S1", "K00001"), ("S1", "K00002"), ("S2", "K00001")])
+    second = _sample_df(
+        [("S2", "K00001"), ("S1", "K00002"), ("S1", "K00001"), ("S1", "K00002")]
+    )
+    different = _sample_df([("S1", "K00001"), ("S2", "K00002")])
+
+    assert MergeResultCache.fingerprint(first) == MergeResultCache.fingerprint(second)
+    assert MergeResultCache.fingerprint(first) != MergeResultCache.fingerprint(
+        different
+    )
+
+
+def test_fingerprint_ignores_column_dtypes():
+    """Categorical and object columns with the same pairs hash alike."""
+    first = _sample_df([("S1", "K00001"), ("S2", "K00001")])
+    encoded = first.astype({"Sample": "category", "KO": "category"})
+    swapped = _sample_df([("K00001", "S1"), ("K00001", "S2")])
+
+    assert MergeResultCache.fingerprint(encoded) == MergeResultCache.fingerprint(first)
+    assert MergeResultCache.fingerprint(swapped) != MergeResultCache.fingerprint(first)
+
+
+def test_build_key_depends_on_reference_version():
+    """Database updates change the key, so stale merges are never served."""
+    cache = MergeResultCache(_DictResumeStore())
+    sample_df = _sample_df([("S1", "K00001")])
+
+    assert cache.build_key(sample_df, "a" * 64) != cache.build_key(sample_df, "b" * 64)
+
+
+def test_set_and_get_round_trip_without_job_metadata():
+    """Stored records come back unchanged; job fields are not cached."""
+    store = _DictResumeStore()
+    cache = MergeResultCache(store)
+    key = cache.build_key(_sample_df([("S1", "K00001")]), "a" * 64)
+
+    assert cache.get(key) is None
+    assert cache.set(key, _result()) is True
+    loaded = cache.get(key)
+
+    assert loaded is not None
+    assert loaded["metadata"] == {"sample_count": 2}
+    for table_key in MergeResultCache.TABLE_KEYS:
+        assert loaded[table_key] == _result()[table_key]
+
+
+def test_unreadable_entry_is_treated_as_miss():
+    """Entries missing tables are ignored instead of raising."""
+    store = _DictResumeStore()
+    cache = MergeResultCache(store)
+    store.data["merge:v2:broken"] = {"biorempp_df": [], "metadata": {}}
+
+    assert cache.get("merge:v2:broken") is None
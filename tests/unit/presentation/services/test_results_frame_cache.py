@@ -0,0 +1,99 @@
+"""Unit tests for the worker-local results frame cache."""
+
+import pytest
+
+from src.presentation.services import results_frame_cache
+from src.presentation.services.results_frame_cache import ResultsFrameCache
+
+
+def _payload(job_id="BRP-1", rows=3):
+    records = [{"Sample": f"S{i}", "KO": f"K{i:05d}"} for i in range(rows)]
+    return {"biorempp_df": records, "metadata": {"job_id": job_id}}
+
+
+def test_same_records_reuse_cached_frame():
+    """A second read of the same record list does not rebuild the frame."""
+    cache = ResultsFrameCache(max_bytes=10 * 1024 * 1024)
+    outcomes = []
+    cache._count = lambda operation, outcome: outcomes.append(outcome)
+    payload = _payload()
+
+    first = cache.get(payload, "biorempp_df")
+    first["extra"] = 1
+    second = cache.get(payload, "biorempp_df")
+
+    assert outcomes == ["miss", "hit"]
+    assert list(second.columns) == ["Sample", "KO"]
+    assert second["Sample"].tolist() == ["S0", "S1", "S2"]
+
+
+def test_new_record_list_replaces_entry():
+    """A different payload for the same job never hits the stale frame."""
+    cache = ResultsFrameCache(max_bytes=10 * 1024 * 1024)
+    cache.get(_payload(rows=2), "biorempp_df")
+
+    frame = cache.get(_payload(rows=4), "biorempp_df")
+
+    assert len(frame) == 4
+    assert len(cache._entries) == 1
+
+
+def test_evicts_least_recently_used_beyond_budget():
+    """Frames are evicted oldest first once the byte budget is exceeded."""
+    probe = ResultsFrameCache(max_bytes=10 * 1024 * 1024)
+    probe.get(_payload(rows=50), "biorempp_df")
+    frame_bytes = probe.total_bytes
+
+    cache = ResultsFrameCache(max_bytes=frame_bytes * 2)
+    first, second, third = (_payload(f"BRP-{i}", rows=50) for i in range(3))
+    cache.get(first, "biorempp_df")
+    cache.get(second, "biorempp_df")
+    cache.get(first, "biorempp_df")
+    cache.get(third, "biorempp_df")
+
+    assert set(cache._entries) == {("BRP-0", "biorempp_df"), ("BRP-2", "biorempp_df")}
+    assert cache.total_bytes <= frame_bytes * 2
+
+
+def test_missing_table_returns_empty_frame():
+    cache = ResultsFrameCache(max_bytes=1024)
+
+    assert cache.get({"metadata": {}}, "kegg_df").empty
+    assert cache.get(None, "kegg_df").empty
+
+
+def test_fingerprint_is_computed_once_per_built_frame(monkeypatch):
+    """Handed-out copies reuse the fingerprint computed at build time."""
+    cache = ResultsFrameCache(max_bytes=10 * 1024 * 1024)
+    payload = _payload()
+    calls = []
+    fingerprint = results_frame_cache.fingerprint_dataframe
+
+    def _counting(frame, ordered=True):
+        calls.append(len(frame))
+        return fingerprint(frame, ordered=ordered)
+
+    monkeypatch.setattr(results_frame_cache, "fingerprint_dataframe", _counting)
+    first = cache.get(payload, "biorempp_df")
+    second = cache.get(payload, "biorempp_df")
+
+    assert calls == [3]
+    assert fingerprint(second) == fingerprint(first) == fingerprint(second.copy())
+
+
+def test_in_place_write_does_not_change_cached_frame():
+    """Handed-out frames are read-only, so the next get sees the original."""
+    cache = ResultsFrameCache(max_bytes=10 * 1024 * 1024)
+    payload = _payload()
+    frame = cache.get(payload, "biorempp_df")
+    fingerprint = results_frame_cache.fingerprint_dataframe(frame)
+
+    with pytest.raises(ValueError):
+        frame.loc[0, "KO"] = "K99999"
+    writable = frame.copy()
+    writable.loc[0, "KO"] = "K99999"
+
+    again = cache.get(payload, "biorempp_df")
+    assert again.loc[0, "KO"] == "K00000"
+    assert results_frame_cache.fingerprint_dataframe(again) == fingerprint
+    assert results_frame_cache.fingerprint_dataframe(writable) != fingerprint
@@ -1,6 +1,18 @@
 """Unit tests for /results payload resolver hydration behavior."""
 
+import threading
+
+import pytest
+
 from src.presentation.services import results_payload_resolver as resolver
+from src.presentation.services.results_hydration_disk_cache import HydrationDiskCache
+from src.shared.metrics import RESULTS_HYDRATION_COALESCED_TOTAL
+
+
+@pytest.fixture(autouse=True)
+def _no_shared_disk_cache(monkeypatch):
+    """Keep the shared L2 tier out of tests that count backend loads."""
+    monkeypatch.setattr(resolver, "_hydration_disk_cache", None)
 
 
 def _build_full_payload(job_id: str) -> dict:
@@ -102,3 +114,177 @@ def test_resolver_does_not_retry_on_token_mismatch(monkeypatch):
     assert resolved == {}
     assert attempts["count"] == 1
     assert sleep_calls == []
+
+
+def test_resolver_loads_only_missing_tables(monkeypatch):
+    """Per-table hydration loads each table once and merges cached tables."""
+    job_id = "BRP-20260310-150013-ABC123"
+    owner_token = "token-tables"
+    store_ref = _build_store_ref(job_id, owner_token)
+    status_ok = resolver.job_resume_service.STATUS_OK
+    requested: list = []
+
+    def _fake_load(_job_id, _owner_token, tables=None):
+        requested.append(tables)
+        payload = {"metadata": {"job_id": job_id}}
+        payload.update({table: [{"table": table}] for table in tables})
+        return payload, status_ok
+
+    monkeypatch.setattr(resolver.job_resume_service, "load_job_payload", _fake_load)
+
+    first = resolver.resolve_results_payload(store_ref, tables=("hadeg_df",))
+    second = resolver.resolve_results_payload(
+        store_ref, tables=("biorempp_df", "hadeg_df")
+    )
+    third = resolver.resolve_results_payload(store_ref, tables=("hadeg_df",))
+
+    assert requested == [("hadeg_df",), ("biorempp_df",)]
+    assert set(first) == {"metadata", "hadeg_df"}
+    assert set(second) == {"metadata", "hadeg_df", "biorempp_df"}
+    assert third is second
+
+
+def test_resolve_use_case_payload_uses_download_config_tables(monkeypatch):
+    """Use cases hydrate the databases declared in download_config.yaml."""
+    job_id = "BRP-20260310-150014-ABC124"
+    store_ref = _build_store_ref(job_id, "token-use-case")
+    requested: list = []
+
+    def _fake_load(_job_id, _owner_token, tables=None):
+        requested.append(tables)
+        return {"metadata": {"job_id": job_id}}, resolver.job_resume_service.STATUS_OK
+
+    monkeypatch.setattr(resolver.job_resume_service, "load_job_payload", _fake_load)
+
+    assert resolver.use_case_tables("UC-4.12") == ("hadeg_df",)
+    assert resolver.use_case_tables("UC-0.0") is None
+
+    resolver.resolve_use_case_payload(store_ref, "UC-4.12")
+
+    assert requested == [("hadeg_df",)]
+
+
+def test_disk_tier_serves_other_workers_without_backend(monkeypatch, tmp_path):
+    """A payload hydrated by one worker is read from L2 by a fresh worker."""
+    job_id = "BRP-20260310-150015-ABC125"
+    store_ref = _build_store_ref(job_id, "token-l2")
+    status_ok = resolver.job_resume_service.STATUS_OK
+    requested: list = []
+    rows = [{"KO": f"K{i:05d}", "Sample": "S1"} for i in range(3)]
+
+    def _fake_load(_job_id, _owner_token, tables=None):
+        requested.append(tables)
+        payload = {"metadata": {"job_id": job_id}}
+        payload.update({table: list(rows) for table in tables})
+        return payload, status_ok
+
+    monkeypatch.setattr(resolver.job_resume_service, "load_job_payload", _fake_load)
+    disk_cache = HydrationDiskCache(tmp_path, size_limit_mb=16, ttl_seconds=60)
+    monkeypatch.setattr(resolver, "_hydration_disk_cache", disk_cache)
+
+    resolver.resolve_results_payload(store_ref, tables=("hadeg_df",))
+    monkeypatch.setattr(
+        resolver, "_hydration_cache", resolver._HydrationCache(8, 60)
+    )
+    shared = resolver.resolve_results_payload(store_ref, tables=("hadeg_df",))
+    resolver.resolve_results_payload(store_ref, tables=("kegg_df",))
+
+    assert requested == [("hadeg_df",), ("kegg_df",)]
+    assert shared == {"metadata": {"job_id": job_id}, "hadeg_df": rows}
+    assert disk_cache.get(resolver._build_cache_key(job_id, "token-l2"), None) is None
+    disk_cache.close()
+
+
+def test_concurrent_misses_share_one_backend_load(monkeypatch):
+    """Callbacks missing the cache together wait on a single load."""
+    job_id = "BRP-20260310-150016-ABC126"
+    store_ref = _build_store_ref(job_id, "token-single-flight")
+    payload = _build_full_payload(job_id)
+    release_load = threading.Event()
+    claims = threading.Semaphore(0)
+    loads: list = []
+
+    def _slow_load(*_args, **_kwargs):
+        loads.append(1)
+        release_load.wait(2)
+        return payload, resolver.job_resume_service.STATUS_OK
+
+    flights = resolver._HydrationFlights()
+    original_claim = flights.claim
+
+    def _counting_claim(key, tables=None):
+        flight = original_claim(key, tables)
+        claims.release()
+        return flight
+
+    monkeypatch.setattr(flights, "claim", _counting_claim)
+    monkeypatch.setattr(resolver, "_hydration_flights", flights)
+    monkeypatch.setattr(resolver.job_resume_service, "load_job_payload", _slow_load)
+    saved = RESULTS_HYDRATION_COALESCED_TOTAL.labels(outcome="saved")
+    saved_before = saved._value.get()
+
+    results: list = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(resolver.resolve_results_payload(store_ref))
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for _ in threads:
+        assert claims.acquire(timeout=2)
+    release_load.set()
+    for thread in threads:
+        thread.join(timeout=2)
+
+    assert len(loads) == 1
+    assert results == [payload] * 4
+    assert saved._value.get() - saved_before == 3
+
+
+def test_concurrent_misses_for_other_tables_load_without_waiting(monkeypatch):
+    """A callback needing tables outside a running load does not wait for it."""
+    job_id = "BRP-20260310-150017-ABC127"
+    store_ref = _build_store_ref(job_id, "token-disjoint")
+    status_ok = resolver.job_resume_service.STATUS_OK
+    kegg_loaded = threading.Event()
+    overlapped: list = []
+    requested: list = []
+
+    def _fake_load(_job_id, _owner_token, tables=None):
+        requested.append(tables)
+        if tables == ("hadeg_df",):
+            # Returns only once the kegg_df load ran alongside this one
+            overlapped.append(kegg_loaded.wait(2))
+        else:
+            kegg_loaded.set()
+        payload = {"metadata": {"job_id": job_id}}
+        payload.update({table: [{"table": table}] for table in tables})
+        return payload, status_ok
+
+    monkeypatch.setattr(resolver, "_hydration_flights", resolver._HydrationFlights())
+    monkeypatch.setattr(resolver.job_resume_service, "load_job_payload", _fake_load)
+    monkeypatch.setattr(resolver.settings, "RESULTS_HYDRATION_WAIT_SECONDS", 10)
+
+    results: dict = {}
+    hadeg = threading.Thread(
+        target=lambda: results.update(
+            hadeg=resolver.resolve_results_payload(store_ref, tables=("hadeg_df",))
+        )
+    )
+    hadeg.start()
+    while not requested:
+        kegg_loaded.wait(0.01)
+    results["kegg"] = resolver.resolve_results_payload(store_ref, tables=("kegg_df",))
+    hadeg.join(timeout=5)
+
+    assert overlapped == [True]
+    # The later load may also return the tables the other one stored
+    assert {"metadata", "hadeg_df"} <= set(results["hadeg"])
+    assert {"metadata", "kegg_df"} <= set(results["kegg"])
+
+    # Both concurrent loads were merged into the worker's cache entry
+    both = resolver.resolve_results_payload(store_ref, tables=("hadeg_df", "kegg_df"))
+    assert set(both) == {"metadata", "hadeg_df", "kegg_df"}
+    assert sorted(requested) == [("hadeg_df",), ("kegg_df",)]
@@ -0,0 +1,174 @@
+"""
+Unit tests for the column-oriented resume payload codec.
+
+Test Coverage:
+- Round trips for string, numeric, boolean and mixed columns
+- Fallback to plain fields for non-tabular values
+- JSON safety of encoded payloads
+- Malformed input handling
+- Packed binary tables read in place
+"""
+
+import json
+import math
+
+import pytest
+
+from src.presentation.services.resume_payload_codec import (
+    decode_payload,
+    decode_table,
+    encode_payload,
+    encode_table,
+    is_packed_table,
+    pack_table,
+    unpack_table,
+)
+
+
+def _records():
+    return [
+        {"Sample": "S1", "KO": "K00001", "Score": 0.5, "Count": 3, "Hit": True},
+        {
+            "Sample": "S1",
+            "KO": "K00002",
+            "Score": float("nan"),
+            "Count": 1,
+            "Hit": False,
+        },
+        {"Sample": None, "KO": "K00001", "Score": 2.0, "Count": 7, "Hit": True},
+    ]
+
+
+class TestEncodeTable:
+    """Test table-level encoding."""
+
+    def test_columns_use_typed_kinds(self):
+        """Test each homogeneous column gets its typed encoding."""
+        table = encode_table(_records())
+
+        kinds = {column["name"]: column["kind"] for column in table["columns"]}
+        assert kinds == {
+            "Sample": "dict",
+            "KO": "dict",
+            "Score": "float64",
+            "Count": "int64",
+            "Hit": "bool",
+        }
+        ko_column = next(c for c in table["columns"] if c["name"] == "KO")
+        assert ko_column["values"] == ["K00001", "K00002"]
+
+    def test_round_trip_preserves_values_and_types(self):
+        """Test decoding restores values, None and NaN."""
+        decoded = decode_table(encode_table(_records()))
+
+        assert [row["Sample"] for row in decoded] == ["S1", "S1", None]
+        assert math.isnan(decoded[1]["Score"])
+        assert decoded[0] == _records()[0]
+        assert type(decoded[0]["Count"]) is int
+        assert type(decoded[0]["Hit"]) is bool
+
+    def test_mixed_column_falls_back_to_values(self):
+        """Test columns mixing types are kept as plain lists."""
+        records = [{"Value": 1}, {"Value": "a"}, {"Value": 2.5}]
+
+        table = encode_table(records)
+
+        assert table["columns"][0]["kind"] == "values"
+        assert decode_table(table) == records
+
+    def test_rows_with_different_keys_are_not_tabular(self):
+        """Test heterogeneous records are rejected."""
+        assert encode_table([{"a": 1}, {"b": 1}]) is None
+        assert encode_table([{"a": 1}, {"a": 1, "b": 2}]) is None
+        assert encode_table(["a", "b"]) is None
+
+    def test_empty_table(self):
+        """Test an empty record list round trips."""
+        assert decode_table(encode_table([])) == []
+
+
+class TestEncodePayload:
+    """Test payload-level encoding."""
+
+    def test_round_trip_keeps_fields_and_key_order(self):
+        """Test non-table entries are kept and key order is restored."""
+        payload = {
+            "metadata": {"job_id": "BRP-1", "sample_count": 2},
+            "biorempp_df": _records()[:1],
+            "tags": ["x", "y"],
+            "hadeg_df": [],
+        }
+
+        encoded = encode_payload(payload)
+        decoded = decode_payload(json.loads(json.dumps(encoded)))
+
+        assert set(encoded["tables"]) == {"biorempp_df", "hadeg_df"}
+        assert set(encoded["fields"]) == {"metadata", "tags"}
+        assert list(decoded) == list(payload)
+        assert decoded == payload
+
+    def test_malformed_payload_raises_value_error(self):
+        """Test missing sections and broken columns raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_payload({"tables": {}, "order": ["metadata"]})
+
+        encoded = encode_payload({"t": [{"a": "x"}, {"a": "y"}]})
+        encoded["tables"]["t"]["rows"] = 5
+        with pytest.raises(ValueError):
+            decode_payload(encoded)
+
+        encoded["tables"]["t"]["columns"][0]["kind"] = "unknown"
+        with pytest.raises(ValueError):
+            decode_payload(encoded)
+
+    def test_decode_selected_tables_keeps_fields(self):
+        """Test decoding a table subset leaves other tables out."""
+        payload = {
+            "metadata": {"job_id": "BRP-1"},
+            "biorempp_df": _records()[:1],
+            "hadeg_df": [{"Gene": "g1"}],
+        }
+
+        decoded = decode_payload(encode_payload(payload), tables=("hadeg_df",))
+
+        assert decoded == {
+            "metadata": payload["metadata"],
+            "hadeg_df": [{"Gene": "g1"}],
+        }
+
+
+class TestPackedTable:
+    """Test packed binary tables."""
+
+    def test_round_trip_reads_arrays_in_place(self):
+        """Test unpacking keeps arrays as views and decodes the same rows."""
+        packed = pack_table(encode_table(_records(), binary=True))
+        table = unpack_table(packed)
+
+        codes = next(c for c in table["columns"] if c["name"] == "KO")["codes"]
+        decoded = decode_table(table)
+
+        assert is_packed_table(packed)
+        assert isinstance(codes, memoryview) and codes.obj is packed
+        assert decoded[0] == _records()[0]
+        assert math.isnan(decoded[1]["Score"])
+        assert (
+            decode_table(unpack_table(pack_table(encode_table([], binary=True)))) == []
+        )
+
+    def test_packing_is_deterministic(self):
+        """Test equal tables pack to equal bytes."""
+        first = pack_table(encode_table(_records(), binary=True))
+        second = pack_table(encode_table(_records(), binary=True))
+
+        assert first == second
+
+    def test_malformed_buffer_raises_value_error(self):
+        """Test foreign and truncated buffers are rejected."""
+        packed = pack_table(encode_table(_records(), binary=True))
+
+        assert not is_packed_table(b'{"format": "columnar-v1"}')
+        with pytest.raises(ValueError):
+            unpack_table(b'{"format": "columnar-v1"}')
+        with pytest.raises(ValueError):
+            unpack_table(packed[:-16])
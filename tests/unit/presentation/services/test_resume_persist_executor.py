@@ -0,0 +1,52 @@
+"""Unit tests for the bounded resume persistence executor."""
+
+import threading
+
+from src.presentation.services.resume_persist_executor import ResumePersistExecutor
+
+
+def test_submit_rejects_when_workers_and_queue_are_full():
+    """Saves beyond workers + queue wait for a slot, then are rejected."""
+    executor = ResumePersistExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def _blocking_save():
+        started.set()
+        release.wait(2)
+
+    running = executor.submit(_blocking_save, timeout_seconds=0.1)
+    assert started.wait(1)
+    queued = executor.submit(lambda: None, timeout_seconds=0.1)
+
+    assert running is not None and queued is not None
+    assert executor.in_flight == 1
+    assert executor.queue_depth == 1
+    assert executor.submit(lambda: None, timeout_seconds=0.05) is None
+
+    release.set()
+    running.result(timeout=1)
+    queued.result(timeout=1)
+    assert executor.submit(lambda: None, timeout_seconds=0.1) is not None
+    assert executor.drain(timeout_seconds=1)
+
+
+def test_drain_waits_for_accepted_saves_and_stops_intake():
+    """Drain completes accepted saves and refuses new ones."""
+    executor = ResumePersistExecutor(max_workers=2, max_queue=4)
+    completed = []
+    for index in range(4):
+        executor.submit(lambda index=index: completed.append(index), 0.1)
+
+    assert executor.drain(timeout_seconds=2)
+    assert sorted(completed) == [0, 1, 2, 3]
+    assert executor.submit(lambda: None, timeout_seconds=0.1) is None
+
+
+def test_drain_reports_timeout_with_pending_saves():
+    executor = ResumePersistExecutor(max_workers=1, max_queue=0)
+    release = threading.Event()
+    executor.submit(lambda: release.wait(2), timeout_seconds=0.1)
+
+    assert executor.drain(timeout_seconds=0.05) is False
+    release.set()
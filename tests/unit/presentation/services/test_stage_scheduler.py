@@ -0,0 +1,93 @@
+"""Unit tests for the dependency-aware stage scheduler."""
+
+import threading
+import time
+
+import pytest
+
+from src.presentation.services.stage_scheduler import Stage, StageScheduler
+
+
+@pytest.fixture(params=[1, 4], ids=["inline", "pooled"])
+def scheduler(request):
+    """Scheduler running stages inline and on a thread pool."""
+    stage_scheduler = StageScheduler(max_workers=request.param)
+    yield stage_scheduler
+    stage_scheduler.shutdown()
+
+
+def test_dependency_results_are_passed_in_order(scheduler):
+    """Stages receive their dependencies' results as positional args."""
+    run = scheduler.run(
+        [
+            Stage("total", lambda a, b: a + b, ("a", "b")),
+            Stage("a", lambda: 2),
+            Stage("b", lambda: 3),
+            Stage("double", lambda total: total * 2, ("total",)),
+        ]
+    )
+
+    assert run.results == {"a": 2, "b": 3, "total": 5, "double": 10}
+    assert set(run.stage_ms) == {"a", "b", "total", "double"}
+
+
+def test_independent_stages_run_concurrently():
+    """Independent stages overlap on the pool."""
+    barrier = threading.Barrier(2, timeout=5)
+    scheduler = StageScheduler(max_workers=2)
+
+    run = scheduler.run(
+        [
+            Stage("left", lambda: barrier.wait() is not None),
+            Stage("right", lambda: barrier.wait() is not None),
+        ]
+    )
+    scheduler.shutdown()
+
+    assert run.results == {"left": True, "right": True}
+
+
+def test_critical_path_follows_longest_chain(scheduler):
+    """Critical path sums stage times along the slowest dependency chain."""
+
+    def sleep_then(value):
+        def stage(*_args):
+            time.sleep(0.02)
+            return value
+
+        return stage
+
+    run = scheduler.run(
+        [
+            Stage("root", sleep_then("root")),
+            Stage("child", sleep_then("child"), ("root",)),
+            Stage("side", lambda: "side"),
+        ]
+    )
+
+    assert run.critical_path_ms == pytest.approx(
+        run.stage_ms["root"] + run.stage_ms["child"]
+    )
+    assert run.critical_path_ms <= run.wall_ms + 1.0
+
+
+def test_stage_exception_is_raised(scheduler):
+    """First stage failure propagates to the caller."""
+
+    def fail(_ok):
+        raise RuntimeError("merge failed")
+
+    with pytest.raises(RuntimeError, match="merge failed"):
+        scheduler.run([Stage("ok", lambda: 1), Stage("bad", fail, ("ok",))])
+
+
+def test_invalid_graphs_are_rejected(scheduler):
+    """Unknown, duplicate and cyclic dependencies raise ValueError."""
+    with pytest.raises(ValueError):
+        scheduler.run([Stage("a", lambda b: b, ("missing",))])
+    with pytest.raises(ValueError):
+        scheduler.run([Stage("a", lambda: 1), Stage("a", lambda: 2)])
+    with pytest.raises(ValueError):
+        scheduler.run(
+            [Stage("a", lambda b: b, ("b",)), Stage("b", lambda a: a, ("a",))]
+        )
@@ -0,0 +1,86 @@
+"""Unit tests for the server-side upload artifact store."""
+
+import json
+from typing import Optional
+
+import numpy as np
+
+from src.application.core.upload_parser import UploadParser
+from src.presentation.services.resume_store import ResumeStore
+from src.presentation.services.upload_artifact_store import UploadArtifactStore
+
+CONTENT = ">S1\nK00001\nK00002\n>S2\nK00001\n"
+
+
+class _DictResumeStore(ResumeStore):
+    """In-memory ResumeStore used to observe artifact payloads."""
+
+    def __init__(self, accept_writes: bool = True) -> None:
+        self.data: dict = {}
+        self.accept_writes = accept_writes
+
+    @property
+    def backend_name(self) -> str:
+        return "memory"
+
+    def set(self, key: str, value: dict, ttl_seconds: int) -> bool:
+        if not self.accept_writes:
+            return False
+        self.data[key] = value
+        return True
+
+    def get(self, key: str) -> Optional[dict]:
+        return self.data.get(key)
+
+    def close(self) -> None:
+        self.data.clear()
+
+
+def test_save_and_load_round_trip():
+    """Loaded artifacts reproduce the parsed upload."""
+    parsed = UploadParser().parse(CONTENT)
+    store = UploadArtifactStore(_DictResumeStore())
+
+    ref = store.save(CONTENT, parsed)
+    loaded = store.load(ref)
+
+    assert ref == UploadArtifactStore.build_ref(CONTENT)
+    assert loaded.sample_names == parsed.sample_names
+    assert loaded.ko_ids == parsed.ko_ids
+    np.testing.assert_array_equal(loaded.sample_codes, parsed.sample_codes)
+    np.testing.assert_array_equal(loaded.ko_codes, parsed.ko_codes)
+    assert loaded.to_frame().equals(parsed.to_frame())
+
+
+def test_payload_is_json_safe_and_holds_no_content():
+    """Payloads survive JSON backends and never keep the raw file."""
+    backend = _DictResumeStore()
+    ref = UploadArtifactStore(backend).save(CONTENT, UploadParser().parse(CONTENT))
+
+    encoded = json.dumps(backend.data[ref])
+    assert "K00001" in encoded
+    assert CONTENT not in encoded
+
+
+def test_load_rejects_malformed_refs_and_payloads():
+    """Malformed references, misses and corrupt payloads load as None."""
+    backend = _DictResumeStore()
+    store = UploadArtifactStore(backend)
+    ref = store.save(CONTENT, UploadParser().parse(CONTENT))
+
+    assert store.load("upload:v1:../../etc") is None
+    assert store.load(None) is None
+    assert store.load(UploadArtifactStore.build_ref("other")) is None
+
+    backend.data[ref]["ko_ids"] = []
+    assert store.load(ref) is None
+
+    backend.data[ref] = {"sample_codes": "***"}
+    assert store.load(ref) is None
+
+
+def test_save_returns_none_when_backend_rejects_write():
+    """A failed write yields no reference so content stays inline."""
+    store = UploadArtifactStore(_DictResumeStore(accept_writes=False))
+
+    assert store.save(CONTENT, UploadParser().parse(CONTENT)) is None
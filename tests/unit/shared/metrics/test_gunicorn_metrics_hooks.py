@@ -84,3 +84,36 @@ def test_worker_hooks_emit_request_and_active_metrics() -> None:
 
     assert float(WORKERS_ACTIVE._value.get()) >= 1.0
     assert _counter_value(WORKER_REQUESTS_TOTAL) >= (before_requests + 1.0)
+
+
+def test_post_fork_exports_memory_breakdown(monkeypatch) -> None:
+    from src.shared.metrics import WORKER_MEMORY_BREAKDOWN_BYTES
+
+    monkeypatch.setattr(
+        gunicorn_config,
+        "read_process_memory",
+        lambda: {"rss": 4096, "pss": 2048, "shared": 3072, "private": 1024},
+    )
+
+    gunicorn_config.post_fork(SimpleNamespace(), _DummyWorker(pid=778))
+
+    assert WORKER_MEMORY_BREAKDOWN_BYTES.labels(kind="pss")._value.get() == 2048
+    assert WORKER_MEMORY_BREAKDOWN_BYTES.labels(kind="shared")._value.get() == 3072
+
+
+def test_preload_reference_data_respects_setting(monkeypatch) -> None:
+    from src.presentation.callbacks import real_processing_callbacks
+
+    calls: list[bool] = []
+    monkeypatch.setattr(
+        real_processing_callbacks, "get_data_service", lambda: calls.append(True)
+    )
+    monkeypatch.setattr(gunicorn_config.gc, "freeze", lambda: None)
+
+    monkeypatch.setattr(gunicorn_config.settings, "PRELOAD_REFERENCE_DATA", False)
+    gunicorn_config._preload_reference_data()
+    assert calls == []
+
+    monkeypatch.setattr(gunicorn_config.settings, "PRELOAD_REFERENCE_DATA", True)
+    gunicorn_config._preload_reference_data()
+    assert calls == [True]
@@ -0,0 +1,66 @@
+"""Unit tests for per-process memory breakdown helpers."""
+
+from __future__ import annotations
+
+from src.shared.metrics import process_memory
+
+_SMAPS_ROLLUP = """\
+00400000-7fffffffffff ---p 00000000 00:00 0                  [rollup]
+Rss:               20480 kB
+Pss:                8192 kB
+Shared_Clean:      14336 kB
+Shared_Dirty:       2048 kB
+Private_Clean:      1024 kB
+Private_Dirty:      3072 kB
+"""
+
+
+def _fake_proc(tmp_path, pid: int, children: list[int] | None = None) -> None:
+    proc_dir = tmp_path / str(pid)
+    task_dir = proc_dir / "task" / str(pid)
+    task_dir.mkdir(parents=True)
+    (proc_dir / "smaps_rollup").write_text(_SMAPS_ROLLUP, encoding="utf-8")
+    (task_dir / "children").write_text(
+        " ".join(str(child) for child in children or []), encoding="utf-8"
+    )
+
+
+def test_read_process_memory_parses_smaps_rollup(monkeypatch, tmp_path) -> None:
+    _fake_proc(tmp_path, 100)
+    monkeypatch.setattr(process_memory, "_PROC_ROOT", tmp_path)
+
+    memory = process_memory.read_process_memory(100)
+
+    assert memory == {
+        "rss": 20480 * 1024,
+        "pss": 8192 * 1024,
+        "shared": 16384 * 1024,
+        "private": 4096 * 1024,
+    }
+
+
+def test_read_process_memory_missing_pid_returns_none(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(process_memory, "_PROC_ROOT", tmp_path)
+
+    assert process_memory.read_process_memory(999) is None
+
+
+def test_memory_report_totals_and_savings(monkeypatch, tmp_path) -> None:
+    _fake_proc(tmp_path, 100, children=[101, 102])
+    _fake_proc(tmp_path, 101)
+    _fake_proc(tmp_path, 102)
+    monkeypatch.setattr(process_memory, "_PROC_ROOT", tmp_path)
+
+    workers = process_memory.find_child_pids(100)
+    report = process_memory.build_memory_report(100, workers)
+
+    assert workers == [101, 102]
+    assert [proc["role"] for proc in report["processes"]] == [
+        "master",
+        "worker",
+        "worker",
+    ]
+    assert report["total_rss"] == 3 * 20480 * 1024
+    assert report["total_pss"] == 3 * 8192 * 1024
+    assert report["shared_savings"] == 3 * (20480 - 8192) * 1024
+    assert "shared_savings=36.0 MiB" in process_memory.format_memory_report(report)
@@ -0,0 +1,112 @@
+"""Unit tests for full-content DataFrame fingerprints."""
+
+import pandas as pd
+import pytest
+
+from src.shared import dataframe_fingerprint
+from src.shared.dataframe_fingerprint import (
+    _frame_guard,
+    fingerprint_dataframe,
+    freeze_dataframe,
+    remember_fingerprint,
+)
+
+
+def _frame(rows=100):
+    return pd.DataFrame(
+        {"Sample": [f"S{i % 7}" for i in range(rows)], "value": range(rows)}
+    )
+
+
+def test_middle_rows_change_the_fingerprint() -> None:
+    """Frames that only differ away from their head and tail differ."""
+    changed = _frame()
+    changed.loc[50, "value"] = -1
+
+    assert fingerprint_dataframe(_frame()) == fingerprint_dataframe(_frame())
+    assert fingerprint_dataframe(_frame()) != fingerprint_dataframe(changed)
+    assert len(fingerprint_dataframe(changed)) == 16
+
+
+def test_unordered_fingerprint_ignores_row_order() -> None:
+    frame = _frame()
+    shuffled = frame.sample(frac=1, random_state=3)
+
+    assert fingerprint_dataframe(frame) != fingerprint_dataframe(shuffled)
+    assert fingerprint_dataframe(frame, ordered=False) == fingerprint_dataframe(
+        shuffled, ordered=False
+    )
+
+
+def test_unhashable_values_fall_back_to_strings() -> None:
+    frame = pd.DataFrame({"items": [["a", "b"], ["c"]]})
+    other = pd.DataFrame({"items": [["a", "b"], ["d"]]})
+
+    assert fingerprint_dataframe(frame) != fingerprint_dataframe(other)
+
+
+def test_remembered_fingerprint_is_dropped_when_columns_change() -> None:
+    frame = _frame()
+    assert freeze_dataframe(frame)
+    remember_fingerprint(frame, "0123456789abcdef")
+
+    assert fingerprint_dataframe(frame) == "0123456789abcdef"
+    assert fingerprint_dataframe(frame.head(10)) != "0123456789abcdef"
+
+    frame["value"] = frame["value"] * 2
+    assert fingerprint_dataframe(frame) == fingerprint_dataframe(frame.copy())
+    assert fingerprint_dataframe(frame) != "0123456789abcdef"
+
+
+def test_writable_frames_are_not_remembered() -> None:
+    """A fingerprint is only reused for frames whose cells cannot change."""
+    frame = _frame()
+    remember_fingerprint(frame, "0123456789abcdef")
+
+    assert fingerprint_dataframe(frame) != "0123456789abcdef"
+
+
+def test_frozen_frames_reject_in_place_writes() -> None:
+    frame = _frame()
+    assert freeze_dataframe(frame)
+    shared = frame.copy(deep=False)
+
+    with pytest.raises(ValueError):
+        shared.loc[0, "value"] = 999
+    with pytest.raises(ValueError):
+        shared.iat[0, 0] = "S9"
+
+    with pytest.raises(ValueError):
+        shared.replace(0, -1, inplace=True)
+    with pytest.raises(ValueError):
+        shared.loc[shared["value"] > 50, "value"] = -1
+
+    shared["value"] = shared["value"] * 2
+    assert frame.loc[0, "value"] == 0
+
+
+def test_frame_guard_follows_the_pandas_2_block_manager() -> None:
+    """The reuse guard relies on pandas 2.x replacing blocks on column writes."""
+    assert int(pd.__version__.split(".")[0]) == 2, "re-check _frame_guard"
+    frame = _frame()
+    guard = _frame_guard(frame)
+
+    assert guard is not None
+    assert all(a is b for a, b in zip(guard, _frame_guard(frame)))
+
+    frame["value"] = frame["value"] + 1
+    assert _frame_guard(frame)[0] is not guard[0]
+
+
+def test_frames_without_block_manager_are_recomputed(monkeypatch) -> None:
+    """Without pandas internals nothing is frozen or remembered."""
+    frame = _frame()
+    expected = fingerprint_dataframe(frame)
+    monkeypatch.setattr(dataframe_fingerprint, "_manager_blocks", lambda df: None)
+
+    assert freeze_dataframe(frame) is False
+    remember_fingerprint(frame, "0123456789abcdef")
+
+    assert fingerprint_dataframe(frame) == expected
+    frame.loc[0, "value"] = 999
+    assert fingerprint_dataframe(frame) != expected